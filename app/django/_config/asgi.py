@@ -3,6 +3,11 @@ ASGI config for _config project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
 
+The API itself is served by gunicorn WSGI workers (_config.wsgi). This ASGI application
+is run only by the separate SSE process (gunicorn + uvicorn worker, helm web-sse deployment),
+to which nginx routes /api/v*/notifications/stream/ so that long-lived streams wait on the
+event loop instead of holding a WSGI worker thread.
+
 For more information on this file, see
 https://docs.djangoproject.com/en/4.0/howto/deployment/asgi/
 """
@@ -1,5 +1,6 @@
 import os
 from celery import Celery
+from celery.signals import task_prerun
 
 # Django 설정 모듈 설정
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', '_config.settings')
@@ -12,6 +13,14 @@ app.config_from_object('django.conf:settings', namespace='CELERY')
 # Django 앱에서 task 자동 탐색
 app.autodiscover_tasks()
 
+
+@task_prerun.connect
+def reset_database_pin(**kwargs):
+    # 워커 스레드에서 이전 태스크의 primary 고정 상태가 이어지지 않도록 초기화
+    from _config.database_router import reset_primary_pin
+    reset_primary_pin()
+
+
 @app.task(bind=True, ignore_result=True)
 def debug_task(self):
     print(f'Request: {self.request!r}')
\ No newline at end of file
@@ -1,39 +1,146 @@
+"""
+primary / replica 데이터베이스 라우터
+
+- 읽기: replica 가 정상이고 복제 지연이 DATABASE_REPLICA_MAX_LAG 초 이하일 때만 replica 사용
+- 복제 상태(연결·지연)는 DATABASE_REPLICA_CHECK_INTERVAL 초마다 재측정 (실패 후에도 주기적으로 재시도)
+- read-your-writes: 쓰기가 발생한 요청/태스크의 이후 읽기는 primary 로 고정하고,
+  PrimaryPinMiddleware 가 쿠키로 후속 요청도 DATABASE_PRIMARY_PIN_SECONDS 초 동안 primary 로 고정
+"""
 import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
 from django.db import connections
-from django.db.utils import OperationalError
+from django.db.utils import DatabaseError
+
+PRIMARY_DB = 'default'
+REPLICA_DB = 'replica'
+PRIMARY_PIN_COOKIE = 'ibs_primary_pin'
+
+_primary_pinned = ContextVar('primary_pinned', default=False)
+_primary_written = ContextVar('primary_written', default=False)
+
+
+def pin_to_primary():
+    """현재 요청/태스크의 이후 읽기를 primary 로 고정"""
+    _primary_pinned.set(True)
+
+
+def reset_primary_pin(pinned=False):
+    """고정 상태 초기화 (요청·태스크 시작 시)"""
+    _primary_pinned.set(pinned)
+    _primary_written.set(False)
+
+
+def is_primary_pinned():
+    return _primary_pinned.get()
+
+
+@contextmanager
+def use_primary():
+    """블록 안의 읽기를 primary 로 고정 (블록 종료 후 이전 상태 복원)"""
+    token = _primary_pinned.set(True)
+    try:
+        yield
+    finally:
+        _primary_pinned.reset(token)
+
+
+class ReplicaMonitor:
+    """replica 연결 상태·복제 지연 측정 결과를 check_interval 초 동안 캐싱 (프로세스 공유)"""
+
+    POSTGRES_LAG_SQL = (
+        "SELECT CASE WHEN NOT pg_is_in_recovery() THEN 0 "
+        "WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+        "ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) END"
+    )
+
+    def __init__(self, alias=REPLICA_DB):
+        self.alias = alias
+        self.healthy = False
+        self.lag = None
+        self.checked_at = None
+        self._lock = threading.Lock()
+
+    @property
+    def check_interval(self):
+        return getattr(settings, 'DATABASE_REPLICA_CHECK_INTERVAL', 10)
+
+    @property
+    def max_lag(self):
+        return getattr(settings, 'DATABASE_REPLICA_MAX_LAG', 5)
+
+    def is_configured(self):
+        # Kubernetes 환경이 아니거나 replica 설정이 없으면 replica 사용 안함
+        return 'KUBERNETES_SERVICE_HOST' in os.environ and self.alias in settings.DATABASES
+
+    def is_available(self):
+        """replica 읽기 가능 여부 (측정 주기가 지났으면 재측정)"""
+        if self.checked_at is None or time.monotonic() - self.checked_at >= self.check_interval:
+            # 측정은 한 스레드만 수행, 나머지는 직전 결과 사용
+            if self._lock.acquire(blocking=False):
+                try:
+                    self.refresh()
+                finally:
+                    self._lock.release()
+        return self.healthy and self.lag is not None and self.lag <= self.max_lag
+
+    def refresh(self):
+        """replica 연결 확인 및 복제 지연(초) 측정"""
+        if not self.is_configured():
+            self.healthy, self.lag = False, None
+        else:
+            try:
+                self.lag = self.measure_lag(connections[self.alias])
+                self.healthy = True
+            except DatabaseError:
+                # 연결 실패 시 primary 사용, 다음 측정 주기에 재연결 시도
+                connections[self.alias].close()
+                self.healthy, self.lag = False, None
+        self.checked_at = time.monotonic()
+
+    def measure_lag(self, connection):
+        with connection.cursor() as cursor:
+            if connection.vendor == 'postgresql':
+                cursor.execute(self.POSTGRES_LAG_SQL)
+                return float(cursor.fetchone()[0])
+
+            cursor.execute('SHOW REPLICA STATUS')
+            row = cursor.fetchone()
+            if row is None:  # 복제 구성이 아닌 서버 (primary 와 동일)
+                return 0.0
+            status = dict(zip([col[0] for col in cursor.description], row))
+            lag = status.get('Seconds_Behind_Master')
+            # 복제 스레드 중단 시 NULL → 지연 측정 불가, replica 사용 안함
+            return float(lag) if lag is not None else None
+
+
+replica_monitor = ReplicaMonitor()
 
 
 class MasterSlaveRouter:
     def __init__(self):
-        self.replica_enabled = self._check_replica_available()
-
-    @staticmethod
-    def _check_replica_available():
-        """replica 데이터베이스 연결 가능 여부 확인"""
-        # Kubernetes 환경이 아니면 replica 사용 안함
-        if 'KUBERNETES_SERVICE_HOST' not in os.environ:
-            return False
-
-        # replica 연결 가능 여부 확인 (캐싱됨)
-        try:
-            connection = connections['replica']
-            connection.ensure_connection()
-            return True
-        except (OperationalError, KeyError):
-            # replica 연결 실패 시 default 사용
-            return False
+        self.monitor = replica_monitor
 
     def db_for_read(self, model, **hints):
-        return 'replica' if self.replica_enabled else 'default'
+        if _primary_pinned.get() or connections[PRIMARY_DB].in_atomic_block:
+            # 쓰기 이후 읽기, 트랜잭션 내부 읽기는 primary 에서 처리
+            return PRIMARY_DB
+        return REPLICA_DB if self.monitor.is_available() else PRIMARY_DB
 
     @staticmethod
     def db_for_write(model, **hints):
-        # 쓰기 작업은 default 데이터베이스에서만 처리
-        return 'default'
+        # 쓰기 작업은 default 데이터베이스에서만 처리, 이후 읽기는 primary 로 고정
+        _primary_pinned.set(True)
+        _primary_written.set(True)
+        return PRIMARY_DB
 
     @staticmethod
     def allow_relation(obj1, obj2, **hints):
-        db_list = ['default', 'replica']
+        db_list = [PRIMARY_DB, REPLICA_DB]
         if obj1._state.db in db_list and obj2._state.db in db_list:
             return True
         return None
@@ -41,4 +148,27 @@ class MasterSlaveRouter:
     @staticmethod
     def allow_migrate(db, app_label, model_name=None, **hints):
         # default 데이터베이스에서만 마이그레이션 수행
-        return db == 'default'
+        return db == PRIMARY_DB
+
+
+class PrimaryPinMiddleware:
+    """
+    read-your-writes 보장 미들웨어
+
+    쓰기가 발생한 요청 응답에 고정 쿠키를 설정하여, 같은 클라이언트의 후속 요청(저장 직후 새로고침 등)이
+    복제 지연 동안 primary 에서 읽도록 한다. 변경 메서드(POST 등) 요청은 처음부터 primary 로 고정한다.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        pinned = PRIMARY_PIN_COOKIE in request.COOKIES or request.method not in ('GET', 'HEAD', 'OPTIONS')
+        reset_primary_pin(pinned)
+        response = self.get_response(request)
+        if _primary_written.get():
+            # 교차 사이트·서브도메인 SPA 의 API 요청에도 전송되도록 세션 쿠키와 같은 속성 사용
+            response.set_cookie(PRIMARY_PIN_COOKIE, '1', max_age=getattr(settings, 'DATABASE_PRIMARY_PIN_SECONDS', 10),
+                                domain=settings.SESSION_COOKIE_DOMAIN or None, secure=settings.SESSION_COOKIE_SECURE,
+                                httponly=True, samesite=settings.SESSION_COOKIE_SAMESITE)
+        return response
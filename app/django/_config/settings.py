@@ -107,6 +107,7 @@ INSTALLED_APPS += [  # app
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    '_config.database_router.PrimaryPinMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -135,6 +136,7 @@ TEMPLATES = [
 ]
 
 WSGI_APPLICATION = '_config.wsgi.application'
+ASGI_APPLICATION = '_config.asgi.application'
 
 # Database
 # https://docs.djangoproject.com/en/4.0/ref/settings/#databases
@@ -193,6 +195,9 @@ DATABASES = {
 }
 
 DATABASE_ROUTERS = ["_config.database_router.MasterSlaveRouter"]
+DATABASE_REPLICA_MAX_LAG = config('DATABASE_REPLICA_MAX_LAG', default=5, cast=float)  # 초과 시 primary 에서 읽기 (초)
+DATABASE_REPLICA_CHECK_INTERVAL = config('DATABASE_REPLICA_CHECK_INTERVAL', default=10, cast=float)  # 복제 상태 측정 주기 (초)
+DATABASE_PRIMARY_PIN_SECONDS = config('DATABASE_PRIMARY_PIN_SECONDS', default=10, cast=int)  # 쓰기 후 primary 고정 시간 (초)
 
 # Password validation
 # https://docs.djangoproject.com/en/4.0/ref/settings/#auth-password-validators
@@ -411,6 +416,18 @@ CELERY_WORKER_PREFETCH_MULTIPLIER = 1
 CELERY_TASK_ACKS_LATE = True
 CELERY_WORKER_MAX_TASKS_PER_CHILD = 1000
 
+# celery beat 실행 시 주기 작업 (각 작업은 처리할 항목이 남아 있으면 자체적으로 재예약)
+CELERY_BEAT_SCHEDULE = {
+    'reconcile-message-send-history': {
+        'task': 'notice.tasks.reconcile_message_send_history',
+        'schedule': 5 * 60,  # 5분
+    },
+    'drain-slack-outbox': {
+        'task': 'accounts.tasks.drain_slack_outbox_task',
+        'schedule': 60,  # 1분
+    },
+}
+
 APP_ORDER = [
     'company',
     'approval',
@@ -4,30 +4,57 @@ Excel Export Common Mixins
 공통 Excel 내보내기 기능을 제공하는 믹스인 클래스들
 """
 import datetime
-import io
-from urllib.parse import quote
+import tempfile
 
 import xlsxwriter
-from django.http import HttpResponse
+from django.http import FileResponse
 from django.views.generic import View
 
 from project.models import Project
 
 TODAY = datetime.date.today().strftime('%Y-%m-%d')
 
+XLSX_CONTENT_TYPE = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+EXPORT_CHUNK_SIZE = 2000  # 쿼리셋 iterator 청크 크기
+SPOOL_MAX_SIZE = 8 * 1024 * 1024  # 이 크기를 넘는 출력 파일은 디스크 임시 파일로 전환
+
 
 class ExcelExportMixin(View):
     """Excel 내보내기 공통 기능 믹스인"""
 
     @staticmethod
-    def create_workbook(sheet_name=None, in_memory=False, default_row=20):
-        """워크북과 워크시트 생성"""
-        output = io.BytesIO()
-        workbook = xlsxwriter.Workbook(output, {'in_memory': in_memory})
+    def create_workbook(sheet_name=None, in_memory=False, default_row=20, constant_memory=False):
+        """
+        워크북과 워크시트 생성
+
+        출력은 SpooledTemporaryFile 에 기록되어 SPOOL_MAX_SIZE 를 넘으면 디스크로 전환된다.
+        constant_memory=True 이면 행을 작성 순서대로 임시 파일에 흘려 보내 메모리 사용량이 일정하다.
+        단, 이미 지나간 행에는 다시 쓸 수 없으므로 (여러 행 병합 헤더, 상단 합계 행 등 불가)
+        위에서 아래로 한 번에 작성하는 목록형 내보내기에서만 사용한다.
+        """
+        output = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE)
+        workbook = xlsxwriter.Workbook(output, {'in_memory': in_memory, 'constant_memory': constant_memory})
         worksheet = workbook.add_worksheet(sheet_name or '데이터')
         worksheet.set_default_row(default_row)
         return output, workbook, worksheet
 
+    @staticmethod
+    def iterate(queryset, chunk_size=EXPORT_CHUNK_SIZE):
+        """쿼리셋을 결과 캐시 없이 chunk_size 단위로 읽는 iterator"""
+        return queryset.iterator(chunk_size=chunk_size)
+
+    @staticmethod
+    def iter_chunks(queryset, chunk_size=EXPORT_CHUNK_SIZE):
+        """쿼리셋을 chunk_size 개씩 묶은 목록으로 반환 (청크 단위 수동 prefetch 용)"""
+        chunk = []
+        for obj in queryset.iterator(chunk_size=chunk_size):
+            chunk.append(obj)
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
     @staticmethod
     def create_title_format(workbook, font_size=18):
         """제목 형식 생성"""
@@ -190,17 +217,12 @@ class ExcelExportMixin(View):
 
     @staticmethod
     def create_response(output, workbook, filename):
-        """HTTP 응답 생성"""
+        """워크북을 닫고 임시 파일을 FileResponse 로 스트리밍"""
         workbook.close()
         output.seek(0)
-
-        response = HttpResponse(output.read(),
-                                content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet')
-        # RFC 5987: filename*=UTF-8''encoded_filename for better browser compatibility
-        encoded_filename = quote(f'{filename}.xlsx')
-        response['Content-Disposition'] = \
-            f"attachment; filename=\"{filename}.xlsx\"; filename*=UTF-8''{encoded_filename}"
-        return response
+        # FileResponse 가 RFC 5987 filename*=UTF-8'' 헤더를 생성하고 전송 후 파일을 닫음
+        return FileResponse(output, as_attachment=True, filename=f'{filename}.xlsx',
+                            content_type=XLSX_CONTENT_TYPE)
 
 
 class ProjectFilterMixin:
@@ -361,84 +383,3 @@ class AdvancedExcelMixin:
         """컬럼 너비 일괄 설정"""
         for col_num, width in enumerate(widths):
             worksheet.set_column(col_num, col_num, width)
-
-
-class XlwtStyleMixin:
-    """xlwt 라이브러리용 스타일 생성 믹스인"""
-
-    @staticmethod
-    def create_xlwt_styles():
-        """
-        xlwt용 재사용 가능한 스타일 세트 생성
-        xlwt는 최대 4094개의 스타일만 지원하므로 미리 생성하여 재사용
-
-        Returns:
-            dict: 스타일 이름을 키로 하는 xlwt.XFStyle 객체 딕셔너리
-        """
-        import xlwt
-
-        # 기본 스타일 (왼쪽 정렬)
-        style_default = xlwt.XFStyle()
-        style_default.borders.left = 1
-        style_default.borders.right = 1
-        style_default.borders.top = 1
-        style_default.borders.bottom = 1
-        style_default.alignment.vert = style_default.alignment.VERT_CENTER
-
-        # 가운데 정렬 스타일
-        style_center = xlwt.XFStyle()
-        style_center.borders.left = 1
-        style_center.borders.right = 1
-        style_center.borders.top = 1
-        style_center.borders.bottom = 1
-        style_center.alignment.vert = style_center.alignment.VERT_CENTER
-        style_center.alignment.horz = style_center.alignment.HORZ_CENTER
-
-        # 오른쪽 정렬 스타일
-        style_right = xlwt.XFStyle()
-        style_right.borders.left = 1
-        style_right.borders.right = 1
-        style_right.borders.top = 1
-        style_right.borders.bottom = 1
-        style_right.alignment.vert = style_right.alignment.VERT_CENTER
-        style_right.alignment.horz = style_right.alignment.HORZ_RIGHT
-
-        # 날짜 스타일 (가운데 정렬 + 날짜 포맷)
-        style_date = xlwt.XFStyle()
-        style_date.borders.left = 1
-        style_date.borders.right = 1
-        style_date.borders.top = 1
-        style_date.borders.bottom = 1
-        style_date.alignment.vert = style_date.alignment.VERT_CENTER
-        style_date.alignment.horz = style_date.alignment.HORZ_CENTER
-        style_date.num_format_str = 'yyyy-mm-dd'
-
-        # 금액 스타일 (숫자 포맷)
-        style_amount = xlwt.XFStyle()
-        style_amount.borders.left = 1
-        style_amount.borders.right = 1
-        style_amount.borders.top = 1
-        style_amount.borders.bottom = 1
-        style_amount.alignment.vert = style_amount.alignment.VERT_CENTER
-        style_amount.num_format_str = '#,##'
-
-        # 헤더 스타일 (굵게 + 회색 배경 + 가운데 정렬)
-        style_header = xlwt.XFStyle()
-        style_header.font.bold = True
-        style_header.borders.left = 1
-        style_header.borders.right = 1
-        style_header.borders.top = 1
-        style_header.borders.bottom = 1
-        style_header.alignment.vert = style_header.alignment.VERT_CENTER
-        style_header.alignment.horz = style_header.alignment.HORZ_CENTER
-        style_header.pattern.pattern = xlwt.Pattern.SOLID_PATTERN
-        style_header.pattern.pattern_fore_colour = 22  # 회색
-
-        return {
-            'default': style_default,
-            'center': style_center,
-            'right': style_right,
-            'date': style_date,
-            'amount': style_amount,
-            'header': style_header,
-        }
@@ -1,3 +1,22 @@
-from django.test import TestCase
+import io
 
-# Create your tests here.
+from django.urls import reverse
+from openpyxl import load_workbook
+from rest_framework import status
+
+from payment.tests import PaymentTestCaseBase
+
+
+class TransactionExcelExportTests(PaymentTestCaseBase):
+    def test_project_transactions_stream_as_xlsx(self):
+        response = self.client.get(reverse('excel:pro-trans'), {'project': self.project.pk, 'filename': '입출금'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        self.assertIn("filename*=utf-8''", response['Content-Disposition'])
+
+        sheet = load_workbook(io.BytesIO(b''.join(response.streaming_content))).active
+        rows = list(sheet.iter_rows(values_only=True))
+        self.assertEqual(rows[1][0], '일시')
+        self.assertEqual(rows[2][0], '2026-01-01')
+        self.assertEqual(rows[2][3], '1차 계약금 납부')
+        self.assertEqual(rows[2][8], 30000000)
@@ -1,3 +1,12 @@
 from django.contrib import admin
 
-# Register your models here.
+from .models import PdfExportJob
+
+
+@admin.register(PdfExportJob)
+class PdfExportJobAdmin(admin.ModelAdmin):
+    list_display = ('id', 'export_type', 'status', 'processed_records', 'total_records',
+                    'filename', 'creator', 'created_at', 'completed_at')
+    list_filter = ('export_type', 'status', 'created_at')
+    search_fields = ('task_id', 'filename', 'creator__username', 'error_message')
+    readonly_fields = ('task_id', 'created_at', 'started_at', 'completed_at')
@@ -0,0 +1,41 @@
+# Generated by Django 6.0.7 on 2026-10-18 05:51
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PdfExportJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('export_type', models.CharField(choices=[('bill', '대금납부 고지서'), ('ledger_payment', '납부 확인서'), ('ledger_daily_late_fee', '일자별 연체료'), ('ledger_calculation', '선납할인/연체가산 내역서')], max_length=30, verbose_name='출력 유형')),
+                ('params', models.JSONField(blank=True, default=dict, verbose_name='요청 파라미터')),
+                ('task_id', models.CharField(blank=True, max_length=255, verbose_name='태스크 ID')),
+                ('status', models.CharField(choices=[('pending', '대기 중'), ('processing', '처리 중'), ('completed', '완료'), ('failed', '실패')], default='pending', max_length=20, verbose_name='상태')),
+                ('total_records', models.IntegerField(default=0, verbose_name='전체 레코드')),
+                ('processed_records', models.IntegerField(default=0, verbose_name='처리된 레코드')),
+                ('error_message', models.TextField(blank=True, verbose_name='오류 메시지')),
+                ('file', models.FileField(blank=True, null=True, upload_to='pdf_exports/%Y/%m/', verbose_name='결과 파일')),
+                ('filename', models.CharField(blank=True, max_length=255, verbose_name='다운로드 파일명')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='생성일시')),
+                ('started_at', models.DateTimeField(blank=True, null=True, verbose_name='시작일시')),
+                ('completed_at', models.DateTimeField(blank=True, null=True, verbose_name='완료일시')),
+                ('creator', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='pdf_export_jobs', to=settings.AUTH_USER_MODEL, verbose_name='생성자')),
+            ],
+            options={
+                'verbose_name': 'PDF 생성 작업',
+                'verbose_name_plural': 'PDF 생성 작업',
+                'ordering': ['-created_at'],
+            },
+        ),
+    ]
@@ -3,9 +3,9 @@ PDF Export Common Mixins
 
 공통 PDF 내보내기 기능을 제공하는 믹스인 클래스들
 """
+from abc import ABCMeta, abstractmethod
 from datetime import date, datetime
 
-from django.core.files.storage import FileSystemStorage
 from django.http import HttpResponse
 from django.template.loader import render_to_string
 from django.views.generic import View
@@ -23,19 +23,22 @@ class PdfExportMixin(View):
     """PDF 내보내기 공통 기능 믹스인"""
 
     @staticmethod
-    def create_pdf_response(template_name, context, filename):
-        """PDF 응답 생성"""
+    def render_pdf(template_name, context):
+        """템플릿을 PDF 바이트로 렌더링 (요청별 메모리 버퍼 사용 - 공유 임시 파일 미사용)"""
         html_string = render_to_string(template_name, context)
-        html = HTML(string=html_string)
-        html.write_pdf(target='/tmp/mypdf.pdf')
+        return HTML(string=html_string).write_pdf()
 
+    @staticmethod
+    def pdf_response(pdf, filename):
+        """PDF 다운로드 응답 생성"""
         encoded_filename = quote(f"{filename}.pdf" if not filename.lower().endswith('.pdf') else filename)
+        response = HttpResponse(pdf, content_type='application/pdf')
+        response['Content-Disposition'] = f"attachment; filename*=UTF-8''{encoded_filename}"
+        return response
 
-        fs = FileSystemStorage('/tmp')
-        with fs.open('mypdf.pdf') as pdf:
-            response = HttpResponse(pdf, content_type='application/pdf')
-            response['Content-Disposition'] = f"attachment; filename*=UTF-8''{encoded_filename}"
-            return response
+    def create_pdf_response(self, template_name, context, filename):
+        """PDF 응답 생성"""
+        return self.pdf_response(self.render_pdf(template_name, context), filename)
 
     @staticmethod
     def get_base_context(**kwargs):
@@ -47,6 +50,52 @@ class PdfExportMixin(View):
         return context
 
 
+class PdfRenderView(PdfExportMixin, metaclass=ABCMeta):
+    """요청 파라미터만으로 PDF를 생성하는 내보내기 뷰 (동기 GET 과 백그라운드 PDF 작업 공용)"""
+
+    @abstractmethod
+    def render(self, params, progress=None):
+        """
+        요청 파라미터로 PDF 생성 (요청 객체를 사용하지 않음)
+        :param params: 요청 파라미터 (QueryDict 또는 dict)
+        :param progress: 진행률 콜백 progress(processed, total) - 선택
+        :return (pdf bytes, 파일명):
+        """
+
+    def get(self, request, *args, **kwargs):
+        pdf, filename = self.render(request.GET)
+        return self.pdf_response(pdf, filename)
+
+
+class ChunkedPdfRenderView(PdfRenderView):
+    """
+    대상 건(items)을 청크 단위로 렌더링할 수 있는 PDF 내보내기 뷰
+
+    요청 스레드에서는 전체 대상 건을 한 번에 렌더링하고,
+    백그라운드 PDF 작업(_pdf.tasks)은 청크별 Celery 태스크로 병렬 렌더링 후 순서대로 병합한다.
+    """
+    chunk_size = 30
+
+    @abstractmethod
+    def get_items(self, params):
+        """요청 파라미터의 대상 건 ID 리스트"""
+
+    @abstractmethod
+    def get_filename(self, params):
+        """다운로드 파일명 (확장자 제외)"""
+
+    @abstractmethod
+    def render_chunk(self, params, items, progress=None):
+        """대상 건 목록을 하나의 PDF 바이트로 렌더링"""
+
+    def get_chunks(self, params):
+        items = self.get_items(params)
+        return [items[i:i + self.chunk_size] for i in range(0, len(items), self.chunk_size)]
+
+    def render(self, params, progress=None):
+        return self.render_chunk(params, self.get_items(params), progress), self.get_filename(params)
+
+
 class ContractPdfMixin:
     """계약 관련 PDF 공통 기능"""
 
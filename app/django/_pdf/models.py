@@ -1,3 +1,71 @@
+from django.conf import settings
 from django.db import models
 
-# Create your models here.
+
+class PdfExportJob(models.Model):
+    """백그라운드 PDF 생성 작업 추적"""
+    PENDING = 'pending'
+    PROCESSING = 'processing'
+    COMPLETED = 'completed'
+    FAILED = 'failed'
+
+    STATUS_CHOICES = [
+        (PENDING, '대기 중'),
+        (PROCESSING, '처리 중'),
+        (COMPLETED, '완료'),
+        (FAILED, '실패'),
+    ]
+
+    EXPORT_TYPE_CHOICES = [
+        ('bill', '대금납부 고지서'),
+        ('ledger_payment', '납부 확인서'),
+        ('ledger_daily_late_fee', '일자별 연체료'),
+        ('ledger_calculation', '선납할인/연체가산 내역서'),
+    ]
+
+    export_type = models.CharField('출력 유형', max_length=30, choices=EXPORT_TYPE_CHOICES)
+    params = models.JSONField('요청 파라미터', default=dict, blank=True)
+    task_id = models.CharField('태스크 ID', max_length=255, blank=True)
+    status = models.CharField('상태', max_length=20, choices=STATUS_CHOICES, default=PENDING)
+    total_records = models.IntegerField('전체 레코드', default=0)
+    processed_records = models.IntegerField('처리된 레코드', default=0)
+    error_message = models.TextField('오류 메시지', blank=True)
+    file = models.FileField('결과 파일', upload_to='pdf_exports/%Y/%m/', blank=True, null=True)
+    filename = models.CharField('다운로드 파일명', max_length=255, blank=True)
+    creator = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True,
+                                verbose_name='생성자', related_name='pdf_export_jobs')
+    created_at = models.DateTimeField('생성일시', auto_now_add=True)
+    started_at = models.DateTimeField('시작일시', blank=True, null=True)
+    completed_at = models.DateTimeField('완료일시', blank=True, null=True)
+
+    class Meta:
+        ordering = ['-created_at']
+        verbose_name = 'PDF 생성 작업'
+        verbose_name_plural = 'PDF 생성 작업'
+
+    def __str__(self):
+        return f'{self.get_export_type_display()} ({self.get_status_display()})'
+
+    @property
+    def progress(self):
+        """진행률 계산 (0-100)"""
+        if self.total_records > 0:
+            return int((self.processed_records / self.total_records) * 100)
+        return 0
+
+    @property
+    def duration(self):
+        """작업 소요 시간 계산"""
+        if self.started_at and self.completed_at:
+            return self.completed_at - self.started_at
+        return None
+
+    def update_progress(self, processed: int, total: int, status: str = None):
+        """진행률 업데이트"""
+        self.processed_records = processed
+        self.total_records = total
+        update_fields = ['processed_records', 'total_records']
+        if status:
+            self.status = status
+            update_fields.append('status')
+        self.save(update_fields=update_fields)
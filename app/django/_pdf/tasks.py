@@ -0,0 +1,150 @@
+import logging
+import uuid
+
+from celery import chord, shared_task
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db.models import F
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from .mixins import ChunkedPdfRenderView
+from .models import PdfExportJob
+from .utils import merge_pdfs
+
+logger = logging.getLogger(__name__)
+
+# 출력 유형별 PDF 뷰 (PdfRenderView.render 구현)
+PDF_EXPORT_VIEWS = {
+    'bill': 'notice.exports.pdf.PdfExportBill',
+    'ledger_payment': 'payment.exports.pdf.PdfExportLedgerPayment',
+    'ledger_daily_late_fee': 'payment.exports.pdf.PdfExportLedgerDailyLateFee',
+    'ledger_calculation': 'payment.exports.pdf.PdfExportLedgerCalculation',
+}
+
+PROGRESS_UPDATE_STEPS = 50  # 진행률 저장 횟수 상한 (레코드마다 저장하지 않음)
+
+CHUNK_FILE_PATH = 'pdf_exports/chunks/{job_id}/{index}.pdf'  # 청크별 렌더링 결과 (병합 후 삭제)
+
+
+def get_export_view(export_type):
+    return import_string(PDF_EXPORT_VIEWS[export_type])()
+
+
+def _complete_job(job, pdf, filename):
+    job.filename = f'{filename}.pdf'
+    job.file.save(f'{uuid.uuid4().hex}.pdf', ContentFile(pdf), save=False)
+    job.status = PdfExportJob.COMPLETED
+    job.completed_at = timezone.now()
+    job.save(update_fields=['filename', 'file', 'status', 'completed_at'])
+
+
+def _fail_job(job_id, error):
+    logger.error(f"PDF 생성 작업 실패 (job_id={job_id}): {error}")
+    PdfExportJob.objects.filter(pk=job_id).exclude(status=PdfExportJob.FAILED).update(
+        status=PdfExportJob.FAILED, error_message=str(error), completed_at=timezone.now())
+
+
+def _delete_chunk_files(job_id, count):
+    for index in range(count):
+        name = CHUNK_FILE_PATH.format(job_id=job_id, index=index)
+        if default_storage.exists(name):
+            default_storage.delete(name)
+
+
+def build_chunk_workflow(job, chunks):
+    """청크별 렌더링 태스크(group)를 병렬 실행하고 모두 끝나면 순서대로 병합하는 chord"""
+    header = [render_pdf_chunk.s(job.pk, index, chunk) for index, chunk in enumerate(chunks)]
+    return chord(header, merge_pdf_chunks.s(job.pk))
+
+
+@shared_task(bind=True)
+def generate_pdf_export(self, job_id: int) -> dict:
+    """
+    PDF 생성 작업 실행 후 결과 파일을 미디어 스토리지에 저장
+
+    청크 렌더링을 지원하는 뷰(ChunkedPdfRenderView)는 청크가 여러 개이면 청크별 태스크로
+    Celery 워커에 분산 렌더링하고(chord), 병합 태스크가 결과 파일을 저장한다.
+
+    Args:
+        job_id: PdfExportJob ID
+
+    Returns:
+        dict: 처리 결과
+    """
+    job = PdfExportJob.objects.get(pk=job_id)
+    job.task_id = self.request.id or job.task_id
+    job.status = PdfExportJob.PROCESSING
+    job.started_at = timezone.now()
+    job.save(update_fields=['task_id', 'status', 'started_at'])
+
+    def progress(processed, total):
+        step = max(1, total // PROGRESS_UPDATE_STEPS)
+        if processed == total or processed % step == 0:
+            job.update_progress(processed, total)
+
+    try:
+        view = get_export_view(job.export_type)
+        if isinstance(view, ChunkedPdfRenderView):
+            chunks = view.get_chunks(job.params)
+            if len(chunks) > 1:
+                job.update_progress(0, sum(len(chunk) for chunk in chunks))
+                build_chunk_workflow(job, chunks).apply_async()
+                return {'success': True, 'job_id': job_id, 'chunks': len(chunks)}
+
+        pdf, filename = view.render(job.params, progress=progress)
+        _complete_job(job, pdf, filename)
+    except Exception as e:
+        _fail_job(job_id, e)
+        return {'success': False, 'job_id': job_id, 'error': str(e)}
+
+    return {'success': True, 'job_id': job_id, 'file': job.file.name}
+
+
+@shared_task(bind=True)
+def render_pdf_chunk(self, job_id: int, index: int, items: list) -> str:
+    """
+    청크(대상 건 목록) 하나를 렌더링하여 임시 청크 파일로 저장
+
+    Returns:
+        str: 저장된 청크 파일 경로
+    """
+    job = PdfExportJob.objects.get(pk=job_id)
+    if job.status == PdfExportJob.FAILED:
+        raise RuntimeError(f'PDF 생성 작업이 이미 실패했습니다. (job_id={job_id})')
+
+    view = get_export_view(job.export_type)
+    try:
+        pdf = view.render_chunk(job.params, items)
+    except Exception as e:
+        # 병합 태스크는 실행되지 않으므로 작업 실패 처리 및 먼저 끝난 청크 파일 정리
+        _fail_job(job_id, e)
+        _delete_chunk_files(job_id, len(view.get_chunks(job.params)))
+        raise
+
+    name = CHUNK_FILE_PATH.format(job_id=job_id, index=index)
+    if default_storage.exists(name):  # 재실행 시 이전 청크 파일 교체
+        default_storage.delete(name)
+    name = default_storage.save(name, ContentFile(pdf))
+    PdfExportJob.objects.filter(pk=job_id).update(processed_records=F('processed_records') + len(items))
+    return name
+
+
+@shared_task(bind=True)
+def merge_pdf_chunks(self, chunk_files: list, job_id: int) -> dict:
+    """청크 파일을 순서대로 병합하여 결과 파일 저장 후 청크 파일 삭제"""
+    job = PdfExportJob.objects.get(pk=job_id)
+    try:
+        pdfs = []
+        for name in chunk_files:
+            with default_storage.open(name, 'rb') as chunk:
+                pdfs.append(chunk.read())
+        _complete_job(job, merge_pdfs(pdfs), get_export_view(job.export_type).get_filename(job.params))
+    except Exception as e:
+        _fail_job(job_id, e)
+        return {'success': False, 'job_id': job_id, 'error': str(e)}
+    finally:
+        for name in chunk_files:
+            default_storage.delete(name)
+
+    return {'success': True, 'job_id': job_id, 'file': job.file.name}
@@ -1,3 +1,124 @@
-from django.test import TestCase
+import io
 
-# Create your tests here.
+from django.contrib.auth import get_user_model
+from django.core.files.storage import default_storage
+from django.urls import reverse
+from pypdf import PdfReader, PdfWriter
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from _pdf.mixins import ChunkedPdfRenderView, PdfRenderView
+from _pdf.models import PdfExportJob
+from _pdf.tasks import CHUNK_FILE_PATH, PDF_EXPORT_VIEWS, build_chunk_workflow, generate_pdf_export
+
+User = get_user_model()
+
+
+class BlankPagePdfView(ChunkedPdfRenderView):
+    """대상 건마다 빈 페이지 1장을 렌더링하는 테스트용 청크 PDF 뷰"""
+    chunk_size = 2
+
+    def get_items(self, params):
+        return params.get('seq').split('-')
+
+    def get_filename(self, params):
+        return 'blank'
+
+    def render_chunk(self, params, items, progress=None):
+        writer = PdfWriter()
+        for processed, _ in enumerate(items, 1):
+            writer.add_blank_page(width=72, height=72)
+            if progress:
+                progress(processed, len(items))
+        buffer = io.BytesIO()
+        writer.write(buffer)
+        return buffer.getvalue()
+
+
+def page_count(pdf):
+    return len(PdfReader(io.BytesIO(pdf)).pages)
+
+
+class PdfRenderViewTests(APITestCase):
+    def test_render_must_be_implemented(self):
+        class IncompleteView(PdfRenderView):
+            pass
+
+        with self.assertRaises(TypeError):
+            IncompleteView()
+
+
+class ChunkedPdfExportTests(APITestCase):
+    def setUp(self):
+        PDF_EXPORT_VIEWS['test_blank'] = f'{__name__}.BlankPagePdfView'
+        self.addCleanup(PDF_EXPORT_VIEWS.pop, 'test_blank')
+        self.params = {'seq': '1-2-3-4-5'}
+
+    def test_request_render_is_inline_single_document(self):
+        reported = []
+        pdf, filename = BlankPagePdfView().render(self.params, progress=lambda n, total: reported.append((n, total)))
+        self.assertEqual(page_count(pdf), 5)
+        self.assertEqual(filename, 'blank')
+        self.assertEqual(reported[-1], (5, 5))
+
+    def test_chunks_split_by_chunk_size(self):
+        self.assertEqual(BlankPagePdfView().get_chunks(self.params), [['1', '2'], ['3', '4'], ['5']])
+
+    def test_chunk_workflow_renders_chunks_and_merges_in_order(self):
+        job = PdfExportJob.objects.create(export_type='test_blank', params=self.params,
+                                          status=PdfExportJob.PROCESSING, total_records=5)
+        chunks = BlankPagePdfView().get_chunks(self.params)
+        build_chunk_workflow(job, chunks).apply()
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, PdfExportJob.COMPLETED)
+        self.assertEqual(job.processed_records, 5)
+        self.assertEqual(job.filename, 'blank.pdf')
+        with job.file.open('rb') as result:
+            self.assertEqual(page_count(result.read()), 5)
+        for index in range(len(chunks)):
+            self.assertFalse(default_storage.exists(CHUNK_FILE_PATH.format(job_id=job.pk, index=index)))
+        job.file.delete(save=False)
+
+    def test_single_chunk_job_renders_inline(self):
+        job = PdfExportJob.objects.create(export_type='test_blank', params={'seq': '1-2'})
+        result = generate_pdf_export.apply(args=[job.pk]).get()
+
+        self.assertTrue(result['success'])
+        self.assertNotIn('chunks', result)
+        job.refresh_from_db()
+        self.assertEqual(job.status, PdfExportJob.COMPLETED)
+        job.file.delete(save=False)
+
+
+class PdfExportJobAPITests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_superuser(
+            username='testadmin',
+            email='admin@test.com',
+            password='password123'
+        )
+        self.client.force_authenticate(user=self.user)
+
+    def test_create_job_is_queued_for_requesting_user(self):
+        url = reverse('api:pdf-export-job-list')
+        response = self.client.post(url, {
+            'export_type': 'ledger_payment',
+            'params': {'contract': 1, 'pub_date': '2026-01-31'}
+        }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        job = PdfExportJob.objects.get(pk=response.data['pk'])
+        self.assertEqual(job.status, PdfExportJob.PENDING)
+        self.assertEqual(job.creator, self.user)
+        self.assertEqual(job.params, {'contract': '1', 'pub_date': '2026-01-31'})
+
+    def test_download_before_completion_returns_404(self):
+        job = PdfExportJob.objects.create(export_type='bill', params={'project': '1', 'seq': '1'}, creator=self.user)
+        url = reverse('api:pdf-export-job-download', args=[job.pk])
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_unknown_export_type_is_rejected(self):
+        url = reverse('api:pdf-export-job-list')
+        response = self.client.post(url, {'export_type': 'unknown', 'params': {}}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
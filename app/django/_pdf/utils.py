@@ -1,3 +1,4 @@
+import io
 from datetime import date, timedelta
 from itertools import accumulate
 
@@ -310,3 +311,20 @@ def get_paid(contract: Contract, simple_orders, pub_date, **kwargs):
     calc_sums = (penalty_sum, discount_sum, ord_i_list)
 
     return paid_dict_list, paid_sum_total, calc_sums
+
+
+def merge_pdfs(pdfs):
+    """
+    :: 여러 PDF 바이트를 순서대로 하나의 PDF로 병합
+    :param pdfs: PDF bytes 리스트
+    :return pdf bytes:
+    """
+    if len(pdfs) == 1:
+        return pdfs[0]
+    from pypdf import PdfWriter
+    writer = PdfWriter()
+    for pdf in pdfs:
+        writer.append(io.BytesIO(pdf))
+    buffer = io.BytesIO()
+    writer.write(buffer)
+    return buffer.getvalue()
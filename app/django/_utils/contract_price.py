@@ -1,4 +1,5 @@
 import logging
+from collections import Counter, defaultdict
 from datetime import timedelta
 from decimal import Decimal
 
@@ -146,6 +147,11 @@ def get_contract_price(contract, houseunit=None, is_set=False):
     return 0, 0, 0, 0
 
 
+def build_payment_dependency_key(project_id, type_sort, order_group_id, unit_type_id):
+    """ContractPrice 납부금액 캐시 의존성 키 (프로젝트:타입종류:차수:타입) - 납부회차/계약금 변경 시 무효화 범위 식별"""
+    return f'{project_id}:{type_sort}:{order_group_id}:{unit_type_id}'
+
+
 def get_fixed_payment_amount(installment_order):
     return installment_order.pay_amt if installment_order and installment_order.pay_amt else None
 
@@ -260,6 +266,230 @@ def get_contract_payment_plan(contract):
         return []
 
 
+class ProjectPaymentPlanCalculator:
+    """
+    프로젝트 단위 일괄 납부 계획 계산기
+
+    SalesPriceByGT, PaymentPerInstallment, DownPayment, ProjectIncBudget, InstallmentPaymentOrder(제외 차수 포함)를
+    프로젝트당 한 번씩만 조회해 두고, 각 계약의 납부 계획을 추가 쿼리 없이 메모리에서 계산한다.
+    금액 산정 규칙은 get_payment_amount / get_contract_payment_plan 과 동일하며,
+    잔금은 계약별 비잔금 회차 합계를 한 번만 구해 재사용한다.
+
+    계약 객체는 contractprice, order_group, unit_type, key_unit__houseunit 을 select_related 로 미리 조회해야
+    추가 쿼리가 발생하지 않는다. (납부기한 계산 시 contractor 포함)
+    """
+
+    def __init__(self, project):
+        self.project = project
+
+        installments = list(InstallmentPaymentOrder.objects.filter(project=project).order_by('pay_code', 'pay_time'))
+        self.installments = installments
+        self.installments_by_type = defaultdict(list)
+        for inst in installments:
+            self.installments_by_type[inst.type_sort].append(inst)
+
+        self.excluded_order_groups = defaultdict(set)
+        through = InstallmentPaymentOrder.excluded_order_groups.through
+        for inst_id, og_id in through.objects.filter(installmentpaymentorder__project=project) \
+                .values_list('installmentpaymentorder_id', 'ordergroup_id'):
+            self.excluded_order_groups[inst_id].add(og_id)
+
+        self.sales_prices = {
+            (sp.order_group_id, sp.unit_type_id, sp.unit_floor_type_id): sp
+            for sp in SalesPriceByGT.objects.filter(project=project)
+        }
+
+        self.manuals = defaultdict(dict)
+        for sp_id, pay_order_id, amount in PaymentPerInstallment.objects.filter(sales_price__project=project) \
+                .values_list('sales_price_id', 'pay_order_id', 'amount'):
+            self.manuals[sp_id][pay_order_id] = amount
+
+        self.down_payments = {
+            (og_id, ut_id): amount for og_id, ut_id, amount in
+            DownPayment.objects.filter(project=project).values_list('order_group_id', 'unit_type_id', 'payment_amount')
+        }
+
+        # ProjectIncBudget.objects.get() 과 동일하게 (차수, 타입)별 단일 행인 경우에만 사용
+        budgets = list(ProjectIncBudget.objects.filter(project=project)
+                       .values_list('order_group_id', 'unit_type_id', 'average_price'))
+        budget_counts = Counter((og_id, ut_id) for og_id, ut_id, _ in budgets)
+        self.budget_prices = {(og_id, ut_id): price for og_id, ut_id, price in budgets
+                              if budget_counts[(og_id, ut_id)] == 1}
+
+    # -- 기초 데이터 -------------------------------------------------------------
+
+    def get_installments(self, contract):
+        """계약 타입/차수에 적용되는 납부 회차 (pay_code, pay_time 순)"""
+        og_id = contract.order_group.pk if contract.order_group else None
+        return [inst for inst in self.installments_by_type.get(contract.unit_type.sort, [])
+                if og_id not in self.excluded_order_groups.get(inst.pk, ())]
+
+    def get_sales_price(self, contract, houseunit=None):
+        if houseunit is None:
+            if not getattr(contract, 'key_unit', None): return None
+            try:
+                houseunit = contract.key_unit.houseunit
+            except AttributeError:
+                return None
+        if not houseunit or not hasattr(houseunit, 'floor_type'): return None
+        og_id = contract.order_group.pk if contract.order_group else None
+        return self.sales_prices.get((og_id, contract.unit_type.pk, houseunit.floor_type_id))
+
+    def resolve_contract_price(self, contract, sales_price=None):
+        """get_contract_price 와 동일한 우선순위의 (공급가, 출처)"""
+        try:
+            cp = contract.contractprice
+            return cp.price or 0, 'contract'
+        except AttributeError:
+            pass
+        if sales_price: return sales_price.price or 0, 'sales_price'
+        og_id = contract.order_group.pk if contract.order_group else None
+        budget_price = self.budget_prices.get((og_id, contract.unit_type.pk))
+        if budget_price: return budget_price, 'budget'
+        if contract.unit_type.average_price: return contract.unit_type.average_price, 'unit_type'
+        return 0, 'none'
+
+    def get_contract_price(self, contract, sales_price=None):
+        return self.resolve_contract_price(contract, sales_price)[0]
+
+    # -- 회차별 금액 -------------------------------------------------------------
+
+    def _get_down_payment(self, contract, inst, sales_price, price):
+        fixed = get_fixed_payment_amount(inst)
+        if fixed is not None: return fixed
+        if sales_price and inst.pk in self.manuals.get(sales_price.pk, {}):
+            return self.manuals[sales_price.pk][inst.pk]
+        if getattr(inst, 'calculation_method', 'auto') != 'ratio':
+            og_id = contract.order_group.pk if contract.order_group else None
+            down = self.down_payments.get((og_id, contract.unit_type.pk))
+            if down: return down
+        if not price: return None
+        ratio = inst.pay_ratio if inst.pay_ratio is not None else Decimal('10.0')
+        return int(price * (ratio / 100))
+
+    def _get_base_amount(self, contract, inst, sales_price, price, total_down):
+        """잔금을 제외한 회차의 get_payment_amount 동일 규칙 금액"""
+        sort = inst.pay_sort
+        if sort == '1': return self._get_down_payment(contract, inst, sales_price, price) or 0
+        if sort == '4':
+            if not inst.pay_ratio or not price: return 0
+            return int(price * (inst.pay_ratio / 100)) - total_down
+        fixed = get_fixed_payment_amount(inst)
+        if fixed is not None: return fixed
+        if not price: return 0
+        if sort == '2':
+            ratio = inst.pay_ratio if inst.pay_ratio is not None else Decimal('10.0')
+            return int(price * (ratio / 100))
+        if inst.pay_ratio: return int(price * (inst.pay_ratio / 100))
+        if sales_price: return self.manuals.get(sales_price.pk, {}).get(inst.pk, 0)
+        return 0
+
+    def get_payment_amounts(self, contract, installments=None):
+        """
+        계약의 회차별 납부금액 계산 (get_payment_amount 규칙, 특별 약정금액 우선 적용 전)
+        Returns: (amounts {installment_id: amount}, sales_price)
+        """
+        if installments is None:
+            installments = self.get_installments(contract)
+        sales_price = self.get_sales_price(contract)
+        price = self.get_contract_price(contract, sales_price)
+
+        total_down = sum(filter(None, [self._get_down_payment(contract, inst, sales_price, price)
+                                       for inst in installments if inst.pay_sort == '1']))
+
+        amounts = {}
+        for inst in installments:
+            if inst.pay_sort != '3':
+                amounts[inst.pk] = self._get_base_amount(contract, inst, sales_price, price, total_down)
+
+        # 잔금: 분양가 - 잔금 외 회차 합계 (계약별 1회 계산)
+        remain_installments = [inst for inst in installments if inst.pay_sort == '3']
+        if remain_installments:
+            total_other = sum(amounts.values())
+            for inst in remain_installments:
+                fixed = get_fixed_payment_amount(inst)
+                if fixed is not None:
+                    amounts[inst.pk] = fixed
+                else:
+                    amounts[inst.pk] = max(0, price - total_other) if price else 0
+        return amounts, sales_price
+
+    # -- 납부기한 ---------------------------------------------------------------
+
+    def _get_first_future_date(self, contract, cont_date):
+        """계약일 이후 첫 중도금 약정일 (없으면 잔금 약정일) - 제외 차수와 무관하게 타입 전체 일정 참조"""
+        candidates = self.installments_by_type.get(contract.unit_type.sort, [])
+        for pay_sort in ('2', '3'):
+            dates = [inst.pay_due_date for inst in candidates
+                     if inst.pay_sort == pay_sort and inst.pay_due_date and inst.pay_due_date >= cont_date]
+            if dates:
+                return min(dates)
+        return None
+
+    def get_due_dates(self, contract, installments):
+        """get_due_date_per_order 와 동일한 규칙의 회차별 납부기한 {installment_id: date}"""
+        cont_date = None
+        if hasattr(contract, 'contractor') and contract.contractor:
+            cont_date = contract.contractor.contract_date
+        if not cont_date:
+            return {inst.pk: None for inst in installments}
+
+        ff_date = self._get_first_future_date(contract, cont_date)
+        due_dates = {}
+        for inst in installments:
+            due_date = None
+            if inst.pay_sort == '1':
+                due_date = cont_date
+            else:
+                if inst.days_since_prev:
+                    pre_si = sum(i.days_since_prev or 0 for i in installments if i.pay_code < inst.pay_code)
+                    due_date = cont_date + timedelta(days=pre_si + inst.days_since_prev)
+                fixed_date = inst.extra_due_date or inst.pay_due_date
+                if fixed_date:
+                    due_date = max(due_date, fixed_date) if due_date else fixed_date
+
+            if inst.pay_sort == '1':
+                if ff_date and due_date and due_date > ff_date:
+                    due_date = ff_date
+            elif inst.pay_sort == '2':
+                if not due_date or due_date <= cont_date:
+                    due_date = ff_date
+            elif inst.pay_sort == '3':
+                if ff_date and due_date and due_date <= cont_date:
+                    due_date = ff_date
+            due_dates[inst.pk] = due_date
+        return due_dates
+
+    # -- 납부 계획 ---------------------------------------------------------------
+
+    def get_contract_payment_plan(self, contract, with_due_date=True):
+        """get_contract_payment_plan 과 동일한 구조의 납부 계획 (with_due_date=False 시 due_date None)"""
+        installments = self.get_installments(contract)
+        amounts, sales_price = self.get_payment_amounts(contract, installments)
+        manuals = self.manuals.get(sales_price.pk, {}) if sales_price else {}
+        due_dates = self.get_due_dates(contract, installments) if with_due_date else {}
+
+        plan = []
+        for inst in installments:
+            is_manual = inst.pk in manuals
+            plan.append({'installment_order': inst,
+                         'amount': manuals[inst.pk] if is_manual else amounts[inst.pk],
+                         'due_date': due_dates.get(inst.pk),
+                         'source': 'payment_per_installment' if is_manual else 'calculated'})
+        return plan
+
+    def get_payment_plans(self, contracts, with_due_date=True):
+        """계약 목록의 납부 계획 일괄 계산 {contract_id: plan}"""
+        plans = {}
+        for contract in contracts:
+            try:
+                plans[contract.pk] = self.get_contract_payment_plan(contract, with_due_date)
+            except Exception:
+                logger.exception('일괄 납부 계획 계산 실패 (contract_pk=%s)', getattr(contract, 'pk', None))
+                plans[contract.pk] = []
+        return plans
+
+
 def get_project_payment_summary(project, order_group=None, unit_type=None):
     if not project: return {'installment_summaries': [], 'grand_total': 0, 'total_contracts': 0}
     try:
@@ -270,31 +500,29 @@ def get_project_payment_summary(project, order_group=None, unit_type=None):
         if unit_type: contracts_q = contracts_q.filter(unit_type=unit_type)
         contracts = list(contracts_q)
         if not contracts: return {'installment_summaries': [], 'grand_total': 0, 'total_contracts': 0}
-        inst_q = InstallmentPaymentOrder.objects.filter(project=project)
-        if order_group: inst_q = inst_q.exclude(excluded_order_groups=order_group)
-        if unit_type: inst_q = inst_q.filter(type_sort=unit_type.sort)
-        insts = list(inst_q.order_by('pay_code', 'pay_time'))
+        calculator = ProjectPaymentPlanCalculator(project)
+        insts = [i for i in calculator.installments
+                 if (not order_group or order_group.pk not in calculator.excluded_order_groups.get(i.pk, ()))
+                 and (not unit_type or i.type_sort == unit_type.sort)]
         summaries = {i.id: {'installment_order': i, 'total_amount': 0, 'contract_count': 0,
                             'source_breakdown': {'calculated': 0, 'payment_per_installment': 0}} for i in insts}
+        plans = calculator.get_payment_plans(contracts, with_due_date=False)
         total, processed = 0, 0
         for c in contracts:
-            try:
-                plan = get_contract_payment_plan(c)
-                has_pay = False
+            plan = plans.get(c.pk, [])
+            has_pay = False
+            for p in plan:
+                iid, amt, src = p['installment_order'].id, p['amount'], p['source']
+                if iid in summaries:
+                    summaries[iid]['total_amount'] += amt
+                    summaries[iid]['source_breakdown'][src] += amt
+                    total += amt
+                    has_pay = True
+            if has_pay:
+                processed += 1
                 for p in plan:
-                    iid, amt, src = p['installment_order'].id, p['amount'], p['source']
-                    if iid in summaries:
-                        summaries[iid]['total_amount'] += amt
-                        summaries[iid]['source_breakdown'][src] += amt
-                        total += amt
-                        has_pay = True
-                if has_pay:
-                    processed += 1
-                    for p in plan:
-                        if p['installment_order'].id in summaries: summaries[p['installment_order'].id][
-                            'contract_count'] += 1; break
-            except Exception:
-                continue
+                    if p['installment_order'].id in summaries: summaries[p['installment_order'].id][
+                        'contract_count'] += 1; break
         res = []
         for s in summaries.values():
             s['average_amount'] = s['total_amount'] // s['contract_count'] if s['contract_count'] > 0 else 0
@@ -0,0 +1,237 @@
+"""
+ContractPrice Payment Amounts Cache Utilities
+
+ContractPrice.payment_amounts(회차별 납부금액) 캐시의 의존성 기반 무효화 및 일괄 재계산
+
+각 ContractPrice 는 계산 시 사용한 의존성 키(프로젝트:타입종류:차수:타입)와 공급가 출처를 기록한다.
+납부회차·가격표·계약금·예산 등 원천 데이터가 변경되면 영향받는 행만 is_stale=True 로 표시하고,
+트랜잭션 커밋 이후 프로젝트 단위 재계산 작업(Celery)을 예약한다.
+재계산 전까지 집계는 마지막 계산값(payment_amounts)을 그대로 사용한다. (is_cache_valid 유지)
+재계산은 ProjectPaymentPlanCalculator 로 프로젝트 기초 데이터를 청크당 한 번만 조회하고
+bulk_update 로 저장한다. (행별 save() 및 post_save 시그널 미발생)
+"""
+import logging
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from _utils.contract_price import ProjectPaymentPlanCalculator
+from _utils.payment_summary_cache import bump_project_generation
+from contract.models import ContractPrice, OrderGroup, PaymentCacheRebuildJob
+
+logger = logging.getLogger(__name__)
+
+REBUILD_BATCH_SIZE = 500
+REBUILD_DEBOUNCE_SECONDS = 5  # 연속 변경을 한 번의 재계산으로 묶는 지연 시간
+
+_REBUILD_SCHEDULED_KEY = 'payment_amounts:rebuild_scheduled:{project_id}'
+
+_UPDATE_FIELDS = ['payment_amounts', 'is_cache_valid', 'is_stale', 'calculated', 'price_source', 'dependency_key']
+
+
+class _UncontractedUnit:
+    """미계약 세대 납부금액 계산용 임시 계약 객체 (ContractPrice.calculate_uncontracted_payments 와 동일)"""
+
+    def __init__(self, project, order_group, unit_type):
+        self.project = project
+        self.order_group = order_group
+        self.unit_type = unit_type
+
+
+def get_project_contract_prices(project_id):
+    """프로젝트의 계약 / 미계약 세대 ContractPrice"""
+    return ContractPrice.objects.filter(
+        Q(contract__project_id=project_id) |
+        Q(contract__isnull=True, house_unit__unit_type__project_id=project_id)
+    )
+
+
+def _dependency_lookup(project_id, type_sort=None, order_group_id=None, unit_type_id=None):
+    """의존성 키 조회 조건 - 의존성 키가 없는(기록 이전) 행은 프로젝트 범위로 항상 포함"""
+    prefix = f'{project_id}:{type_sort}:' if type_sort is not None else f'{project_id}:'
+    if type_sort is not None and order_group_id is not None and unit_type_id is None:
+        prefix += f'{order_group_id}:'
+
+    lookup = Q(dependency_key__startswith=prefix)
+    if order_group_id is not None and unit_type_id is not None:
+        lookup &= Q(dependency_key__endswith=f':{order_group_id}:{unit_type_id}')
+
+    legacy = Q(dependency_key='') & (Q(contract__project_id=project_id) |
+                                     Q(contract__isnull=True, house_unit__unit_type__project_id=project_id))
+    return lookup | legacy
+
+
+def invalidate_payment_amounts(project_id, reason='', type_sort=None, order_group_id=None, unit_type_id=None,
+                               price_sources=None):
+    """
+    원천 데이터 변경에 영향받는 ContractPrice 캐시만 재계산 대기로 표시하고 커밋 후 재계산 예약
+
+    - type_sort: 해당 타입종류의 행 (납부회차 변경)
+    - type_sort + order_group_id: 해당 타입종류·차수의 행 (납부회차 제외 차수 변경)
+    - order_group_id + unit_type_id: 해당 차수·타입의 행 (가격표, 계약금, 예산 변경)
+    - price_sources: 지정 시 해당 공급가 출처로 계산된 행(출처 미확인 행 포함)만 대상
+    """
+    if not project_id:
+        return 0
+
+    queryset = ContractPrice.objects.filter(
+        _dependency_lookup(project_id, type_sort, order_group_id, unit_type_id), is_stale=False)
+    if price_sources:
+        queryset = queryset.filter(Q(price_source__in=price_sources) | Q(price_source='') | Q(dependency_key=''))
+
+    count = queryset.update(is_stale=True)
+    if count:
+        schedule_payment_amounts_rebuild(project_id, reason)
+    return count
+
+
+def schedule_payment_amounts_rebuild(project_id, reason=''):
+    """
+    트랜잭션 커밋 이후 프로젝트 재계산 작업 예약 (디바운스 시간 내 중복 예약 방지)
+
+    작업 기록(PaymentCacheRebuildJob)은 예약 시 한 번만 생성하고 태스크에는 job_id 만 전달한다.
+    (태스크 재시도 시 같은 작업 기록을 이어서 사용)
+    """
+
+    def _schedule():
+        if not cache.add(_REBUILD_SCHEDULED_KEY.format(project_id=project_id), True,
+                         timeout=REBUILD_DEBOUNCE_SECONDS):
+            return  # 이미 예약된 작업이 실행 시점에 함께 처리
+
+        # 브로커 장애 시 재계산 대기 행은 기존 값으로 조회되며 rebuild_payment_cache 명령으로 복구
+        job = PaymentCacheRebuildJob.objects.create(project_id=project_id, reason=reason[:100])
+        dispatch_rebuild_job(job, countdown=REBUILD_DEBOUNCE_SECONDS)
+
+    transaction.on_commit(_schedule)
+
+
+def dispatch_rebuild_job(job, countdown=None):
+    """재계산 작업 기록을 Celery 태스크로 전달 (실패 시 작업 기록을 실패로 표시하고 False 반환)"""
+    from contract.tasks import rebuild_payment_amounts_task
+    try:
+        result = rebuild_payment_amounts_task.apply_async(args=[job.pk], countdown=countdown)
+    except Exception as e:
+        logger.exception('납부금액 캐시 재계산 태스크 전달 실패 (job=%s)', job.pk)
+        job.status = job.FAILED
+        job.error_message = str(e)
+        job.completed_at = timezone.now()
+        job.save(update_fields=['status', 'error_message', 'completed_at'])
+        return False
+
+    job.task_id = result.id or ''
+    job.save(update_fields=['task_id'])
+    return True
+
+
+def _get_uncontracted_fallback_pay_time(calculator):
+    """근린생활시설 기본 납부회차(잔금 100%)의 pay_time - 잔금 회차가 여러 개면 계산 불가(None)"""
+    remain_orders = [inst for inst in calculator.installments if inst.pay_sort == '3']
+    if not remain_orders:
+        return '10'
+    if len(remain_orders) == 1:
+        return str(remain_orders[0].pay_time)
+    return None
+
+
+def _calculate_payment_amounts(calculator, contract_price, default_order_group):
+    """
+    행 단위 납부금액 계산 (ContractPrice.calculate_and_cache_payments / calculate_uncontracted_payments 동일 규칙)
+    Returns: (payment_amounts, 계산 기준 계약 객체, 공급가 출처)
+    """
+    if contract_price.contract_id:
+        contract = contract_price.contract
+        plan = calculator.get_contract_payment_plan(contract, with_due_date=False)
+        amounts = {str(item['installment_order'].pay_time): item['amount'] for item in plan}
+        price_source = calculator.resolve_contract_price(contract, calculator.get_sales_price(contract))[1]
+        return amounts, contract, price_source
+
+    if not default_order_group:
+        raise ValueError('프로젝트 기본 미계약 차수가 없습니다.')
+
+    unit_type = contract_price.house_unit.unit_type
+    temp_contract = _UncontractedUnit(calculator.project, default_order_group, unit_type)
+    installments = calculator.get_installments(temp_contract)
+    by_id, _ = calculator.get_payment_amounts(temp_contract, installments)
+    amounts = {str(inst.pay_time): by_id[inst.pk] for inst in installments}
+
+    # 근린생활시설의 경우 InstallmentPaymentOrder가 없으면 기본 납부회차(잔금 100%) 적용
+    if not amounts and unit_type.name == '근린생활시설':
+        pay_time = _get_uncontracted_fallback_pay_time(calculator)
+        if pay_time is None:
+            raise ValueError('잔금 납부회차가 여러 개입니다.')
+        amounts = {pay_time: contract_price.price}
+
+    price_source = calculator.resolve_contract_price(temp_contract)[1]
+    return amounts, temp_contract, price_source
+
+
+def rebuild_payment_amounts(project, invalid_only=True, batch_size=REBUILD_BATCH_SIZE, job=None):
+    """
+    프로젝트 ContractPrice 납부금액 일괄 재계산
+
+    청크마다 대상 행을 잠근 뒤 기초 데이터를 조회하므로, 재계산 중 발생한 무효화는
+    잠금 해제 후 다시 적용되어 다음 재계산에 반영된다.
+
+    Args:
+        project: 프로젝트
+        invalid_only: 재계산 대기·무효 캐시만 재계산 (False 이면 전체)
+        batch_size: 청크 크기
+        job: PaymentCacheRebuildJob (진행률 기록용, 선택)
+
+    Returns:
+        dict: {'total': 전체, 'success': 성공, 'error': 실패}
+    """
+    queryset = get_project_contract_prices(project.pk)
+    if invalid_only:
+        queryset = queryset.filter(Q(is_stale=True) | Q(is_cache_valid=False))
+    ids = list(queryset.order_by('pk').values_list('pk', flat=True))
+    total = len(ids)
+
+    if job:
+        job.update_progress(0, total, job.PROCESSING)
+
+    default_order_group = OrderGroup.get_default_for_project(project)
+    processed = success = errors = 0
+
+    for start in range(0, total, batch_size):
+        chunk_ids = ids[start:start + batch_size]
+
+        with transaction.atomic():
+            locked_ids = list(ContractPrice.objects.select_for_update()
+                              .filter(pk__in=chunk_ids).order_by('pk').values_list('pk', flat=True))
+            calculator = ProjectPaymentPlanCalculator(project)
+            rows = ContractPrice.objects.filter(pk__in=locked_ids).select_related(
+                'contract__project', 'contract__order_group', 'contract__unit_type', 'contract__key_unit__houseunit',
+                'house_unit__unit_type')
+
+            now = timezone.now()
+            updated = []
+            for contract_price in rows:
+                try:
+                    amounts, contract, price_source = _calculate_payment_amounts(
+                        calculator, contract_price, default_order_group)
+                except Exception as e:
+                    errors += 1
+                    logger.warning('ContractPrice(pk=%s) 납부금액 재계산 실패: %s', contract_price.pk, e)
+                    continue
+
+                contract_price.payment_amounts = amounts
+                contract_price.is_cache_valid = True
+                contract_price.calculated = now
+                contract_price.set_cache_dependency(contract, price_source)
+                updated.append(contract_price)
+
+            ContractPrice.objects.bulk_update(updated, _UPDATE_FIELDS)
+
+        success += len(updated)
+        processed += len(chunk_ids)
+        if job:
+            job.update_progress(processed, total)
+
+    if success:
+        # 재계산 이전 값으로 저장된 납부 요약 캐시 폐기
+        bump_project_generation(project.pk)
+
+    return {'total': total, 'success': success, 'error': errors}
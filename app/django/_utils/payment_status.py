@@ -0,0 +1,237 @@
+"""
+Payment Status Aggregation Utilities
+
+차수(order_group) × 타입(unit_type)별 수납 현황 집계 엔진
+
+프로젝트의 모든 (차수, 타입) 조합에 대한 매출액, 계약 현황, 실수납금액, 미계약 현황을
+조합 수와 무관하게 고정된 소수의 GROUP BY 쿼리로 계산한다.
+PaymentStatusByUnitTypeViewSet, ContractPaymentStatusByUnitTypeViewSet 및
+ExportLedgerPaymentStatus 엑셀 출력이 공통으로 사용한다.
+"""
+from django.db import connection
+from django.db.models import Sum
+
+from contract.models import OrderGroup
+from items.models import HouseUnit
+from payment.models import SalesPriceByGT, ContractPayment
+
+COMMERCIAL_UNIT_SORT = '5'  # 근린생활시설
+
+_BUDGET_ROWS_QUERY = """
+    SELECT pib.order_group_id as order_group_id,
+           og.name            as order_group_name,
+           pib.unit_type_id   as unit_type_id,
+           ut.name            as unit_type_name,
+           ut.color           as unit_type_color,
+           ut.sort            as unit_type_sort,
+           ut.average_price   as unit_type_average_price,
+           pib.quantity       as planned_units,
+           pib.budget         as total_budget
+    FROM project_projectincbudget pib
+             INNER JOIN items_unittype ut ON pib.unit_type_id = ut.id
+             INNER JOIN contract_ordergroup og ON pib.order_group_id = og.id
+    WHERE pib.project_id = %s
+    ORDER BY order_group_id, unit_type_id
+    """
+
+# 계약 세대수, 계약금액(cp.price), 회차별 납부금액 합계(payment_amounts)를 한 번에 집계
+_CONTRACT_AGGREGATE_QUERY = """
+    SELECT c.order_group_id,
+           c.unit_type_id,
+           COUNT(*)                   as contract_units,
+           COALESCE(SUM(cp.price), 0) as contract_amount,
+           COALESCE(SUM((SELECT SUM(CAST(value AS INTEGER))
+                          FROM jsonb_each_text(cp.payment_amounts))), 0) as sales_amount
+    FROM contract_contract c
+             INNER JOIN contract_contractprice cp ON cp.contract_id = c.id
+    WHERE c.project_id = %s
+      AND c.is_active = true
+      AND cp.is_cache_valid = true
+    GROUP BY c.order_group_id, c.unit_type_id
+    """
+
+_NON_CONTRACT_AGGREGATE_QUERY = """
+    SELECT hu.unit_type_id,
+           COUNT(*) as non_contract_units,
+           COALESCE(SUM((SELECT SUM(CAST(value AS INTEGER))
+                          FROM jsonb_each_text(cp.payment_amounts))), 0) as non_contract_amount
+    FROM contract_contractprice cp
+             INNER JOIN items_houseunit hu ON cp.house_unit_id = hu.id
+             INNER JOIN items_unittype ut ON hu.unit_type_id = ut.id
+    WHERE cp.contract_id IS NULL
+      AND ut.project_id = %s
+      AND cp.is_cache_valid = true
+    GROUP BY hu.unit_type_id
+    """
+
+_PAID_AGGREGATE_QUERY = """
+    SELECT c.order_group_id,
+           c.unit_type_id,
+           COALESCE(SUM(pae.amount), 0) as paid_amount
+    FROM payment_contractpayment cp
+             INNER JOIN ledger_projectaccountingentry pae ON cp.accounting_entry_id = pae.id
+             INNER JOIN ledger_projectaccount pa ON pae.account_id = pa.id
+             INNER JOIN contract_contract c ON cp.contract_id = c.id
+             {ledger_join}
+    WHERE cp.project_id = %s
+      AND c.is_active = true
+      AND pae.amount IS NOT NULL
+      AND pa.is_payment = true
+      AND cp.is_payment_mismatch = false
+      {date_filter}
+    GROUP BY c.order_group_id, c.unit_type_id
+    """
+
+
+def normalize_date_param(date):
+    """쿼리 파라미터의 날짜 값 정규화 ('', 'null', 'undefined' → None)"""
+    if date in (None, '', 'null', 'undefined', 'None'):
+        return None
+    return date
+
+
+def _fetch_contract_aggregates(cursor, project_id):
+    cursor.execute(_CONTRACT_AGGREGATE_QUERY, [project_id])
+    return {
+        (og_id, ut_id): {'contract_units': units, 'contract_amount': amount, 'sales_amount': sales}
+        for og_id, ut_id, units, amount, sales in cursor.fetchall()
+    }
+
+
+def _fetch_non_contract_aggregates(cursor, project_id):
+    cursor.execute(_NON_CONTRACT_AGGREGATE_QUERY, [project_id])
+    return {
+        ut_id: {'non_contract_units': units, 'non_contract_amount': amount}
+        for ut_id, units, amount in cursor.fetchall()
+    }
+
+
+def _fetch_paid_aggregates(cursor, project_id, date, use_ledger_join):
+    params = [project_id]
+    ledger_join = ''
+    date_filter = ''
+
+    if use_ledger_join:
+        ledger_join = 'INNER JOIN ledger_projectbanktransaction pbt ON pae.transaction_id = pbt.transaction_id'
+
+    if date:
+        date_filter = 'AND pbt.deal_date <= %s' if use_ledger_join else 'AND cp.deal_date <= %s'
+        params.append(date)
+
+    cursor.execute(_PAID_AGGREGATE_QUERY.format(ledger_join=ledger_join, date_filter=date_filter), params)
+    return {(og_id, ut_id): paid for og_id, ut_id, paid in cursor.fetchall()}
+
+
+def get_standardized_paid_by_unit_type(project, date=None):
+    """
+    차수 × 타입별 표준화된 실수납금액 (유효 계약자 입금만, ContractPayment.deal_date 기준)
+
+    get_ledger_standardized_payment_sum과 동일한 집계 기준을 단일 GROUP BY 쿼리로 적용
+    """
+    queryset = ContractPayment.objects.filter(
+        project=project,
+        contract__isnull=False,
+        contract__is_active=True,
+        is_payment_mismatch=False
+    )
+
+    date = normalize_date_param(date)
+    if date:
+        queryset = queryset.filter(deal_date__lte=date)
+
+    rows = (queryset
+            .values('contract__order_group_id', 'contract__unit_type_id')
+            .annotate(total=Sum('accounting_entry__amount')))
+
+    return {(row['contract__order_group_id'], row['contract__unit_type_id']): row['total'] or 0 for row in rows}
+
+
+def calculate_payment_status_by_unit_type(project_id, date=None, use_ledger_join=False):
+    """
+    PaymentStatus 요약 현황 계산 (집합 기반)
+
+    - 예산 행(ProjectIncBudget), 계약 집계, 미계약 집계, 실수납 집계 각 1회 쿼리
+    - 근린생활시설 fallback 판단용 HouseUnit / SalesPriceByGT 존재 여부 각 1회 쿼리
+    - 기본 미계약 차수 조회 1회
+    """
+    date = normalize_date_param(date)
+
+    with connection.cursor() as cursor:
+        cursor.execute(_BUDGET_ROWS_QUERY, [project_id])
+        budget_rows = cursor.fetchall()
+        if not budget_rows:
+            return []
+
+        contract_map = _fetch_contract_aggregates(cursor, project_id)
+        non_contract_map = _fetch_non_contract_aggregates(cursor, project_id)
+        paid_map = _fetch_paid_aggregates(cursor, project_id, date, use_ledger_join)
+
+    default_og = OrderGroup.objects.filter(project_id=project_id, is_default_for_uncontracted=True) \
+        .values_list('pk', flat=True).first()
+
+    # 근린생활시설 fallback 판단 자료 (해당 타입이 있을 때만 조회)
+    commercial_type_ids = {row[2] for row in budget_rows if row[5] == COMMERCIAL_UNIT_SORT}
+    types_with_house_units = set()
+    priced_pairs = set()
+    if commercial_type_ids:
+        types_with_house_units = set(
+            HouseUnit.objects.filter(unit_type_id__in=commercial_type_ids)
+            .values_list('unit_type_id', flat=True).distinct()
+        )
+        priced_pairs = set(
+            SalesPriceByGT.objects.filter(project_id=project_id, unit_type_id__in=commercial_type_ids)
+            .values_list('order_group_id', 'unit_type_id').distinct()
+        )
+
+    empty_contract = {'contract_units': 0, 'contract_amount': 0, 'sales_amount': 0}
+    empty_non_contract = {'non_contract_units': 0, 'non_contract_amount': 0}
+
+    results = []
+    for og_id, og_name, ut_id, ut_name, ut_color, ut_sort, ut_average_price, planned_units, budget in budget_rows:
+        contract_data = contract_map.get((og_id, ut_id), empty_contract)
+        # 미계약 세대는 기본 미계약 차수에만 귀속
+        non_contract_data = non_contract_map.get(ut_id, empty_non_contract) \
+            if default_og and og_id == default_og else empty_non_contract
+
+        contract_units = contract_data['contract_units']
+        contract_amount = contract_data['contract_amount']
+        paid_amount = paid_map.get((og_id, ut_id), 0)
+        non_contract_units = non_contract_data['non_contract_units']
+        non_contract_amount = non_contract_data['non_contract_amount']
+
+        total_sales_amount = contract_data['sales_amount'] + non_contract_amount
+        # 합계 = 계약금액 + 미계약금액
+        total_amount = contract_amount + non_contract_amount
+
+        # 근린생활시설 특별 처리: 가격표 없이 호실만 있는 경우 예산 → 평균가 순으로 대체
+        is_commercial_fallback = (
+                ut_sort == COMMERCIAL_UNIT_SORT
+                and ut_id in types_with_house_units
+                and (og_id, ut_id) not in priced_pairs
+        )
+        if is_commercial_fallback:
+            fallback_amount = budget if budget and budget > 0 else (ut_average_price or 0)
+            if total_sales_amount == 0:
+                total_sales_amount = fallback_amount
+            if total_amount == 0:
+                total_amount = fallback_amount
+
+        results.append({
+            'order_group_id': og_id,
+            'order_group_name': og_name,
+            'unit_type_id': ut_id,
+            'unit_type_name': ut_name,
+            'unit_type_color': ut_color,
+            'total_sales_amount': total_sales_amount,
+            'planned_units': planned_units,
+            'contract_units': contract_units,
+            'non_contract_units': non_contract_units,
+            'contract_amount': contract_amount,
+            'paid_amount': paid_amount,
+            'unpaid_amount': contract_amount - paid_amount,
+            'non_contract_amount': non_contract_amount,
+            'total_budget': total_amount
+        })
+
+    return results
+
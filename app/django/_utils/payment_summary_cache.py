@@ -0,0 +1,66 @@
+"""
+Payment Summary Cache Utilities
+
+프로젝트 단위 세대(generation) 기반 납부 요약 캐시 버전 관리
+
+계약·가격·납부회차 관련 모델이 저장/삭제되면 해당 프로젝트의 세대 키를 증가시켜
+이전 세대 키로 저장된 캐시가 더 이상 조회되지 않도록 한다.
+캐시 항목은 오래 유지하되 원천 데이터가 바뀌면 즉시 무효화된다.
+"""
+import time
+
+from django.core.cache import cache
+from django.db import transaction
+
+PAYMENT_SUMMARY_CACHE_TIMEOUT = 60 * 60 * 24 * 7  # 7일 (세대 키 변경으로 무효화)
+
+_GENERATION_KEY = 'payment_summary:generation:{project_id}'
+
+
+def _generation_key(project_id):
+    return _GENERATION_KEY.format(project_id=project_id)
+
+
+def _initial_generation():
+    # 세대 키가 유실(eviction)된 뒤 다시 생성되어도 이전 세대 값과 겹치지 않도록 시각 기반 초기값 사용
+    return int(time.time() * 1000)
+
+
+def get_project_generations(project_ids):
+    """프로젝트별 현재 캐시 세대 조회 (없으면 생성)"""
+    keys = {_generation_key(pid): pid for pid in project_ids}
+    found = cache.get_many(list(keys))
+
+    generations = {keys[key]: value for key, value in found.items()}
+    missing = {key: _initial_generation() for key in keys if key not in found}
+    if missing:
+        for key, value in missing.items():
+            # 동시 요청이 먼저 생성한 값이 있으면 그것을 사용
+            cache.add(key, value, timeout=None)
+            generations[keys[key]] = cache.get(key, value)
+    return generations
+
+
+def bump_project_generation(project_id):
+    """프로젝트 캐시 세대 증가 → 해당 프로젝트가 포함된 모든 요약 캐시 무효화"""
+    if not project_id:
+        return
+    key = _generation_key(project_id)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, _initial_generation(), timeout=None)
+
+
+def invalidate_project_payment_summary(project_id):
+    """트랜잭션 커밋 이후 세대 증가 (커밋 전 재계산 결과가 새 세대로 저장되는 것을 방지)"""
+    if project_id:
+        transaction.on_commit(lambda: bump_project_generation(project_id))
+
+
+def payment_summary_cache_key(project_ids, order_group_id=None, unit_type_id=None):
+    """프로젝트 세대가 반영된 납부 요약 캐시 키 생성"""
+    project_ids = sorted({int(pid) for pid in project_ids})
+    generations = get_project_generations(project_ids)
+    scope = '-'.join(f'{pid}.{generations[pid]}' for pid in project_ids)
+    return f'payment_summary_{scope}_{order_group_id}_{unit_type_id}'
@@ -0,0 +1,96 @@
+"""
+Sequence Allocation Utilities
+
+범위(scope) 키별 원자적 채번 서비스
+
+대상 테이블의 MAX()/COUNT() 를 조회해 다음 번호를 계산하면 동시 요청(gunicorn 스레드, Celery 워커)이
+같은 번호를 받는다. 카운터 행을 단일 UPDATE(last = last + n)로 증가시키고 증가된 값을 돌려받아
+O(1) 로 채번한다. 행 잠금은 UPDATE 문 실행(자동 커밋) 또는 호출 트랜잭션 동안만 유지되며,
+번호를 받은 뒤 저장에 실패하면 번호가 비어도(gap) 중복은 발생하지 않는다.
+
+- allocate(scope, count): count 개 번호 블록 선할당 (bulk_create 등 일괄 생성용)
+- next_value(scope): 다음 번호 1개
+- increment_counter(): 기존 카운터 테이블(LetterSequence 등)에 동일한 원자 증가 적용
+"""
+from django.db import IntegrityError, connections, router, transaction
+from django.db.models import F
+
+
+def make_scope(*parts):
+    """범위 키 생성 (예: make_scope('work.issue_log', 123) → 'work.issue_log:123')"""
+    return ':'.join(str(part) for part in parts)
+
+
+def _increment(model, filters, field, count, using):
+    """카운터 행 원자 증가 → 증가 후 값 (행이 없으면 None)"""
+    connection = connections[using]
+    if connection.vendor == 'postgresql':
+        # UPDATE ... RETURNING: 증가와 조회를 한 문장으로 처리
+        qn = connection.ops.quote_name
+        columns = {model._meta.get_field(name).column: value for name, value in filters.items()}
+        column = model._meta.get_field(field).column
+        where = ' AND '.join(f'{qn(col)} = %s' for col in columns)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'UPDATE {qn(model._meta.db_table)} SET {qn(column)} = {qn(column)} + %s '
+                f'WHERE {where} RETURNING {qn(column)}',
+                [count, *columns.values()],
+            )
+            row = cursor.fetchone()
+        return row[0] if row else None
+
+    # 그 외 DB: 같은 트랜잭션에서 UPDATE 로 행을 잠근 뒤 값 조회
+    queryset = model._default_manager.using(using).filter(**filters)
+    if not queryset.update(**{field: F(field) + count}):
+        return None
+    return queryset.values_list(field, flat=True).get()
+
+
+def increment_counter(model, filters, field, count=1, initial=None):
+    """
+    카운터 모델 행을 count 만큼 증가시키고 증가 후 값 반환 (행이 없으면 생성)
+
+    Args:
+        model: 카운터 모델 (filters 조합이 유일해야 함)
+        filters: 카운터 행 식별 조건 (생성 시 필드 값으로도 사용, 필드명 기준)
+        field: 증가시킬 정수 필드명
+        count: 증가량 (선할당 블록 크기)
+        initial: 행 최초 생성 시 시작 값을 계산하는 함수 (기존 데이터 기준 이어서 채번, 범위당 1회 실행)
+    """
+    using = router.db_for_write(model)
+    with transaction.atomic(using=using):
+        value = _increment(model, filters, field, count, using)
+        if value is None:
+            try:
+                # 동시 생성 경합 시 먼저 생성된 행을 사용
+                with transaction.atomic(using=using):
+                    model._default_manager.using(using).create(
+                        **filters, **{field: initial() if initial else 0})
+            except IntegrityError:
+                pass
+            value = _increment(model, filters, field, count, using)
+    return value
+
+
+def allocate(scope, count=1, initial=None):
+    """
+    범위 키 시퀀스에서 count 개 번호 블록 할당
+
+    Returns:
+        range: 할당된 연속 번호 (start ~ start + count - 1)
+    """
+    from ibs.models import Sequence
+    last = increment_counter(Sequence, {'scope': scope}, 'last_value', count, initial)
+    return range(last - count + 1, last + 1)
+
+
+def next_value(scope, initial=None):
+    """범위 키 시퀀스의 다음 번호"""
+    return allocate(scope, 1, initial)[0]
+
+
+def peek(scope, default=0):
+    """현재 마지막 번호 조회 (미리보기용, 번호를 할당하지 않음)"""
+    from ibs.models import Sequence
+    value = Sequence.objects.filter(scope=scope).values_list('last_value', flat=True).first()
+    return default if value is None else value
@@ -1,9 +1,17 @@
+from collections import defaultdict
+from datetime import timedelta
+
 import requests
 from decouple import config
 from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
 from django.contrib.humanize.templatetags.humanize import intcomma
+from django.core.cache import cache
+from django.db import transaction
 from django.db.models import Q
+from django.utils import timezone
 
+from accounts.models import User, SlackNotificationEvent
 from contract.models import Contract, Succession, ContractorRelease
 from docs.models import LawsuitCase, Document
 from ledger.models import CompanyBankTransaction, ProjectBankTransaction
@@ -12,6 +20,19 @@ from work.models.project import IssueProject
 
 SYSTEM_NAME = 'IBS 업무관리시스템'
 
+SLACK_NOTIFICATION_MODELS = (CompanyBankTransaction, ProjectBankTransaction, LawsuitCase, Document, Contract,
+                             Succession, ContractorRelease, Site, SiteOwner, SiteContract)
+
+SLACK_OUTBOX_DRAIN_DELAY = 5  # 이벤트 병합 대기 시간 (초)
+SLACK_OUTBOX_BATCH_SIZE = 200  # 1회 전송 작업에서 처리할 이벤트 수
+SLACK_OUTBOX_STALE_SECONDS = 10 * 60  # 처리 중 상태로 남은 이벤트 재처리 기준 (초)
+SLACK_OUTBOX_LOCK_KEY = 'slack:outbox_drain_scheduled:{countdown}'
+SLACK_OUTBOX_LOCK_TIMEOUT = SLACK_OUTBOX_DRAIN_DELAY  # 중복 예약 병합 구간 (초) - 대기 시간과 무관하게 고정
+SLACK_COALESCE_LIMIT = 20  # 병합 메시지 1건당 최대 알림 수
+SLACK_MAX_ATTEMPTS = 5
+SLACK_RETRY_BASE_DELAY = 30  # 재시도 기본 대기 (초) - 시도마다 2배
+SLACK_RETRY_MAX_DELAY = 60 * 60  # 재시도 최대 대기 (초)
+
 
 def send_bulk_import_summary(summary_data, user=None, target_instance=None):
     """Excel 대량 가져오기 완료 후 Slack 요약 알림 전송"""
@@ -65,17 +86,10 @@ def send_bulk_import_summary(summary_data, user=None, target_instance=None):
         ]
     }
 
-    # Slack으로 메시지 전송
-    try:
-        print(f"[BULK_IMPORT] Slack 메시지 전송 시도: {model_name} {total_records}건")
-
-        response = requests.post(webhook_url, json=message, timeout=10)
-        response.raise_for_status()
-        print(f"대량 가져오기 Slack 알림 전송 성공: {model_name} {total_records}건 처리 완료")
-        return True
-    except requests.RequestException as e:
-        print(f"대량 가져오기 Slack 알림 전송 실패: {e}")
-        return False
+    # Slack 아웃박스에 등록 (커밋 후 Celery 작업에서 전송)
+    print(f"[BULK_IMPORT] Slack 메시지 전송 등록: {model_name} {total_records}건")
+    enqueue_slack_message(webhook_url, message)
+    return True
 
 
 def get_slack_webhook_url(issue_project):
@@ -774,55 +788,218 @@ def send_slack_message(webhook_url, message_data):
         return False
 
 
-def send_slack_notification(instance, action, user=None):
-    """통합 Slack 알림 전송 함수"""
-
-    # Slack 알림이 비활성화된 경우 종료
-    if not getattr(settings, 'SLACK_NOTIFICATIONS_ENABLED', True):
-        return
-
-    # 대상 IssueProject 찾기
-    issue_project = get_target_issue_project(instance)
-    if not issue_project:
-        print(f"Slack 알림 대상 프로젝트를 찾을 수 없음: {instance}")
-        return
-
-    # 메시지 등록
-    message_data = None
+def build_slack_message(instance, action, user=None):
+    """모델 인스턴스 유형별 Slack 메시지 생성"""
     if isinstance(instance, (CompanyBankTransaction, ProjectBankTransaction)):
-        message_data = SlackMessageBuilder.build_bank_transaction_message(instance, action, user)
+        return SlackMessageBuilder.build_bank_transaction_message(instance, action, user)
     elif isinstance(instance, LawsuitCase):
-        message_data = SlackMessageBuilder.build_lawsuitcase_message(instance, action, user)
+        return SlackMessageBuilder.build_lawsuitcase_message(instance, action, user)
     elif isinstance(instance, Document):
-        message_data = SlackMessageBuilder.build_document_message(instance, action, user)
+        return SlackMessageBuilder.build_document_message(instance, action, user)
     elif isinstance(instance, Contract):
-        message_data = SlackMessageBuilder.build_contract_message(instance, action, user)
+        return SlackMessageBuilder.build_contract_message(instance, action, user)
     elif isinstance(instance, Succession):
-        message_data = SlackMessageBuilder.build_succession_message(instance, action, user)
+        return SlackMessageBuilder.build_succession_message(instance, action, user)
     elif isinstance(instance, ContractorRelease):
-        message_data = SlackMessageBuilder.build_contractor_release_message(instance, action, user)
+        return SlackMessageBuilder.build_contractor_release_message(instance, action, user)
     elif isinstance(instance, Site):
-        message_data = SlackMessageBuilder.build_site_message(instance, action, user)
+        return SlackMessageBuilder.build_site_message(instance, action, user)
     elif isinstance(instance, SiteOwner):
-        message_data = SlackMessageBuilder.build_site_owner_message(instance, action, user)
+        return SlackMessageBuilder.build_site_owner_message(instance, action, user)
     elif isinstance(instance, SiteContract):
-        message_data = SlackMessageBuilder.build_site_contract_message(instance, action, user)
+        return SlackMessageBuilder.build_site_contract_message(instance, action, user)
+    return None
+
+
+def prepare_slack_notification(instance, action, user=None):
+    """대상 프로젝트/메시지/웹훅 URL 조회 - 알림 대상이 아니면 (None, None)"""
+    issue_project = get_target_issue_project(instance)
+    if not issue_project:
+        print(f"Slack 알림 대상 프로젝트를 찾을 수 없음: {instance}")
+        return None, None
 
+    message_data = build_slack_message(instance, action, user)
     if not message_data:
         print(f"지원하지 않는 모델 타입: {type(instance)}")
-        return
+        return None, None
 
     # 환경변수에서 Slack 웹훅 URL 조회
     slack_webhook_url = get_slack_webhook_url(issue_project)
     if not slack_webhook_url:
         print(f"Slack 웹훅 URL을 찾을 수 없음: {issue_project.name} (slug: {issue_project.slug})")
+        return None, None
+
+    return message_data, slack_webhook_url
+
+
+def schedule_slack_outbox_drain(countdown=SLACK_OUTBOX_DRAIN_DELAY):
+    """
+    아웃박스 전송 작업 예약 (병합 구간 내 발생한 이벤트는 한 번의 작업으로 병합)
+
+    병합 잠금은 대기 시간별로 짧게 고정하여, 재시도의 긴 대기 시간이 새 이벤트의 전송 예약을 막지 않는다.
+    """
+    if cache.add(SLACK_OUTBOX_LOCK_KEY.format(countdown=countdown), 1, timeout=SLACK_OUTBOX_LOCK_TIMEOUT):
+        from accounts.tasks import drain_slack_outbox_task
+        drain_slack_outbox_task.apply_async(countdown=countdown)
+
+
+def enqueue_slack_message(webhook_url, message_data):
+    """완성된 Slack 메시지를 커밋 후 아웃박스에 등록"""
+
+    def create_event():
+        SlackNotificationEvent.objects.create(webhook_url=webhook_url, payload=message_data)
+        schedule_slack_outbox_drain()
+
+    transaction.on_commit(create_event)
+
+
+def send_slack_notification(instance, action, user=None):
+    """
+    통합 Slack 알림 등록 (트랜잭션 아웃박스)
+
+    커밋 후 알림 이벤트만 기록하며, 메시지 생성과 웹훅 전송은 Celery 작업(drain_slack_outbox)에서 처리한다.
+    삭제 알림은 전송 시점에 대상을 다시 조회할 수 없으므로 대상 필드 값(관계 ID 포함)만 함께 기록하고,
+    메시지는 전송 작업에서 복원한 인스턴스로 생성한다.
+    """
+
+    # Slack 알림이 비활성화된 경우 종료
+    if not getattr(settings, 'SLACK_NOTIFICATIONS_ENABLED', True):
         return
 
-    # Slack 메시지 전송
-    success = send_slack_message(slack_webhook_url, message_data)
+    if not isinstance(instance, SLACK_NOTIFICATION_MODELS):
+        print(f"지원하지 않는 모델 타입: {type(instance)}")
+        return
+
+    content_type = ContentType.objects.get_for_model(instance)
+    object_id = str(instance.pk)
+    user_id = user.pk if user else None
+    object_data = snapshot_instance(instance) if action == '삭제' else None
+
+    def create_event():
+        SlackNotificationEvent.objects.create(content_type=content_type, object_id=object_id, action=action,
+                                              user_id=user_id, object_data=object_data)
+        schedule_slack_outbox_drain()
+
+    transaction.on_commit(create_event)
+
+
+def coalesce_slack_messages(messages):
+    """같은 웹훅으로 보낼 여러 메시지를 첨부(attachments)를 합친 한 건의 메시지로 병합"""
+    if len(messages) == 1:
+        return messages[0]
+
+    attachments = [attachment for message in messages for attachment in message.get('attachments', [])]
+    texts = [message['text'] for message in messages if message.get('text')]
+    return {
+        'text': '\n'.join([f"📢 {len(messages)}건의 변경 알림", *texts]),
+        'attachments': attachments,
+    }
+
+
+def snapshot_instance(instance):
+    """삭제 알림 메시지 생성용 대상 필드 값 (외래 키는 ID 로 기록)"""
+    return {field.attname: field.value_from_object(instance) for field in instance._meta.concrete_fields}
+
+
+def restore_instance(model, object_data):
+    """기록된 필드 값으로 삭제된 대상 인스턴스 복원 (저장하지 않음, 관계는 ID 로 지연 조회)"""
+    fields = {field.attname: field for field in model._meta.concrete_fields}
+    return model(**{name: fields[name].to_python(value) for name, value in object_data.items() if name in fields})
+
+
+def _resolve_event_message(event, users):
+    """이벤트 대상 인스턴스(삭제 알림은 기록된 필드 값으로 복원)를 조회하여 메시지/웹훅 URL 생성"""
+    model = event.content_type.model_class() if event.content_type else None
+    if model is None:
+        return None, None
+    if event.object_data is not None:
+        instance = restore_instance(model, event.object_data)
+    else:
+        instance = model.objects.filter(pk=event.object_id).first()
+    if instance is None:  # 전송 전 삭제된 경우 - 삭제 알림으로 대체
+        return None, None
+    return prepare_slack_notification(instance, event.action, users.get(event.user_id))
 
-    if success:
-        # 권한 있는 멤버들 로그 (선택적)
-        members = get_authorized_members(issue_project)
-        member_names = [member.user.username for member in members if member.user]
-        print(f"Slack 알림 전송 완료 - 프로젝트: {issue_project.name}, 멤버: {', '.join(member_names)}")
+
+def _retry_delay(attempts):
+    return timedelta(seconds=min(SLACK_RETRY_BASE_DELAY * 2 ** (attempts - 1), SLACK_RETRY_MAX_DELAY))
+
+
+def drain_slack_outbox(batch_size=SLACK_OUTBOX_BATCH_SIZE):
+    """
+    대기 중인 Slack 알림 이벤트를 웹훅별로 병합하여 전송
+
+    - 여러 워커가 동시에 실행되어도 skip_locked 로 선점한 이벤트만 처리
+    - 같은 대상/작업의 중복 이벤트는 한 건만 전송
+    - 전송 실패 시 지수 백오프로 재시도하고, 최대 시도 횟수 초과 시 실패 처리
+
+    Returns:
+        dict: 처리 결과
+    """
+    now = timezone.now()
+    stale = now - timedelta(seconds=SLACK_OUTBOX_STALE_SECONDS)
+
+    with transaction.atomic():
+        events = list(
+            SlackNotificationEvent.objects.select_for_update(skip_locked=True, of=('self',))
+            .filter(Q(status=SlackNotificationEvent.PENDING, next_attempt_at__lte=now) |
+                    Q(status=SlackNotificationEvent.PROCESSING, claimed_at__lt=stale))
+            .select_related('content_type')
+            .order_by('created_at')[:batch_size]
+        )
+        SlackNotificationEvent.objects.filter(pk__in=[e.pk for e in events]) \
+            .update(status=SlackNotificationEvent.PROCESSING, claimed_at=now)
+
+    user_ids = {e.user_id for e in events if e.user_id}
+    users = {u.pk: u for u in User.objects.filter(pk__in=user_ids)} if user_ids else {}
+
+    groups = defaultdict(list)
+    seen = set()
+    for event in events:
+        event.status = SlackNotificationEvent.SKIPPED
+        if not event.payload:
+            key = (event.content_type_id, event.object_id, event.action)
+            if key in seen:
+                continue
+            seen.add(key)
+            try:
+                event.payload, event.webhook_url = _resolve_event_message(event, users)
+            except Exception as e:
+                print(f"Slack 알림 메시지 생성 오류: {e}")
+                event.error_message = str(e)
+                continue
+        if event.payload and event.webhook_url:
+            groups[event.webhook_url].append(event)
+
+    result = {'sent': 0, 'failed': 0, 'retry': 0, 'messages': 0}
+    for webhook_url, group in groups.items():
+        for i in range(0, len(group), SLACK_COALESCE_LIMIT):
+            chunk = group[i:i + SLACK_COALESCE_LIMIT]
+            success = send_slack_message(webhook_url, coalesce_slack_messages([e.payload for e in chunk]))
+            result['messages'] += 1
+            for event in chunk:
+                event.attempts += 1
+                if success:
+                    event.status = SlackNotificationEvent.SENT
+                    event.sent_at = timezone.now()
+                    result['sent'] += 1
+                elif event.attempts >= SLACK_MAX_ATTEMPTS:
+                    event.status = SlackNotificationEvent.FAILED
+                    event.error_message = '최대 전송 시도 횟수 초과'
+                    result['failed'] += 1
+                else:
+                    event.status = SlackNotificationEvent.PENDING
+                    event.next_attempt_at = timezone.now() + _retry_delay(event.attempts)
+                    result['retry'] += 1
+
+    SlackNotificationEvent.objects.bulk_update(
+        events, ['status', 'payload', 'webhook_url', 'attempts', 'next_attempt_at', 'sent_at', 'error_message'])
+
+    # 남은 이벤트(배치 초과분 또는 재시도 대기) 처리 예약
+    upcoming = SlackNotificationEvent.objects.filter(status=SlackNotificationEvent.PENDING) \
+        .order_by('next_attempt_at').values_list('next_attempt_at', flat=True).first()
+    if upcoming:
+        delay = int((upcoming - timezone.now()).total_seconds())
+        schedule_slack_outbox_drain(min(max(delay, SLACK_OUTBOX_DRAIN_DELAY), SLACK_RETRY_MAX_DELAY))
+
+    return result
@@ -0,0 +1,101 @@
+"""
+Work Permission Cache Utilities
+
+업무 워크스페이스(IssueProject) 사용자 실효 권한 캐시 - 세대(generation) 기반 무효화
+
+사용자별 캐시 항목 하나에 워크스페이스별 권한 코드·역할 속성을 모아 두고, 항목을 계산할 때의
+전역 세대(역할·권한·워크스페이스 트리 변경)와 사용자 세대(구성원·구성원 역할 변경)를 함께 기록한다.
+조회 시 세대 키 2개와 사용자 항목을 get_many 한 번으로 읽어 세대가 같으면 그대로 사용하므로
+권한 검사는 캐시 조회 1회로 처리되고, 원천 데이터가 바뀌면 세대 증가로 즉시 무효화된다.
+"""
+import time
+
+from django.core.cache import cache
+from django.db import transaction
+
+WORK_PERMISSION_CACHE_TIMEOUT = 60 * 60 * 24  # 1일 (세대 키 변경으로 무효화)
+HQ_SCOPE = 'hq'  # 본사(type='1') 워크스페이스 전체 권한 합집합
+
+_GLOBAL_GENERATION_KEY = 'work_permission:generation'
+_USER_GENERATION_KEY = 'work_permission:generation:user:{user_id}'
+_ENTRY_KEY = 'work_permission:user:{user_id}'
+_GLOBAL_ENTRY_KEY = 'work_permission:global:{name}'
+
+
+def _initial_generation():
+    # 세대 키가 유실(eviction)된 뒤 다시 생성되어도 이전 세대 값과 겹치지 않도록 시각 기반 초기값 사용
+    return int(time.time() * 1000)
+
+
+def _generation_keys(user_id):
+    return [_GLOBAL_GENERATION_KEY, _USER_GENERATION_KEY.format(user_id=user_id)]
+
+
+def bump_permission_generation(user_id=None):
+    """세대 증가 - user_id 지정 시 해당 사용자, 미지정 시 모든 사용자의 권한 캐시 무효화"""
+    key = _USER_GENERATION_KEY.format(user_id=user_id) if user_id else _GLOBAL_GENERATION_KEY
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, _initial_generation(), timeout=None)
+
+
+def invalidate_work_permissions(user_id=None):
+    """
+    즉시 세대 증가 + 트랜잭션 커밋 이후 한 번 더 증가
+
+    트랜잭션 진행 중 다른 요청이 커밋 전 데이터로 재계산해 새 세대로 저장한 항목도 커밋 시점에 무효화된다.
+    """
+    bump_permission_generation(user_id)
+    transaction.on_commit(lambda: bump_permission_generation(user_id))
+
+
+def _resolve_generations(found, keys):
+    """get_many 결과에서 세대 값 확인 (없으면 생성)"""
+    generations = []
+    for key in keys:
+        if key not in found:
+            # 동시 요청이 먼저 생성한 값이 있으면 그것을 사용
+            cache.add(key, _initial_generation(), timeout=None)
+            found[key] = cache.get(key)
+        generations.append(found[key])
+    return tuple(generations)
+
+
+def get_cached_permission_value(user_id, scope, kind, compute):
+    """
+    사용자·범위별 권한 값 조회 (세대 불일치 또는 미계산 시 compute() 결과 저장)
+
+    Args:
+        user_id: 사용자 pk
+        scope: 워크스페이스 pk 또는 HQ_SCOPE
+        kind: 'permissions' | 'role_attributes'
+        compute: 캐시 미스 시 값을 계산할 함수
+    """
+    generation_keys = _generation_keys(user_id)
+    entry_key = _ENTRY_KEY.format(user_id=user_id)
+    found = cache.get_many([*generation_keys, entry_key])
+    generations = _resolve_generations(found, generation_keys)
+
+    entry = found.get(entry_key)
+    if not entry or entry.get('generations') != generations:
+        entry = {'generations': generations, 'values': {}}
+
+    field = f'{kind}:{scope}'
+    if field not in entry['values']:
+        entry['values'][field] = compute()
+        cache.set(entry_key, entry, timeout=WORK_PERMISSION_CACHE_TIMEOUT)
+    return entry['values'][field]
+
+
+def get_cached_global_value(name, compute):
+    """사용자와 무관한 권한 정책 값 조회 (전역 세대 기준, 예: 비회원 역할 속성)"""
+    entry_key = _GLOBAL_ENTRY_KEY.format(name=name)
+    found = cache.get_many([_GLOBAL_GENERATION_KEY, entry_key])
+    generations = _resolve_generations(found, [_GLOBAL_GENERATION_KEY])
+
+    entry = found.get(entry_key)
+    if not entry or entry.get('generations') != generations:
+        entry = {'generations': generations, 'value': compute()}
+        cache.set(entry_key, entry, timeout=WORK_PERMISSION_CACHE_TIMEOUT)
+    return entry['value']
@@ -6,7 +6,7 @@ from django.utils.translation import gettext_lazy as _
 from import_export.admin import ImportExportMixin
 
 from .forms import UserCreationForm, UserChangeForm
-from .models import User, DocScrape  # , PostScrape
+from .models import User, DocScrape, SlackNotificationEvent  # , PostScrape
 
 
 # class ProfileInline(admin.StackedInline):
@@ -76,6 +76,14 @@ class DocScrapeAdmin(ImportExportMixin, admin.ModelAdmin):
     list_display = ('pk', 'user', 'docs', 'title', 'created')
     list_display_links = ('user', 'docs')
 
+
+@admin.register(SlackNotificationEvent)
+class SlackNotificationEventAdmin(admin.ModelAdmin):
+    list_display = ('pk', 'content_type', 'object_id', 'action', 'status', 'attempts', 'next_attempt_at',
+                    'sent_at', 'created_at')
+    list_filter = ('status', 'content_type')
+    readonly_fields = ('claimed_at', 'sent_at', 'created_at')
+
 # @admin.register(PostScrape)
 # class DocScrapeAdmin(ImportExportMixin, admin.ModelAdmin):
 #     list_display = ('pk', 'user', 'post', 'title', 'created')
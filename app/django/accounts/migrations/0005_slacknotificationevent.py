@@ -0,0 +1,42 @@
+# Generated by Django 6.0.7 on 2026-10-18 05:58
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0004_fcmdevice_notification'),
+        ('contenttypes', '0002_remove_content_type_name'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SlackNotificationEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('object_id', models.CharField(blank=True, max_length=50, verbose_name='대상 식별자')),
+                ('action', models.CharField(blank=True, help_text='등록, 편집, 삭제 등', max_length=10, verbose_name='작업')),
+                ('webhook_url', models.CharField(blank=True, max_length=500, verbose_name='웹훅 URL')),
+                ('payload', models.JSONField(blank=True, help_text='미리 생성된 메시지 (삭제 알림 등)', null=True, verbose_name='메시지')),
+                ('status', models.CharField(choices=[('pending', '대기 중'), ('processing', '처리 중'), ('sent', '전송 완료'), ('failed', '전송 실패'), ('skipped', '전송 제외')], default='pending', max_length=10, verbose_name='상태')),
+                ('attempts', models.PositiveSmallIntegerField(default=0, verbose_name='전송 시도 횟수')),
+                ('next_attempt_at', models.DateTimeField(default=django.utils.timezone.now, verbose_name='다음 시도 일시')),
+                ('claimed_at', models.DateTimeField(blank=True, null=True, verbose_name='처리 시작 일시')),
+                ('sent_at', models.DateTimeField(blank=True, null=True, verbose_name='전송 일시')),
+                ('error_message', models.TextField(blank=True, verbose_name='오류 메시지')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='발생일시')),
+                ('content_type', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='contenttypes.contenttype', verbose_name='대상 모델')),
+                ('user', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to=settings.AUTH_USER_MODEL, verbose_name='작업자')),
+            ],
+            options={
+                'verbose_name': 'Slack 알림 이벤트',
+                'verbose_name_plural': 'Slack 알림 이벤트 목록',
+                'ordering': ('created_at',),
+                'indexes': [models.Index(fields=['status', 'next_attempt_at'], name='accounts_sl_status_a8d549_idx')],
+            },
+        ),
+    ]
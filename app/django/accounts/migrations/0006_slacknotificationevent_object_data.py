@@ -0,0 +1,24 @@
+# Generated by Django 6.0.7 on 2026-10-18 06:50
+
+import django.core.serializers.json
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0005_slacknotificationevent'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='slacknotificationevent',
+            name='object_data',
+            field=models.JSONField(blank=True, encoder=django.core.serializers.json.DjangoJSONEncoder, help_text='삭제 알림 메시지 생성용 대상 필드 값 (관계 ID 포함)', null=True, verbose_name='삭제 대상 데이터'),
+        ),
+        migrations.AlterField(
+            model_name='slacknotificationevent',
+            name='payload',
+            field=models.JSONField(blank=True, help_text='미리 생성된 메시지 (대량 가져오기 요약 등)', null=True, verbose_name='메시지'),
+        ),
+    ]
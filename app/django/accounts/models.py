@@ -1,6 +1,7 @@
 from django.contrib.auth.base_user import AbstractBaseUser
 from django.contrib.auth.models import UserManager, PermissionsMixin
 from django.contrib.auth.validators import UnicodeUsernameValidator
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import models
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
@@ -219,3 +220,46 @@ class Notification(models.Model):
         verbose_name = '사용자 알림'
         verbose_name_plural = '사용자 알림 목록'
 
+
+
+class SlackNotificationEvent(models.Model):
+    """Slack 알림 아웃박스 (커밋 후 이벤트만 기록하고 Celery 작업에서 병합 전송)"""
+    PENDING = 'pending'
+    PROCESSING = 'processing'
+    SENT = 'sent'
+    FAILED = 'failed'
+    SKIPPED = 'skipped'
+
+    STATUS_CHOICES = (
+        (PENDING, '대기 중'),
+        (PROCESSING, '처리 중'),
+        (SENT, '전송 완료'),
+        (FAILED, '전송 실패'),
+        (SKIPPED, '전송 제외'),
+    )
+
+    content_type = models.ForeignKey('contenttypes.ContentType', on_delete=models.SET_NULL, null=True, blank=True,
+                                     verbose_name='대상 모델')
+    object_id = models.CharField('대상 식별자', max_length=50, blank=True)
+    action = models.CharField('작업', max_length=10, blank=True, help_text='등록, 편집, 삭제 등')
+    user = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True, verbose_name='작업자')
+    webhook_url = models.CharField('웹훅 URL', max_length=500, blank=True)
+    payload = models.JSONField('메시지', null=True, blank=True, help_text='미리 생성된 메시지 (대량 가져오기 요약 등)')
+    object_data = models.JSONField('삭제 대상 데이터', null=True, blank=True, encoder=DjangoJSONEncoder,
+                                   help_text='삭제 알림 메시지 생성용 대상 필드 값 (관계 ID 포함)')
+    status = models.CharField('상태', max_length=10, choices=STATUS_CHOICES, default=PENDING)
+    attempts = models.PositiveSmallIntegerField('전송 시도 횟수', default=0)
+    next_attempt_at = models.DateTimeField('다음 시도 일시', default=timezone.now)
+    claimed_at = models.DateTimeField('처리 시작 일시', null=True, blank=True)
+    sent_at = models.DateTimeField('전송 일시', null=True, blank=True)
+    error_message = models.TextField('오류 메시지', blank=True)
+    created_at = models.DateTimeField('발생일시', auto_now_add=True)
+
+    def __str__(self):
+        return f"[{self.get_status_display()}] {self.content_type} {self.object_id} ({self.action})"
+
+    class Meta:
+        ordering = ('created_at',)
+        indexes = [models.Index(fields=['status', 'next_attempt_at'])]
+        verbose_name = 'Slack 알림 이벤트'
+        verbose_name_plural = 'Slack 알림 이벤트 목록'
@@ -0,0 +1,21 @@
+import logging
+
+from celery import shared_task
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(bind=True, ignore_result=True)
+def drain_slack_outbox_task(self) -> dict:
+    """
+    Slack 알림 아웃박스 전송 (웹훅별 병합, 실패 시 백오프 재시도)
+
+    Returns:
+        dict: 처리 결과
+    """
+    from _utils.slack_notifications import drain_slack_outbox
+
+    result = drain_slack_outbox()
+    if result['messages']:
+        logger.info(f"Slack 알림 아웃박스 전송: {result}")
+    return result
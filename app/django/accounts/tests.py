@@ -1,3 +1,53 @@
-from django.test import TestCase
+from django.core.cache import cache
 
-# Create your tests here.
+from _utils.slack_notifications import (
+    SLACK_OUTBOX_LOCK_KEY, build_slack_message, coalesce_slack_messages, restore_instance
+)
+from accounts.models import SlackNotificationEvent
+from ledger.models import ProjectBankTransaction
+from payment.tests import PaymentTestCaseBase
+
+
+class SlackOutboxTests(PaymentTestCaseBase):
+    def test_bank_transaction_save_records_outbox_event_on_commit(self):
+        cache.set(SLACK_OUTBOX_LOCK_KEY, 1, 60)  # 전송 작업 예약 생략
+        SlackNotificationEvent.objects.all().delete()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.bank_transaction.content = '1차 계약금 납부 (수정)'
+            self.bank_transaction.updator = self.user
+            self.bank_transaction.save()
+
+        event = SlackNotificationEvent.objects.get()
+        self.assertEqual(event.status, SlackNotificationEvent.PENDING)
+        self.assertEqual(event.object_id, str(self.bank_transaction.pk))
+        self.assertEqual(event.action, '편집')
+        self.assertIsNone(event.payload)
+
+    def test_coalesce_merges_attachments_into_single_message(self):
+        messages = [{'attachments': [{'title': 'a'}]}, {'attachments': [{'title': 'b'}]}]
+        merged = coalesce_slack_messages(messages)
+        self.assertEqual([a['title'] for a in merged['attachments']], ['a', 'b'])
+        self.assertIs(coalesce_slack_messages(messages[:1]), messages[0])
+
+    def test_coalesce_joins_top_level_text(self):
+        messages = [{'text': '대량 가져오기 완료', 'attachments': [{'title': 'a'}]}, {'attachments': [{'title': 'b'}]}]
+        merged = coalesce_slack_messages(messages)
+        self.assertEqual(merged['text'].split('\n')[1:], ['대량 가져오기 완료'])
+
+    def test_delete_event_records_object_data_and_task_builds_message(self):
+        cache.set(SLACK_OUTBOX_LOCK_KEY, 1, 60)  # 전송 작업 예약 생략
+        SlackNotificationEvent.objects.all().delete()
+        pk = self.bank_transaction.pk
+        with self.captureOnCommitCallbacks(execute=True):
+            self.bank_transaction.delete()
+
+        event = SlackNotificationEvent.objects.get()
+        self.assertEqual(event.action, '삭제')
+        self.assertIsNone(event.payload)
+        self.assertEqual(event.object_data['id'], pk)
+
+        instance = restore_instance(ProjectBankTransaction, event.object_data)
+        self.assertEqual((instance.pk, instance.project, instance.amount),
+                         (pk, self.project, self.bank_transaction.amount))
+        message = build_slack_message(instance, event.action, self.user)
+        self.assertIn('(삭제)', message['attachments'][0]['title'])
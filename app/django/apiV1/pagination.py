@@ -1,5 +1,13 @@
-from rest_framework.pagination import PageNumberPagination, LimitOffsetPagination
+import base64
+import binascii
+import json
+
+from django.db import connections
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination, LimitOffsetPagination
 from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
 
 
 class PageNumberPaginationBase(PageNumberPagination):
@@ -121,3 +129,174 @@ class PageNumberPaginationFifteen(PageNumberPaginationBase):
 
 class PageNumberPaginationTen(PageNumberPaginationBase):
     page_size = 10
+
+
+def estimate_count(queryset):
+    """
+    쿼리셋 결과 건수 추정
+
+    PostgreSQL 은 실행 계획(EXPLAIN)의 예상 행 수를 사용하여 전체 COUNT 스캔을 피하고,
+    그 외 DB 는 정확한 COUNT 를 반환한다.
+    """
+    queryset = queryset.order_by()
+    if connections[queryset.db].vendor == 'postgresql':
+        plan = json.loads(queryset.explain(format='json'))
+        return int(plan[0]['Plan']['Plan Rows'])
+    return queryset.count()
+
+
+class KeysetPagination(BasePagination):
+    """
+    키셋(커서) 페이지네이션
+
+    ordering 필드 값 조합(예: deal_date, id)을 커서로 사용하여 OFFSET 스캔과 전체 COUNT 없이
+    다음/이전 페이지를 조회한다. 커서는 마지막으로 본 행의 키 값이므로
+    조회 중 새 행이 추가되어도 페이지 경계가 밀리지 않는다.
+
+    - ?cursor=<커서>: 이동할 페이지 (다음/이전 링크 값)
+    - ?total=approx|exact: 전체 건수 포함 (approx 는 PostgreSQL 실행 계획 추정치)
+    """
+    ordering = ('-deal_date', '-id')
+    page_size = 15
+    page_size_query_param = 'limit'
+    max_page_size = 1000
+    cursor_query_param = 'cursor'
+    total_query_param = 'total'
+
+    def __init__(self):
+        self.base_url = None
+        self.page = []
+        self.has_more = False
+        self.reverse = False
+        self.has_cursor = False
+        self.count = None
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        if page_size <= 0:
+            return self.page_size
+        return min(page_size, self.max_page_size)
+
+    def decode_cursor(self, request):
+        """커서 문자열 → (키 값 목록, 역방향 여부)"""
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None, False
+        try:
+            data = json.loads(base64.urlsafe_b64decode(encoded.encode('ascii')).decode('utf-8'))
+            values, reverse = data['k'], bool(data.get('r'))
+        except (binascii.Error, UnicodeError, ValueError, TypeError, KeyError):
+            raise NotFound('유효하지 않은 커서입니다.')
+        if not isinstance(values, list) or len(values) != len(self.ordering):
+            raise NotFound('유효하지 않은 커서입니다.')
+        return values, reverse
+
+    def encode_cursor(self, instance, reverse):
+        values = [str(getattr(instance, field.lstrip('-'))) for field in self.ordering]
+        data = {'k': values, 'r': 1} if reverse else {'k': values}
+        encoded = base64.urlsafe_b64encode(json.dumps(data, separators=(',', ':')).encode('utf-8')).decode('ascii')
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    def keyset_filter(self, values, reverse):
+        """(a, b) 키 기준 '다음 행' 조건: a < v1 OR (a = v1 AND b < v2) (내림차순 기준)"""
+        condition = Q()
+        for i, field in enumerate(self.ordering):
+            name = field.lstrip('-')
+            descending = field.startswith('-') != reverse
+            q = Q(**{f'{name}__{"lt" if descending else "gt"}': values[i]})
+            for prev_field, prev_value in zip(self.ordering[:i], values[:i]):
+                q &= Q(**{prev_field.lstrip('-'): prev_value})
+            condition |= q
+        return condition
+
+    def paginate_queryset(self, queryset, request, view=None):
+        page_size = self.get_page_size(request)
+        self.base_url = remove_query_param(request.build_absolute_uri(), self.total_query_param)
+        values, self.reverse = self.decode_cursor(request)
+        self.has_cursor = values is not None
+
+        total = request.query_params.get(self.total_query_param)
+        if total == 'approx':
+            self.count = estimate_count(queryset)
+        elif total == 'exact':
+            self.count = queryset.count()
+
+        ordering = self.ordering
+        if self.reverse:
+            ordering = tuple(field[1:] if field.startswith('-') else f'-{field}' for field in ordering)
+        queryset = queryset.order_by(*ordering)
+        if self.has_cursor:
+            queryset = queryset.filter(self.keyset_filter(values, self.reverse))
+
+        results = list(queryset[:page_size + 1])
+        self.has_more = len(results) > page_size
+        self.page = results[:page_size]
+        if self.reverse:
+            self.page.reverse()
+        return self.page
+
+    def get_next_link(self):
+        if not self.page or not (self.reverse or self.has_more):
+            return None
+        return self.encode_cursor(self.page[-1], reverse=False)
+
+    def get_previous_link(self):
+        if not self.page or not self.has_cursor or (self.reverse and not self.has_more):
+            return None
+        return self.encode_cursor(self.page[0], reverse=True)
+
+    def get_paginated_response(self, data):
+        return Response({
+            'count': self.count,
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'results': data
+        })
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'count': {'type': 'integer', 'nullable': True},
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'previous': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'results': schema,
+            },
+        }
+
+
+class TransactionPagination(BasePagination):
+    """
+    원장 거래 목록 페이지네이션
+
+    기본은 페이지 번호 방식이며, ?pagination=cursor 또는 ?cursor= 가 있으면
+    (deal_date, id) 키셋 커서 방식으로 조회한다.
+    """
+    page_number_class = PageNumberPaginationFifteen
+    keyset_class = KeysetPagination
+    mode_query_param = 'pagination'
+
+    def __init__(self):
+        self.paginator = None
+
+    def is_keyset_request(self, request):
+        return (request.query_params.get(self.mode_query_param) == 'cursor'
+                or self.keyset_class.cursor_query_param in request.query_params)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if self.is_keyset_request(request):
+            self.paginator = self.keyset_class()
+            self.paginator.page_size = self.page_number_class.page_size
+        else:
+            self.paginator = self.page_number_class()
+        return self.paginator.paginate_queryset(queryset, request, view=view)
+
+    def get_paginated_response(self, data):
+        return self.paginator.get_paginated_response(data)
+
+    def get_paginated_response_schema(self, schema):
+        return self.page_number_class().get_paginated_response_schema(schema)
@@ -1,5 +1,7 @@
 from rest_framework import permissions
 
+from _utils.work_permission_cache import HQ_SCOPE, get_cached_permission_value
+
 from apiV1.permissions._utils import (get_project_pk_from_request, resolve_issue_project,
                                       is_project_locked, is_project_closed)
 from apiV1.permissions.work_perms import ProjectPermission
@@ -79,15 +81,20 @@ class HqProjectModulePermission(permissions.BasePermission):
 
     @classmethod
     def _get_all_hq_user_permissions(cls, user):
-        """모든 type='1' 본사업무 워크스페이스의 권한을 합집합으로 반환"""
+        """모든 type='1' 본사업무 워크스페이스의 권한을 합집합으로 반환 (사용자별 권한 캐시 사용)"""
+        return set(get_cached_permission_value(
+            user.pk, HQ_SCOPE, 'permissions', lambda: cls._compute_all_hq_user_permissions(user)))
+
+    @staticmethod
+    def _compute_all_hq_user_permissions(user):
         from work.models.project import IssueProject
         all_hq_ips = IssueProject.objects.filter(type='1')
 
         all_perms = set()
         for hq_ip in all_hq_ips:
             # 각 워크스페이스의 권한을 수집
-            all_perms.update(set(hq_ip.get_user_permissions(user)))
-        return all_perms
+            all_perms.update(hq_ip.compute_user_permissions(user))
+        return sorted(all_perms)
 
     def has_permission(self, request, view) -> bool:
         # 1. 미인증 요청 차단
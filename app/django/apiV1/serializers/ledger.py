@@ -57,9 +57,7 @@ class CompanyAccountSerializer(serializers.ModelSerializer):
     parent_name = serializers.CharField(source='parent.name', read_only=True)
     category_display = serializers.CharField(source='get_category_display', read_only=True)
     direction_display = serializers.CharField(source='get_direction_display', read_only=True)
-    computed_direction = serializers.SerializerMethodField(read_only=True)
     computed_direction_display = serializers.SerializerMethodField(read_only=True)
-    full_path = serializers.CharField(source='get_full_path', read_only=True)
     children_count = serializers.SerializerMethodField(read_only=True)
 
     class Meta:
@@ -68,16 +66,11 @@ class CompanyAccountSerializer(serializers.ModelSerializer):
                   'category_display', 'direction', 'direction_display', 'computed_direction',
                   'computed_direction_display', 'is_category_only', 'is_transfer_fee', 'is_active',
                   'requires_affiliate', 'order', 'full_path', 'children_count')
-        read_only_fields = ('depth',)
-
-    @staticmethod
-    def get_computed_direction(obj):
-        """동적으로 계산된 거래 방향"""
-        return obj.get_computed_direction()
+        read_only_fields = ('depth', 'full_path', 'computed_direction')
 
     @staticmethod
     def get_computed_direction_display(obj):
-        """동적으로 계산된 거래 방향의 표시 텍스트"""
+        """저장된 계산 거래 방향의 표시 텍스트"""
         return obj.get_direction_display_computed()
 
     @staticmethod
@@ -93,9 +86,7 @@ class ProjectAccountSerializer(serializers.ModelSerializer):
     parent_name = serializers.CharField(source='parent.name', read_only=True)
     category_display = serializers.CharField(source='get_category_display', read_only=True)
     direction_display = serializers.CharField(source='get_direction_display', read_only=True)
-    computed_direction = serializers.SerializerMethodField(read_only=True)
     computed_direction_display = serializers.SerializerMethodField(read_only=True)
-    full_path = serializers.CharField(source='get_full_path', read_only=True)
     children_count = serializers.SerializerMethodField(read_only=True)
 
     class Meta:
@@ -104,16 +95,11 @@ class ProjectAccountSerializer(serializers.ModelSerializer):
                   'direction', 'direction_display', 'computed_direction', 'computed_direction_display',
                   'is_category_only', 'is_transfer_fee', 'is_active', 'order', 'is_payment',
                   'requires_contract', 'is_related_contractor', 'full_path', 'children_count')
-        read_only_fields = ('depth',)
-
-    @staticmethod
-    def get_computed_direction(obj):
-        """동적으로 계산된 거래 방향"""
-        return obj.get_computed_direction()
+        read_only_fields = ('depth', 'full_path', 'computed_direction')
 
     @staticmethod
     def get_computed_direction_display(obj):
-        """동적으로 계산된 거래 방향의 표시 텍스트"""
+        """저장된 계산 거래 방향의 표시 텍스트"""
         return obj.get_direction_display_computed()
 
     @staticmethod
@@ -172,7 +158,7 @@ class CompanyAccountingEntrySerializer(serializers.ModelSerializer):
     sort_name = serializers.CharField(source='sort.name', read_only=True)
     account_name = serializers.CharField(source='account.name', read_only=True)
     account_code = serializers.CharField(source='account.code', read_only=True)
-    account_full_path = serializers.CharField(source='account.get_full_path', read_only=True)
+    account_full_path = serializers.CharField(source='account.full_path', read_only=True)
     affiliate_display = serializers.SerializerMethodField(read_only=True)
     evidence_type_display = serializers.CharField(source='get_evidence_type_display', read_only=True)
 
@@ -207,7 +193,7 @@ class ProjectAccountingEntrySerializer(serializers.ModelSerializer):
     project_name = serializers.CharField(source='project.name', read_only=True)
     account_name = serializers.CharField(source='account.name', read_only=True)
     account_code = serializers.CharField(source='account.code', read_only=True)
-    account_full_path = serializers.CharField(source='account.get_full_path', read_only=True)
+    account_full_path = serializers.CharField(source='account.full_path', read_only=True)
     contract_display = serializers.SerializerMethodField(read_only=True)
     contractor_display = serializers.SerializerMethodField(read_only=True)
     evidence_type_display = serializers.CharField(source='get_evidence_type_display', read_only=True)
@@ -515,6 +501,7 @@ class CompanyCompositeTransactionSerializer(serializers.Serializer):
             )
             accounting_entries.append(accounting_entry)
 
+        bank_tx.refresh_entry_balance()
         return {
             'bank_transaction': bank_tx,
             'accounting_entries': accounting_entries,
@@ -591,6 +578,8 @@ class CompanyCompositeTransactionSerializer(serializers.Serializer):
         else:
             accounting_entries = instance.accounting_entries.all()
 
+        # 분개 일괄 삭제(queryset.delete) 포함 최종 분개 기준으로 균형 상태 갱신
+        instance.refresh_entry_balance()
         return {
             'bank_transaction': instance,
             'accounting_entries': accounting_entries,
@@ -826,6 +815,7 @@ class ProjectCompositeTransactionSerializer(serializers.Serializer):
 
             accounting_entries.append(accounting_entry)
 
+        bank_tx.refresh_entry_balance()
         result = {
             'bank_transaction': bank_tx,
             'accounting_entries': accounting_entries,
@@ -935,6 +925,8 @@ class ProjectCompositeTransactionSerializer(serializers.Serializer):
             # payload에 accounting_entries가 없는 경우, 기존 분개 목록을 그대로 사용
             accounting_entries = instance.accounting_entries.all()
 
+        # 분개 일괄 삭제 포함 최종 분개 기준으로 균형 상태 갱신
+        instance.refresh_entry_balance()
         result = {
             'bank_transaction': instance,
             'accounting_entries': accounting_entries,
@@ -1,6 +1,8 @@
 from rest_framework import serializers
 
 from apiV1.serializers.accounts import SimpleUserSerializer
+from _pdf.models import PdfExportJob
+from _pdf.tasks import PDF_EXPORT_VIEWS
 from notice.models import SalesBillIssue, RegisteredSenderNumber, MessageTemplate, MessageSendHistory
 
 
@@ -86,8 +88,8 @@ class SMSMessageSerializer(serializers.Serializer):
     recipients = serializers.ListField(
         child=serializers.CharField(max_length=20),
         min_length=1,
-        max_length=1000,
-        help_text="수신자 번호 리스트 (최대 1000명)"
+        max_length=10000,
+        help_text="수신자 번호 리스트 (최대 10,000명, 1,000명 단위 분할 발송)"
     )
     scheduled_send = serializers.BooleanField(
         default=False,
@@ -157,9 +159,9 @@ class SMSMessageSerializer(serializers.Serializer):
     @staticmethod
     def validate_recipients(value):
         """수신자 번호 유효성 검사"""
-        if len(value) > 1000:
+        if len(value) > 10000:
             raise serializers.ValidationError(
-                "수신자는 최대 1000명까지 가능합니다."
+                "수신자는 최대 10,000명까지 가능합니다."
             )
 
         # 전화번호 형식 검사
@@ -377,9 +379,11 @@ class MessageSendHistorySerializer(serializers.ModelSerializer):
         fields = (
             'id', 'message_type', 'sender_number', 'message_content', 'title',
             'recipients', 'recipient_count', 'sent_at', 'request_no', 'company_id',
-            'project', 'scheduled_send', 'schedule_datetime', 'sent_by', 'created'
+            'project', 'scheduled_send', 'schedule_datetime', 'sent_by', 'status',
+            'success_count', 'fail_count', 'result_message', 'checked_at', 'created'
         )
-        read_only_fields = ('id', 'sent_by', 'created')
+        read_only_fields = ('id', 'sent_by', 'status', 'success_count', 'fail_count',
+                            'result_message', 'checked_at', 'created')
 
 
 class MessageSendHistoryListSerializer(serializers.ModelSerializer):
@@ -391,5 +395,32 @@ class MessageSendHistoryListSerializer(serializers.ModelSerializer):
     class Meta:
         model = MessageSendHistory
         fields = ('id', 'message_type', 'sender_number', 'title', 'message_content', 'recipient_count',
-                  'sent_at', 'request_no', 'scheduled_send', 'sent_by', 'created')
-        read_only_fields = ('id', 'sent_by', 'created')
+                  'sent_at', 'request_no', 'scheduled_send', 'sent_by', 'status', 'success_count',
+                  'fail_count', 'created')
+        read_only_fields = ('id', 'sent_by', 'status', 'success_count', 'fail_count', 'created')
+
+
+# PDF Export Job ------------------------------------------------------------------
+class PdfExportJobSerializer(serializers.ModelSerializer):
+    """백그라운드 PDF 생성 작업 시리얼라이저"""
+    progress = serializers.IntegerField(read_only=True)
+
+    class Meta:
+        model = PdfExportJob
+        fields = ('pk', 'export_type', 'params', 'status', 'progress', 'total_records', 'processed_records',
+                  'filename', 'error_message', 'created_at', 'started_at', 'completed_at')
+        read_only_fields = ('status', 'total_records', 'processed_records', 'filename', 'error_message',
+                            'created_at', 'started_at', 'completed_at')
+
+    @staticmethod
+    def validate_export_type(value):
+        if value not in PDF_EXPORT_VIEWS:
+            raise serializers.ValidationError("지원하지 않는 출력 유형입니다.")
+        return value
+
+    @staticmethod
+    def validate_params(value):
+        # 동기 출력 URL 의 쿼리 파라미터와 동일한 문자열 값만 허용
+        if not isinstance(value, dict) or not all(isinstance(v, (str, int)) for v in value.values()):
+            raise serializers.ValidationError("파라미터는 문자열 값의 객체여야 합니다.")
+        return {key: str(v) for key, v in value.items()}
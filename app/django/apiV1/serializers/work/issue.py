@@ -1,4 +1,4 @@
-from django.db import transaction, IntegrityError
+from django.db import models, transaction, IntegrityError
 from django.utils import timezone
 from rest_framework import serializers
 
@@ -10,6 +10,9 @@ from work.models.issue import (IssueCategory, Tracker, IssueStatus, Workflow, Co
                                Issue, IssueRelation, IssueFile, IssueLink, IssueComment)
 from work.models.meeting import Meeting
 from work.models.project import IssueProject, Member, Version, ProjectSubscription
+from work.services.issue_counter import count_by_tracker
+from work.services.issue_loader import LOADED_OUTGOING_RELATIONS, LOADED_SUB_ISSUES, load_issue_relations
+from work.services.project_tree import get_subtree_ids
 
 
 class MeetingInIssueSerializer(serializers.ModelSerializer):
@@ -89,6 +92,13 @@ class IssueRelationIncomingSerializer(serializers.ModelSerializer):
         fields = ('pk', 'issue', 'delay')
 
 
+class IssueListSerializer(serializers.ListSerializer):
+    def to_representation(self, data):
+        # 페이지 업무 ID 기준 관계 일괄 로딩 후 직렬화 (업무별 추가 쿼리 방지)
+        iterable = data.all() if isinstance(data, models.manager.BaseManager) else data
+        return super().to_representation(load_issue_relations(list(iterable)))
+
+
 class IssueSerializer(serializers.ModelSerializer):
     project = SimpleIssueProjectSerializer(read_only=True)
     tracker = TrackerInIssueProjectSerializer(read_only=True)
@@ -114,14 +124,15 @@ class IssueSerializer(serializers.ModelSerializer):
                   'expected_duration', 'expected_duration_display', 'start_date', 'due_date',
                   'done_ratio', 'closed', 'files', 'links', 'sub_issues', 'outgoing_relations', 'incoming_relation',
                   'creator', 'updater', 'created', 'updated', 'meeting', 'meeting_desc')
+        list_serializer_class = IssueListSerializer
 
     @staticmethod
     def get_sub_issues(obj):
-        return IssueInIssueSerializer(obj.issue_set.all().order_by('id'), many=True, read_only=True).data
+        return IssueInIssueSerializer(getattr(obj, LOADED_SUB_ISSUES), many=True, read_only=True).data
 
     @staticmethod
     def get_outgoing_relations(obj):
-        return IssueRelationInIssueSerializer(obj.outgoing_relations.all().order_by('id'), many=True,
+        return IssueRelationInIssueSerializer(getattr(obj, LOADED_OUTGOING_RELATIONS), many=True,
                                               read_only=True).data
 
     @staticmethod
@@ -131,6 +142,7 @@ class IssueSerializer(serializers.ModelSerializer):
         return None
 
     def to_representation(self, instance):
+        load_issue_relations([instance])
         ret = super().to_representation(instance)
         user = self.context['request'].user
 
@@ -143,7 +155,7 @@ class IssueSerializer(serializers.ModelSerializer):
         is_related = (
                 user == instance.creator or
                 user == instance.assigned_to or
-                instance.watchers.filter(pk=user.id).exists()
+                any(watcher.pk == user.pk for watcher in instance.watchers.all())
         )
         if not is_related and 'issue.watcher_read' not in user_perms:
             ret['watchers'] = []
@@ -661,52 +673,27 @@ class IssueCountByTrackerSerializer(serializers.ModelSerializer):
         fields = ['pk', 'name', 'open', 'closed']
 
     def get_open(self, obj):
-        issues = Issue.objects.filter(tracker=obj, closed__isnull=True)
-        # Access the request object from context
-        request = self.context.get('request')
-        issues = self.filter_project(request, issues)
-        return issues.count()
+        return self.get_tracker_counts().get((obj.pk, False), 0)
 
     def get_closed(self, obj):
-        issues = Issue.objects.filter(tracker=obj).exclude(closed__isnull=True)
-        # Access the request object from context
-        request = self.context.get('request')
-        issues = self.filter_project(request, issues)
-        return issues.count()
-
-    def filter_project(self, request, issues):
-        project_id = request.query_params.get('projects')
-        if not project_id:
-            return issues  # 프로젝트 ID가 제공되지 않은 경우, 필터링 없이 반환
-
-        # 1. 이미 이전 루프에서 모아둔 캐시가 있다면 재사용
-        if hasattr(self, '_project_slugs_cache'):
-            return issues.filter(project__slug__in=self._project_slugs_cache)
-
-        try:
-            project = IssueProject.objects.get(pk=project_id)
-        except IssueProject.DoesNotExist:
-            return issues  # 유효하지 않은 프로젝트 ID인 경우, 필터링 없이 반환
-
-        # 2. 단 한 번의 쿼리로 모든 프로젝트를 메모리에 로드
-        all_projects = list(IssueProject.objects.all())
-
-        # 3. DB 히트 없이 메모리에서 자식 노드 재귀 수집
-        sub_projects_slugs = []
+        return self.get_tracker_counts().get((obj.pk, True), 0)
 
-        def collect_children(parent_obj):
-            for p in all_projects:
-                if p.parent_id == parent_obj.id:
-                    sub_projects_slugs.append(p.slug)
-                    collect_children(p)
+    def get_tracker_counts(self):
+        # 업무 건수 카운터에서 유형별 진행·완료 수를 한 번에 조회하여 재사용
+        if not hasattr(self, '_tracker_counts_cache'):
+            request = self.context.get('request')
+            self._tracker_counts_cache = count_by_tracker(self.get_project_ids(request))
+        return self._tracker_counts_cache
 
-        collect_children(project)
-        slugs = [project.slug] + sub_projects_slugs
-
-        # 4. 캐싱 처리
-        self._project_slugs_cache = slugs
+    @staticmethod
+    def get_project_ids(request):
+        project_id = request.query_params.get('projects') if request else None
+        if not project_id:
+            return None  # 프로젝트 ID가 제공되지 않은 경우, 필터링 없이 집계
 
-        return issues.filter(project__slug__in=slugs)
+        if not IssueProject.objects.filter(pk=project_id).exists():
+            return None  # 유효하지 않은 프로젝트 ID인 경우, 필터링 없이 집계
+        return get_subtree_ids(int(project_id))
 
 
 class IssueStatusSerializer(serializers.ModelSerializer):
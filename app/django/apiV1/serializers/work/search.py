@@ -2,7 +2,7 @@ from rest_framework import serializers
 
 from work.models.issue import Issue, IssueComment
 from work.models.meeting import Meeting
-from work.models.inform import News
+from work.models.inform import News, SearchEntry
 from docs.models import Document
 from forum.models import Post
 
@@ -128,3 +128,19 @@ class PostSearchSerializer(serializers.ModelSerializer):
     @staticmethod
     def get_creator(obj):
         return {'pk': obj.creator.pk, 'username': obj.creator.username} if obj.creator else None
+
+
+class SearchEntrySerializer(serializers.ModelSerializer):
+    type = serializers.CharField(source='object_type', read_only=True)
+    type_desc = serializers.CharField(source='get_object_type_display', read_only=True)
+    pk = serializers.IntegerField(source='object_id', read_only=True)
+    project = serializers.SerializerMethodField()
+    score = serializers.FloatField(source='rank', read_only=True)
+
+    class Meta:
+        model = SearchEntry
+        fields = ('type', 'type_desc', 'pk', 'issue', 'project', 'title', 'score', 'updated')
+
+    @staticmethod
+    def get_project(obj):
+        return {'slug': obj.project.slug, 'name': obj.project.name}
@@ -1,10 +1,21 @@
+from datetime import timedelta
+
 from django.contrib.auth import get_user_model
-from django.test import TestCase, RequestFactory
+from django.http import HttpResponse
+from django.test import TestCase, RequestFactory, override_settings
 from django.core.files.uploadedfile import SimpleUploadedFile
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
 from work.models.meeting import Meeting, MeetingCategory, MeetingFile
 from work.models.project import IssueProject
 from company.models import Company
 from apiV1.serializers.work.meeting import MeetingSerializer
+from notice.models import MessageSendHistory
+from notice.tasks import RECONCILE_MAX_CHECKS, SEND_CLAIM_TIMEOUT, apply_send_history_records, close_unsettled_histories
+from _config.database_router import (
+    PRIMARY_PIN_COOKIE, MasterSlaveRouter, PrimaryPinMiddleware, is_primary_pinned, reset_primary_pin, use_primary)
 
 User = get_user_model()
 
@@ -113,3 +124,123 @@ class MeetingSerializerTests(TestCase):
         self.assertEqual(files.count(), 1)
         # Check that the file was created (the name is renamed by Django)
         self.assertTrue(files.first().file.name.endswith('.txt'))
+
+
+class MessageSendQueueTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_superuser(username='sender', password='password', email='sender@test.com')
+        self.client.force_authenticate(user=self.user)
+
+    def test_send_sms_is_queued_in_recipient_batches(self):
+        recipients = [f'010{i:08d}' for i in range(1500)]
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            response = self.client.post(reverse('api:messages-send-sms'), {
+                'message': '테스트 메시지',
+                'sender_number': '0212345678',
+                'recipients': recipients,
+                'company_id': 'test-company',
+            }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(response.data['resultCode'], 0)
+        self.assertEqual(len(callbacks), 1)
+
+        histories = MessageSendHistory.objects.order_by('pk')
+        self.assertEqual([h.recipient_count for h in histories], [1000, 500])
+        self.assertEqual(sorted(response.data['historyIds']), [h.pk for h in histories])
+        for history in histories:
+            self.assertEqual(history.status, MessageSendHistory.QUEUED)
+            self.assertEqual(history.message_type, 'SMS')
+            self.assertEqual(history.sent_by, self.user)
+
+    def test_send_history_records_settle_status_and_sent_at(self):
+        history = MessageSendHistory.objects.create(
+            message_type='SMS', sender_number='0212345678', message_content='테스트',
+            recipients=['01000000000', '01000000001'], recipient_count=2, sent_at=timezone.now(),
+            company_id='test-company', request_no='100', status=MessageSendHistory.REQUESTED)
+
+        self.assertFalse(apply_send_history_records(history, [{'requestNo': '100', 'sendStatusCode': 'WAIT'}]))
+        self.assertEqual(history.status, MessageSendHistory.REQUESTED)
+        self.assertEqual(history.check_count, 1)
+
+        settled = apply_send_history_records(history, [
+            {'requestNo': '100', 'sendStatusCode': 'WAIT'},
+            {'requestNo': '100', 'sendStatusCode': '06', 'sendDate': '2026-10-18 10:00:05'},
+            {'requestNo': '100', 'sendStatusCode': '07', 'sendDate': '2026-10-18 10:00:07'},
+        ])
+        self.assertTrue(settled)
+        self.assertEqual(history.status, MessageSendHistory.COMPLETED)
+        self.assertEqual((history.success_count, history.fail_count), (1, 1))
+        self.assertEqual(timezone.localtime(history.sent_at).strftime('%Y-%m-%d %H:%M:%S'), '2026-10-18 10:00:07')
+
+    def test_unsettled_histories_end_in_unknown_status(self):
+        history = MessageSendHistory.objects.create(
+            message_type='SMS', sender_number='0212345678', message_content='테스트',
+            recipients=['01000000000'], recipient_count=1, sent_at=timezone.now(), company_id='test-company',
+            request_no='100', status=MessageSendHistory.REQUESTED, check_count=RECONCILE_MAX_CHECKS - 1)
+        self.assertTrue(apply_send_history_records(history, [{'requestNo': '100', 'sendStatusCode': 'WAIT'}]))
+        self.assertEqual(history.status, MessageSendHistory.UNKNOWN)
+
+        now = timezone.now()
+        stale = MessageSendHistory.objects.create(
+            message_type='SMS', sender_number='0212345678', message_content='테스트',
+            recipients=['01000000000'], recipient_count=1, sent_at=now, status=MessageSendHistory.SENDING,
+            claimed_at=now - timedelta(seconds=SEND_CLAIM_TIMEOUT + 60))
+        sending = MessageSendHistory.objects.create(
+            message_type='SMS', sender_number='0212345678', message_content='테스트',
+            recipients=['01000000000'], recipient_count=1, sent_at=now, status=MessageSendHistory.SENDING,
+            claimed_at=now)
+
+        self.assertEqual(close_unsettled_histories(now), 1)
+        stale.refresh_from_db()
+        sending.refresh_from_db()
+        self.assertEqual(stale.status, MessageSendHistory.UNKNOWN)
+        self.assertEqual(sending.status, MessageSendHistory.SENDING)
+
+
+class DatabaseRouterPinTests(TestCase):
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.router = MasterSlaveRouter()
+        reset_primary_pin()
+
+    def tearDown(self):
+        reset_primary_pin()
+
+    def test_write_pins_following_reads_to_primary(self):
+        self.assertFalse(is_primary_pinned())
+        self.assertEqual(self.router.db_for_write(Company), 'default')
+        self.assertTrue(is_primary_pinned())
+        self.assertEqual(self.router.db_for_read(Company), 'default')
+
+    def test_use_primary_restores_previous_state(self):
+        with use_primary():
+            self.assertTrue(is_primary_pinned())
+        self.assertFalse(is_primary_pinned())
+
+    @override_settings(SESSION_COOKIE_SAMESITE='None', SESSION_COOKIE_SECURE=True,
+                       SESSION_COOKIE_DOMAIN='.example.com')
+    def test_pin_cookie_follows_session_cookie_attributes(self):
+        def write_view(request):
+            self.router.db_for_write(Company)
+            return HttpResponse()
+
+        cookie = PrimaryPinMiddleware(write_view)(self.factory.post('/')).cookies[PRIMARY_PIN_COOKIE]
+        self.assertEqual(cookie['samesite'], 'None')
+        self.assertTrue(cookie['secure'])
+        self.assertEqual(cookie['domain'], '.example.com')
+
+    def test_middleware_sets_pin_cookie_only_after_write(self):
+        def write_view(request):
+            self.router.db_for_write(Company)
+            return HttpResponse()
+
+        response = PrimaryPinMiddleware(lambda request: HttpResponse())(self.factory.get('/'))
+        self.assertNotIn(PRIMARY_PIN_COOKIE, response.cookies)
+
+        response = PrimaryPinMiddleware(write_view)(self.factory.post('/'))
+        self.assertIn(PRIMARY_PIN_COOKIE, response.cookies)
+
+        request = self.factory.get('/')
+        request.COOKIES[PRIMARY_PIN_COOKIE] = '1'
+        PrimaryPinMiddleware(lambda request: HttpResponse())(request)
+        self.assertTrue(is_primary_pinned())
@@ -195,6 +195,7 @@ router.register(r'messages', notice.MessageViewSet, basename='messages')
 router.register(r'registered-sender-numbers', notice.RegisteredSenderNumberViewSet)
 router.register(r'message-templates', notice.MessageTemplateViewSet)
 router.register(r'message-send-history', notice.MessageSendHistoryViewSet)
+router.register(r'pdf-export-job', notice.PdfExportJobViewSet, basename='pdf-export-job')
 
 # docs
 router.register(r'category', docs.CategoryViewSet)
@@ -15,6 +15,7 @@ from rest_framework.views import APIView
 
 from _utils.contract_price import get_project_payment_summary, get_multiple_projects_payment_summary, \
     get_contract_price, get_contract_payment_plan
+from _utils.payment_summary_cache import PAYMENT_SUMMARY_CACHE_TIMEOUT, payment_summary_cache_key
 from apiV1.permissions.auth_perms import permissions, IsProjectStaffOrReadOnly
 from apiV1.permissions.ibs_perms import IbsModulePermission
 from contract.models import OrderGroup, DocumentType, RequiredDocument, Contractor, Contract, ContractPrice, \
@@ -282,8 +283,8 @@ class ContractViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        # Generate cache key
-        cache_key = f'payment_summary_{project_id}_{order_group_id}_{unit_type_id}'
+        # Generate cache key (프로젝트 캐시 세대 포함 - 관련 데이터 변경 시 자동 무효화)
+        cache_key = payment_summary_cache_key([project.pk], order_group_id, unit_type_id)
 
         if use_cache:
             cached_result = cache.get(cache_key)
@@ -301,7 +302,7 @@ class ContractViewSet(viewsets.ModelViewSet):
         result = serializer.data
 
         if use_cache:
-            cache.set(cache_key, result, timeout=3600)  # Cache for 1 hour
+            cache.set(cache_key, result, timeout=PAYMENT_SUMMARY_CACHE_TIMEOUT)
 
         return Response(result)
 
@@ -394,10 +395,12 @@ class ContractViewSet(viewsets.ModelViewSet):
             - projects: Comma-separated project IDs (required)
             - order_group: OrderGroup ID (optional)
             - unit_type: UnitType ID (optional)
+            - use_cache: Boolean (default: true)
         """
         project_ids_str = request.query_params.get('projects', '')
         order_group_id = request.query_params.get('order_group')
         unit_type_id = request.query_params.get('unit_type')
+        use_cache = request.query_params.get('use_cache', 'true').lower() == 'true'
 
         if not project_ids_str:
             return Response(
@@ -429,6 +432,13 @@ class ContractViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
+        cache_key = f'multi_{payment_summary_cache_key(project_ids, order_group_id, unit_type_id)}'
+
+        if use_cache:
+            cached_result = cache.get(cache_key)
+            if cached_result:
+                return Response(cached_result)
+
         # Get combined payment summary
         summary_data = get_multiple_projects_payment_summary(projects, order_group, unit_type)
         summary_data['projects'] = [p.id for p in projects]
@@ -437,7 +447,12 @@ class ContractViewSet(viewsets.ModelViewSet):
 
         # Serialize result
         serializer = MultiProjectPaymentSummarySerializer(summary_data)
-        return Response(serializer.data)
+        result = serializer.data
+
+        if use_cache:
+            cache.set(cache_key, result, timeout=PAYMENT_SUMMARY_CACHE_TIMEOUT)
+
+        return Response(result)
 
 
 class ContractSetViewSet(ContractViewSet):
@@ -2,7 +2,7 @@ from collections import defaultdict
 from datetime import datetime
 
 from django.db import transaction as db_transaction
-from django.db.models import Sum, F, Case, When, Count, Q
+from django.db.models import Count, Q
 from django_filters import CharFilter
 from django_filters.rest_framework import FilterSet
 from rest_framework import permissions
@@ -17,11 +17,16 @@ from ledger.models import (
     CompanyBankTransaction, ProjectBankTransaction,
     CompanyAccountingEntry, ProjectAccountingEntry,
     CompanyLedgerCalculation, ProjectLedgerCalculation,
+    CompanyBankBalanceSnapshot, ProjectBankBalanceSnapshot,
 )
-from ledger.services.company_transaction import get_company_transactions
+from ledger.services.bank_balance import get_balances_as_of
+from ledger.services.company_transaction import get_company_transactions, prefetch_company_transactions
 from ledger.services.project_transaction import get_project_transactions, prefetch_project_transactions
 from work.models import IssueProject
-from ..pagination import PageNumberPaginationFifteen, PageNumberPaginationFifty, PageNumberPaginationThreeHundred
+from ..pagination import (
+    PageNumberPaginationFifteen, PageNumberPaginationFifty, PageNumberPaginationThreeHundred,
+    TransactionPagination,
+)
 from ..permissions import IsProjectStaffOrReadOnly
 from ..serializers.ledger import (
     CompanyAccountSerializer, ProjectAccountSerializer, AffiliateSerializer,
@@ -115,7 +120,7 @@ class CompanyAccountViewSet(viewsets.ModelViewSet):
         계정 검색 (부모 계정 포함)
 
         하위 계정이 검색 결과에 포함되면 해당 부모 계정들도 결과에 포함시킵니다.
-        분류 전용 계정의 경우 동적으로 computed_direction을 계산하여 표시합니다.
+        분류 전용 계정의 경우 저장된 computed_direction(하위 계정 방향 합산)을 표시합니다.
         """
         query = request.query_params.get('q', '')
         direction = request.query_params.get('direction', '')
@@ -127,22 +132,20 @@ class CompanyAccountViewSet(viewsets.ModelViewSet):
         matched_accounts = CompanyAccount.objects.filter(
             name__icontains=query,
             is_active=True
-        ).select_related('parent')
+        )
 
         # 2. direction 필터링 (computed_direction 기반)
         if direction:
             filtered_accounts = []
             for account in matched_accounts:
-                computed = account.get_computed_direction()
+                computed = account.computed_direction
                 if direction == 'both' or computed == direction or computed == 'both':
                     filtered_accounts.append(account)
             matched_accounts = filtered_accounts
 
-        # 3. 매치된 계정들의 모든 부모 계정들 수집
-        parent_accounts = set()
-        for account in matched_accounts:
-            parents = account.get_ancestors()
-            parent_accounts.update(parents)
+        # 3. 매치된 계정들의 모든 부모 계정들 수집 (ancestor_ids 인덱스로 단일 조회)
+        ancestor_ids = {pk for account in matched_accounts for pk in account.ancestor_ids}
+        parent_accounts = CompanyAccount.objects.filter(pk__in=ancestor_ids) if ancestor_ids else []
 
         # 4. 결과 조합 및 직렬화
         results = []
@@ -153,8 +156,8 @@ class CompanyAccountViewSet(viewsets.ModelViewSet):
                 'pk': account.pk,
                 'code': account.code,
                 'name': account.name,
-                'full_path': account.get_full_path(),
-                'computed_direction': account.get_computed_direction(),
+                'full_path': account.full_path,
+                'computed_direction': account.computed_direction,
                 'computed_direction_display': account.get_direction_display_computed(),
                 'is_category_only': account.is_category_only,
                 'is_parent_of_matches': False,
@@ -165,7 +168,7 @@ class CompanyAccountViewSet(viewsets.ModelViewSet):
         for parent in parent_accounts:
             # direction 필터링 적용
             if direction:
-                computed = parent.get_computed_direction()
+                computed = parent.computed_direction
                 if not (direction == 'both' or computed == direction or computed == 'both'):
                     continue
 
@@ -173,8 +176,8 @@ class CompanyAccountViewSet(viewsets.ModelViewSet):
                 'pk': parent.pk,
                 'code': parent.code,
                 'name': parent.name,
-                'full_path': parent.get_full_path(),
-                'computed_direction': parent.get_computed_direction(),
+                'full_path': parent.full_path,
+                'computed_direction': parent.computed_direction,
                 'computed_direction_display': parent.get_direction_display_computed(),
                 'is_category_only': parent.is_category_only,
                 'is_parent_of_matches': True,
@@ -199,7 +202,7 @@ class CompanyAccountViewSet(viewsets.ModelViewSet):
         """계정 트리 구조 조회"""
         category = request.query_params.get('category')
 
-        queryset = CompanyAccount.objects.select_related('parent').filter(is_active=True)
+        queryset = self.get_queryset().filter(is_active=True)
         if category:
             queryset = queryset.filter(category=category)
 
@@ -238,7 +241,7 @@ class ProjectAccountViewSet(viewsets.ModelViewSet):
         계정 검색 (부모 계정 포함)
 
         하위 계정이 검색 결과에 포함되면 해당 부모 계정들도 결과에 포함시킵니다.
-        분류 전용 계정의 경우 동적으로 computed_direction을 계산하여 표시합니다.
+        분류 전용 계정의 경우 저장된 computed_direction(하위 계정 방향 합산)을 표시합니다.
         """
         query = request.query_params.get('q', '')
         direction = request.query_params.get('direction', '')
@@ -252,7 +255,7 @@ class ProjectAccountViewSet(viewsets.ModelViewSet):
         matched_accounts = ProjectAccount.objects.filter(
             name__icontains=query,
             is_active=True
-        ).select_related('parent')
+        )
 
         # 2. 프로젝트 특수 필터링
         if is_payment is not None:
@@ -267,16 +270,14 @@ class ProjectAccountViewSet(viewsets.ModelViewSet):
         if direction:
             filtered_accounts = []
             for account in matched_accounts:
-                computed = account.get_computed_direction()
+                computed = account.computed_direction
                 if direction == 'both' or computed == direction or computed == 'both':
                     filtered_accounts.append(account)
             matched_accounts = filtered_accounts
 
-        # 4. 매치된 계정들의 모든 부모 계정들 수집
-        parent_accounts = set()
-        for account in matched_accounts:
-            parents = account.get_ancestors()
-            parent_accounts.update(parents)
+        # 4. 매치된 계정들의 모든 부모 계정들 수집 (ancestor_ids 인덱스로 단일 조회)
+        ancestor_ids = {pk for account in matched_accounts for pk in account.ancestor_ids}
+        parent_accounts = ProjectAccount.objects.filter(pk__in=ancestor_ids) if ancestor_ids else []
 
         # 5. 결과 조합 및 직렬화
         results = []
@@ -287,8 +288,8 @@ class ProjectAccountViewSet(viewsets.ModelViewSet):
                 'pk': account.pk,
                 'code': account.code,
                 'name': account.name,
-                'full_path': account.get_full_path(),
-                'computed_direction': account.get_computed_direction(),
+                'full_path': account.full_path,
+                'computed_direction': account.computed_direction,
                 'computed_direction_display': account.get_direction_display_computed(),
                 'is_category_only': account.is_category_only,
                 'is_parent_of_matches': False,
@@ -301,7 +302,7 @@ class ProjectAccountViewSet(viewsets.ModelViewSet):
         for parent in parent_accounts:
             # direction 필터링 적용
             if direction:
-                computed = parent.get_computed_direction()
+                computed = parent.computed_direction
                 if not (direction == 'both' or computed == direction or computed == 'both'):
                     continue
 
@@ -309,8 +310,8 @@ class ProjectAccountViewSet(viewsets.ModelViewSet):
                 'pk': parent.pk,
                 'code': parent.code,
                 'name': parent.name,
-                'full_path': parent.get_full_path(),
-                'computed_direction': parent.get_computed_direction(),
+                'full_path': parent.full_path,
+                'computed_direction': parent.computed_direction,
                 'computed_direction_display': parent.get_direction_display_computed(),
                 'is_category_only': parent.is_category_only,
                 'is_parent_of_matches': True,
@@ -337,7 +338,7 @@ class ProjectAccountViewSet(viewsets.ModelViewSet):
         """계정 트리 구조 조회"""
         category = request.query_params.get('category')
 
-        queryset = ProjectAccount.objects.select_related('parent').filter(is_active=True)
+        queryset = self.get_queryset().filter(is_active=True)
         if category:
             queryset = queryset.filter(category=category)
 
@@ -398,7 +399,7 @@ class CompanyBankTransactionViewSet(viewsets.ModelViewSet):
     queryset = CompanyBankTransaction.objects.all()
     serializer_class = CompanyBankTransactionSerializer
     permission_classes = (permissions.IsAuthenticated, HqFinancialOfficerPermission)
-    pagination_class = PageNumberPaginationFifteen
+    pagination_class = TransactionPagination
 
     def get_queryset(self):
         """
@@ -421,20 +422,7 @@ class CompanyBankTransactionViewSet(viewsets.ModelViewSet):
         queryset = self.filter_queryset(self.get_queryset())
         page = self.paginate_queryset(queryset)
         instances = page if page is not None else list(queryset)
-
-        transaction_ids = [t.transaction_id for t in instances]
-        if transaction_ids:
-            entries = CompanyAccountingEntry.objects.filter(
-                transaction_id__in=transaction_ids
-            ).select_related('account', 'affiliate', 'affiliate__company', 'affiliate__project')
-            entries_map = defaultdict(list)
-            for entry in entries:
-                entries_map[entry.transaction_id].append(entry)
-            for tx in instances:
-                tx.prefetched_accounting_entries = entries_map.get(tx.transaction_id, [])
-        else:
-            for tx in instances:
-                tx.prefetched_accounting_entries = []
+        prefetch_company_transactions(instances)
 
         serializer = self.get_serializer(instances, many=True)
         if page is not None:
@@ -450,45 +438,18 @@ class CompanyBankTransactionViewSet(viewsets.ModelViewSet):
 
     @action(detail=False, methods=['get'])
     def balance_by_account(self, request):
-        """계좌별 잔액 조회 (누적 + 당일 입출금)"""
+        """계좌별 잔액 조회 (일별 잔액 스냅샷 기준 누적 + 당일 입출금)"""
         date = request.query_params.get('date', TODAY)
         company = request.query_params.get('company')
         is_balance = request.query_params.get('is_balance', '')
 
-        queryset = CompanyBankTransaction.objects.filter(deal_date__lte=date).order_by('bank_account')
-        if company:
-            queryset = queryset.filter(company_id=company)
-
-        result = queryset.values(
-            bank_acc=F('bank_account__alias_name'),
-            bank_num=F('bank_account__number')
-        ).annotate(
-            # 누적 합계
-            inc_sum=Sum(Case(
-                When(sort_id=1, then=F('amount')),  # 1 = 입금
-                default=0
-            )),
-            out_sum=Sum(Case(
-                When(sort_id=2, then=F('amount')),  # 2 = 출금
-                default=0
-            )),
-            # 당일 합계
-            date_inc=Sum(Case(
-                When(sort_id=1, deal_date=date, then=F('amount')),
-                default=0
-            )),
-            date_out=Sum(Case(
-                When(sort_id=2, deal_date=date, then=F('amount')),
-                default=0
-            ))
-        ).annotate(
-            balance=F('inc_sum') - F('out_sum')
-        )
+        filters = {'bank_account__company_id': company} if company else {}
+        result = get_balances_as_of(CompanyBankBalanceSnapshot, date, **filters)
 
         if is_balance == 'true':
-            result = result.exclude(balance=0)
+            result = [row for row in result if row['balance'] != 0]
 
-        return Response(list(result))
+        return Response(result)
 
     @action(detail=False, methods=['get'])
     def daily_transactions(self, request):
@@ -559,7 +520,7 @@ class ProjectBankTransactionViewSet(viewsets.ModelViewSet):
     queryset = ProjectBankTransaction.objects.all()
     serializer_class = ProjectBankTransactionSerializer
     permission_classes = (permissions.IsAuthenticated, IsProjectStaffOrReadOnly, IbsModulePermission)
-    pagination_class = PageNumberPaginationFifteen
+    pagination_class = TransactionPagination
 
     @property
     def required_permission(self):
@@ -599,44 +560,18 @@ class ProjectBankTransactionViewSet(viewsets.ModelViewSet):
 
     @action(detail=False, methods=['get'])
     def balance_by_account(self, request):
-        """계좌별 잔액 조회"""
+        """계좌별 잔액 조회 (일별 잔액 스냅샷 기준)"""
         date = request.query_params.get('date', TODAY)
         project = request.query_params.get('project')
         is_balance = request.query_params.get('is_balance', '')
 
-        queryset = ProjectBankTransaction.objects.filter(deal_date__lte=date).order_by('bank_account')
-        if project:
-            queryset = queryset.filter(project_id=project)
-
-        result = queryset.values(
-            bank_acc=F('bank_account__alias_name'),
-            bank_num=F('bank_account__number')
-        ).annotate(
-            inc_sum=Sum(Case(
-                When(sort_id=1, then=F('amount')),  # 1 = 입금
-                default=0
-            )),
-            out_sum=Sum(Case(
-                When(sort_id=2, then=F('amount')),  # 2 = 출금
-                default=0
-            )),
-            # 당일 합계
-            date_inc=Sum(Case(
-                When(sort_id=1, deal_date=date, then=F('amount')),
-                default=0
-            )),
-            date_out=Sum(Case(
-                When(sort_id=2, deal_date=date, then=F('amount')),
-                default=0
-            ))
-        ).annotate(
-            balance=F('inc_sum') - F('out_sum')
-        )
+        filters = {'bank_account__project_id': project} if project else {}
+        result = get_balances_as_of(ProjectBankBalanceSnapshot, date, **filters)
 
         if is_balance == 'true':
-            result = result.exclude(balance=0)
+            result = [row for row in result if row['balance'] != 0]
 
-        return Response(list(result))
+        return Response(result)
 
     @action(detail=False, methods=['get'])
     def daily_transactions(self, request):
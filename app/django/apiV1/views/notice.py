@@ -1,8 +1,6 @@
-import time
-from datetime import datetime
-
+from django.db import transaction
 from django.db.models import Q
-from django.utils import timezone
+from django.http import FileResponse
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
@@ -10,14 +8,17 @@ from rest_framework.filters import OrderingFilter
 from rest_framework.parsers import MultiPartParser, FormParser, JSONParser
 from rest_framework.response import Response
 
+from _pdf.models import PdfExportJob
+from _pdf.tasks import generate_pdf_export
 from contract.models import ContractorContact, Contractor, Contract
 from notice.models import SalesBillIssue, RegisteredSenderNumber, MessageTemplate, MessageSendHistory
+from notice.tasks import queue_message_send, encode_message_image
 from notice.utils import IwinvSMSService
 from apiV1.permissions.auth_perms import permissions, IsProjectStaffOrReadOnly
 from apiV1.permissions.ibs_perms import IbsModulePermission
 from ..serializers.notice import SallesBillIssueSerializer, RegisteredSenderNumberSerializer, \
     MessageTemplateSerializer, SMSMessageSerializer, MMSMessageSerializer, KakaoMessageSerializer, \
-    SMSHistoryQuerySerializer, MessageSendHistoryListSerializer, MessageSendHistorySerializer
+    SMSHistoryQuerySerializer, MessageSendHistoryListSerializer, MessageSendHistorySerializer, PdfExportJobSerializer
 
 
 class BillIssueViewSet(viewsets.ModelViewSet):
@@ -79,150 +80,34 @@ class MessageViewSet(viewsets.ViewSet):
     permission_classes = (permissions.IsAuthenticated, IsProjectStaffOrReadOnly)
     parser_classes = [JSONParser, MultiPartParser, FormParser]
 
+    @staticmethod
+    def _accepted_response(histories, message_type):
+        """발송 요청 접수 응답 (실제 발송/결과는 발송 기록에서 확인)"""
+        return {
+            'resultCode': 0,
+            'message': f'발송 요청이 접수되었습니다. ({sum(h.recipient_count for h in histories)}건)',
+            'requestNo': None,
+            'msgType': message_type,
+            'historyIds': [h.pk for h in histories],
+        }
+
     @action(detail=False, methods=['post'], url_path='send-sms')
     def send_sms(self, request):
-        """SMS/LMS 메시지 발송"""
+        """SMS/LMS 메시지 발송 요청 (수신자 배치별 Celery 작업으로 발송)"""
         serializer = SMSMessageSerializer(data=request.data)
         if not serializer.is_valid():
             return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
-        try:
-            # iwinv SMS 서비스 초기화
-            sms_service = IwinvSMSService()
-
-            # 발송 데이터 준비
-            validated_data = serializer.validated_data
-            message_type = validated_data.get('message_type', 'AUTO')
-
-            # 예약 발송 시간 처리
-            schedule_date = validated_data.get('schedule_date')
-            schedule_time = validated_data.get('schedule_time')
-
-            schedule_date_str = schedule_date.strftime('%Y-%m-%d') if schedule_date else None
-            schedule_time_str = schedule_time.strftime('%H:%M') if schedule_time else None
-
-            # 메시지 타입에 따른 발송
-            if message_type == 'SMS':
-                result = sms_service.send_sms(
-                    recipients=validated_data['recipients'],
-                    message=validated_data['message'],
-                    sender_number=validated_data['sender_number'],
-                    schedule_date=schedule_date_str,
-                    schedule_time=schedule_time_str,
-                    use_v2_api=validated_data.get('use_v2_api', True)
-                )
-            elif message_type == 'LMS':
-                result = sms_service.send_lms(
-                    recipients=validated_data['recipients'],
-                    message=validated_data['message'],
-                    title=validated_data.get('title', ''),
-                    sender_number=validated_data['sender_number'],
-                    schedule_date=schedule_date_str,
-                    schedule_time=schedule_time_str,
-                    use_v2_api=validated_data.get('use_v2_api', True)
-                )
-            else:  # AUTO
-                result = sms_service.send_auto_message(
-                    recipients=validated_data['recipients'],
-                    message=validated_data['message'],
-                    sender_number=validated_data['sender_number'],
-                    title=validated_data.get('title'),
-                    schedule_date=schedule_date_str,
-                    schedule_time=schedule_time_str
-                )
-
-            # 결과에 따른 응답 상태 코드 결정
-            result_code = result.get('resultCode')
-
-            if result_code == 0:
-                response_status = status.HTTP_200_OK
-
-                # 발송 성공 시 히스토리 저장
-                company_id = validated_data.get('company_id')
-                request_no = result.get('requestNo')
-
-                if request_no:
-                    try:
-                        # 예약 발송 일시 조합
-                        schedule_datetime = None
-                        if schedule_date and schedule_time:
-                            schedule_datetime = timezone.make_aware(
-                                datetime.combine(schedule_date, schedule_time)
-                            )
-
-                        # 실제 발송 시간 (company_id가 있으면 API에서 가져오기, 없으면 현재 시간)
-                        actual_sent_at = timezone.now()
-
-                        if company_id:
-                            # company_id가 있으면 발송 내역 조회로 실제 발송 시간 확인
-                            time.sleep(2.5)  # iwinv API 처리 대기
-
-                            from datetime import date
-                            today = date.today()
-                            history_result = sms_service.get_send_history(
-                                company_id=company_id,
-                                start_date=today.strftime('%Y-%m-%d'),
-                                end_date=today.strftime('%Y-%m-%d'),
-                                request_no=request_no,
-                                page_num=1,
-                                page_size=10
-                            )
-
-                            if history_result.get('resultCode') == 0 and history_result.get('list'):
-                                records = [item for item in history_result['list'] if
-                                           item.get('requestNo') == request_no]
-                                send_result = next(
-                                    (item for item in records if item.get('sendStatusCode') not in ['WAIT', 'FAIL']),
-                                    records[0] if records else None)
-
-                                if send_result:
-                                    # sendDate 파싱
-                                    send_date_str = send_result.get('sendDate')
-                                    if send_date_str:
-                                        try:
-                                            actual_sent_at = datetime.strptime(send_date_str, '%Y-%m-%d %H:%M:%S')
-                                            actual_sent_at = timezone.make_aware(actual_sent_at)
-                                        except ValueError:
-                                            pass
-
-                        # 히스토리 저장 (resultCode=0이면 성공으로 간주)
-                        MessageSendHistory.objects.create(
-                            message_type=result.get('msgType', message_type),
-                            sender_number=validated_data['sender_number'],
-                            message_content=validated_data['message'],
-                            title=validated_data.get('title', ''),
-                            recipients=validated_data['recipients'],
-                            recipient_count=len(validated_data['recipients']),
-                            sent_at=actual_sent_at,
-                            request_no=request_no,
-                            company_id=company_id or '',
-                            project_id=request.data.get('project'),
-                            scheduled_send=validated_data.get('scheduled_send', False),
-                            schedule_datetime=schedule_datetime,
-                            sent_by=request.user
-                        )
-
-                    except Exception:
-                        # 히스토리 저장 실패는 무시 (발송 자체는 성공)
-                        pass
-            else:
-                response_status = status.HTTP_400_BAD_REQUEST
-
-            # 에러 메시지 추가
-            if 'message' not in result:
-                result['message'] = IwinvSMSService.get_error_message(result.get('resultCode', -1))
-
-            return Response(result, status=response_status)
-
-        except ValueError as e:
-            return Response({
-                'resultCode': -1,
-                'message': str(e),
-                'requestNo': None,
-                'msgType': message_type
-            }, status=status.HTTP_400_BAD_REQUEST)
+        validated_data = serializer.validated_data
+        message_type = validated_data.get('message_type', 'AUTO')
 
-        except Exception as e:
+        try:
+            histories = queue_message_send(
+                validated_data, message_type, request.user,
+                project_id=request.data.get('project'),
+                options={'use_v2_api': validated_data.get('use_v2_api', True)}
+            )
+        except Exception:
             return Response({
                 'resultCode': -1,
                 'message': '서버 내부 오류가 발생했습니다.',
@@ -230,217 +115,71 @@ class MessageViewSet(viewsets.ViewSet):
                 'msgType': message_type
             }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
+        return Response(self._accepted_response(histories, message_type), status=status.HTTP_202_ACCEPTED)
+
     @action(detail=False, methods=['post'], url_path='send-mms')
     def send_mms(self, request):
-        """MMS 메시지 발송"""
+        """MMS 메시지 발송 요청 (이미지는 작업 인자로 전달)"""
         serializer = MMSMessageSerializer(data=request.data)
         if not serializer.is_valid():
             return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
-        try:
-            # iwinv SMS 서비스 초기화
-            sms_service = IwinvSMSService()
+        validated_data = serializer.validated_data
 
-            # 발송 데이터 준비
-            validated_data = serializer.validated_data
-
-            # 예약 발송 시간 처리
-            schedule_date = validated_data.get('schedule_date')
-            schedule_time = validated_data.get('schedule_time')
-
-            schedule_date_str = schedule_date.strftime('%Y-%m-%d') if schedule_date else None
-            schedule_time_str = schedule_time.strftime('%H:%M') if schedule_time else None
-
-            # MMS 발송
-            result = sms_service.send_mms(
-                recipients=validated_data['recipients'],
-                message=validated_data['message'],
-                title=validated_data.get('title', ''),
-                sender_number=validated_data['sender_number'],
-                image_file=validated_data['image'],
-                schedule_date=schedule_date_str,
-                schedule_time=schedule_time_str,
-                use_v2_api=validated_data.get('use_v2_api', True)
+        try:
+            histories = queue_message_send(
+                validated_data, 'MMS', request.user,
+                project_id=request.data.get('project'),
+                options={
+                    'use_v2_api': validated_data.get('use_v2_api', True),
+                    'image': encode_message_image(validated_data['image']),
+                }
             )
-
-            # 결과에 따른 응답 상태 코드 결정
-            result_code = result.get('resultCode')
-
-            if result_code == 0:
-                response_status = status.HTTP_200_OK
-
-                # 발송 성공 시 히스토리 저장
-                company_id = validated_data.get('company_id')
-                request_no = result.get('requestNo')
-
-                if request_no:
-                    try:
-                        # 예약 발송 일시 조합
-                        schedule_datetime = None
-                        if schedule_date and schedule_time:
-                            schedule_datetime = timezone.make_aware(
-                                datetime.combine(schedule_date, schedule_time)
-                            )
-
-                        # 실제 발송 시간 (company_id가 있으면 API에서 가져오기, 없으면 현재 시간)
-                        actual_sent_at = timezone.now()
-
-                        if company_id:
-                            # company_id가 있으면 발송 내역 조회로 실제 발송 시간 확인
-                            time.sleep(2.5)  # iwinv API 처리 대기
-
-                            from datetime import date
-                            today = date.today()
-                            history_result = sms_service.get_send_history(
-                                company_id=company_id,
-                                start_date=today.strftime('%Y-%m-%d'),
-                                end_date=today.strftime('%Y-%m-%d'),
-                                request_no=request_no,
-                                page_num=1,
-                                page_size=10
-                            )
-
-                            if history_result.get('resultCode') == 0 and history_result.get('list'):
-                                records = [item for item in history_result['list'] if
-                                           item.get('requestNo') == request_no]
-                                send_result = next(
-                                    (item for item in records if item.get('sendStatusCode') not in ['WAIT', 'FAIL']),
-                                    records[0] if records else None)
-
-                                if send_result:
-                                    # sendDate 파싱
-                                    send_date_str = send_result.get('sendDate')
-                                    if send_date_str:
-                                        try:
-                                            actual_sent_at = datetime.strptime(send_date_str, '%Y-%m-%d %H:%M:%S')
-                                            actual_sent_at = timezone.make_aware(actual_sent_at)
-                                        except ValueError:
-                                            pass
-
-                        # 히스토리 저장 (resultCode=0이면 성공으로 간주)
-                        MessageSendHistory.objects.create(
-                            message_type='MMS',
-                            sender_number=validated_data['sender_number'],
-                            message_content=validated_data['message'],
-                            title=validated_data.get('title', ''),
-                            recipients=validated_data['recipients'],
-                            recipient_count=len(validated_data['recipients']),
-                            sent_at=actual_sent_at,
-                            request_no=request_no,
-                            company_id=company_id or '',
-                            project_id=request.data.get('project'),
-                            scheduled_send=validated_data.get('scheduled_send', False),
-                            schedule_datetime=schedule_datetime,
-                            sent_by=request.user
-                        )
-
-                    except Exception:
-                        # 히스토리 저장 실패는 무시 (발송 자체는 성공)
-                        pass
-            else:
-                response_status = status.HTTP_400_BAD_REQUEST
-
-            # 에러 메시지 추가
-            if 'message' not in result:
-                result['message'] = IwinvSMSService.get_error_message(result.get('resultCode', -1))
-
-            return Response(result, status=response_status)
-
-        except ValueError as e:
+        except Exception:
             return Response({
                 'resultCode': -1,
                 'message': '서버 내부 오류가 발생했습니다.',
                 'requestNo': None,
                 'msgType': 'MMS'
-            }, status=status.HTTP_400_BAD_REQUEST)
-
-        except Exception as e:
-            # Optionally log the original error internally
-            # logging.error(f"Unhandled exception in send_mms: {str(e)}")
-            return Response({
-                'resultCode': -1,
-                'message': '서버 내부 오류가 발생했습니다.',  # Generic message: "Internal server error occurred."
-                'requestNo': None,
-                'msgType': 'MMS'
             }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
+        return Response(self._accepted_response(histories, 'MMS'), status=status.HTTP_202_ACCEPTED)
+
     @action(detail=False, methods=['post'], url_path='send-kakao')
     def send_kakao(self, request):
-        """카카오 알림톡 발송"""
+        """카카오 알림톡 발송 요청"""
         serializer = KakaoMessageSerializer(data=request.data)
         if not serializer.is_valid():
             return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
-        try:
-            # iwinv SMS 서비스 초기화
-            sms_service = IwinvSMSService()
-
-            # 발송 데이터 준비
-            validated_data = serializer.validated_data
+        validated_data = serializer.validated_data
 
-            # 예약 발송 시간 처리
-            schedule_date = validated_data.get('schedule_date')
-            schedule_time = validated_data.get('schedule_time')
-
-            schedule_date_str = schedule_date.strftime('%Y-%m-%d') if schedule_date else None
-            schedule_time_str = schedule_time.strftime('%H:%M') if schedule_time else None
-
-            # 카카오 알림톡 발송
-            result = sms_service.send_kakao_alimtalk(
-                recipients=validated_data['recipients'],
-                template_code=validated_data['template_code'],
-                sender_number=validated_data['sender_number'],
-                reserve=validated_data.get('scheduled_send', False),
-                send_date=schedule_date_str,
-                send_time=schedule_time_str,
-                re_send=validated_data.get('re_send', False),
-                resend_type=validated_data.get('resend_type', 'Y'),
-                resend_title=validated_data.get('resend_title'),
-                resend_content=validated_data.get('resend_content')
+        try:
+            histories = queue_message_send(
+                validated_data, 'KAKAO', request.user,
+                project_id=request.data.get('project'),
+                options={
+                    're_send': validated_data.get('re_send', False),
+                    'resend_type': validated_data.get('resend_type', 'Y'),
+                    'resend_title': validated_data.get('resend_title'),
+                }
             )
-
-            # 결과에 따른 응답 상태 코드 결정
-            if result.get('code') == 200:
-                response_status = status.HTTP_200_OK
-            else:
-                response_status = status.HTTP_400_BAD_REQUEST
-
-            # 에러 메시지 추가
-            if 'message' not in result:
-                result['message'] = IwinvSMSService.get_kakao_error_message(result.get('code', -1))
-
-            return Response(result, status=response_status)
-
-        except ValueError as e:
-            # Handle case where validated_data might not be defined
-            fail_count = 0
-            try:
-                fail_count = len(validated_data.get('recipients', []))
-            except NameError:
-                fail_count = 0
-
-            return Response({
-                'code': -1,
-                'message': str(e),
-                'success': 0,
-                'fail': fail_count
-            }, status=status.HTTP_400_BAD_REQUEST)
-
-        except Exception as e:
-            # Handle case where validated_data might not be defined
-            fail_count = 0
-            try:
-                fail_count = len(validated_data.get('recipients', []))
-            except NameError:
-                fail_count = 0
-
+        except Exception:
             return Response({
                 'code': -1,
                 'message': '서버 내부 오류가 발생했습니다.',
                 'success': 0,
-                'fail': fail_count
+                'fail': len(validated_data['recipients'])
             }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
+        return Response({
+            'code': 200,
+            'message': f'발송 요청이 접수되었습니다. ({len(validated_data["recipients"])}건)',
+            'success': 0,
+            'fail': 0,
+            'historyIds': [h.pk for h in histories],
+        }, status=status.HTTP_202_ACCEPTED)
+
     @action(detail=False, methods=['get'], url_path='error-codes')
     def get_error_codes(self, request):
         """에러 코드 목록 조회"""
@@ -624,7 +363,7 @@ class MessageSendHistoryViewSet(viewsets.ReadOnlyModelViewSet):
     queryset = MessageSendHistory.objects.select_related('sent_by', 'project').all()
     permission_classes = (permissions.IsAuthenticated,)
     filter_backends = (DjangoFilterBackend, OrderingFilter)
-    filterset_fields = ('message_type', 'sender_number', 'project')
+    filterset_fields = ('message_type', 'sender_number', 'project', 'status')
     ordering_fields = ('created', 'sent_at', 'recipient_count')
     ordering = ('-created',)
 
@@ -648,3 +387,49 @@ class MessageSendHistoryViewSet(viewsets.ReadOnlyModelViewSet):
             queryset = queryset.filter(sent_at__date__lte=end_date)
 
         return queryset
+
+
+class PdfExportJobViewSet(viewsets.ModelViewSet):
+    """
+    백그라운드 PDF 생성 작업 ViewSet
+
+    - POST: 작업 등록 후 Celery 로 생성 (export_type, params = 동기 출력 URL 의 쿼리 파라미터)
+    - GET: 진행률 조회 (status, progress)
+    - GET download/: 완료된 PDF 파일 내려받기 (미디어 스토리지)
+    """
+    serializer_class = PdfExportJobSerializer
+    permission_classes = (permissions.IsAuthenticated,)
+    http_method_names = ['get', 'post', 'delete']
+
+    def get_queryset(self):
+        """본인이 요청한 작업만 조회"""
+        return PdfExportJob.objects.filter(creator=self.request.user)
+
+    def perform_create(self, serializer):
+        job = serializer.save(creator=self.request.user)
+        transaction.on_commit(lambda: self._dispatch(job))
+
+    @staticmethod
+    def _dispatch(job):
+        result = generate_pdf_export.delay(job.pk)
+        PdfExportJob.objects.filter(pk=job.pk, task_id='').update(task_id=result.id)
+
+    def perform_destroy(self, instance):
+        if instance.file:
+            instance.file.delete(save=False)
+        instance.delete()
+
+    @action(detail=True, methods=['get'])
+    def download(self, request, pk=None):
+        job = self.get_object()
+
+        if job.status != PdfExportJob.COMPLETED or not job.file:
+            return Response({'error': 'PDF가 아직 생성되지 않았습니다.', 'status': job.status},
+                            status=status.HTTP_404_NOT_FOUND)
+
+        return FileResponse(
+            job.file.open('rb'),
+            as_attachment=True,
+            filename=job.filename or f'{job.export_type}.pdf',
+            content_type='application/pdf'
+        )
@@ -10,6 +10,7 @@ from rest_framework import viewsets
 from rest_framework.response import Response
 
 from _utils.contract_price import get_contract_payment_plan
+from _utils.payment_status import calculate_payment_status_by_unit_type
 from apiV1.permissions.auth_perms import permissions, IsProjectStaffOrReadOnly
 from apiV1.permissions.ibs_perms import IbsModulePermission
 from contract.models import ContractPrice, OrderGroup, Contract
@@ -161,72 +162,6 @@ class OverDueRuleViewSet(viewsets.ModelViewSet):
 
 # Helper Functions for Unit Type Payment status calculations -----------------------
 
-def get_sales_amount_by_unit_type(project_id, order_group_id, unit_type_id):
-    """ContractPrice 테이블의 유효한 모든 가격정보 합계 (계약 있는 것 + 계약 없는 것)"""
-    try:
-        with connection.cursor() as cursor:
-            project = Project.objects.get(pk=project_id)
-            default_og = OrderGroup.get_default_for_project(project)
-
-            contract_query = """
-                             SELECT COALESCE(SUM(CAST(value AS INTEGER)), 0) as contract_amount
-                             FROM contract_contractprice cp
-                                      CROSS JOIN jsonb_each_text(cp.payment_amounts)
-                                      INNER JOIN contract_contract c ON cp.contract_id = c.id
-                             WHERE c.project_id = %s
-                               AND c.order_group_id = %s
-                               AND c.unit_type_id = %s
-                               AND c.is_active = true
-                               AND cp.is_cache_valid = true
-                             """
-
-            cursor.execute(contract_query, [project_id, order_group_id, unit_type_id])
-            contract_result = cursor.fetchone()
-            contract_amount = contract_result[0] if contract_result else 0
-
-            # 미계약 가격 합계
-            non_contract_amount = 0
-            if default_og and order_group_id == default_og.pk:
-                non_contract_query = """
-                                     SELECT COALESCE(SUM(CAST(value AS INTEGER)), 0) as non_contract_amount
-                                     FROM contract_contractprice cp
-                                              CROSS JOIN jsonb_each_text(cp.payment_amounts)
-                                              INNER JOIN items_houseunit hu ON cp.house_unit_id = hu.id
-                                     WHERE cp.contract_id IS NULL
-                                       AND hu.unit_type_id = %s
-                                       AND cp.is_cache_valid = true
-                                     """
-
-                cursor.execute(non_contract_query, [unit_type_id])
-                non_contract_result = cursor.fetchone()
-                non_contract_amount = non_contract_result[0] if non_contract_result else 0
-
-            total_amount = contract_amount + non_contract_amount
-
-            # 근린생활시설 특별 처리
-            if total_amount == 0:
-                try:
-                    unit_type = UnitType.objects.get(pk=unit_type_id)
-                    if unit_type.sort == '5':
-                        has_house_units = HouseUnit.objects.filter(unit_type_id=unit_type_id).exists()
-                        has_sales_price = SalesPriceByGT.objects.filter(
-                            project_id=project_id,
-                            order_group_id=order_group_id,
-                            unit_type_id=unit_type_id
-                        ).exists()
-
-                        if has_house_units and not has_sales_price:
-                            total_amount = get_commercial_fallback_amount(project_id, order_group_id, unit_type_id)
-                except UnitType.DoesNotExist:
-                    pass
-
-            return total_amount
-
-    except Exception as e:
-        logger.error(f"Error in get_sales_amount_by_unit_type: {e}")
-        return 0
-
-
 def get_commercial_fallback_amount(project_id, order_group_id, unit_type_id):
     """근린생활시설 전용 fallback 로직"""
     try:
@@ -255,256 +190,6 @@ def get_commercial_fallback_amount(project_id, order_group_id, unit_type_id):
         return 0
 
 
-def get_contract_data_by_unit_type(project_id, order_group_id, unit_type_id):
-    """계약 현황 데이터 계산"""
-    try:
-        with connection.cursor() as cursor:
-            query = """
-                    SELECT COUNT(*)                   as contract_units,
-                           COALESCE(SUM(cp.price), 0) as contract_amount
-                    FROM contract_contract c
-                             INNER JOIN contract_contractprice cp ON cp.contract_id = c.id
-                    WHERE c.project_id = %s
-                      AND c.order_group_id = %s
-                      AND c.unit_type_id = %s
-                      AND c.is_active = true
-                      AND cp.is_cache_valid = true
-                    """
-
-            cursor.execute(query, [project_id, order_group_id, unit_type_id])
-            result = cursor.fetchone()
-            return {
-                'contract_units': result[0] if result else 0,
-                'contract_amount': result[1] if result else 0
-            }
-
-    except Exception as e:
-        logger.error(f"Error in get_contract_data_by_unit_type: {e}")
-        return {'contract_units': 0, 'contract_amount': 0}
-
-
-def get_paid_amount_by_unit_type(project_id, order_group_id, unit_type_id, date, use_ledger_join=False):
-    """order_group과 unit_type별 실수납금액 계산"""
-    try:
-        with connection.cursor() as cursor:
-            date_filter = ""
-            params = [project_id, order_group_id, unit_type_id]
-
-            if date:
-                if use_ledger_join:
-                    date_filter = "AND pbt.deal_date <= %s"
-                else:
-                    date_filter = "AND cp.deal_date <= %s"
-                params.append(date)
-
-            if use_ledger_join:
-                query = f"""
-                        SELECT COALESCE(SUM(pae.amount), 0) as paid_amount
-                        FROM payment_contractpayment cp
-                                 INNER JOIN ledger_projectaccountingentry pae ON cp.accounting_entry_id = pae.id
-                                 INNER JOIN ledger_projectbanktransaction pbt ON pae.transaction_id = pbt.transaction_id
-                                 INNER JOIN contract_contract c ON cp.contract_id = c.id
-                                 INNER JOIN ledger_projectaccount pa ON pae.account_id = pa.id
-                        WHERE cp.project_id = %s
-                          AND c.order_group_id = %s
-                          AND c.unit_type_id = %s
-                          AND c.is_active = true
-                          AND pa.is_payment = true
-                          AND cp.is_payment_mismatch = false
-                          {date_filter}
-                        """
-            else:
-                query = f"""
-                        SELECT COALESCE(SUM(pae.amount), 0) as paid_amount
-                        FROM payment_contractpayment cp
-                        INNER JOIN ledger_projectaccountingentry pae ON cp.accounting_entry_id = pae.id
-                        INNER JOIN ledger_projectaccount pa ON pae.account_id = pa.id
-                        INNER JOIN contract_contract c ON cp.contract_id = c.id
-                        WHERE cp.project_id = %s
-                          AND c.order_group_id = %s
-                          AND c.unit_type_id = %s
-                          AND c.is_active = true
-                          AND pae.amount IS NOT NULL
-                          AND pa.is_payment = true
-                          AND cp.is_payment_mismatch = false
-                          {date_filter}
-                        """
-
-            cursor.execute(query, params)
-            result = cursor.fetchone()
-            return result[0] if result else 0
-
-    except Exception as e:
-        logger.error(f"Error in get_paid_amount_by_unit_type: {e}")
-        return 0
-
-
-def get_non_contract_amount_by_unit_type(project_id, order_group_id, unit_type_id):
-    """order_group과 unit_type별 미계약 금액 계산"""
-    try:
-        project = Project.objects.get(pk=project_id)
-        default_og = OrderGroup.get_default_for_project(project)
-        if not default_og:
-            return 0
-
-        if order_group_id == default_og.pk:
-            with connection.cursor() as cursor:
-                query = """
-                        SELECT COALESCE(SUM(CAST(value AS INTEGER)), 0) as non_contract_amount
-                        FROM contract_contractprice cp, jsonb_each_text(cp.payment_amounts)
-                        WHERE cp.contract_id IS NULL
-                          AND cp.house_unit_id IN (SELECT hu.id
-                                                   FROM items_houseunit hu
-                                                   WHERE hu.unit_type_id = %s)
-                          AND cp.is_cache_valid = true
-                        """
-
-                cursor.execute(query, [unit_type_id])
-                result = cursor.fetchone()
-                return result[0] if result else 0
-        else:
-            return 0
-
-    except Exception as e:
-        logger.error(f"Error in get_non_contract_amount_by_unit_type: {e}")
-        return 0
-
-
-def get_non_contract_units_by_unit_type(project_id, order_group_id, unit_type_id):
-    """order_group과 unit_type별 미계약 세대수 계산"""
-    try:
-        project = Project.objects.get(pk=project_id)
-        default_og = OrderGroup.get_default_for_project(project)
-        if not default_og:
-            return 0
-
-        if order_group_id == default_og.pk:
-            with connection.cursor() as cursor:
-                query = """
-                        SELECT COUNT(*) as non_contract_units
-                        FROM contract_contractprice cp
-                                 INNER JOIN items_houseunit hu ON cp.house_unit_id = hu.id
-                        WHERE cp.contract_id IS NULL
-                          AND hu.unit_type_id = %s
-                          AND cp.is_cache_valid = true
-                        """
-
-                cursor.execute(query, [unit_type_id])
-                result = cursor.fetchone()
-                return result[0] if result else 0
-        else:
-            return 0
-
-    except Exception as e:
-        logger.error(f"Error in get_non_contract_units_by_unit_type: {e}")
-        return 0
-
-
-def calculate_payment_status_by_unit_type_core(project_id, date=None, use_ledger_join=False):
-    """PaymentStatus 요약 현황 계산 코어 로직"""
-    with connection.cursor() as cursor:
-        query = """
-                SELECT pib.order_group_id as order_group_id,
-                       og.name            as order_group_name,
-                       pib.unit_type_id   as unit_type_id,
-                       ut.name            as unit_type_name,
-                       ut.color           as unit_type_color,
-                       pib.quantity       as planned_units,
-                       pib.budget         as total_budget,
-                       pib.average_price  as average_price
-                FROM project_projectincbudget pib
-                         INNER JOIN items_unittype ut ON pib.unit_type_id = ut.id
-                         INNER JOIN contract_ordergroup og ON pib.order_group_id = og.id
-                WHERE pib.project_id = %s
-                ORDER BY order_group_id, unit_type_id
-                """
-
-        cursor.execute(query, [project_id])
-
-        results = []
-        for row in cursor.fetchall():
-            order_group_id = row[0]
-            unit_type_id = row[2]
-            planned_units = row[5]
-            total_budget = row[6]
-
-            # 매출액 계산
-            total_sales_amount = get_sales_amount_by_unit_type(project_id, order_group_id, unit_type_id)
-
-            # 근린생활시설 특별 처리
-            if total_budget == 0 and total_sales_amount > 0:
-                try:
-                    unit_type = UnitType.objects.get(pk=unit_type_id)
-                    if unit_type.sort == '5':  # 근린생활시설
-                        has_house_units = HouseUnit.objects.filter(unit_type_id=unit_type_id).exists()
-                        has_sales_price = SalesPriceByGT.objects.filter(
-                            project_id=project_id,
-                            order_group_id=order_group_id,
-                            unit_type_id=unit_type_id
-                        ).exists()
-
-                        if has_house_units and not has_sales_price:
-                            total_budget = total_sales_amount
-                except UnitType.DoesNotExist:
-                    pass
-
-            # 계약 현황 계산
-            contract_data = get_contract_data_by_unit_type(project_id, order_group_id, unit_type_id)
-
-            # 실수납금액 계산
-            paid_amount = get_paid_amount_by_unit_type(project_id, order_group_id, unit_type_id, date, use_ledger_join)
-
-            contract_units = contract_data['contract_units']
-            contract_amount = contract_data['contract_amount']
-            unpaid_amount = contract_amount - paid_amount
-
-            # 미계약 금액
-            non_contract_amount = get_non_contract_amount_by_unit_type(project_id, order_group_id, unit_type_id)
-
-            # 미계약 세대수
-            non_contract_units = get_non_contract_units_by_unit_type(project_id, order_group_id, unit_type_id)
-
-            # 합계 = 계약금액 + 미계약금액
-            total_amount = contract_amount + non_contract_amount
-
-            # 근린생활시설 특별 처리
-            if total_amount == 0:
-                try:
-                    unit_type = UnitType.objects.get(pk=unit_type_id)
-                    if unit_type.sort == '5':  # 근린생활시설
-                        has_house_units = HouseUnit.objects.filter(unit_type_id=unit_type_id).exists()
-                        has_sales_price = SalesPriceByGT.objects.filter(
-                            project_id=project_id,
-                            order_group_id=order_group_id,
-                            unit_type_id=unit_type_id
-                        ).exists()
-
-                        if has_house_units and not has_sales_price:
-                            total_amount = get_commercial_fallback_amount(
-                                project_id, order_group_id, unit_type_id
-                            )
-                except UnitType.DoesNotExist:
-                    pass
-
-            results.append({
-                'order_group_id': order_group_id,
-                'order_group_name': row[1],
-                'unit_type_id': unit_type_id,
-                'unit_type_name': row[3],
-                'unit_type_color': row[4],
-                'total_sales_amount': total_sales_amount,
-                'planned_units': planned_units,
-                'contract_units': contract_units,
-                'non_contract_units': non_contract_units,
-                'contract_amount': contract_amount,
-                'paid_amount': paid_amount,
-                'unpaid_amount': unpaid_amount,
-                'non_contract_amount': non_contract_amount,
-                'total_budget': total_amount
-            })
-    return results
-
-
 def is_due_period(order, date_str):
     """납부 회차의 기간도래 여부 판단"""
     current_date = datetime.strptime(date_str, '%Y-%m-%d').date()
@@ -535,7 +220,7 @@ class PaymentSummaryViewSet(viewsets.ViewSet):
 
         try:
             # 코어 계산 로직 호출 (use_ledger_join=False)
-            payment_status_data = calculate_payment_status_by_unit_type_core(project_id, date, use_ledger_join=False)
+            payment_status_data = calculate_payment_status_by_unit_type(project_id, date, use_ledger_join=False)
 
             # unit_type별로 그룹화해서 합계 계산
             unit_type_aggregates = defaultdict(lambda: {
@@ -606,7 +291,7 @@ class PaymentStatusByUnitTypeViewSet(viewsets.ViewSet):
             return Response({'error': 'project parameter is required'}, status=400)
 
         try:
-            results = calculate_payment_status_by_unit_type_core(project_id, date, use_ledger_join=False)
+            results = calculate_payment_status_by_unit_type(project_id, date, use_ledger_join=False)
             serializer = PaymentStatusByUnitTypeSerializer(results, many=True)
             return Response(serializer.data)
 
@@ -944,7 +629,7 @@ class OverallSummaryViewSet(viewsets.ViewSet):
                 # HouseUnit은 있지만 SalesPriceByGT가 없을 때만 fallback 적용
                 if has_house_units and not has_sales_price:
                     # 예산 데이터에서 기본 금액 가져오기
-                    base_amount = PaymentStatusByUnitTypeViewSet._get_commercial_fallback_amount(
+                    base_amount = get_commercial_fallback_amount(
                         project_id, default_og.pk, unit_type.pk
                     )
 
@@ -1292,7 +977,7 @@ class OverallSummaryViewSet(viewsets.ViewSet):
 
         # 계약률 계산 (금액 기준): 계약금액 / 총매출액
         try:
-            payment_status_data = calculate_payment_status_by_unit_type_core(project_id, use_ledger_join=False)
+            payment_status_data = calculate_payment_status_by_unit_type(project_id, use_ledger_join=False)
             total_contract_amount = sum(item['contract_amount'] for item in payment_status_data)
             total_sales_amount = sum(item['total_sales_amount'] for item in payment_status_data)
             contract_rate = (total_contract_amount / total_sales_amount * 100) if total_sales_amount > 0 else 0
@@ -1443,7 +1128,7 @@ class ContractPaymentSummaryViewSet(viewsets.ViewSet):
 
         try:
             # 코어 계산 로직 호출 (use_ledger_join=True)
-            payment_status_data = calculate_payment_status_by_unit_type_core(project_id, date, use_ledger_join=True)
+            payment_status_data = calculate_payment_status_by_unit_type(project_id, date, use_ledger_join=True)
 
             # unit_type별로 그룹화해서 합계 계산
             unit_type_aggregates = defaultdict(lambda: {
@@ -1520,7 +1205,7 @@ class ContractPaymentStatusByUnitTypeViewSet(viewsets.ViewSet):
             return Response({'error': 'project parameter is required'}, status=400)
 
         try:
-            results = calculate_payment_status_by_unit_type_core(project_id, date, use_ledger_join=True)
+            results = calculate_payment_status_by_unit_type(project_id, date, use_ledger_join=True)
             serializer = PaymentStatusByUnitTypeSerializer(results, many=True)
             return Response(serializer.data)
 
@@ -1530,73 +1215,6 @@ class ContractPaymentStatusByUnitTypeViewSet(viewsets.ViewSet):
                 'error': 'An internal server error has occurred.'
             }, status=500)
 
-    @staticmethod
-    def _get_sales_amount_by_unit_type(project_id, order_group_id, unit_type_id):
-        """ContractPrice 테이블의 유효한 모든 가격정보 합계"""
-        try:
-            with connection.cursor() as cursor:
-                project = Project.objects.get(pk=project_id)
-                default_og = OrderGroup.get_default_for_project(project)
-
-                contract_query = """
-                                 SELECT COALESCE(SUM(CAST(value AS INTEGER)), 0) as contract_amount
-                                 FROM contract_contractprice cp
-                                          CROSS JOIN jsonb_each_text(cp.payment_amounts)
-                                          INNER JOIN contract_contract c ON cp.contract_id = c.id
-                                 WHERE c.project_id = %s
-                                   AND c.order_group_id = %s
-                                   AND c.unit_type_id = %s
-                                   AND c.is_active = true
-                                   AND cp.is_cache_valid = true \
-                                 """
-
-                cursor.execute(contract_query, [project_id, order_group_id, unit_type_id])
-                contract_result = cursor.fetchone()
-                contract_amount = contract_result[0] if contract_result else 0
-
-                # 미계약 가격 합계
-                non_contract_amount = 0
-                if default_og and order_group_id == default_og.pk:
-                    non_contract_query = """
-                                         SELECT COALESCE(SUM(CAST(value AS INTEGER)), 0) as non_contract_amount
-                                         FROM contract_contractprice cp
-                                                  CROSS JOIN jsonb_each_text(cp.payment_amounts)
-                                                  INNER JOIN items_houseunit hu ON cp.house_unit_id = hu.id
-                                         WHERE cp.contract_id IS NULL
-                                           AND hu.unit_type_id = %s
-                                           AND cp.is_cache_valid = true \
-                                         """
-
-                    cursor.execute(non_contract_query, [unit_type_id])
-                    non_contract_result = cursor.fetchone()
-                    non_contract_amount = non_contract_result[0] if non_contract_result else 0
-
-                total_amount = contract_amount + non_contract_amount
-
-                # 근린생활시설 특별 처리
-                if total_amount == 0:
-                    try:
-                        unit_type = UnitType.objects.get(pk=unit_type_id)
-                        if unit_type.sort == '5':
-                            has_house_units = HouseUnit.objects.filter(unit_type_id=unit_type_id).exists()
-                            has_sales_price = SalesPriceByGT.objects.filter(
-                                project_id=project_id,
-                                order_group_id=order_group_id,
-                                unit_type_id=unit_type_id
-                            ).exists()
-
-                            if has_house_units and not has_sales_price:
-                                total_amount = ContractPaymentStatusByUnitTypeViewSet._get_commercial_fallback_amount(
-                                    project_id, order_group_id, unit_type_id
-                                )
-                    except UnitType.DoesNotExist:
-                        pass
-
-                return total_amount
-
-        except Exception as e:
-            return 0
-
     @staticmethod
     def _get_commercial_fallback_amount(project_id, order_group_id, unit_type_id):
         """근린생활시설 전용 fallback 로직"""
@@ -1624,132 +1242,6 @@ class ContractPaymentStatusByUnitTypeViewSet(viewsets.ViewSet):
         except Exception as e:
             return 0
 
-    @staticmethod
-    def _get_contract_data_by_unit_type(project_id, order_group_id, unit_type_id):
-        """계약 현황 데이터 계산"""
-        try:
-            with connection.cursor() as cursor:
-                query = """
-                        SELECT COUNT(*)                   as contract_units,
-                               COALESCE(SUM(cp.price), 0) as contract_amount
-                        FROM contract_contract c
-                                 INNER JOIN contract_contractprice cp ON cp.contract_id = c.id
-                        WHERE c.project_id = %s
-                          AND c.order_group_id = %s
-                          AND c.unit_type_id = %s
-                          AND c.is_active = true
-                          AND cp.is_cache_valid = true
-                        """
-
-                cursor.execute(query, [project_id, order_group_id, unit_type_id])
-                result = cursor.fetchone()
-                return {
-                    'contract_units': result[0] if result else 0,
-                    'contract_amount': result[1] if result else 0
-                }
-
-        except Exception as e:
-            return {'contract_units': 0, 'contract_amount': 0}
-
-    @staticmethod
-    def _get_paid_amount_by_unit_type(project_id, order_group_id, unit_type_id, date):
-        """
-        order_group과 unit_type별 실수납금액 계산 (Ledger 기반)
-
-        변경점: ProjectCashBook → ContractPayment + ProjectAccountingEntry
-        """
-        try:
-            with connection.cursor() as cursor:
-                date_filter = ""
-                params = [project_id, order_group_id, unit_type_id]
-
-                if date:
-                    date_filter = "AND pbt.deal_date <= %s"
-                    params.append(date)
-
-                # Ledger 기반 집계: ContractPayment → accounting_entry → related_transaction
-                query = f"""
-                        SELECT COALESCE(SUM(pae.amount), 0) as paid_amount
-                        FROM payment_contractpayment cp
-                                 INNER JOIN ledger_projectaccountingentry pae ON cp.accounting_entry_id = pae.id
-                                 INNER JOIN ledger_projectbanktransaction pbt ON pae.transaction_id = pbt.transaction_id
-                                 INNER JOIN contract_contract c ON cp.contract_id = c.id
-                                 INNER JOIN ledger_projectaccount pa ON pae.account_id = pa.id
-                        WHERE cp.project_id = %s
-                          AND c.order_group_id = %s
-                          AND c.unit_type_id = %s
-                          AND c.is_active = true
-                          AND pa.is_payment = true
-                          AND cp.is_payment_mismatch = false
-                          {date_filter}
-                        """
-
-                cursor.execute(query, params)
-                result = cursor.fetchone()
-                return result[0] if result else 0
-
-        except Exception as e:
-            return 0
-
-    @staticmethod
-    def _get_non_contract_amount_by_unit_type(project_id, order_group_id, unit_type_id):
-        """order_group과 unit_type별 미계약 금액 계산"""
-        try:
-            project = Project.objects.get(pk=project_id)
-            default_og = OrderGroup.get_default_for_project(project)
-            if not default_og:
-                return 0
-
-            if order_group_id == default_og.pk:
-                with connection.cursor() as cursor:
-                    query = """
-                            SELECT COALESCE(SUM(CAST(value AS INTEGER)), 0) as non_contract_amount
-                            FROM contract_contractprice cp, jsonb_each_text(cp.payment_amounts)
-                            WHERE cp.contract_id IS NULL
-                              AND cp.house_unit_id IN (SELECT hu.id
-                                                       FROM items_houseunit hu
-                                                       WHERE hu.unit_type_id = %s)
-                              AND cp.is_cache_valid = true
-                            """
-
-                    cursor.execute(query, [unit_type_id])
-                    result = cursor.fetchone()
-                    return result[0] if result else 0
-            else:
-                return 0
-
-        except Exception as e:
-            return 0
-
-    @staticmethod
-    def _get_non_contract_units_by_unit_type(project_id, order_group_id, unit_type_id):
-        """order_group과 unit_type별 미계약 세대수 계산"""
-        try:
-            project = Project.objects.get(pk=project_id)
-            default_og = OrderGroup.get_default_for_project(project)
-            if not default_og:
-                return 0
-
-            if order_group_id == default_og.pk:
-                with connection.cursor() as cursor:
-                    query = """
-                            SELECT COUNT(*) as non_contract_units
-                            FROM contract_contractprice cp
-                                     INNER JOIN items_houseunit hu ON cp.house_unit_id = hu.id
-                            WHERE cp.contract_id IS NULL
-                              AND hu.unit_type_id = %s
-                              AND cp.is_cache_valid = true
-                            """
-
-                    cursor.execute(query, [unit_type_id])
-                    result = cursor.fetchone()
-                    return result[0] if result else 0
-            else:
-                return 0
-
-        except Exception as e:
-            return 0
-
 
 class ContractPaymentOverallSummaryViewSet(viewsets.ViewSet):
     """
@@ -2179,7 +1671,7 @@ class ContractPaymentOverallSummaryViewSet(viewsets.ViewSet):
 
         # 계약률 계산 (금액 기준): 계약금액 / 총매출액
         try:
-            payment_status_data = calculate_payment_status_by_unit_type_core(project_id, use_ledger_join=True)
+            payment_status_data = calculate_payment_status_by_unit_type(project_id, use_ledger_join=True)
             total_contract_amount = sum(item['contract_amount'] for item in payment_status_data)
             total_sales_amount = sum(item['total_sales_amount'] for item in payment_status_data)
             contract_rate = (total_contract_amount / total_sales_amount * 100) if total_sales_amount > 0 else 0
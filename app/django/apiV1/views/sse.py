@@ -1,20 +1,135 @@
+import asyncio
 import json
 import logging
 import time
+import weakref
+from collections import defaultdict
+
 from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
 from django.http import StreamingHttpResponse, HttpResponseForbidden, HttpResponse
 from rest_framework_simplejwt.tokens import AccessToken
 from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
 
 logger = logging.getLogger(__name__)
 
+CHANNEL_PREFIX = 'user_notify_'
+HEARTBEAT_INTERVAL = 20  # 프록시/브라우저 타임아웃 방지용 Ping 주기 (초)
+CLIENT_QUEUE_SIZE = 100  # 느린 클라이언트 대기 메시지 상한 (초과 시 오래된 메시지부터 폐기)
+RECONNECT_DELAY = 3  # Redis 연결 끊김 시 재연결 대기 (초)
+
 
-def sse_notification_stream(request):
+class NotificationHub:
     """
-    Server-Sent Events (SSE) 실시간 알림 스트림 엔드포인트
-    URL: /api/v1/notifications/stream/
-    인증: Query param 'token' 또는 Authorization Bearer 헤더 지원
+    프로세스(이벤트 루프) 단위 공유 Redis Pub/Sub 구독자
+
+    하나의 asyncio Redis 연결로 접속 중인 사용자 채널만 구독하고,
+    수신 메시지를 해당 사용자의 모든 SSE 클라이언트 큐로 분배한다.
+    대기 중인 스트림은 큐에서 await 만 하므로 요청 스레드를 점유하지 않는다.
     """
+
+    def __init__(self):
+        self._queues = defaultdict(set)  # channel -> {asyncio.Queue}
+        self._lock = asyncio.Lock()
+        self._redis = None
+        self._pubsub = None
+        self._reader = None
+
+    async def subscribe(self, user_id):
+        channel = f'{CHANNEL_PREFIX}{user_id}'
+        queue = asyncio.Queue(maxsize=CLIENT_QUEUE_SIZE)
+        async with self._lock:
+            await self._ensure_connection()
+            if channel not in self._queues:
+                await self._pubsub.subscribe(channel)
+            self._queues[channel].add(queue)
+            if self._reader is None or self._reader.done():
+                self._reader = asyncio.create_task(self._read_loop())
+        return queue
+
+    async def unsubscribe(self, user_id, queue):
+        channel = f'{CHANNEL_PREFIX}{user_id}'
+        async with self._lock:
+            queues = self._queues.get(channel)
+            if queues is None:
+                return
+            queues.discard(queue)
+            if not queues:
+                del self._queues[channel]
+                try:
+                    await self._pubsub.unsubscribe(channel)
+                except Exception as e:
+                    logger.debug(f"SSE Redis unsubscribe error: {e}")
+
+    async def _ensure_connection(self):
+        if self._pubsub is not None:
+            return
+        import redis.asyncio as aioredis
+        redis_url = getattr(settings, 'REDIS_URL', 'redis://localhost:6379/1')
+        self._redis = aioredis.Redis.from_url(redis_url)
+        self._pubsub = self._redis.pubsub(ignore_subscribe_messages=True)
+
+    async def _reset_connection(self):
+        """연결 재생성 후 현재 접속 중인 채널 재구독"""
+        async with self._lock:
+            try:
+                await self._pubsub.aclose()
+                await self._redis.aclose()
+            except Exception:
+                pass
+            self._redis = self._pubsub = None
+            await self._ensure_connection()
+            if self._queues:
+                await self._pubsub.subscribe(*self._queues)
+
+    async def _read_loop(self):
+        while self._queues:
+            try:
+                message = await self._pubsub.get_message(timeout=1.0)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"SSE Redis subscriber error: {e}")
+                await asyncio.sleep(RECONNECT_DELAY)
+                try:
+                    await self._reset_connection()
+                except Exception as e:
+                    logger.warning(f"SSE Redis reconnect error: {e}")
+                continue
+
+            if not message or message['type'] != 'message':
+                continue
+            channel, data = message['channel'], message['data']
+            if isinstance(channel, bytes):
+                channel = channel.decode('utf-8')
+            if isinstance(data, bytes):
+                data = data.decode('utf-8')
+            for queue in tuple(self._queues.get(channel, ())):
+                self._put_nowait(queue, data)
+
+    @staticmethod
+    def _put_nowait(queue, data):
+        if queue.full():
+            try:
+                queue.get_nowait()
+            except asyncio.QueueEmpty:
+                pass
+        queue.put_nowait(data)
+
+
+_hubs = weakref.WeakKeyDictionary()
+
+
+def get_notification_hub():
+    """현재 이벤트 루프에 바인딩된 공유 구독자 (ASGI 워커당 1개)"""
+    loop = asyncio.get_running_loop()
+    hub = _hubs.get(loop)
+    if hub is None:
+        hub = _hubs[loop] = NotificationHub()
+    return hub
+
+
+def _authenticate(request):
     token_str = request.GET.get('token')
     if not token_str:
         auth_header = request.headers.get('Authorization', '')
@@ -22,27 +137,24 @@ def sse_notification_stream(request):
             token_str = auth_header[7:].strip()
 
     if not token_str:
-        return HttpResponseForbidden("Authentication token required for SSE stream.")
+        return None, HttpResponseForbidden("Authentication token required for SSE stream.")
 
     try:
         access_token = AccessToken(token_str)
-        user_id = access_token['user_id']
+        return access_token['user_id'], None
     except (InvalidToken, TokenError, KeyError, Exception) as e:
         logger.debug(f"SSE Auth failed: {e}")
-        return HttpResponseForbidden("Invalid or expired token.")
+        return None, HttpResponseForbidden("Invalid or expired token.")
 
-    try:
-        import redis
-        redis_url = getattr(settings, 'REDIS_URL', 'redis://localhost:6379/1')
-        r = redis.Redis.from_url(redis_url)
-        pubsub = r.pubsub()
-        pubsub.subscribe(f'user_notify_{user_id}')
-    except Exception as e:
-        logger.error(f"SSE Redis connection error: {e}")
-        return HttpResponse("SSE Redis error", status=500)
+
+def _wsgi_event_stream(user_id):
+    """WSGI 개발 서버(runserver)용 동기 스트림 - 연결마다 Redis 구독 및 요청 스레드 점유"""
+    import redis
+    redis_url = getattr(settings, 'REDIS_URL', 'redis://localhost:6379/1')
+    pubsub = redis.Redis.from_url(redis_url).pubsub(ignore_subscribe_messages=True)
+    pubsub.subscribe(f'{CHANNEL_PREFIX}{user_id}')
 
     def event_stream():
-        # 초기 연결 성공 이벤트
         yield f"event: connected\ndata: {json.dumps({'status': 'connected', 'user_id': user_id})}\n\n"
         last_ping = time.time()
         try:
@@ -53,24 +165,61 @@ def sse_notification_stream(request):
                     if isinstance(data, bytes):
                         data = data.decode('utf-8')
                     yield f"event: notification\ndata: {data}\n\n"
-
-                # 20초마다 Heartbeat Ping 패킷 전송 (프록시/브라우저 타임아웃 방지)
-                now = time.time()
-                if now - last_ping >= 20:
+                if time.time() - last_ping >= HEARTBEAT_INTERVAL:
                     yield ": ping\n\n"
-                    last_ping = now
-        except GeneratorExit:
-            logger.debug(f"SSE Client disconnected for user {user_id}")
-        except Exception as e:
-            logger.debug(f"SSE stream error for user {user_id}: {e}")
+                    last_ping = time.time()
         finally:
             try:
-                pubsub.unsubscribe(f'user_notify_{user_id}')
                 pubsub.close()
             except Exception:
                 pass
 
-    response = StreamingHttpResponse(event_stream(), content_type='text/event-stream')
+    return event_stream()
+
+
+async def _asgi_event_stream(hub, user_id, queue):
+    try:
+        # 초기 연결 성공 이벤트
+        yield f"event: connected\ndata: {json.dumps({'status': 'connected', 'user_id': user_id})}\n\n"
+        while True:
+            try:
+                data = await asyncio.wait_for(queue.get(), timeout=HEARTBEAT_INTERVAL)
+            except asyncio.TimeoutError:
+                yield ": ping\n\n"
+                continue
+            yield f"event: notification\ndata: {data}\n\n"
+    except asyncio.CancelledError:
+        logger.debug(f"SSE Client disconnected for user {user_id}")
+        raise
+    except Exception as e:
+        logger.debug(f"SSE stream error for user {user_id}: {e}")
+    finally:
+        await hub.unsubscribe(user_id, queue)
+
+
+async def sse_notification_stream(request):
+    """
+    Server-Sent Events (SSE) 실시간 알림 스트림 엔드포인트
+    URL: /api/v1/notifications/stream/
+    인증: Query param 'token' 또는 Authorization Bearer 헤더 지원
+    ASGI(_config.asgi) 서빙 시 프로세스 공유 Redis 구독자에서 메시지를 전달받아 스레드를 점유하지 않는다.
+    """
+    user_id, error_response = _authenticate(request)
+    if error_response:
+        return error_response
+
+    try:
+        if isinstance(request, ASGIRequest):
+            hub = get_notification_hub()
+            queue = await hub.subscribe(user_id)
+            stream = _asgi_event_stream(hub, user_id, queue)
+        else:
+            stream = _wsgi_event_stream(user_id)
+    except Exception as e:
+        logger.error(f"SSE Redis connection error: {e}")
+        return HttpResponse("SSE Redis error", status=500)
+
+    response = StreamingHttpResponse(stream, content_type='text/event-stream')
     response['Cache-Control'] = 'no-cache, no-transform'
     response['X-Accel-Buffering'] = 'no'
     return response
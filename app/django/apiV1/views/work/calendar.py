@@ -6,6 +6,8 @@ from apiV1.permissions.work_perms import ProjectPermission
 from apiV1.views.work.issue import IssueFilter
 from work.models.issue import Issue
 from work.models.meeting import Meeting
+from work.models.project import IssueProject
+from work.services.project_tree import get_subtree_ids
 
 
 class CalendarViewSet(viewsets.ViewSet):
@@ -32,13 +34,19 @@ class CalendarViewSet(viewsets.ViewSet):
 
         is_admin = user.is_superuser or getattr(user, 'work_manager', False)
 
+        # 선택 워크스페이스와 하위 워크스페이스 (업무 목록 필터와 동일한 트리 범위)
+        project_ids = None
+        if project_slug:
+            project_pk = IssueProject.objects.filter(slug=project_slug).values_list('pk', flat=True).first()
+            project_ids = get_subtree_ids(project_pk) if project_pk else []
+
         events = []
 
         # ── 1. Issue 쿼리셋 ────────────────────────────────────────────────
         if event_type in ('all', 'issue'):
             issue_qs = Issue.objects.filter(project__status='1')
-            if project_slug:
-                issue_qs = issue_qs.filter(project__slug=project_slug)
+            if project_ids is not None:
+                issue_qs = issue_qs.filter(project_id__in=project_ids)
 
             if not is_admin:
                 issue_qs = issue_qs.filter(
@@ -83,8 +91,8 @@ class CalendarViewSet(viewsets.ViewSet):
         # ── 2. Meeting 쿼리셋 ──────────────────────────────────────────────
         if event_type in ('all', 'meeting'):
             meeting_qs = Meeting.objects.all()
-            if project_slug:
-                meeting_qs = meeting_qs.filter(project__slug=project_slug)
+            if project_ids is not None:
+                meeting_qs = meeting_qs.filter(project_id__in=project_ids)
 
             if not is_admin:
                 meeting_qs = meeting_qs.filter(
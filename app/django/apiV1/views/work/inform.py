@@ -5,15 +5,16 @@ from rest_framework.decorators import action
 from rest_framework.filters import SearchFilter
 from rest_framework.response import Response
 
-from apiV1.pagination import PageNumberPaginationTen
+from apiV1.pagination import PageNumberPaginationTen, PageNumberPaginationTwenty
 from apiV1.permissions.auth_perms import permissions
 from apiV1.permissions.work_perms import NewsPermission, QueryPermission
 from apiV1.serializers.work import NewsFileSerializer, NewsCommentSerializer, SearchSerializer
 from apiV1.serializers.work.inform import NewsSerializer, CustomQuerySerializer
-from apiV1.serializers.work.search import (CommentSearchSerializer)
+from apiV1.serializers.work.search import CommentSearchSerializer, SearchEntrySerializer
 from work.models import NewsFile
-from work.models.inform import News, NewsComment, Search, CustomQuery
+from work.models.inform import News, NewsComment, Search, CustomQuery, SearchEntry
 from work.models.issue import IssueComment
+from work.services.search_index import SEARCH_SOURCES, search_entries, top_entries_by_type
 
 
 class NewsViewSet(viewsets.ModelViewSet):
@@ -155,247 +156,88 @@ class SearchViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=['get'], url_path='run')
     def run(self, request):
         """
-        통합 검색 실행 엔드포인트
+        통합 검색 실행 엔드포인트 (유형별 상위 25건)
         GET /api/v1/issue-search/run/?q=키워드&scope=all&t=issues&t=comments&t=meetings&t=news
         파라미터:
           q          : 검색어 (필수, 2자 이상)
-          scope      : 'all' | 'project' (기본: 'all')
+          scope      : 'all' | 'project' | 'my' (기본: 'all')
           slug       : 프로젝트 slug (scope='project'일 때)
-          t          : 검색 대상 (복수 가능) - issues, comments, meetings, news
+          t          : 검색 대상 (복수 가능) - issues, comments, meetings, news, documents, posts
           title_only : '1'이면 제목만 검색 (기본: '0')
         """
-        q = request.query_params.get('q', '').strip()
-        if len(q) < 2:
-            return Response({'error': '검색어는 2자 이상 입력하세요.'}, status=400)
-
-        scope = request.query_params.get('scope', 'all')
-        slug = request.query_params.get('slug', '')
-        targets = (set(request.query_params.getlist('t')) or
-                   {'issues', 'comments', 'meetings', 'news', 'documents', 'posts'})
-        title_only = request.query_params.get('title_only', '0') == '1'
-        opened_only = request.query_params.get('opened_only', '0') == '1'
-        attach_mode = request.query_params.get('attach_mode', '1')
-
-        results = {}
-        if 'issues' in targets:
-            results['issues'] = self._search_issues(request.user, q, scope, slug, title_only, opened_only, attach_mode)
-        if 'comments' in targets:
-            results['comments'] = self._search_comments(request.user, q, scope, slug)
-        if 'meetings' in targets:
-            results['meetings'] = self._search_meetings(request.user, q, scope, slug, title_only, attach_mode)
-        if 'news' in targets:
-            results['news'] = self._search_news(request.user, q, scope, slug, title_only, attach_mode)
-        if 'documents' in targets:
-            results['documents'] = self._search_documents(request.user, q, scope, slug, title_only, attach_mode)
-        if 'posts' in targets:
-            results['posts'] = self._search_posts(request.user, q, scope, slug, title_only, attach_mode)
-
+        params, error = self._search_params(request)
+        if error:
+            return error
+
+        results = {target: [] for target in params['object_types']}
+        entries = search_entries(request.user, **params)
+        if entries is not None:
+            # 통합 검색 색인에서 유형별 관련도 상위 25건을 한 번에 조회 후 원본 직렬화
+            for object_type, type_entries in top_entries_by_type(entries, limit=25).items():
+                results[object_type] = self._load_results(
+                    request.user, object_type, [entry.object_id for entry in type_entries])
         return Response(results)
 
-    @staticmethod
-    def _search_issues(user, q, scope, slug, title_only, opened_only, attach_mode):
-        from apiV1.views.work.issue import build_issue_queryset
-        from apiV1.serializers.work.search import IssueSearchSerializer
-
-        qs = build_issue_queryset(user)
-        if opened_only:
-            qs = qs.filter(closed__isnull=True)
-        if title_only:
-            qs = qs.filter(subject__icontains=q)
-        else:
-            if attach_mode == '1':
-                qs = qs.filter(Q(subject__icontains=q) | Q(description__icontains=q))
-            elif attach_mode == '2':
-                qs = qs.filter(
-                    Q(subject__icontains=q) |
-                    Q(description__icontains=q) |
-                    Q(files__file_name__icontains=q) |
-                    Q(files__description__icontains=q)
-                ).distinct()
-            elif attach_mode == '3':
-                qs = qs.filter(
-                    Q(files__file_name__icontains=q) |
-                    Q(files__description__icontains=q)
-                ).distinct()
-        if scope == 'project' and slug:
-            qs = qs.filter(project__slug=slug)
-        elif scope == 'my':
-            qs = qs.filter(project__members__user=user)
-        return IssueSearchSerializer(qs[:25], many=True).data
-
-    @staticmethod
-    def _search_comments(user, q, scope, slug):
-        qs = IssueComment.objects.filter(
-            content__icontains=q,
-            issue__project__status='1',
-        ).select_related('issue__project', 'creator')
-
-        if not (user.is_superuser or getattr(user, 'work_manager', False)):
-            qs = qs.filter(
-                Q(issue__project__is_public=True) | Q(issue__project__members__user=user)
-            ).filter(
-                Q(is_private=False) | Q(creator=user)
-            ).distinct()
-        else:
-            qs = qs.filter(Q(is_private=False) | Q(creator=user))
+    @action(detail=False, methods=['get'], url_path='ranked')
+    def ranked(self, request):
+        """
+        통합 검색 (전체 유형 관련도 순 페이지 결과)
+        GET /api/v1/issue-search/ranked/?q=키워드&page=1 (파라미터는 run 과 동일)
+        """
+        params, error = self._search_params(request)
+        if error:
+            return error
 
-        if scope == 'project' and slug:
-            qs = qs.filter(issue__project__slug=slug)
-        elif scope == 'my':
-            qs = qs.filter(issue__project__members__user=user)
-        return CommentSearchSerializer(qs[:25], many=True).data
+        entries = search_entries(request.user, **params)
+        if entries is None:
+            entries = SearchEntry.objects.none()
+        paginator = PageNumberPaginationTwenty()
+        page = paginator.paginate_queryset(entries, request, view=self)
+        return paginator.get_paginated_response(SearchEntrySerializer(page, many=True).data)
 
     @staticmethod
-    def _search_meetings(user, q, scope, slug, title_only, attach_mode):
-        from apiV1.serializers.work.search import MeetingSearchSerializer
-        from work.models.meeting import Meeting
-
-        if title_only:
-            q_expr = Q(title__icontains=q)
-        else:
-            if attach_mode == '1':
-                q_expr = Q(title__icontains=q) | Q(agenda__icontains=q) | Q(decisions__icontains=q)
-            elif attach_mode == '2':
-                q_expr = (
-                        Q(title__icontains=q) |
-                        Q(agenda__icontains=q) |
-                        Q(decisions__icontains=q) |
-                        Q(files__file_name__icontains=q) |
-                        Q(files__description__icontains=q)
-                )
-            elif attach_mode == '3':
-                q_expr = Q(files__file_name__icontains=q) | Q(files__description__icontains=q)
-
-        qs = Meeting.objects.filter(q_expr).select_related('project', 'creator')
-        if not (user.is_superuser or getattr(user, 'work_manager', False)):
-            qs = qs.filter(
-                Q(project__is_public=True) | Q(project__members__user=user)
-            ).distinct()
-        if scope == 'project' and slug:
-            qs = qs.filter(project__slug=slug)
-        elif scope == 'my':
-            qs = qs.filter(project__members__user=user)
-        return MeetingSearchSerializer(qs[:25], many=True).data
-
-    @staticmethod
-    def _search_news(user, q, scope, slug, title_only, attach_mode):
-        from apiV1.serializers.work.search import NewsSearchSerializer
-        from work.models.inform import News
-
-        if title_only:
-            q_expr = Q(title__icontains=q)
-        else:
-            if attach_mode == '1':
-                q_expr = Q(title__icontains=q) | Q(summary__icontains=q) | Q(content__icontains=q)
-            elif attach_mode == '2':
-                q_expr = (
-                        Q(title__icontains=q) |
-                        Q(summary__icontains=q) |
-                        Q(content__icontains=q) |
-                        Q(files__file_name__icontains=q) |
-                        Q(files__description__icontains=q)
-                )
-            elif attach_mode == '3':
-                q_expr = Q(files__file_name__icontains=q) | Q(files__description__icontains=q)
-
-        qs = News.objects.filter(q_expr).select_related('project', 'author')
-        if not (user.is_superuser or getattr(user, 'work_manager', False)):
-            qs = qs.filter(
-                Q(project__is_public=True) | Q(project__members__user=user)
-            ).distinct()
-        if scope == 'project' and slug:
-            qs = qs.filter(project__slug=slug)
-        elif scope == 'my':
-            qs = qs.filter(project__members__user=user)
-        return NewsSearchSerializer(qs[:25], many=True).data
+    def _search_params(request):
+        q = request.query_params.get('q', '').strip()
+        if len(q) < 2:
+            return None, Response({'error': '검색어는 2자 이상 입력하세요.'}, status=400)
+
+        targets = set(request.query_params.getlist('t')) or set(SEARCH_SOURCES)
+        return {
+            'text': q,
+            'object_types': [object_type for object_type in SEARCH_SOURCES if object_type in targets],
+            'scope': request.query_params.get('scope', 'all'),
+            'slug': request.query_params.get('slug', ''),
+            'title_only': request.query_params.get('title_only', '0') == '1',
+            'opened_only': request.query_params.get('opened_only', '0') == '1',
+            'attach_mode': request.query_params.get('attach_mode', '1'),
+        }, None
 
     @staticmethod
-    def _search_documents(user, q, scope, slug, title_only, attach_mode):
-        from apiV1.serializers.work.search import DocumentSearchSerializer
+    def _load_results(user, object_type, object_ids):
+        """색인 결과 ID 목록의 원본 객체를 관련도 순으로 직렬화"""
+        from apiV1.serializers.work.search import (IssueSearchSerializer, MeetingSearchSerializer,
+                                                   NewsSearchSerializer, DocumentSearchSerializer,
+                                                   PostSearchSerializer)
         from docs.models import Document
-
-        if title_only:
-            q_expr = Q(title__icontains=q)
-        else:
-            if attach_mode == '1':
-                q_expr = Q(title__icontains=q) | Q(description__icontains=q)
-            elif attach_mode == '2':
-                q_expr = (
-                        Q(title__icontains=q) |
-                        Q(description__icontains=q) |
-                        Q(files__file_name__icontains=q) |
-                        Q(files__description__icontains=q) |
-                        Q(images__image_name__icontains=q) |
-                        Q(links__link__icontains=q) |
-                        Q(links__description__icontains=q)
-                )
-            elif attach_mode == '3':
-                q_expr = (
-                        Q(files__file_name__icontains=q) |
-                        Q(images__image_name__icontains=q) |
-                        Q(links__link__icontains=q)
-                )
-
-        # 소프트 딜리트 필터: deleted=None (SoftDeleteManager가 적용되어 있으므로 기본 objects 사용 가능)
-        qs = Document.objects.filter(q_expr, issue_project__status='1').select_related('issue_project', 'creator')
-
-        # 권한 제어: 사용자가 관리자가 아닌 경우 멤버십 프로젝트 문서만 허용 (비밀글/블라인드글 제외)
-        if not (user.is_superuser or getattr(user, 'work_manager', False)):
-            qs = qs.filter(
-                issue_project__members__user=user
-            ).filter(
-                Q(is_secret=False) | Q(creator=user)
-            ).filter(is_blind=False).distinct()
-
-        if scope == 'project' and slug:
-            qs = qs.filter(issue_project__slug=slug)
-        elif scope == 'my':
-            qs = qs.filter(issue_project__members__user=user)
-        return DocumentSearchSerializer(qs[:25], many=True).data
-
-    @staticmethod
-    def _search_posts(user, q, scope, slug, title_only, attach_mode):
-        from apiV1.serializers.work.search import PostSearchSerializer
         from forum.models import Post
+        from work.models.issue import Issue
+        from work.models.meeting import Meeting
 
-        if title_only:
-            q_expr = Q(title__icontains=q)
-        else:
-            if attach_mode == '1':
-                q_expr = Q(title__icontains=q) | Q(content__icontains=q)
-            elif attach_mode == '2':
-                q_expr = (
-                        Q(title__icontains=q) |
-                        Q(content__icontains=q) |
-                        Q(files__file_name__icontains=q) |
-                        Q(images__image_name__icontains=q)
-                )
-            elif attach_mode == '3':
-                q_expr = Q(files__file_name__icontains=q) | Q(images__image_name__icontains=q)
-
-        # 소프트 딜리트 필터, 검색 가능 게시판(forum__search_able=True), 프로젝트 활성 상태(status='1')
-        qs = Post.objects.filter(
-            q_expr,
-            deleted__isnull=True,
-            forum__search_able=True,
-            forum__project__status='1'
-        ).select_related('forum__project', 'creator')
-
-        # 권한 제어: 공개 프로젝트 OR 멤버십 프로젝트의 게시글 허용 (비밀글/블라인드글 보안 가드)
-        if not (user.is_superuser or getattr(user, 'work_manager', False)):
-            qs = qs.filter(
-                Q(forum__project__is_public=True) | Q(forum__project__members__user=user)
-            ).filter(
-                Q(is_secret=False) | Q(creator=user)
-            ).filter(is_blind=False).distinct()
-        else:
-            qs = qs.filter(is_blind=False)
-
-        if scope == 'project' and slug:
-            qs = qs.filter(forum__project__slug=slug)
-        elif scope == 'my':
-            qs = qs.filter(forum__project__members__user=user)
-        return PostSearchSerializer(qs[:25], many=True).data
+        loaders = {
+            'issues': (lambda: Issue.objects.select_related('project', 'tracker', 'status', 'creator'),
+                       IssueSearchSerializer),
+            'comments': (lambda: IssueComment.objects.select_related('issue__project', 'creator'),
+                         CommentSearchSerializer),
+            'meetings': (lambda: Meeting.objects.select_related('project', 'creator'), MeetingSearchSerializer),
+            'news': (lambda: News.objects.select_related('project', 'author'), NewsSearchSerializer),
+            'documents': (lambda: Document.objects.select_related('issue_project', 'creator'),
+                          DocumentSearchSerializer),
+            'posts': (lambda: Post.objects.select_related('forum__project', 'creator'), PostSearchSerializer),
+        }
+        queryset, serializer_class = loaders[object_type]
+        # 색인 갱신 전 비공개·숨김 전환, 권한 변경에 대비해 원본 기준 가시성 조건을 다시 적용
+        objects = queryset().filter(SEARCH_SOURCES[object_type].visible_q(user)).in_bulk(object_ids)
+        return serializer_class([objects[pk] for pk in object_ids if pk in objects], many=True).data
 
 
 class CustomQueryViewSet(viewsets.ModelViewSet):
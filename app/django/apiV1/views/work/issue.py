@@ -16,8 +16,11 @@ from apiV1.serializers.work import (IssueCountByMemberSerializer, IssueRelationS
 from apiV1.serializers.work.issue import IssueSerializer
 from work.models import Issue, IssueRelation, IssueProject, IssueFile, IssueComment, Tracker, \
     IssueCategory, IssueStatus, Workflow, CodeIssuePriority
-from work.models.project import Member, Role
 from work.models.logging import IssueLogEntry
+from work.services.issue_access import visible_comment_q, visible_issue_q
+from work.services.issue_counter import count_by_user
+from work.services.issue_loader import issue_prefetches
+from work.services.project_tree import get_subtree_ids
 
 
 class IssueFilter(FilterSet):
@@ -46,8 +49,9 @@ class IssueFilter(FilterSet):
     subject__exclude = CharFilter(field_name='subject', lookup_expr='icontains', exclude=True, label='제목-제외')
     description = CharFilter(field_name='description', lookup_expr='icontains', label='설명')
     description__exclude = CharFilter(field_name='description', lookup_expr='icontains', exclude=True, label='설명-제외')
-    comment = CharFilter(field_name='comments__content', lookup_expr='icontains', label='댓글')
-    comment__exclude = CharFilter(field_name='comments__content', lookup_expr='icontains', exclude=True, label='댓글-제외')
+    comment = CharFilter(field_name='comments__content', lookup_expr='icontains', distinct=True, label='댓글')
+    comment__exclude = CharFilter(field_name='comments__content', lookup_expr='icontains', exclude=True, distinct=True,
+                                  label='댓글-제외')
     any_searchable = CharFilter(method='filter_any_searchable', label='전체내용-검색')
     any_searchable__exclude = CharFilter(method='filter_any_searchable_exclude', label='전체내용-제외')
     file = CharFilter(field_name='files__file_name', lookup_expr='icontains', label='파일명')
@@ -442,32 +446,22 @@ class IssueFilter(FilterSet):
         for name, value in self.form.cleaned_data.items():
             if name == 'project__slug' and value:
                 try:
-                    project = IssueProject.objects.get(slug=value)
-                    all_projects = list(IssueProject.objects.all())
-                    sub_projects_slugs = []
-
-                    def collect_children(parent_obj):
-                        for p in all_projects:
-                            if p.parent_id == parent_obj.id:
-                                sub_projects_slugs.append(p.slug)
-                                collect_children(p)
-
-                    collect_children(project)
+                    project_pk = IssueProject.objects.values_list('pk', flat=True).get(slug=value)
+                    project_ids = get_subtree_ids(project_pk)
 
                     sub_project_val = self.form.cleaned_data.get('sub_project')
                     sub_project_exclude_val = self.form.cleaned_data.get('sub_project__exclude')
                     sub_project_isnull_val = self.form.cleaned_data.get('sub_project__isnull')
 
                     if sub_project_isnull_val == '1':  # 없음 (Only main project)
-                        queryset = queryset.filter(project__slug=project.slug)
+                        queryset = queryset.filter(project_id=project_pk)
                     elif sub_project_val:  # 이다 (Specific sub-project)
                         queryset = queryset.filter(project_id=sub_project_val)
                     elif sub_project_exclude_val:  # 아니다 (Exclude specific sub-project)
-                        queryset = queryset.filter(project__slug__in=[project.slug] + sub_projects_slugs).exclude(
+                        queryset = queryset.filter(project_id__in=project_ids).exclude(
                             project_id=sub_project_exclude_val)
                     else:  # 모두 (Default)
-                        slugs = [project.slug] + sub_projects_slugs
-                        queryset = queryset.filter(project__slug__in=slugs)
+                        queryset = queryset.filter(project_id__in=project_ids)
                 except IssueProject.DoesNotExist:
                     pass
             elif value is not None and name not in ['project__slug', 'sub_project', 'sub_project__exclude',
@@ -491,39 +485,8 @@ def build_issue_queryset(user, base_qs=None):
     if getattr(user, 'work_manager', False) or user.is_superuser:
         return base_qs
 
-    user_members = Member.objects.filter(user=user).prefetch_related('roles__permissions')
-    member_all_pids, member_pub_pids, private_pids = [], [], []
-    issue_visibility_order = {'ALL': 3, 'PUB': 2, 'PRI': 1, 'NOP': 0}
-
-    for member in user_members:
-        best_visible, has_private_perm = 'NOP', False
-        for role in member.roles.all():
-            if issue_visibility_order.get(role.issue_visible, 0) > issue_visibility_order.get(best_visible, 0):
-                best_visible = role.issue_visible
-            for perm in role.permissions.all():
-                if perm.code == 'issue.private':
-                    has_private_perm = True
-        if best_visible == 'ALL':
-            member_all_pids.append(member.project_id)
-        elif best_visible == 'PUB':
-            member_pub_pids.append(member.project_id)
-        if has_private_perm:
-            private_pids.append(member.project_id)
-
-    try:
-        non_member_visible = Role.objects.get(pk=2).issue_visible
-    except Role.DoesNotExist:
-        non_member_visible = 'NOP'
-
-    q_expr = Q(creator=user) | Q(assigned_to=user)
-    if member_all_pids:
-        q_expr |= Q(project_id__in=member_all_pids)
-    if non_member_visible == 'ALL':
-        q_expr |= Q(project__is_public=True)
-    elif non_member_visible == 'PUB':
-        q_expr |= Q(project__is_public=True, is_private=False)
-
-    return base_qs.filter(q_expr).distinct()
+    # 사용자별 업무 조회 범위(IssueAccess) 서브쿼리로 필터링 - 다중 조인이 없어 distinct() 불필요
+    return base_qs.filter(visible_issue_q(user))
 
 
 class IssueViewSet(viewsets.ModelViewSet):
@@ -571,8 +534,8 @@ class IssueViewSet(viewsets.ModelViewSet):
         return build_issue_queryset(
             self.request.user,
             Issue.objects.all().select_related(
-                'project', 'status', 'creator', 'assigned_to', 'tracker', 'fixed_version'
-            ).prefetch_related('files', 'links', 'watchers')
+                'project', 'status', 'creator', 'assigned_to', 'tracker', 'fixed_version', 'parent__tracker'
+            ).prefetch_related(*issue_prefetches())
         )
 
     def filter_queryset(self, queryset):
@@ -601,18 +564,16 @@ class IssueCountByMemberView(APIView):
     @staticmethod
     def get(request, *args, **kwargs):
         user_param = request.query_params.get('user', None)
-        user = user_param if user_param else request.user
+        user_id = user_param if user_param else request.user.pk
 
-        # Count issues assigned to the user
-        issues_in_charge = Issue.objects.filter(assigned_to=user).exclude(project__status='9')
-        open_charged = issues_in_charge.filter(closed__isnull=True).count()
-        closed_charged = issues_in_charge.filter(closed__isnull=False).count()
+        # 업무 건수 카운터에서 담당·작성 업무 수 조회
+        counts = count_by_user(user_id)
+        open_charged = counts['charged'][False]
+        closed_charged = counts['charged'][True]
         all_charged = open_charged + closed_charged
 
-        # Count issues created by the user
-        issues_in_created = Issue.objects.filter(creator=user).exclude(project__status='9')
-        open_created = issues_in_created.filter(closed__isnull=True).count()
-        closed_created = issues_in_created.filter(closed__isnull=False).count()
+        open_created = counts['created'][False]
+        closed_created = counts['created'][True]
         all_created = open_created + closed_created
 
         summary_data = {
@@ -699,70 +660,8 @@ class IssueCommentViewSet(viewsets.ModelViewSet):
         if user.is_superuser or getattr(user, 'work_manager', False):
             return queryset
 
-        # 1. 사용자의 멤버 프로젝트들을 가져와 권한 수준에 따라 분류
-        from work.models.project import Member
-        user_members = Member.objects.filter(user=user).prefetch_related('roles__permissions')
-
-        member_all_pids = []
-        member_pub_pids = []
-        private_comment_read_pids = []
-
-        issue_visibility_order = {'ALL': 3, 'PUB': 2, 'PRI': 1, 'NOP': 0}
-
-        for member in user_members:
-            # (A) issue_visible 수준 판별
-            best_visible = 'NOP'
-            has_private_read = False
-
-            for role in member.roles.all():
-                if issue_visibility_order.get(role.issue_visible, 0) > issue_visibility_order.get(best_visible, 0):
-                    best_visible = role.issue_visible
-
-                for perm in role.permissions.all():
-                    if perm.code == 'issue.private_comment_read':
-                        has_private_read = True
-
-            if best_visible == 'ALL':
-                member_all_pids.append(member.project_id)
-            elif best_visible == 'PUB':
-                member_pub_pids.append(member.project_id)
-
-            if has_private_read:
-                private_comment_read_pids.append(member.project_id)
-
-        # 2. 비회원 역할(pk=2) 정보 가져오기
-        from work.models.project import Role
-        try:
-            non_member_role = Role.objects.prefetch_related('permissions').get(pk=2)
-            non_member_visible = non_member_role.issue_visible
-            non_member_private_read = any(
-                perm.code == 'issue.private_comment_read' for perm in non_member_role.permissions.all())
-        except Role.DoesNotExist:
-            non_member_visible = 'NOP'
-            non_member_private_read = False
-
-        # 3. 부모 업무(Issue) 가시성에 따른 필터 조건 (issue_q)
-        issue_q = Q(issue__creator=user) | Q(issue__assigned_to=user)
-
-        if member_all_pids:
-            issue_q |= Q(issue__project_id__in=member_all_pids)
-        if member_pub_pids:
-            issue_q |= Q(issue__project_id__in=member_pub_pids, issue__is_private=False)
-
-        if non_member_visible == 'ALL':
-            issue_q |= Q(issue__project__is_public=True)
-        elif non_member_visible == 'PUB':
-            issue_q |= Q(issue__project__is_public=True, issue__is_private=False)
-
-        # 4. 비공개 댓글 가시성에 따른 필터 조건 (comment_q)
-        comment_q = Q(is_private=False) | Q(creator=user)
-
-        if private_comment_read_pids:
-            comment_q |= Q(issue__project_id__in=private_comment_read_pids)
-        if non_member_private_read:
-            comment_q |= Q(issue__project__is_public=True)
-
-        return queryset.filter(issue_q & comment_q).distinct()
+        # 부모 업무 가시성 + 비공개 댓글 열람 범위(IssueAccess) 조건
+        return queryset.filter(visible_comment_q(user))
 
     def perform_create(self, serializer):
         serializer.save(creator=self.request.user)
@@ -1,5 +1,3 @@
-from django.core.cache import cache
-from django.db import connection
 from django.db.models import Q
 from django_filters.rest_framework import FilterSet, DateFilter, CharFilter
 from rest_framework import viewsets
@@ -10,27 +8,7 @@ from apiV1.serializers.work import IssueLogEntrySerializer
 from apiV1.serializers.work.logging import ActivityLogEntrySerializer
 from work.models.logging import ActivityLogEntry, IssueLogEntry
 from work.models.project import IssueProject, Role, Member
-
-
-def get_sub_project_ids(parent):
-    cache_key = f"filter:sub_projects:{parent.id}"
-    project_ids = cache.get(cache_key)
-    if project_ids is None:
-        table_name = IssueProject._meta.db_table
-        with connection.cursor() as cursor:
-            cursor.execute(f"""
-                    WITH RECURSIVE project_tree AS (
-                        SELECT id FROM {table_name} WHERE id = %s
-                        UNION
-                        SELECT p.id
-                        FROM {table_name} p
-                        JOIN project_tree pt ON p.parent_id = pt.id
-                    )
-                    SELECT id FROM project_tree
-                """, [parent.id])
-            project_ids = [row[0] for row in cursor.fetchall()]
-        cache.set(cache_key, project_ids, timeout=3600)
-    return project_ids
+from work.services.project_tree import get_subtree_ids
 
 
 class ActivityLogFilter(FilterSet):
@@ -47,9 +25,8 @@ class ActivityLogFilter(FilterSet):
     @staticmethod
     def filter_by_project_with_sub(queryset, name, value):
         try:
-            project = IssueProject.objects.get(slug=value)
-            project_ids = [project.pk] + get_sub_project_ids(project)
-            return queryset.filter(project__id__in=project_ids)
+            project_pk = IssueProject.objects.values_list('pk', flat=True).get(slug=value)
+            return queryset.filter(project_id__in=get_subtree_ids(project_pk))
         except IssueProject.DoesNotExist:
             return queryset.none()
 
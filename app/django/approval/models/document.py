@@ -7,6 +7,7 @@ from django.db import models
 
 from _utils.file_cleanup import file_cleanup_signals
 from _utils.file_upload import get_approval_file_path, populate_file_meta
+from _utils.sequence import make_scope, next_value
 from .document_type import DocumentType, RouteTemplate
 
 
@@ -109,12 +110,16 @@ class ApprovalDocument(models.Model):
         """최종 승인 시 문서 번호 자동 채번 (예: BIZ-2026-0001)"""
         code = self.doc_type.code
         year = self.completed_at.year if self.completed_at else self.created_at.year
-        count = ApprovalDocument.objects.filter(
-            doc_type=self.doc_type,
-            status=self.STATUS_APPROVED,
-            completed_at__year=year,
-        ).count()
-        return f'{code}-{year}-{str(count).zfill(4)}'
+        prefix = f'{code}-{year}-'
+
+        def last_issued():
+            # 유형·연도 시퀀스 최초 사용 시 기존 발급 번호의 최대값부터 이어서 채번
+            numbers = ApprovalDocument.objects.filter(doc_number__startswith=prefix).values_list(
+                'doc_number', flat=True)
+            return max((int(n[len(prefix):]) for n in numbers if n[len(prefix):].isdigit()), default=0)
+
+        number = next_value(make_scope('approval.doc_number', code, year), initial=last_issued)
+        return f'{prefix}{str(number).zfill(4)}'
 
     def save(self, *args, **kwargs):
         if not self.security_level and self.doc_type_id:
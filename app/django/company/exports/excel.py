@@ -22,7 +22,7 @@ class ExportStaffs(ExcelExportMixin):
 
     def get(self, request):
         # 워크북 생성
-        output, workbook, worksheet = self.create_workbook('직원_정보')
+        output, workbook, worksheet = self.create_workbook('직원_정보', constant_memory=True)
 
         # data start --------------------------------------------- #
         company = Company.objects.get(pk=request.GET.get('company'))
@@ -118,7 +118,7 @@ class ExportStaffs(ExcelExportMixin):
         # Write body
         sort_map = dict(Staff.SORT_CHOICES)
         status_map = dict(Staff.STATUS_CHOICES)
-        for i, s in enumerate(obj_list):
+        for i, s in enumerate(self.iterate(obj_list)):
             row_num += 1
             row_data = [
                 i + 1,
@@ -5,7 +5,8 @@ from import_export.admin import ImportExportMixin
 
 from .models import (OrderGroup, DocumentType, RequiredDocument, Contract, ContractDocument,
                      ContractDocumentFile, ContractPrice, ContractFile, Contractor, ContractorAddress,
-                     ContractorContact, ContractorConsultationLogs, Succession, ContractorRelease)
+                     ContractorContact, ContractorConsultationLogs, Succession, ContractorRelease,
+                     PaymentCacheRebuildJob)
 
 
 @admin.register(OrderGroup)
@@ -89,6 +90,8 @@ class ContractPriceAdmin(ImportExportMixin, admin.ModelAdmin):
         'house_unit__unit_type',  # 미계약 세대의 unit_type 필터
         ContractStatusFilter,  # 계약 상태 필터 추가
         'is_cache_valid',  # 캐시 유효성 필터
+        'is_stale',  # 재계산 대기 필터
+        'price_source',  # 공급가 출처 필터
     )
     search_fields = (
         'contract__serial_number',
@@ -96,7 +99,7 @@ class ContractPriceAdmin(ImportExportMixin, admin.ModelAdmin):
         'house_unit__name',
         'house_unit__unit_type__name'
     )
-    readonly_fields = ('calculated',)
+    readonly_fields = ('calculated', 'price_source', 'dependency_key')
 
     def contract_status(self, obj):
         """계약 상태 표시"""
@@ -341,3 +344,38 @@ class ContractorReleaseAdmin(ImportExportMixin, admin.ModelAdmin):
                     'refund_account_bank', 'refund_account_number',
                     'refund_account_depositor', 'request_date', 'completion_date')
     list_editable = ('status', 'release_type', 'request_date', 'completion_date')
+
+
+@admin.register(PaymentCacheRebuildJob)
+class PaymentCacheRebuildJobAdmin(admin.ModelAdmin):
+    """납부금액 캐시 재계산 작업 관리"""
+    list_display = ('id', 'project', 'reason', 'status', 'progress_bar',
+                    'success_count', 'error_count', 'created_at', 'duration_display')
+    list_filter = ('project', 'status', 'created_at')
+    search_fields = ('task_id', 'reason', 'error_message')
+    readonly_fields = ('task_id', 'created_at', 'started_at', 'completed_at', 'duration_display')
+
+    def progress_bar(self, obj):
+        """진행률 표시"""
+        if obj.total_records > 0:
+            color = 'green' if obj.status == PaymentCacheRebuildJob.COMPLETED \
+                else 'blue' if obj.status == PaymentCacheRebuildJob.PROCESSING else 'red'
+            return format_html(
+                '<div style="width: 100px; background-color: #f0f0f0; border-radius: 3px;">'
+                '<div style="width: {}px; height: 20px; background-color: {}; border-radius: 3px; text-align: center; line-height: 20px; color: white; font-size: 12px;">'
+                '{}%</div></div>',
+                obj.progress, color, obj.progress
+            )
+        return '-'
+
+    progress_bar.short_description = '진행률'
+
+    def duration_display(self, obj):
+        """작업 소요 시간 표시"""
+        duration = obj.duration
+        if duration:
+            minutes, seconds = divmod(int(duration.total_seconds()), 60)
+            return f'{minutes}분 {seconds}초' if minutes else f'{seconds}초'
+        return '-'
+
+    duration_display.short_description = '소요 시간'
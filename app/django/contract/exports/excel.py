@@ -24,7 +24,7 @@ class ExportContracts(ExcelExportMixin):
         # 워크북 생성
         status = request.GET.get('status')
         t_name = '계약' if status == '2' else '청약'
-        output, workbook, worksheet = self.create_workbook(f'{t_name}목록_정보')
+        output, workbook, worksheet = self.create_workbook(f'{t_name}목록_정보', constant_memory=True)
 
         project = Project.objects.get(pk=request.GET.get('project'))
         cols = sorted(list(map(int, request.GET.get('col').split('-'))))
@@ -239,7 +239,7 @@ class ExportContracts(ExcelExportMixin):
 
         quali_str = {'1': '일반분양', '2': '미인가', '3': '인가', '4': '부적격', }
 
-        for i, row in enumerate(data):
+        for i, row in enumerate(self.iterate(data)):
             row_num += 1
             row = list(row)
 
@@ -267,12 +267,6 @@ class ExportContracts(ExcelExportMixin):
                 bf = workbook.add_format(body_format)
                 worksheet.write(row_num, col_num, cell_value, bf)
 
-        # Close the workbook before sending the data.
-        workbook.close()
-
-        # Rewind the buffer.
-        output.seek(0)
-
         # Set up the Http response.
         filename = request.GET.get('filename') or 'contracts'
         filename = f'{filename}-{TODAY}'
@@ -284,7 +278,7 @@ class ExportSuccessions(ExcelExportMixin):
 
     def get(self, request):
         # 워크북 생성
-        output, workbook, worksheet = self.create_workbook('권리의무승계_목록')
+        output, workbook, worksheet = self.create_workbook('권리의무승계_목록', constant_memory=True)
 
         project = Project.objects.get(pk=request.GET.get('project'))
 
@@ -350,7 +344,7 @@ class ExportSuccessions(ExcelExportMixin):
         worksheet.ignore_errors({'number_stored_as_text': 'F:G'})
 
         # Write header
-        for i, row in enumerate(data):
+        for i, row in enumerate(self.iterate(data)):
             row = list(row)
             row_num += 1
             row.insert(0, i + 1)
@@ -375,12 +369,6 @@ class ExportSuccessions(ExcelExportMixin):
                 bformat = workbook.add_format(body_format)
                 worksheet.write(row_num, col_num, cell_data, bformat)
 
-        # Close the workbook before sending the data.
-        workbook.close()
-
-        # Rewind the buffer.
-        output.seek(0)
-
         # Set up the Http response.
         filename = request.GET.get('filename') or 'successions'
         filename = f'{filename}-{TODAY}'
@@ -495,12 +483,6 @@ class ExportReleases(ExcelExportMixin):
                 bformat = workbook.add_format(body_format)
                 worksheet.write(row_num, col_num, cell_data, bformat)
 
-        # Close the workbook before sending the data.
-        workbook.close()
-
-        # Rewind the buffer.
-        output.seek(0)
-
         # Set up the Http response.
         filename = request.GET.get('filename') or 'releases'
         filename = f'{filename}-{TODAY}'
@@ -622,12 +604,6 @@ class ExportUnitStatus(ExcelExportMixin):
             col_num = col_num + lines.count() + 1
         # data end ----------------------------------------------- #
 
-        # Close the workbook before sending the data.
-        workbook.close()
-
-        # Rewind the buffer.
-        output.seek(0)
-
         # Set up the Http response.
         filename = request.GET.get('filename') or 'unit-status-board'
         filename = f'{filename}-{TODAY}'
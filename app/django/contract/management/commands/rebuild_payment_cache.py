@@ -1,10 +1,13 @@
-from django.core.management.base import BaseCommand
-from django.db import transaction
-from contract.models import ContractPrice
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from _utils.payment_amounts_cache import rebuild_payment_amounts, dispatch_rebuild_job, REBUILD_BATCH_SIZE
+from contract.models import ContractPrice, PaymentCacheRebuildJob
+from project.models import Project
 
 
 class Command(BaseCommand):
-    help = '모든 ContractPrice 인스턴스의 납부 금액 캐시를 재계산합니다.'
+    help = 'ContractPrice 인스턴스의 회차별 납부 금액 캐시를 프로젝트 단위로 일괄 재계산합니다.'
 
     def add_arguments(self, parser):
         parser.add_argument(
@@ -15,57 +18,66 @@ class Command(BaseCommand):
         parser.add_argument(
             '--batch-size',
             type=int,
-            default=100,
-            help='배치 처리 크기 (기본값: 100)'
+            default=REBUILD_BATCH_SIZE,
+            help=f'배치 처리 크기 (기본값: {REBUILD_BATCH_SIZE})'
+        )
+        parser.add_argument(
+            '--invalid-only',
+            action='store_true',
+            help='재계산 대기·무효 캐시만 재계산'
+        )
+        parser.add_argument(
+            '--async',
+            action='store_true',
+            dest='run_async',
+            help='Celery 작업으로 예약하고 즉시 종료 (진행률은 관리자 화면의 재계산 작업에서 확인)'
         )
 
     def handle(self, *args, **options):
         project_id = options.get('project')
         batch_size = options['batch_size']
-
-        # 쿼리셋 준비
-        queryset = ContractPrice.objects.select_related(
-            'contract', 'contract__project').filter(contract__is_active=True)
+        invalid_only = options['invalid_only']
 
         if project_id:
-            queryset = queryset.filter(contract__project_id=project_id)
+            projects = Project.objects.filter(pk=project_id)
+            if not projects.exists():
+                raise CommandError(f'프로젝트 {project_id}를 찾을 수 없습니다.')
             self.stdout.write(f'프로젝트 {project_id}의 ContractPrice 캐시를 재계산합니다.')
         else:
+            projects = Project.objects.all()
             self.stdout.write('모든 ContractPrice 캐시를 재계산합니다.')
 
-        total_count = queryset.count()
         processed_count = 0
         success_count = 0
         error_count = 0
 
-        self.stdout.write(f'총 {total_count}개의 레코드를 처리합니다.')
+        for project in projects:
+            job = PaymentCacheRebuildJob.objects.create(
+                project=project, reason='관리 명령 실행', invalid_only=invalid_only)
 
-        # 배치 처리
-        for i in range(0, total_count, batch_size):
-            batch = queryset[i:i + batch_size]
+            if options['run_async']:
+                if dispatch_rebuild_job(job):
+                    self.stdout.write(f'[{project}] 재계산 작업 예약 (job={job.pk}, task={job.task_id})')
+                else:
+                    self.stderr.write(f'[{project}] 재계산 작업 예약 실패 (job={job.pk}): {job.error_message}')
+                continue
 
-            with transaction.atomic():
-                for contract_price in batch:
-                    try:
-                        if contract_price.contract:
-                            contract_price.calculate_and_cache_payments()
-                            contract_price.save()
-                            success_count += 1
-                        else:
-                            self.stdout.write(
-                                self.style.WARNING(f'ContractPrice {contract_price.id}: 연결된 계약이 없습니다.')
-                            )
-                    except Exception as e:
-                        error_count += 1
-                        self.stdout.write(
-                            self.style.ERROR(f'ContractPrice {contract_price.id} 처리 실패: {e}')
-                        )
+            job.started_at = timezone.now()
+            result = rebuild_payment_amounts(project, invalid_only=invalid_only, batch_size=batch_size, job=job)
+            job.status = PaymentCacheRebuildJob.COMPLETED
+            job.success_count = result['success']
+            job.error_count = result['error']
+            job.completed_at = timezone.now()
+            job.save(update_fields=['status', 'success_count', 'error_count', 'started_at', 'completed_at'])
 
-                    processed_count += 1
+            processed_count += result['total']
+            success_count += result['success']
+            error_count += result['error']
+            self.stdout.write(f'[{project}] 처리: {result["total"]}, 성공: {result["success"]}, '
+                              f'실패: {result["error"]}')
 
-            # 진행 상황 출력
-            percentage = (processed_count / total_count) * 100
-            self.stdout.write(f'진행률: {percentage:.1f}% ({processed_count}/{total_count})')
+        if options['run_async']:
+            return
 
         # 최종 결과 출력
         self.stdout.write(
@@ -80,9 +92,11 @@ class Command(BaseCommand):
         # 캐시 유효성 통계
         valid_cache_count = ContractPrice.objects.filter(is_cache_valid=True).count()
         invalid_cache_count = ContractPrice.objects.filter(is_cache_valid=False).count()
+        stale_cache_count = ContractPrice.objects.filter(is_stale=True).count()
 
         self.stdout.write(
             f'\n캐시 상태:\n'
             f'유효: {valid_cache_count}\n'
-            f'무효: {invalid_cache_count}'
+            f'무효: {invalid_cache_count}\n'
+            f'재계산 대기: {stale_cache_count}'
         )
@@ -0,0 +1,49 @@
+# Generated by Django 6.0.7 on 2026-10-18 05:47
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contract', '0006_alter_contractorrelease_contractor_and_more'),
+        ('project', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='contractprice',
+            name='dependency_key',
+            field=models.CharField(blank=True, db_index=True, default='', help_text='프로젝트:타입종류:차수:타입 - 원천 데이터 변경 시 무효화 범위', max_length=50, verbose_name='의존성 키'),
+        ),
+        migrations.AddField(
+            model_name='contractprice',
+            name='price_source',
+            field=models.CharField(blank=True, choices=[('contract', '계약 공급가'), ('sales_price', '차수/타입별 분양가'), ('budget', '예산 평균가'), ('unit_type', '타입 평균가'), ('none', '없음')], default='', help_text='납부금액 계산에 사용된 공급가 출처', max_length=12, verbose_name='공급가 출처'),
+        ),
+        migrations.CreateModel(
+            name='PaymentCacheRebuildJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('reason', models.CharField(blank=True, default='', max_length=100, verbose_name='재계산 사유')),
+                ('invalid_only', models.BooleanField(default=True, help_text='무효화된 캐시만 재계산할지 여부', verbose_name='무효 캐시만')),
+                ('task_id', models.CharField(blank=True, max_length=255, verbose_name='태스크 ID')),
+                ('status', models.CharField(choices=[('pending', '대기 중'), ('processing', '처리 중'), ('completed', '완료'), ('failed', '실패')], default='pending', max_length=20, verbose_name='상태')),
+                ('total_records', models.IntegerField(default=0, verbose_name='전체 레코드')),
+                ('processed_records', models.IntegerField(default=0, verbose_name='처리된 레코드')),
+                ('success_count', models.IntegerField(default=0, verbose_name='성공 건수')),
+                ('error_count', models.IntegerField(default=0, verbose_name='오류 건수')),
+                ('error_message', models.TextField(blank=True, verbose_name='오류 메시지')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='생성일시')),
+                ('started_at', models.DateTimeField(blank=True, null=True, verbose_name='시작일시')),
+                ('completed_at', models.DateTimeField(blank=True, null=True, verbose_name='완료일시')),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='project.project', verbose_name='프로젝트')),
+            ],
+            options={
+                'verbose_name': '11. 납부금액 캐시 재계산 작업',
+                'verbose_name_plural': '11. 납부금액 캐시 재계산 작업',
+                'ordering': ['-created_at'],
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 6.0.7 on 2026-10-18 06:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contract', '0007_contractprice_dependency_key_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='contractprice',
+            name='is_stale',
+            field=models.BooleanField(db_index=True, default=False, help_text='원천 데이터 변경으로 재계산이 예약된 상태 (재계산 전까지 기존 값 사용)', verbose_name='재계산 대기'),
+        ),
+    ]
@@ -4,7 +4,7 @@ from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.db import models
 
-from _utils.contract_price import get_contract_payment_plan
+from _utils.contract_price import get_contract_payment_plan, build_payment_dependency_key
 from _utils.file_cleanup import file_cleanup_signals
 from _utils.file_upload import get_contract_file_path, get_upload_path, populate_file_meta
 from payment.models import InstallmentPaymentOrder
@@ -247,6 +247,16 @@ class ContractPrice(models.Model):
     calculated = models.DateTimeField('계산일시', auto_now=True, help_text='마지막 계산 수행 시각')
     is_cache_valid = models.BooleanField('캐시 유효성', default=False, help_text='저장된 계산값이 유효한지 여부')
 
+    # 캐시 의존성 정보 - 원천 데이터(납부회차, 가격표, 계약금, 예산) 변경 시 무효화 대상 식별
+    PRICE_SOURCE_CHOICES = (('contract', '계약 공급가'), ('sales_price', '차수/타입별 분양가'),
+                            ('budget', '예산 평균가'), ('unit_type', '타입 평균가'), ('none', '없음'))
+    price_source = models.CharField('공급가 출처', max_length=12, choices=PRICE_SOURCE_CHOICES,
+                                    blank=True, default='', help_text='납부금액 계산에 사용된 공급가 출처')
+    dependency_key = models.CharField('의존성 키', max_length=50, blank=True, default='', db_index=True,
+                                      help_text='프로젝트:타입종류:차수:타입 - 원천 데이터 변경 시 무효화 범위')
+    is_stale = models.BooleanField('재계산 대기', default=False, db_index=True,
+                                   help_text='원천 데이터 변경으로 재계산이 예약된 상태 (재계산 전까지 기존 값 사용)')
+
     def save(self, *args, **kwargs):
         # order_group은 생성 시에만 자동 설정 (수정 시에는 기존값 유지)
         if not self.pk and not self.order_group:  # 새로 생성하는 경우에만
@@ -287,11 +297,21 @@ class ContractPrice(models.Model):
 
             self.payment_amounts = payment_amounts
             self.is_cache_valid = True
+            # 계약 공급가는 이 ContractPrice 자신의 price (출처 조회 쿼리 불필요)
+            self.set_cache_dependency(self.contract, 'contract')
 
         except Exception as e:
             self.is_cache_valid = False
             logger.warning('ContractPrice(pk=%s) 납부 계획 계산 실패: %s', self.pk, e)
 
+    def set_cache_dependency(self, contract, price_source):
+        """계산에 사용된 (프로젝트, 타입종류, 차수, 타입) 의존성 키와 공급가 출처 기록"""
+        order_group_id = contract.order_group.pk if contract.order_group else None
+        self.dependency_key = build_payment_dependency_key(
+            contract.project.pk, contract.unit_type.sort, order_group_id, contract.unit_type.pk)
+        self.price_source = price_source
+        self.is_stale = False
+
     def calculate_uncontracted_payments(self):
         """미계약 상태에서 house_unit 기반으로 납부 계획을 계산하여 JSON 필드에 저장"""
         try:
@@ -354,6 +374,8 @@ class ContractPrice(models.Model):
 
             self.payment_amounts = payment_amounts
             self.is_cache_valid = True
+            # 공급가 출처 미확인('') - 모든 출처 변경 시 무효화 대상, 일괄 재계산 시 기록
+            self.set_cache_dependency(temp_contract, '')
 
         except Exception as e:
             self.is_cache_valid = False
@@ -712,3 +734,64 @@ class ContractorRelease(models.Model):
     class Meta:
         verbose_name = '10. 계약 해지 정보'
         verbose_name_plural = '10. 계약 해지 정보'
+
+
+class PaymentCacheRebuildJob(models.Model):
+    """ContractPrice 회차별 납부금액(payment_amounts) 일괄 재계산 작업 추적"""
+    PENDING = 'pending'
+    PROCESSING = 'processing'
+    COMPLETED = 'completed'
+    FAILED = 'failed'
+
+    STATUS_CHOICES = [
+        (PENDING, '대기 중'),
+        (PROCESSING, '처리 중'),
+        (COMPLETED, '완료'),
+        (FAILED, '실패'),
+    ]
+
+    project = models.ForeignKey('project.Project', on_delete=models.CASCADE, verbose_name='프로젝트')
+    reason = models.CharField('재계산 사유', max_length=100, blank=True, default='')
+    invalid_only = models.BooleanField('무효 캐시만', default=True, help_text='무효화된 캐시만 재계산할지 여부')
+    task_id = models.CharField('태스크 ID', max_length=255, blank=True)
+    status = models.CharField('상태', max_length=20, choices=STATUS_CHOICES, default=PENDING)
+    total_records = models.IntegerField('전체 레코드', default=0)
+    processed_records = models.IntegerField('처리된 레코드', default=0)
+    success_count = models.IntegerField('성공 건수', default=0)
+    error_count = models.IntegerField('오류 건수', default=0)
+    error_message = models.TextField('오류 메시지', blank=True)
+    created_at = models.DateTimeField('생성일시', auto_now_add=True)
+    started_at = models.DateTimeField('시작일시', blank=True, null=True)
+    completed_at = models.DateTimeField('완료일시', blank=True, null=True)
+
+    class Meta:
+        ordering = ['-created_at']
+        verbose_name = '11. 납부금액 캐시 재계산 작업'
+        verbose_name_plural = '11. 납부금액 캐시 재계산 작업'
+
+    def __str__(self):
+        return f'{self.project} 납부금액 캐시 재계산 ({self.get_status_display()})'
+
+    @property
+    def progress(self):
+        """진행률 계산 (0-100)"""
+        if self.total_records > 0:
+            return int((self.processed_records / self.total_records) * 100)
+        return 0
+
+    @property
+    def duration(self):
+        """작업 소요 시간 계산"""
+        if self.started_at and self.completed_at:
+            return self.completed_at - self.started_at
+        return None
+
+    def update_progress(self, processed: int, total: int, status: str = None):
+        """진행률 업데이트"""
+        self.processed_records = processed
+        self.total_records = total
+        update_fields = ['processed_records', 'total_records']
+        if status:
+            self.status = status
+            update_fields.append('status')
+        self.save(update_fields=update_fields)
@@ -1,8 +1,9 @@
 from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
 
+from _utils.payment_summary_cache import invalidate_project_payment_summary
 from _utils.slack_notifications import send_slack_notification
-from .models import Contract, Succession, ContractorRelease
+from .models import Contract, ContractPrice, OrderGroup, Succession, ContractorRelease
 
 
 @receiver(post_save, sender=Contract, dispatch_uid="contract_slack_notification")
@@ -49,3 +50,29 @@ def notify_contractor_release_change(sender, instance, created, raw=False, **kwa
 @receiver(post_delete, sender=ContractorRelease, dispatch_uid="contractor_release_delete_slack_notification")
 def notify_contractor_release_delete(sender, instance, **kwargs):
     send_slack_notification(instance, "삭제", instance.creator)
+
+
+# Payment summary cache invalidation -----------------------------------------------
+
+def _get_contract_price_project_id(instance):
+    if instance.contract_id:
+        return Contract.objects.filter(pk=instance.contract_id).values_list('project_id', flat=True).first()
+    if instance.order_group_id:
+        return OrderGroup.objects.filter(pk=instance.order_group_id).values_list('project_id', flat=True).first()
+    return None
+
+
+@receiver(post_save, sender=Contract, dispatch_uid="contract_payment_summary_invalidation")
+@receiver(post_delete, sender=Contract, dispatch_uid="contract_delete_payment_summary_invalidation")
+def invalidate_contract_payment_summary(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    invalidate_project_payment_summary(instance.project_id)
+
+
+@receiver(post_save, sender=ContractPrice, dispatch_uid="contract_price_payment_summary_invalidation")
+@receiver(post_delete, sender=ContractPrice, dispatch_uid="contract_price_delete_payment_summary_invalidation")
+def invalidate_contract_price_payment_summary(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    invalidate_project_payment_summary(_get_contract_price_project_id(instance))
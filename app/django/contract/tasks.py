@@ -0,0 +1,61 @@
+import logging
+
+from celery import shared_task
+from django.utils import timezone
+
+from .models import PaymentCacheRebuildJob
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(
+    bind=True,
+    autoretry_for=(Exception,),
+    retry_backoff=True,
+    retry_backoff_max=300,  # 5분 최대 지연
+    max_retries=3,
+    retry_jitter=True
+)
+def rebuild_payment_amounts_task(self, job_id: int) -> dict:
+    """
+    프로젝트 ContractPrice 회차별 납부금액 캐시 일괄 재계산
+
+    Args:
+        job_id: 예약 시 생성된 PaymentCacheRebuildJob ID (대상 프로젝트·사유·범위 포함, 재시도 시에도 동일)
+
+    Returns:
+        dict: 처리 결과
+    """
+    from _utils.payment_amounts_cache import rebuild_payment_amounts
+
+    job = PaymentCacheRebuildJob.objects.select_related('project').filter(pk=job_id).first()
+    if not job:
+        logger.warning('납부금액 캐시 재계산 작업 없음 (job_id=%s)', job_id)
+        return {'success': False, 'error': 'job not found'}
+    if job.status == PaymentCacheRebuildJob.COMPLETED:
+        return {'success': True, 'job_id': job.pk, 'skipped': True}
+
+    job.task_id = self.request.id or job.task_id
+    job.status = PaymentCacheRebuildJob.PROCESSING
+    job.started_at = job.started_at or timezone.now()
+    job.save(update_fields=['task_id', 'status', 'started_at'])
+
+    try:
+        result = rebuild_payment_amounts(job.project, invalid_only=job.invalid_only, job=job)
+    except Exception as e:
+        logger.error('납부금액 캐시 재계산 실패 (project_id=%s): %s', job.project_id, e)
+        job.status = PaymentCacheRebuildJob.FAILED
+        job.error_message = str(e)
+        job.completed_at = timezone.now()
+        job.save(update_fields=['status', 'error_message', 'completed_at'])
+        raise
+
+    job.status = PaymentCacheRebuildJob.COMPLETED
+    job.success_count = result['success']
+    job.error_count = result['error']
+    job.error_message = ''
+    job.completed_at = timezone.now()
+    job.save(update_fields=['status', 'success_count', 'error_count', 'error_message', 'completed_at'])
+
+    logger.info('납부금액 캐시 재계산 완료 (project_id=%s): %s', job.project_id, result)
+    return {'success': True, 'job_id': job.pk, **result}
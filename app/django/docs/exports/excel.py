@@ -158,12 +158,6 @@ class ExportSuitCases(ExcelExportMixin):
 
         # data finish -------------------------------------------- #
 
-        # Close the workbook before sending the data.
-        workbook.close()
-
-        # Rewind the buffer.
-        output.seek(0)
-
         # Set up the Http response.
         filename = request.GET.get('filename') or 'successions'
         filename = f'{filename}-{TODAY}'
@@ -280,12 +274,6 @@ class ExportSuitCase(ExcelExportMixin):
 
         # data finish -------------------------------------------- #
 
-        # Close the workbook before sending the data.
-        workbook.close()
-
-        # Rewind the buffer.
-        output.seek(0)
-
         # Set up the Http response.
         filename = request.GET.get('filename') or 'suitcase'
         filename = f'{filename}-{TODAY}'
@@ -8,6 +8,7 @@ from django.core.files.storage import default_storage
 
 from _utils.file_cleanup import file_cleanup_signals
 from _utils.file_upload import get_docs_file_path, get_docs_image_path, get_letter_pdf_path, populate_file_meta
+from _utils.sequence import increment_counter
 from .courts import COURT_CHOICES
 
 DOC_TYPE_CHOICES = (('1', '일반문서'), ('2', '소송기록'))
@@ -219,17 +220,17 @@ class LetterSequence(models.Model):
     def get_next_document_number(cls, company):
         """다음 문서번호 생성 (YYYY-NNN 형식)"""
         current_year = timezone.now().year
+        # 시퀀스 행 원자 증가 (조회 후 저장 방식의 동시 채번 중복 방지)
+        last_sequence = increment_counter(cls, {'company_id': company.pk, 'year': current_year}, 'last_sequence')
+        return f'{current_year}-{last_sequence:03d}'
 
-        sequence, created = cls.objects.get_or_create(
-            company=company,
-            year=current_year,
-            defaults={'last_sequence': 0}
-        )
-
-        sequence.last_sequence += 1
-        sequence.save()
-
-        return f'{current_year}-{sequence.last_sequence:03d}'
+    @classmethod
+    def peek_next_document_number(cls, company):
+        """다음 문서번호 미리보기 (번호를 할당하지 않으며 잠금 없이 조회)"""
+        current_year = timezone.now().year
+        last_sequence = cls.objects.filter(company=company, year=current_year).values_list(
+            'last_sequence', flat=True).first() or 0
+        return f'{current_year}-{last_sequence + 1:03d}'
 
 
 class OfficialLetter(models.Model):
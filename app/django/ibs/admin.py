@@ -2,7 +2,7 @@ from django.contrib import admin
 from import_export.admin import ImportExportMixin
 
 from .models import (AccountSort, AccountSubD1, AccountSubD2, AccountSubD3,
-                     ProjectAccountD2, ProjectAccountD3, WiseSaying)
+                     ProjectAccountD2, ProjectAccountD3, Sequence, WiseSaying)
 
 
 @admin.register(AccountSort)
@@ -73,3 +73,10 @@ class ProjectAccountD3Admin(ImportExportMixin, admin.ModelAdmin):
 class WiseSayingAdmin(ImportExportMixin, admin.ModelAdmin):
     list_display = ('pk', 'saying_ko', 'spoked_by')
     list_display_links = ('saying_ko',)
+
+
+@admin.register(Sequence)
+class SequenceAdmin(admin.ModelAdmin):
+    list_display = ('id', 'scope', 'last_value')
+    list_display_links = ('scope',)
+    search_fields = ('scope',)
@@ -0,0 +1,25 @@
+# Generated by Django 6.0.7 on 2026-10-18 06:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ibs', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Sequence',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('scope', models.CharField(help_text='예: work.issue_log:123, approval.doc_number:BIZ:2026', max_length=100, unique=True, verbose_name='범위 키')),
+                ('last_value', models.BigIntegerField(default=0, verbose_name='마지막 번호')),
+            ],
+            options={
+                'verbose_name': '08. (공통) - 채번 시퀀스',
+                'verbose_name_plural': '08. (공통) - 채번 시퀀스',
+            },
+        ),
+    ]
@@ -134,3 +134,15 @@ class WiseSaying(models.Model):
     class Meta:
         verbose_name = "오늘의 한마디"
         verbose_name_plural = "오늘의 한마디"
+
+
+class Sequence(models.Model):
+    scope = models.CharField('범위 키', max_length=100, unique=True, help_text='예: work.issue_log:123, approval.doc_number:BIZ:2026')
+    last_value = models.BigIntegerField('마지막 번호', default=0)
+
+    def __str__(self):
+        return f'{self.scope} ({self.last_value})'
+
+    class Meta:
+        verbose_name = "08. (공통) - 채번 시퀀스"
+        verbose_name_plural = "08. (공통) - 채번 시퀀스"
@@ -0,0 +1,25 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from _utils.payment_summary_cache import invalidate_project_payment_summary
+from .models import BuildingUnit, HouseUnit, KeyUnit
+
+
+# Payment summary cache invalidation -----------------------------------------------
+# 납부 요약 계산(ProjectPaymentPlanCalculator)은 계약 유닛·호수의 층범위 타입을 참조함
+
+@receiver(post_save, sender=KeyUnit, dispatch_uid="key_unit_payment_summary_invalidation")
+@receiver(post_delete, sender=KeyUnit, dispatch_uid="key_unit_delete_payment_summary_invalidation")
+def invalidate_key_unit_payment_summary(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    invalidate_project_payment_summary(instance.project_id)
+
+
+@receiver(post_save, sender=HouseUnit, dispatch_uid="house_unit_payment_summary_invalidation")
+@receiver(post_delete, sender=HouseUnit, dispatch_uid="house_unit_delete_payment_summary_invalidation")
+def invalidate_house_unit_payment_summary(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    invalidate_project_payment_summary(
+        BuildingUnit.objects.filter(pk=instance.building_unit_id).values_list('project_id', flat=True).first())
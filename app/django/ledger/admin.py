@@ -11,6 +11,7 @@ from ledger.models import (
     CompanyBankTransaction, ProjectBankTransaction,
     CompanyAccountingEntry, ProjectAccountingEntry,
     CompanyLedgerCalculation, ProjectLedgerCalculation,
+    CompanyBankBalanceSnapshot, ProjectBankBalanceSnapshot,
 )
 from ledger.resources import (
     CompanyBankTransactionResource, ProjectBankTransactionResource,
@@ -278,7 +279,7 @@ class CompanyBankTransactionAdmin(AsyncImportExportMixin, admin.ModelAdmin):
     list_display = ('id', 'transaction_id_short', 'company', 'bank_account', 'deal_date',
                     'sort', 'formatted_amount', 'content', 'is_balanced', 'creator', 'created_at')
     list_display_links = ('transaction_id_short',)
-    list_filter = ('company', 'bank_account', 'sort', ('deal_date', DateRangeFilter))
+    list_filter = ('company', 'bank_account', 'sort', 'is_balanced', ('deal_date', DateRangeFilter))
     search_fields = ('transaction_id', 'content', 'note')
     date_hierarchy = 'deal_date'
     ordering = ('-deal_date', '-created_at')
@@ -379,7 +380,7 @@ class ProjectBankTransactionAdmin(AsyncImportExportMixin, admin.ModelAdmin):
     list_display = ('id', 'transaction_id_short', 'project', 'bank_account', 'deal_date', 'sort',
                     'formatted_amount', 'content', 'is_balanced', 'creator', 'created_at')
     list_display_links = ('transaction_id_short',)
-    list_filter = ('project', 'bank_account', 'sort', ('deal_date', DateRangeFilter))
+    list_filter = ('project', 'bank_account', 'sort', 'is_balanced', ('deal_date', DateRangeFilter))
     search_fields = ('transaction_id', 'content', 'note', 'project__name')
     date_hierarchy = 'deal_date'
     ordering = ('-deal_date', '-created_at')
@@ -692,3 +693,28 @@ class ProjectLedgerCalculationAdmin(admin.ModelAdmin):
             'fields': ('creator', 'created_at', 'updated_at')
         }),
     )
+
+
+class BaseBankBalanceSnapshotAdmin(admin.ModelAdmin):
+    """일별 잔액 스냅샷 Admin 공통 (거래 저장 시 자동 관리되므로 조회 전용)"""
+    list_display = ('bank_account', 'deal_date', 'inflow', 'outflow', 'closing_balance', 'updated_at')
+    date_hierarchy = 'deal_date'
+    list_select_related = ('bank_account',)
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+
+@admin.register(CompanyBankBalanceSnapshot)
+class CompanyBankBalanceSnapshotAdmin(BaseBankBalanceSnapshotAdmin):
+    """본사 계좌 일별 잔액 Admin"""
+    list_filter = ('bank_account__company', ('deal_date', DateRangeFilter))
+
+
+@admin.register(ProjectBankBalanceSnapshot)
+class ProjectBankBalanceSnapshotAdmin(BaseBankBalanceSnapshotAdmin):
+    """프로젝트 계좌 일별 잔액 Admin"""
+    list_filter = ('bank_account__project', ('deal_date', DateRangeFilter))
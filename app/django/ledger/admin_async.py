@@ -114,13 +114,14 @@ class AsyncImportExportMixin(ImportExportMixin):
         task = async_import_ledger_account.delay(
             file_path=job.file.name,
             user_id=request.user.id,
-            resource_type=resource_type
+            resource_type=resource_type,
+            job_id=job.id
         )
 
         job.task_id = task.id
         job.status = ImportJob.PROCESSING
         job.started_at = timezone.now()
-        job.save()
+        job.save(update_fields=['task_id', 'status', 'started_at'])
 
         messages.success(
             request,
@@ -5,16 +5,15 @@
 import datetime
 from collections import defaultdict
 
-import xlwt
 from dateutil.relativedelta import relativedelta
 from django.db.models import Sum, When, F, PositiveBigIntegerField, Case, Q
-from django.http import HttpResponse
 
-from _excel.mixins import ExcelExportMixin, XlwtStyleMixin
+from _excel.mixins import ExcelExportMixin
 from company.models import Company
 from ledger.models import CompanyBankTransaction, CompanyAccountingEntry, ProjectBankTransaction, \
-    ProjectAccountingEntry
-from ledger.services.company_transaction import get_company_transactions
+    ProjectAccountingEntry, CompanyBankBalanceSnapshot, ProjectBankBalanceSnapshot
+from ledger.services.bank_balance import get_balances_as_of
+from ledger.services.company_transaction import get_company_transactions, prefetch_company_transactions
 from ledger.services.project_transaction import get_project_transactions, prefetch_project_transactions
 from project.models import Project, ProjectOutBudget
 
@@ -66,34 +65,8 @@ class ExportLedgerBalanceByAcc(ExcelExportMixin):
         worksheet.set_column(6, 6, 20)
         worksheet.write(row_num, 6, '금일잔고', h_format)
 
-        # 4. Contents - CompanyBankTransaction 기반 데이터 조회 (Vue API와 동일한 로직)
-        qs = CompanyBankTransaction.objects.filter(deal_date__lte=date).order_by('bank_account')
-        if company:
-            qs = qs.filter(company_id=company.pk)
-
-        balance_set = qs.values(
-            bank_acc=F('bank_account__alias_name'),
-            bank_num=F('bank_account__number')
-        ).annotate(
-            # 누적 합계 (Vue API와 동일한 로직)
-            inc_sum=Sum(Case(
-                When(sort_id=1, then=F('amount')),  # 1 = 입금
-                default=0
-            )),
-            out_sum=Sum(Case(
-                When(sort_id=2, then=F('amount')),  # 2 = 출금
-                default=0
-            )),
-            # 당일 합계 (Vue API와 동일한 로직)
-            date_inc=Sum(Case(
-                When(sort_id=1, deal_date=date, then=F('amount')),
-                default=0
-            )),
-            date_out=Sum(Case(
-                When(sort_id=2, deal_date=date, then=F('amount')),
-                default=0
-            ))
-        )
+        # 4. Contents - 일별 잔액 스냅샷 기반 데이터 조회 (Vue API와 동일한 로직)
+        balance_set = get_balances_as_of(CompanyBankBalanceSnapshot, date, bank_account__company_id=company.pk)
 
         total_inc = 0
         total_out = 0
@@ -119,7 +92,7 @@ class ExportLedgerBalanceByAcc(ExcelExportMixin):
                 if col == 0 and row == 0:
                     worksheet.write(row_num, col, '현금', center_format)
                 if col == 0 and row == 1:
-                    worksheet.merge_range(row_num, col, balance_set.count() + 2, col, '보통예금', center_format)
+                    worksheet.merge_range(row_num, col, len(balance_set) + 2, col, '보통예금', center_format)
                 if col == 1:
                     worksheet.write(row_num, col, balance['bank_acc'], left_format)
                 if col == 2:
@@ -308,139 +281,86 @@ class ExportLedgerDateCashbook(ExcelExportMixin):
         return ExcelExportMixin.create_response(output, workbook, filename)
 
 
-def export_com_transaction_xls(request):
-    """본사 입출금 내역 (공용 서비스 함수 사용)"""
-    # 서비스 함수를 직접 호출하므로 ViewSet 관련 import는 더 이상 필요 없음
+TRANSACTION_COLUMNS = (
+    ('일시', 13), ('메모', 12), ('계좌', 20), ('적요', 21), ('입금액', 13),
+    ('출금액', 13), ('계정', 19), ('거래처', 14), ('분류금액', 13), ('증빙', 12),
+)
 
-    filename = request.GET.get('filename')
-    filename = f'{filename}-{TODAY}' if filename else f'cashbook-{TODAY}'
-    response = HttpResponse(content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet')
-    response['Content-Disposition'] = f'attachment; filename={filename}.xls'
 
-    wb = xlwt.Workbook(encoding='utf-8')
-    ws = wb.add_sheet('본사_입출금_내역')
+def write_transaction_workbook(title, sheet_name, filename, transactions, prefetch):
+    """
+    입출금 내역 엑셀 작성 (constant_memory 스트리밍)
 
-    # --- 데이터 조회 로직 (공용 서비스 함수 직접 호출) ---
-    # request.GET을 직접 전달하여 모든 필터 파라미터를 서비스 함수가 처리하도록 함
-    obj_list = get_company_transactions(request.GET)
-    obj_list = obj_list.order_by('deal_date', 'created_at')
-    # -----------------------------------------
-
-    # --- N+1 문제 해결을 위한 수동 Prefetch ---
-    transaction_ids = [t.transaction_id for t in obj_list]
-    if transaction_ids:
-        accounting_entries = CompanyAccountingEntry.objects.filter(
-            transaction_id__in=transaction_ids
-        ).select_related('account')
+    거래를 iterator 청크 단위로 읽어 청크마다 분개를 prefetch(chunk) 로 맵핑한 뒤
+    위에서 아래로 한 번에 기록한다.
+    """
+    output, workbook, worksheet = ExcelExportMixin.create_workbook(sheet_name, constant_memory=True)
 
-        entries_map = defaultdict(list)
-        for entry in accounting_entries:
-            entries_map[entry.transaction_id].append(entry)
+    formats = {
+        'title': workbook.add_format({'bold': True, 'font_size': 15, 'valign': 'vcenter'}),
+        'header': workbook.add_format({'bold': True, 'border': True, 'align': 'center', 'valign': 'vcenter',
+                                       'bg_color': '#c0c0c0'}),
+        'default': workbook.add_format({'border': True, 'valign': 'vcenter'}),
+        'date': workbook.add_format({'border': True, 'align': 'center', 'valign': 'vcenter'}),
+        'amount': workbook.add_format({'border': True, 'valign': 'vcenter', 'num_format': '#,##0'}),
+    }
 
-        for transaction in obj_list:
-            transaction.prefetched_entries = entries_map.get(transaction.transaction_id, [])
-    # ------------------------------------
-
-    company = Company.objects.get(pk=request.GET.get('company'))
-    com_name = company.name.replace('주식회사 ', '(주)')
+    for col_num, (_, width) in enumerate(TRANSACTION_COLUMNS):
+        worksheet.set_column(col_num, col_num, width)
 
     # Sheet Title, first row
-    row_num = 0
-
-    style = xlwt.XFStyle()
-    style.font.bold = True
-    style.font.height = 300
-    style.alignment.vert = style.alignment.VERT_CENTER
-
-    ws.write(row_num, 0, com_name + ' 입출금 내역', style)
-    ws.row(0).height_mismatch = True
-    ws.row(0).height = 38 * 20
-
-    # Column definitions
-    columns = [
-        '일시', '메모', '계좌', '적요', '입금액', '출금액',
-        '계정', '거래처', '분류금액', '증빙'
-    ]
-
-    # Column width settings
-    ws.col(0).width = 110 * 30
-    ws.col(1).width = 100 * 30
-    ws.col(2).width = 170 * 30
-    ws.col(3).width = 180 * 30
-    ws.col(4).width = 110 * 30
-    ws.col(5).width = 110 * 30
-    ws.col(6).width = 160 * 30
-    ws.col(7).width = 120 * 30
-    ws.col(8).width = 110 * 30
-    ws.col(9).width = 100 * 30
+    worksheet.set_row(0, 38)
+    worksheet.write(0, 0, title, formats['title'])
 
     # Sheet header, second row
+    for col_num, (col_name, _) in enumerate(TRANSACTION_COLUMNS):
+        worksheet.write(1, col_num, col_name, formats['header'])
+
+    # Sheet body, remaining rows
     row_num = 1
+    for chunk in ExcelExportMixin.iter_chunks(transactions):
+        prefetch(chunk)
+        for trans in chunk:
+            entries = getattr(trans, 'prefetched_accounting_entries', [])
+            row_num += 1
+            # Bank transaction columns - only on the first row
+            worksheet.write(row_num, 0, trans.deal_date.strftime('%Y-%m-%d'), formats['date'])
+            worksheet.write(row_num, 1, trans.note or '', formats['default'])
+            worksheet.write(row_num, 2, trans.bank_account.alias_name if trans.bank_account else '',
+                            formats['default'])
+            worksheet.write(row_num, 3, trans.content or '', formats['default'])
+            worksheet.write(row_num, 4, trans.amount if trans.sort_id == 1 else 0, formats['amount'])
+            worksheet.write(row_num, 5, trans.amount if trans.sort_id == 2 else 0, formats['amount'])
 
-    header_style = xlwt.XFStyle()
-    header_style.font.bold = True
-    header_style.borders.left = 1
-    header_style.borders.right = 1
-    header_style.borders.top = 1
-    header_style.borders.bottom = 1
-    header_style.pattern.pattern = xlwt.Pattern.SOLID_PATTERN
-    header_style.pattern.pattern_fore_colour = xlwt.Style.colour_map['silver_ega']
-    header_style.alignment.vert = header_style.alignment.VERT_CENTER
-    header_style.alignment.horz = header_style.alignment.HORZ_CENTER
+            if not entries:  # 거래는 있으나 분개가 없는 경우
+                for col_num in range(6, 10):
+                    worksheet.write(row_num, col_num, '', formats['default'])
 
-    for col_num, col_name in enumerate(columns):
-        ws.write(row_num, col_num, col_name, header_style)
+            for i, entry in enumerate(entries):
+                if i > 0:
+                    row_num += 1
+                # Classification columns are always written
+                worksheet.write(row_num, 6, entry.account.name if entry.account else '', formats['default'])
+                worksheet.write(row_num, 7, entry.trader or '', formats['default'])
+                worksheet.write(row_num, 8, entry.amount or 0, formats['amount'])
+                worksheet.write(row_num, 9, entry.get_evidence_type_display() or '', formats['default'])
 
-    # Sheet body, remaining rows
-    styles = XlwtStyleMixin.create_xlwt_styles()
+    return ExcelExportMixin.create_response(output, workbook, filename)
 
-    for trans in obj_list:
-        entries = getattr(trans, 'prefetched_entries', [])
-        if not entries:  # 거래는 있으나 분개가 없는 경우
-            row_num += 1
-            ws.write(row_num, 0, trans.deal_date.strftime('%Y-%m-%d'), styles['date'])
-            ws.write(row_num, 1, trans.note or '', styles['default'])
-            ws.write(row_num, 2, trans.bank_account.alias_name if trans.bank_account else '', styles['default'])
-            ws.write(row_num, 3, trans.content or '', styles['default'])
-            ws.write(row_num, 4, trans.amount if trans.sort.pk == 1 else 0, styles['amount'])
-            ws.write(row_num, 5, trans.amount if trans.sort.pk == 2 else 0, styles['amount'])
-            for i in range(6, 10):
-                ws.write(row_num, i, '', styles['default'])
-        elif len(entries) == 1:
-            entry = entries[0]
-            row_num += 1
-            # Bank transaction columns
-            ws.write(row_num, 0, trans.deal_date.strftime('%Y-%m-%d'), styles['date'])
-            ws.write(row_num, 1, trans.note or '', styles['default'])
-            ws.write(row_num, 2, trans.bank_account.alias_name if trans.bank_account else '', styles['default'])
-            ws.write(row_num, 3, trans.content or '', styles['default'])
-            ws.write(row_num, 4, trans.amount if trans.sort.pk == 1 else 0, styles['amount'])
-            ws.write(row_num, 5, trans.amount if trans.sort.pk == 2 else 0, styles['amount'])
-            # Classification columns
-            ws.write(row_num, 6, entry.account.name if entry.account else '', styles['default'])
-            ws.write(row_num, 7, entry.trader or '', styles['default'])
-            ws.write(row_num, 8, entry.amount or 0, styles['amount'])
-            ws.write(row_num, 9, entry.get_evidence_type_display() or '', styles['default'])
-        else:
-            for i, acc_entry in enumerate(entries):
-                row_num += 1
-                if i == 0:
-                    # Bank transaction columns - only on the first row
-                    ws.write(row_num, 0, trans.deal_date.strftime('%Y-%m-%d'), styles['date'])
-                    ws.write(row_num, 1, trans.note or '', styles['default'])
-                    ws.write(row_num, 2, trans.bank_account.alias_name if trans.bank_account else '', styles['default'])
-                    ws.write(row_num, 3, trans.content or '', styles['default'])
-                    ws.write(row_num, 4, trans.amount if trans.sort.pk == 1 else 0, styles['amount'])
-                    ws.write(row_num, 5, trans.amount if trans.sort.pk == 2 else 0, styles['amount'])
 
-                # Classification columns are always written
-                ws.write(row_num, 6, acc_entry.account.name if acc_entry.account else '', styles['default'])
-                ws.write(row_num, 7, acc_entry.trader or '', styles['default'])
-                ws.write(row_num, 8, acc_entry.amount or 0, styles['amount'])
-                ws.write(row_num, 9, acc_entry.get_evidence_type_display() or '', styles['default'])
+def export_com_transaction_xls(request):
+    """본사 입출금 내역 (공용 서비스 함수 사용)"""
+    filename = request.GET.get('filename')
+    filename = f'{filename}-{TODAY}' if filename else f'cashbook-{TODAY}'
+
+    # request.GET을 직접 전달하여 모든 필터 파라미터를 서비스 함수가 처리하도록 함
+    obj_list = get_company_transactions(request.GET).order_by('deal_date', 'created_at')
+
+    company = Company.objects.get(pk=request.GET.get('company'))
+    com_name = company.name.replace('주식회사 ', '(주)')
 
-    wb.save(response)
-    return response
+    return write_transaction_workbook(com_name + ' 입출금 내역', '본사_입출금_내역', filename, obj_list,
+                                      prefetch_company_transactions)
 
 
 class ExportProjectLedgerBalance(ExcelExportMixin):
@@ -535,34 +455,17 @@ class ExportProjectLedgerBalance(ExcelExportMixin):
 
     @staticmethod
     def _get_balance_data(project, date, directpay='0', is_balance=''):
-        """잔고 데이터 조회"""
+        """잔고 데이터 조회 (일별 잔액 스냅샷 기준)"""
         is_directpay = directpay == 'i'
 
-        qs = ProjectBankTransaction.objects.filter(
-            project=project,
-            deal_date__lte=date
-        ).order_by('bank_account')
-
+        filters = {'bank_account__project_id': project}
         if not is_directpay:
-            qs = qs.filter(bank_account__directpay=False)
-
-        result = qs.annotate(
-            bank_acc=F('bank_account__alias_name'),
-            bank_num=F('bank_account__number')
-        ).values('bank_acc', 'bank_num').annotate(
-            inc_sum=Sum(Case(When(sort_id=1, then=F('amount')), default=0)),
-            out_sum=Sum(Case(When(sort_id=2, then=F('amount')), default=0)),
-            date_inc=Sum(Case(When(sort_id=1, deal_date=date, then=F('amount')), default=0)),
-            date_out=Sum(Case(When(sort_id=2, deal_date=date, then=F('amount')), default=0)),
-            balance=Sum(Case(
-                When(sort_id=1, then=F('amount')),
-                When(sort_id=2, then=F('amount') * -1),
-                default=0
-            ))
-        )
+            filters['bank_account__directpay'] = False
+
+        result = get_balances_as_of(ProjectBankBalanceSnapshot, date, **filters)
 
         if is_balance:
-            result = result.filter(balance__gt=0)
+            result = [row for row in result if row['balance'] > 0]
 
         return result
 
@@ -1226,122 +1129,13 @@ class ExportLedgerCashFlowForm(ExcelExportMixin):
 
 def export_pro_transaction_xls(request):
     """프로젝트별 입출금 내역 (공용 서비스 함수 사용)"""
-    # 서비스 함수를 직접 호출하므로 ViewSet 관련 import는 더 이상 필요 없음
-
     filename = request.GET.get('filename')
     filename = f'{filename}-{TODAY}' if filename else f'pro_transaction-{TODAY}'
-    response = HttpResponse(content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet')
-    response['Content-Disposition'] = f'attachment; filename={filename}.xls'
-
-    wb = xlwt.Workbook(encoding='utf-8')
-    ws = wb.add_sheet('프로젝트_입출금_내역')
 
-    # --- 데이터 조회 로직 (공용 서비스 함수 직접 호출) ---
     # request.GET을 직접 전달하여 모든 필터 파라미터를 서비스 함수가 처리하도록 함
-    obj_list = get_project_transactions(request.GET)
-    obj_list = list(obj_list.order_by('deal_date', 'created_at'))
-    prefetch_project_transactions(obj_list, request.GET)
-    # -----------------------------------------
-
-    # ------------------------------------
+    obj_list = get_project_transactions(request.GET).order_by('deal_date', 'created_at')
 
     project = Project.objects.get(pk=request.GET.get('project'))
-    pro_name = project.name
-
-    # Sheet Title, first row
-    row_num = 0
-
-    style = xlwt.XFStyle()
-    style.font.bold = True
-    style.font.height = 300
-    style.alignment.vert = style.alignment.VERT_CENTER
-
-    ws.write(row_num, 0, pro_name + ' 입출금 내역', style)
-    ws.row(0).height_mismatch = True
-    ws.row(0).height = 38 * 20
-
-    # Column definitions
-    columns = [
-        '일시', '메모', '계좌', '적요', '입금액', '출금액',
-        '계정', '거래처', '분류금액', '증빙'
-    ]
-
-    # Column width settings
-    ws.col(0).width = 110 * 30
-    ws.col(1).width = 100 * 30
-    ws.col(2).width = 170 * 30
-    ws.col(3).width = 180 * 30
-    ws.col(4).width = 110 * 30
-    ws.col(5).width = 110 * 30
-    ws.col(6).width = 160 * 30
-    ws.col(7).width = 120 * 30
-    ws.col(8).width = 110 * 30
-    ws.col(9).width = 100 * 30
-
-    # Sheet header, second row
-    row_num = 1
-
-    header_style = xlwt.XFStyle()
-    header_style.font.bold = True
-    header_style.borders.left = 1
-    header_style.borders.right = 1
-    header_style.borders.top = 1
-    header_style.borders.bottom = 1
-    header_style.pattern.pattern = xlwt.Pattern.SOLID_PATTERN
-    header_style.pattern.pattern_fore_colour = xlwt.Style.colour_map['silver_ega']
-    header_style.alignment.vert = header_style.alignment.VERT_CENTER
-    header_style.alignment.horz = header_style.alignment.HORZ_CENTER
-
-    for col_num, col_name in enumerate(columns):
-        ws.write(row_num, col_num, col_name, header_style)
-
-    # Sheet body, remaining rows
-    styles = XlwtStyleMixin.create_xlwt_styles()
-
-    for trans in obj_list:
-        entries = getattr(trans, 'prefetched_accounting_entries', [])
-        if not entries:  # 거래는 있으나 분개가 없는 경우
-            row_num += 1
-            ws.write(row_num, 0, trans.deal_date.strftime('%Y-%m-%d'), styles['date'])
-            ws.write(row_num, 1, trans.note or '', styles['default'])
-            ws.write(row_num, 2, trans.bank_account.alias_name if trans.bank_account else '', styles['default'])
-            ws.write(row_num, 3, trans.content or '', styles['default'])
-            ws.write(row_num, 4, trans.amount if trans.sort.pk == 1 else 0, styles['amount'])
-            ws.write(row_num, 5, trans.amount if trans.sort.pk == 2 else 0, styles['amount'])
-            for i in range(6, 10):
-                ws.write(row_num, i, '', styles['default'])
-        elif len(entries) == 1:
-            entry = entries[0]
-            row_num += 1
-            # Bank transaction columns
-            ws.write(row_num, 0, trans.deal_date.strftime('%Y-%m-%d'), styles['date'])
-            ws.write(row_num, 1, trans.note or '', styles['default'])
-            ws.write(row_num, 2, trans.bank_account.alias_name if trans.bank_account else '', styles['default'])
-            ws.write(row_num, 3, trans.content or '', styles['default'])
-            ws.write(row_num, 4, trans.amount if trans.sort.pk == 1 else 0, styles['amount'])
-            ws.write(row_num, 5, trans.amount if trans.sort.pk == 2 else 0, styles['amount'])
-            # Classification columns
-            ws.write(row_num, 6, entry.account.name if entry.account else '', styles['default'])
-            ws.write(row_num, 7, entry.trader or '', styles['default'])
-            ws.write(row_num, 8, entry.amount or 0, styles['amount'])
-            ws.write(row_num, 9, entry.get_evidence_type_display() or '', styles['default'])
-        else:
-            for i, acc_entry in enumerate(entries):
-                row_num += 1
-                if i == 0:
-                    # Bank transaction columns - only on the first row
-                    ws.write(row_num, 0, trans.deal_date.strftime('%Y-%m-%d'), styles['date'])
-                    ws.write(row_num, 1, trans.note or '', styles['default'])
-                    ws.write(row_num, 2, trans.bank_account.alias_name if trans.bank_account else '', styles['default'])
-                    ws.write(row_num, 3, trans.content or '', styles['default'])
-                    ws.write(row_num, 4, trans.amount if trans.sort.pk == 1 else 0, styles['amount'])
-                    ws.write(row_num, 5, trans.amount if trans.sort.pk == 2 else 0, styles['amount'])
-
-                # Classification columns are always written
-                ws.write(row_num, 6, acc_entry.account.name if acc_entry.account else '', styles['default'])
-                ws.write(row_num, 7, acc_entry.trader or '', styles['default'])
-                ws.write(row_num, 8, acc_entry.amount or 0, styles['amount'])
-                ws.write(row_num, 9, acc_entry.get_evidence_type_display() or '', styles['default'])
 
-    wb.save(response)
-    return response
+    return write_transaction_workbook(project.name + ' 입출금 내역', '프로젝트_입출금_내역', filename, obj_list,
+                                      lambda chunk: prefetch_project_transactions(chunk, request.GET))
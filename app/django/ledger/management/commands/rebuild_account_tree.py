@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand
+
+from ledger.models import CompanyAccount, ProjectAccount
+from ledger.services.account_tree import rebuild_account_tree, REBUILD_BATCH_SIZE
+
+
+class Command(BaseCommand):
+    help = '본사/프로젝트 계정 과목의 경로 인덱스(전체 경로, 깊이, 상위 계정 ID, 계산된 거래방향)를 재구성합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--model',
+            choices=['company', 'project'],
+            help='특정 계정 모델만 처리 (선택사항)'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=REBUILD_BATCH_SIZE,
+            help=f'배치 처리 크기 (기본값: {REBUILD_BATCH_SIZE})'
+        )
+
+    def handle(self, *args, **options):
+        models = {'company': CompanyAccount, 'project': ProjectAccount}
+        if options.get('model'):
+            models = {options['model']: models[options['model']]}
+
+        for model in models.values():
+            updated = rebuild_account_tree(model, batch_size=options['batch_size'])
+            self.stdout.write(self.style.SUCCESS(
+                f'[{model._meta.verbose_name}] 전체: {model.objects.count()}, 갱신: {updated}'
+            ))
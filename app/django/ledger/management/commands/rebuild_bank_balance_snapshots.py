@@ -0,0 +1,46 @@
+from django.core.management.base import BaseCommand
+
+from ledger.models import (
+    CompanyBankBalanceSnapshot, ProjectBankBalanceSnapshot, CompanyBankTransaction, ProjectBankTransaction
+)
+from ledger.services.bank_balance import rebuild_balance_snapshots, REBUILD_BATCH_SIZE
+
+
+class Command(BaseCommand):
+    help = '은행 거래 원장으로부터 본사/프로젝트 계좌별 일별 잔액 스냅샷을 재구성합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--model',
+            choices=['company', 'project'],
+            help='본사 또는 프로젝트 계좌만 처리 (선택사항)'
+        )
+        parser.add_argument(
+            '--bank-account',
+            type=int,
+            action='append',
+            dest='bank_accounts',
+            help='특정 계좌 ID만 처리 (여러 번 지정 가능, --model과 함께 사용)'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=REBUILD_BATCH_SIZE,
+            help=f'배치 처리 크기 (기본값: {REBUILD_BATCH_SIZE})'
+        )
+
+    def handle(self, *args, **options):
+        targets = {
+            'company': (CompanyBankBalanceSnapshot, CompanyBankTransaction),
+            'project': (ProjectBankBalanceSnapshot, ProjectBankTransaction),
+        }
+        if options.get('model'):
+            targets = {options['model']: targets[options['model']]}
+
+        for snapshot_model, transaction_model in targets.values():
+            created = rebuild_balance_snapshots(snapshot_model, transaction_model,
+                                                bank_account_ids=options.get('bank_accounts'),
+                                                batch_size=options['batch_size'])
+            self.stdout.write(self.style.SUCCESS(
+                f'[{snapshot_model._meta.verbose_name}] 스냅샷 {created}건 재구성 완료'
+            ))
@@ -0,0 +1,53 @@
+from django.core.management.base import BaseCommand
+
+from ledger.models import CompanyBankTransaction, ProjectBankTransaction
+from ledger.services.transaction_balance import verify_transaction_balances, VERIFY_BATCH_SIZE
+
+
+class Command(BaseCommand):
+    help = '은행 거래에 저장된 회계 분개 합계/균형 여부를 실제 분개와 비교하고 불일치를 복구합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--model',
+            choices=['company', 'project'],
+            help='본사 또는 프로젝트 거래만 처리 (선택사항)'
+        )
+        parser.add_argument(
+            '--repair',
+            action='store_true',
+            help='불일치 행을 실제 분개 합계로 복구 (미지정 시 검증만 수행)'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=VERIFY_BATCH_SIZE,
+            help=f'배치 처리 크기 (기본값: {VERIFY_BATCH_SIZE})'
+        )
+        parser.add_argument(
+            '--show',
+            type=int,
+            default=20,
+            help='출력할 불일치 상세 건수 (기본값: 20)'
+        )
+
+    def handle(self, *args, **options):
+        models = {'company': CompanyBankTransaction, 'project': ProjectBankTransaction}
+        if options.get('model'):
+            models = {options['model']: models[options['model']]}
+
+        for model in models.values():
+            drifts = verify_transaction_balances(model, model.accounting_entry_model(),
+                                                 repair=options['repair'], batch_size=options['batch_size'])
+            label = model._meta.verbose_name
+            if not drifts:
+                self.stdout.write(self.style.SUCCESS(f'[{label}] 불일치 없음'))
+                continue
+
+            for drift in drifts[:options['show']]:
+                self.stdout.write(f"  pk={drift['pk']} 저장값={drift['stored']} 실제값={drift['actual']}")
+            if options['repair']:
+                self.stdout.write(self.style.SUCCESS(f'[{label}] 불일치 {len(drifts)}건 복구 완료'))
+            else:
+                self.stdout.write(self.style.WARNING(
+                    f'[{label}] 불일치 {len(drifts)}건 발견 (--repair 옵션으로 복구)'))
@@ -0,0 +1,61 @@
+# Generated by Django 6.0.7 on 2026-10-18 06:01
+
+import django.contrib.postgres.fields
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+
+from ledger.services.account_tree import rebuild_account_tree
+
+
+def build_account_tree_index(apps, schema_editor):
+    for model_name in ('CompanyAccount', 'ProjectAccount'):
+        rebuild_account_tree(apps.get_model('ledger', model_name))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ledger', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='companyaccount',
+            name='ancestor_ids',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.PositiveBigIntegerField(), blank=True, default=list, editable=False, help_text='루트부터 직속 상위 계정까지의 ID', verbose_name='상위 계정 ID 목록'),
+        ),
+        migrations.AddField(
+            model_name='companyaccount',
+            name='computed_direction',
+            field=models.CharField(blank=True, editable=False, help_text='분류 전용 계정은 활성 하위 계정들의 거래 방향을 합산 (자동 관리)', max_length=10, null=True, verbose_name='계산된 거래방향'),
+        ),
+        migrations.AddField(
+            model_name='companyaccount',
+            name='full_path',
+            field=models.CharField(blank=True, default='', editable=False, max_length=1000, verbose_name='전체 경로'),
+        ),
+        migrations.AddField(
+            model_name='projectaccount',
+            name='ancestor_ids',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.PositiveBigIntegerField(), blank=True, default=list, editable=False, help_text='루트부터 직속 상위 계정까지의 ID', verbose_name='상위 계정 ID 목록'),
+        ),
+        migrations.AddField(
+            model_name='projectaccount',
+            name='computed_direction',
+            field=models.CharField(blank=True, editable=False, help_text='분류 전용 계정은 활성 하위 계정들의 거래 방향을 합산 (자동 관리)', max_length=10, null=True, verbose_name='계산된 거래방향'),
+        ),
+        migrations.AddField(
+            model_name='projectaccount',
+            name='full_path',
+            field=models.CharField(blank=True, default='', editable=False, max_length=1000, verbose_name='전체 경로'),
+        ),
+        migrations.AddIndex(
+            model_name='companyaccount',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['ancestor_ids'], name='ledger_comp_ancestor_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='projectaccount',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['ancestor_ids'], name='ledger_proj_ancestor_gin'),
+        ),
+        migrations.RunPython(build_account_tree_index, migrations.RunPython.noop),
+    ]
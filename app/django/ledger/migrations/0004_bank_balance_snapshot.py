@@ -0,0 +1,65 @@
+# Generated by Django 6.0.7 on 2026-10-18 06:04
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+from ledger.services.bank_balance import rebuild_balance_snapshots
+
+
+def build_bank_balance_snapshots(apps, schema_editor):
+    for prefix in ('Company', 'Project'):
+        rebuild_balance_snapshots(apps.get_model('ledger', f'{prefix}BankBalanceSnapshot'),
+                                  apps.get_model('ledger', f'{prefix}BankTransaction'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ledger', '0003_account_tree_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CompanyBankBalanceSnapshot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('deal_date', models.DateField(verbose_name='거래일자')),
+                ('inflow', models.PositiveBigIntegerField(default=0, verbose_name='당일 입금')),
+                ('outflow', models.PositiveBigIntegerField(default=0, verbose_name='당일 출금')),
+                ('cumulative_inflow', models.PositiveBigIntegerField(default=0, verbose_name='누적 입금')),
+                ('cumulative_outflow', models.PositiveBigIntegerField(default=0, verbose_name='누적 출금')),
+                ('closing_balance', models.BigIntegerField(default=0, verbose_name='마감 잔액')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='수정일시')),
+                ('bank_account', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='balance_snapshots', to='ledger.companybankaccount', verbose_name='거래계좌')),
+            ],
+            options={
+                'verbose_name': '13. 본사 계좌 일별 잔액',
+                'verbose_name_plural': '13. 본사 계좌 일별 잔액',
+                'ordering': ['bank_account', '-deal_date'],
+                'abstract': False,
+                'constraints': [models.UniqueConstraint(fields=('bank_account', 'deal_date'), name='unique_company_balance_snapshot')],
+            },
+        ),
+        migrations.CreateModel(
+            name='ProjectBankBalanceSnapshot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('deal_date', models.DateField(verbose_name='거래일자')),
+                ('inflow', models.PositiveBigIntegerField(default=0, verbose_name='당일 입금')),
+                ('outflow', models.PositiveBigIntegerField(default=0, verbose_name='당일 출금')),
+                ('cumulative_inflow', models.PositiveBigIntegerField(default=0, verbose_name='누적 입금')),
+                ('cumulative_outflow', models.PositiveBigIntegerField(default=0, verbose_name='누적 출금')),
+                ('closing_balance', models.BigIntegerField(default=0, verbose_name='마감 잔액')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='수정일시')),
+                ('bank_account', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='balance_snapshots', to='ledger.projectbankaccount', verbose_name='거래계좌')),
+            ],
+            options={
+                'verbose_name': '14. 프로젝트 계좌 일별 잔액',
+                'verbose_name_plural': '14. 프로젝트 계좌 일별 잔액',
+                'ordering': ['bank_account', '-deal_date'],
+                'abstract': False,
+                'constraints': [models.UniqueConstraint(fields=('bank_account', 'deal_date'), name='unique_project_balance_snapshot')],
+            },
+        ),
+        migrations.RunPython(build_bank_balance_snapshots, migrations.RunPython.noop),
+    ]
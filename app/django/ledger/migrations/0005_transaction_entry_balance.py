@@ -0,0 +1,52 @@
+# Generated by Django 6.0.7 on 2026-10-18 06:07
+
+from django.db import migrations, models
+
+from ledger.services.transaction_balance import verify_transaction_balances
+
+
+def fill_entry_balances(apps, schema_editor):
+    for prefix in ('Company', 'Project'):
+        verify_transaction_balances(apps.get_model('ledger', f'{prefix}BankTransaction'),
+                                    apps.get_model('ledger', f'{prefix}AccountingEntry'), repair=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ledger', '0004_bank_balance_snapshot'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='companybanktransaction',
+            name='entry_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='분개 수'),
+        ),
+        migrations.AddField(
+            model_name='companybanktransaction',
+            name='entry_total',
+            field=models.PositiveBigIntegerField(default=0, editable=False, verbose_name='분개 합계'),
+        ),
+        migrations.AddField(
+            model_name='companybanktransaction',
+            name='is_balanced',
+            field=models.BooleanField(db_index=True, default=False, editable=False, help_text='은행 거래 금액과 회계 분개 금액 합계 일치 여부', verbose_name='분개 균형 여부'),
+        ),
+        migrations.AddField(
+            model_name='projectbanktransaction',
+            name='entry_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='분개 수'),
+        ),
+        migrations.AddField(
+            model_name='projectbanktransaction',
+            name='entry_total',
+            field=models.PositiveBigIntegerField(default=0, editable=False, verbose_name='분개 합계'),
+        ),
+        migrations.AddField(
+            model_name='projectbanktransaction',
+            name='is_balanced',
+            field=models.BooleanField(db_index=True, default=False, editable=False, help_text='은행 거래 금액과 회계 분개 금액 합계 일치 여부', verbose_name='분개 균형 여부'),
+        ),
+        migrations.RunPython(fill_entry_balances, migrations.RunPython.noop),
+    ]
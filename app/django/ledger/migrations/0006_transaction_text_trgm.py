@@ -0,0 +1,46 @@
+# Generated by Django 6.0.7 on 2026-10-18 06:08
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import TrigramExtension
+from django.conf import settings
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('company', '0014_alter_staff_status'),
+        ('contract', '0007_contractprice_dependency_key_and_more'),
+        ('ibs', '0001_initial'),
+        ('ledger', '0005_transaction_entry_balance'),
+        ('project', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddIndex(
+            model_name='companyaccountingentry',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['trader'], name='ledger_cae_trader_trgm', opclasses=['gin_trgm_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='companybanktransaction',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['content'], name='ledger_cbt_content_trgm', opclasses=['gin_trgm_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='companybanktransaction',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['note'], name='ledger_cbt_note_trgm', opclasses=['gin_trgm_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='projectaccountingentry',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['trader'], name='ledger_pae_trader_trgm', opclasses=['gin_trgm_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='projectbanktransaction',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['content'], name='ledger_pbt_content_trgm', opclasses=['gin_trgm_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='projectbanktransaction',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['note'], name='ledger_pbt_note_trgm', opclasses=['gin_trgm_ops']),
+        ),
+    ]
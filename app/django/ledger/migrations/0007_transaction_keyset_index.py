@@ -0,0 +1,26 @@
+# Generated by Django 6.0.7 on 2026-10-18 06:11
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('company', '0014_alter_staff_status'),
+        ('ibs', '0001_initial'),
+        ('ledger', '0006_transaction_text_trgm'),
+        ('project', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='companybanktransaction',
+            index=models.Index(fields=['company', 'deal_date', 'id'], name='ledger_cbt_keyset_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='projectbanktransaction',
+            index=models.Index(fields=['project', 'deal_date', 'id'], name='ledger_pbt_keyset_idx'),
+        ),
+    ]
@@ -1,13 +1,22 @@
 import logging
 import uuid
 
+from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex
 from django.core.exceptions import ValidationError
 from django.db import models, transaction
 from django.db.models import Count, Sum
 from django.utils import timezone
 from tree_queries.query import TreeQuerySet
 
-from ledger.services.sync_payment_contract import trigger_sync_contract_payment
+from ledger.services.account_tree import PATH_SEPARATOR, TREE_INDEX_FIELDS, resolve_direction
+from ledger.services.bank_balance import record_balance_change, transaction_balance_state
+from ledger.services.sync_payment_contract import (
+    is_bulk_import_active, trigger_sync_contract_payment, trigger_sync_contract_payments
+)
+from ledger.services.transaction_balance import (
+    BALANCE_FIELDS, apply_entry_totals, get_entry_totals, refresh_transaction_balances
+)
 
 logger = logging.getLogger(__name__)
 
@@ -110,6 +119,10 @@ class Account(models.Model):
 
     이 모델은 추상 모델로, CompanyAccount와 ProjectAccount로 상속됩니다.
     구조는 동일하지만 계정 데이터는 완전히 분리되어 관리됩니다.
+
+    경로 인덱스(depth, full_path, ancestor_ids, computed_direction)는 저장/이동/삭제 시
+    함께 갱신되어 트리 조회와 검색이 계층 깊이와 무관하게 단일 쿼리로 처리됩니다.
+    (fixture 적재 등 save()를 거치지 않은 경우 rebuild_account_tree 명령으로 재구성)
     """
     objects = TreeQuerySet.as_manager()
 
@@ -141,6 +154,11 @@ class Account(models.Model):
                                related_name='children', verbose_name='상위 계정')
     depth = models.PositiveIntegerField(default=1, editable=False, verbose_name='계층 깊이')
 
+    # 경로 인덱스 (자동 관리)
+    full_path = models.CharField(max_length=1000, blank=True, default='', editable=False, verbose_name='전체 경로')
+    ancestor_ids = ArrayField(models.PositiveBigIntegerField(), blank=True, default=list, editable=False,
+                              verbose_name='상위 계정 ID 목록', help_text='루트부터 직속 상위 계정까지의 ID')
+
     # 회계 분류
     category = models.CharField(
         max_length=20,
@@ -162,6 +180,10 @@ class Account(models.Model):
                                  null=True, blank=True, verbose_name='거래방향',
                                  help_text='이 계정이 사용되는 기본 거래 방향 (분류 전용 계정은 비워둠)')
 
+    computed_direction = models.CharField(max_length=10, null=True, blank=True, editable=False,
+                                          verbose_name='계산된 거래방향',
+                                          help_text='분류 전용 계정은 활성 하위 계정들의 거래 방향을 합산 (자동 관리)')
+
     # 분류 전용 계정 (거래 사용 불가)
     is_category_only = models.BooleanField(default=False, verbose_name='분류 전용',
                                            help_text='체크 시: 이 계정은 분류 목적으로만 사용되며 직접 거래에 사용 불가. '
@@ -219,80 +241,124 @@ class Account(models.Model):
         new_code = parent_code + (sibling_order * step)
         return str(new_code)
 
-    def save(self, *args, **kwargs):
-        # 깊이 자동 계산
+    def _apply_tree_index(self):
+        """상위 계정의 경로 인덱스로부터 자신의 depth, full_path, ancestor_ids 계산"""
         if self.parent:
             self.depth = self.parent.depth + 1
-            # 상위 계정의 category와 direction 상속 (선택적)
-            if not self.pk:  # 신규 생성 시에만
-                if not self.category:
-                    self.category = self.parent.category
-                if not self.direction:
-                    self.direction = self.parent.direction
+            self.full_path = f'{self.parent.full_path}{PATH_SEPARATOR}{self.name}'
+            self.ancestor_ids = list(self.parent.ancestor_ids) + [self.parent_id]
         else:
             self.depth = 1
+            self.full_path = self.name
+            self.ancestor_ids = []
+
+    def _resolve_computed_direction(self):
+        """자신의 거래 방향 계산 (하위 계정은 이미 저장된 computed_direction 사용)"""
+        child_directions = []
+        if self.pk and self.is_category_only:
+            child_directions = self.children.filter(is_active=True).values_list('computed_direction', flat=True)
+        return resolve_direction(self.is_category_only, self.direction, child_directions)
+
+    def _rebuild_subtree_index(self):
+        """이동/이름 변경 시 하위 계정 전체의 경로 인덱스 일괄 갱신"""
+        descendants = list(self.__class__.objects.filter(ancestor_ids__contains=[self.pk]).order_by('depth'))
+        nodes = {self.pk: self}
+        for node in descendants:
+            parent = nodes[node.parent_id]
+            node.depth = parent.depth + 1
+            node.full_path = f'{parent.full_path}{PATH_SEPARATOR}{node.name}'
+            node.ancestor_ids = list(parent.ancestor_ids) + [parent.pk]
+            nodes[node.pk] = node
+        self.__class__.objects.bulk_update(descendants, ['depth', 'full_path', 'ancestor_ids'])
+
+    @classmethod
+    def refresh_computed_directions(cls, ids):
+        """지정 계정들의 computed_direction을 하위 계정부터 순서대로 재계산"""
+        for account in cls.objects.filter(pk__in=ids).order_by('-depth'):
+            computed = account._resolve_computed_direction()
+            if computed != account.computed_direction:
+                cls.objects.filter(pk=account.pk).update(computed_direction=computed)
+
+    def save(self, *args, **kwargs):
+        previous = None
+        if self.pk:
+            previous = self.__class__.objects.filter(pk=self.pk).values(
+                'parent_id', 'name', 'ancestor_ids', 'computed_direction', 'is_active').first()
+
+        # 상위 계정의 category와 direction 상속 (선택적)
+        if self.parent and not self.pk:  # 신규 생성 시에만
+            if not self.category:
+                self.category = self.parent.category
+            if not self.direction:
+                self.direction = self.parent.direction
+
+        # 깊이 및 경로 인덱스 자동 계산
+        self._apply_tree_index()
+        self.computed_direction = self._resolve_computed_direction()
 
         # 코드 자동 생성 (비어있을 경우에만)
         if not self.code:
             self.code = self._generate_code()
 
-        super().save(*args, **kwargs)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None:
+            kwargs['update_fields'] = set(update_fields) | set(TREE_INDEX_FIELDS)
+
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+
+            moved = previous is not None and previous['parent_id'] != self.parent_id
+            if moved or (previous is not None and previous['name'] != self.name):
+                self._rebuild_subtree_index()
+
+            # 거래 방향 변경이 상위 분류 계정에 영향을 주는 경우 상위 계정 재계산
+            affected = set()
+            if previous is None or moved or previous['is_active'] != self.is_active or \
+                    previous['computed_direction'] != self.computed_direction:
+                affected.update(self.ancestor_ids)
+            if moved:
+                affected.update(previous['ancestor_ids'] or [])
+            if affected:
+                self.__class__.refresh_computed_directions(affected)
+
+    def delete(self, *args, **kwargs):
+        ancestor_ids = list(self.ancestor_ids)
+        with transaction.atomic():
+            result = super().delete(*args, **kwargs)
+            self.__class__.refresh_computed_directions(ancestor_ids)
+        return result
 
     def clean(self):
         """유효성 검증"""
-        # 순환 참조 방지
-        if self.parent:
-            parent = self.parent
-            while parent:
-                if parent == self:
-                    raise ValidationError({'parent': '순환 참조가 발생했습니다.'})
-                parent = parent.parent
+        # 순환 참조 방지 (상위 계정의 ancestor_ids에 자신이 포함되면 순환)
+        if self.parent and self.pk:
+            if self.parent_id == self.pk or self.pk in self.parent.ancestor_ids:
+                raise ValidationError({'parent': '순환 참조가 발생했습니다.'})
 
     def get_full_path(self):
         """전체 경로 반환 (예: '수익 > 매출 > 분양매출')"""
-        path = [self.name]
-        parent = self.parent
-        while parent:
-            path.insert(0, parent.name)
-            parent = parent.parent
-        return ' > '.join(path)
+        return self.full_path
 
     def get_descendants(self, include_self=False):
         """모든 하위 계정 조회"""
-        return list(self.__class__._default_manager.descendants(self, include_self=include_self))
+        descendants = self.__class__.objects.filter(ancestor_ids__contains=[self.pk])
+        if include_self:
+            descendants = descendants | self.__class__.objects.filter(pk=self.pk)
+        return list(descendants.order_by('depth', 'code'))
 
     def get_ancestors(self, include_self=False):
         """모든 상위 계정 조회 (루트까지)"""
-        return list(self.__class__._default_manager.ancestors(self, include_self=include_self))
+        ids = list(self.ancestor_ids) + ([self.pk] if include_self else [])
+        return list(self.__class__.objects.filter(pk__in=ids).order_by('depth'))
 
     def get_computed_direction(self):
         """
-        분류 전용 계정의 거래 방향을 하위 계정들을 기반으로 계산
+        분류 전용 계정의 거래 방향 (하위 계정들을 기반으로 저장 시 계산된 값)
 
         Returns:
             str: 'deposit', 'withdraw', 'both', None
         """
-        if not self.is_category_only:
-            # 거래 계정인 경우 실제 direction 반환
-            return self.direction
-
-        # 분류 전용 계정인 경우 하위 계정들의 direction 분석
-        child_directions = set()
-        for child in self.children.filter(is_active=True):
-            child_direction = child.get_computed_direction()
-            if child_direction == 'both':
-                # 하위에 'both'가 있으면 즉시 'both' 반환
-                return 'both'
-            elif child_direction:
-                child_directions.add(child_direction)
-
-        if len(child_directions) == 0:
-            return None
-        elif len(child_directions) == 1:
-            return list(child_directions)[0]
-        else:
-            # 입금과 출금이 모두 있는 경우
-            return 'both'
+        return self.computed_direction
 
     def get_direction_display_computed(self):
         """computed_direction의 표시용 텍스트"""
@@ -331,6 +397,7 @@ class CompanyAccount(Account):
             models.Index(fields=['parent', 'order']),
             models.Index(fields=['category', 'is_active']),
             models.Index(fields=['requires_affiliate']),
+            GinIndex(fields=['ancestor_ids'], name='ledger_comp_ancestor_gin'),
         ]
 
 
@@ -356,6 +423,7 @@ class ProjectAccount(Account):
             models.Index(fields=['is_payment']),
             models.Index(fields=['requires_contract']),
             models.Index(fields=['is_payment', 'requires_contract']),
+            GinIndex(fields=['ancestor_ids'], name='ledger_proj_ancestor_gin'),
         ]
 
 
@@ -445,6 +513,12 @@ class BankTransaction(models.Model):
     content = models.CharField(max_length=100, blank=True, default='', verbose_name='적요', help_text='거래 기록 사항')
     note = models.TextField(blank=True, default='', verbose_name='비고', help_text='추가 설명')
 
+    # 회계 분개 합계 (분개 저장/삭제 시 자동 관리)
+    entry_total = models.PositiveBigIntegerField(default=0, editable=False, verbose_name='분개 합계')
+    entry_count = models.PositiveIntegerField(default=0, editable=False, verbose_name='분개 수')
+    is_balanced = models.BooleanField(default=False, editable=False, db_index=True, verbose_name='분개 균형 여부',
+                                      help_text='은행 거래 금액과 회계 분개 금액 합계 일치 여부')
+
     # 감사 필드
     created_at = models.DateTimeField(auto_now_add=True, verbose_name='생성일시')
     updated_at = models.DateTimeField(auto_now=True, verbose_name='수정일시')
@@ -466,22 +540,48 @@ class BankTransaction(models.Model):
             raise ValidationError({'deal_date': '미래 날짜로 거래를 생성할 수 없습니다.'})
 
     def save(self, *args, **kwargs):
-        """저장 전 유효성 검증"""
+        """저장 전 유효성 검증 및 일별 잔액 스냅샷 증분 갱신"""
         self.full_clean()
-        super().save(*args, **kwargs)
+        before = None
+        if self.pk:
+            before = self.__class__.objects.filter(pk=self.pk).values(
+                'bank_account_id', 'deal_date', 'sort_id', 'amount').first()
+
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            record_balance_change(self.balance_snapshot_model(), before, transaction_balance_state(self))
+            # 일괄 가져오기 중에는 가져오기 완료 후 일괄 재집계
+            if not is_bulk_import_active():
+                self.refresh_entry_balance()
+
+    def delete(self, *args, **kwargs):
+        before = transaction_balance_state(self)
+        with transaction.atomic():
+            result = super().delete(*args, **kwargs)
+            record_balance_change(self.balance_snapshot_model(), before, None)
+        return result
+
+    @classmethod
+    def balance_snapshot_model(cls):
+        """일별 잔액 스냅샷 모델 (하위 클래스에서 구현)"""
+        raise NotImplementedError('하위 클래스에서 구현해야 합니다.')
 
-    @property
-    def is_balanced(self):
-        """
-        회계 분개 금액 균형 여부 (실시간 계산)
+    @classmethod
+    def accounting_entry_model(cls):
+        """회계 분개 모델 (하위 클래스에서 구현)"""
+        raise NotImplementedError('하위 클래스에서 구현해야 합니다.')
 
-        은행 거래 금액과 회계 분개 금액 합계가 일치하는지 실시간으로 검증합니다.
-        """
-        try:
-            result = self.validate_accounting_entries()
-            return result['is_valid']
-        except (AttributeError, NotImplementedError):
-            return False
+    @classmethod
+    def refresh_entry_balances(cls, transaction_ids):
+        """지정 거래들의 분개 합계/균형 여부 일괄 재집계"""
+        return refresh_transaction_balances(cls, cls.accounting_entry_model(), transaction_ids)
+
+    def refresh_entry_balance(self):
+        """이 거래의 분개 합계/균형 여부 재집계 (인스턴스 값도 갱신)"""
+        totals = get_entry_totals(self.accounting_entry_model(), [self.transaction_id])
+        total, count = totals.get(self.transaction_id, (0, 0))
+        if apply_entry_totals(self, total, count):
+            self.__class__.objects.filter(pk=self.pk).update(**{field: getattr(self, field) for field in BALANCE_FIELDS})
 
     @property
     def accounting_entries(self):
@@ -532,8 +632,19 @@ class CompanyBankTransaction(BankTransaction):
         ordering = ['-deal_date', '-created_at']
         indexes = [
             models.Index(fields=['bank_account', 'deal_date']),
+            models.Index(fields=['company', 'deal_date', 'id'], name='ledger_cbt_keyset_idx'),
+            GinIndex(fields=['content'], opclasses=['gin_trgm_ops'], name='ledger_cbt_content_trgm'),
+            GinIndex(fields=['note'], opclasses=['gin_trgm_ops'], name='ledger_cbt_note_trgm'),
         ]
 
+    @classmethod
+    def balance_snapshot_model(cls):
+        return CompanyBankBalanceSnapshot
+
+    @classmethod
+    def accounting_entry_model(cls):
+        return CompanyAccountingEntry
+
     @property
     def accounting_entries(self):
         """이 은행 거래에 연결된 모든 회계 분개 항목들을 반환합니다."""
@@ -565,6 +676,9 @@ class ProjectBankTransaction(BankTransaction):
         ordering = ['-deal_date', '-created_at']
         indexes = [
             models.Index(fields=['bank_account', 'deal_date']),
+            models.Index(fields=['project', 'deal_date', 'id'], name='ledger_pbt_keyset_idx'),
+            GinIndex(fields=['content'], opclasses=['gin_trgm_ops'], name='ledger_pbt_content_trgm'),
+            GinIndex(fields=['note'], opclasses=['gin_trgm_ops'], name='ledger_pbt_note_trgm'),
         ]
 
     def save(self, *args, **kwargs):
@@ -614,10 +728,10 @@ class ProjectBankTransaction(BankTransaction):
 
         # project 또는 deal_date 변경 시 ContractPayment 동기화
         if project_changed or deal_date_changed:
-            entries = list(ProjectAccountingEntry.objects.filter(transaction_id=self.transaction_id))
+            entries = list(ProjectAccountingEntry.objects.filter(
+                transaction_id=self.transaction_id).values_list('pk', flat=True))
 
-            for entry in entries:
-                trigger_sync_contract_payment(entry)
+            trigger_sync_contract_payments(entries)
 
             if deal_date_changed:
                 logger.info(
@@ -626,6 +740,14 @@ class ProjectBankTransaction(BankTransaction):
                     f"연결된 {len(entries)}개 ContractPayment 동기화 완료"
                 )
 
+    @classmethod
+    def balance_snapshot_model(cls):
+        return ProjectBankBalanceSnapshot
+
+    @classmethod
+    def accounting_entry_model(cls):
+        return ProjectAccountingEntry
+
     @property
     def accounting_entries(self):
         """이 은행 거래에 연결된 모든 회계 분개 항목들을 반환합니다."""
@@ -639,6 +761,56 @@ class ProjectBankTransaction(BankTransaction):
         return entries
 
 
+class BankBalanceSnapshot(models.Model):
+    """
+    계좌별 일별 잔액 스냅샷 추상 모델
+
+    거래가 있는 날마다 계좌별 1행으로 당일 입출금과 해당일 마감 누계를 보관합니다.
+    기준일 잔액은 기준일 이전 마지막 스냅샷 1행으로 조회합니다.
+    거래 저장/삭제 시 증분 갱신되며 rebuild_bank_balance_snapshots 명령으로 재구성할 수 있습니다.
+    """
+    deal_date = models.DateField(verbose_name='거래일자')
+    inflow = models.PositiveBigIntegerField(default=0, verbose_name='당일 입금')
+    outflow = models.PositiveBigIntegerField(default=0, verbose_name='당일 출금')
+    cumulative_inflow = models.PositiveBigIntegerField(default=0, verbose_name='누적 입금')
+    cumulative_outflow = models.PositiveBigIntegerField(default=0, verbose_name='누적 출금')
+    closing_balance = models.BigIntegerField(default=0, verbose_name='마감 잔액')
+    updated_at = models.DateTimeField(auto_now=True, verbose_name='수정일시')
+
+    class Meta:
+        abstract = True
+        ordering = ['bank_account', '-deal_date']
+
+    def __str__(self):
+        return f"{self.bank_account} {self.deal_date} 잔액 {self.closing_balance:,}원"
+
+
+class CompanyBankBalanceSnapshot(BankBalanceSnapshot):
+    """본사 계좌 일별 잔액 스냅샷"""
+    bank_account = models.ForeignKey(CompanyBankAccount, on_delete=models.CASCADE, verbose_name='거래계좌',
+                                     related_name='balance_snapshots')
+
+    class Meta(BankBalanceSnapshot.Meta):
+        verbose_name = '13. 본사 계좌 일별 잔액'
+        verbose_name_plural = '13. 본사 계좌 일별 잔액'
+        constraints = [
+            models.UniqueConstraint(fields=['bank_account', 'deal_date'], name='unique_company_balance_snapshot'),
+        ]
+
+
+class ProjectBankBalanceSnapshot(BankBalanceSnapshot):
+    """프로젝트 계좌 일별 잔액 스냅샷"""
+    bank_account = models.ForeignKey(ProjectBankAccount, on_delete=models.CASCADE, verbose_name='거래계좌',
+                                     related_name='balance_snapshots')
+
+    class Meta(BankBalanceSnapshot.Meta):
+        verbose_name = '14. 프로젝트 계좌 일별 잔액'
+        verbose_name_plural = '14. 프로젝트 계좌 일별 잔액'
+        constraints = [
+            models.UniqueConstraint(fields=['bank_account', 'deal_date'], name='unique_project_balance_snapshot'),
+        ]
+
+
 # ============================================
 # Accounting Domain - 본사 / 현장 회계 분개 도메인
 # ============================================
@@ -686,6 +858,29 @@ class AccountingEntry(models.Model):
             models.Index(fields=['evidence_type']),
         ]
 
+    def save(self, *args, **kwargs):
+        """저장 후 연결 은행 거래의 분개 합계/균형 여부 갱신 (거래 ID 변경 시 이전 거래 포함)"""
+        previous_transaction_id = None
+        if self.pk:
+            previous_transaction_id = self.__class__.objects.filter(pk=self.pk).values_list(
+                'transaction_id', flat=True).first()
+
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            if not is_bulk_import_active():
+                self.bank_transaction_model().refresh_entry_balances([self.transaction_id, previous_transaction_id])
+
+    def delete(self, *args, **kwargs):
+        with transaction.atomic():
+            result = super().delete(*args, **kwargs)
+            self.bank_transaction_model().refresh_entry_balances([self.transaction_id])
+        return result
+
+    @classmethod
+    def bank_transaction_model(cls):
+        """연결 은행 거래 모델 (하위 클래스에서 구현)"""
+        raise NotImplementedError('하위 클래스에서 구현해야 합니다.')
+
     @property
     def related_transaction(self):
         """연관된 BankTransaction 조회"""
@@ -741,6 +936,7 @@ class CompanyAccountingEntry(AccountingEntry):
         indexes = [
             models.Index(fields=['account', 'created_at']),
             models.Index(fields=['affiliate']),
+            GinIndex(fields=['trader'], opclasses=['gin_trgm_ops'], name='ledger_cae_trader_trgm'),
         ]
 
     def clean(self):
@@ -770,6 +966,10 @@ class CompanyAccountingEntry(AccountingEntry):
         self.full_clean()
         super().save(*args, **kwargs)
 
+    @classmethod
+    def bank_transaction_model(cls):
+        return CompanyBankTransaction
+
 
 class ProjectAccountingEntry(AccountingEntry):
     """
@@ -804,8 +1004,13 @@ class ProjectAccountingEntry(AccountingEntry):
         indexes = [
             models.Index(fields=['account', 'created_at']),
             models.Index(fields=['contract']),
+            GinIndex(fields=['trader'], opclasses=['gin_trgm_ops'], name='ledger_pae_trader_trgm'),
         ]
 
+    @classmethod
+    def bank_transaction_model(cls):
+        return ProjectBankTransaction
+
     def clean_fields(self, exclude=None):
         """
         FK 유효성 검증 오버라이드
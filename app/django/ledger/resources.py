@@ -1,3 +1,5 @@
+import uuid
+
 from django.contrib.auth import get_user_model
 from django.db import transaction
 from import_export import resources, fields, widgets
@@ -6,9 +8,9 @@ from tablib import Dataset
 
 from company.models import Company
 from ibs.models import AccountSort
-from ledger.services.sync_payment_contract import set_bulk_import_active, _sync_contract_payment_for_entry
+from ledger.services.sync_payment_contract import set_bulk_import_active, sync_contract_payments_for_entries
 from .models import (
-    CompanyBankTransaction, ProjectBankTransaction,
+    BankTransaction, CompanyBankTransaction, ProjectBankTransaction,
     CompanyAccountingEntry, ProjectAccountingEntry, CompanyBankAccount
 )
 
@@ -30,10 +32,29 @@ class BaseTransactionResource(resources.ModelResource):
         return super().before_import(dataset, **kwargs)
 
     def after_import(self, dataset, result, **kwargs):
-        """Clear bulk import flag after import"""
+        """Clear bulk import flag after import and refresh entry balances of imported transactions"""
         set_bulk_import_active(False)
+        if not kwargs.get('dry_run', False):
+            self._refresh_entry_balances(dataset)
         return super().after_import(dataset, result, **kwargs)
 
+    def _refresh_entry_balances(self, dataset):
+        """가져온 행의 거래 ID 기준으로 은행 거래 분개 합계/균형 여부 일괄 재집계"""
+        if 'transaction_id' not in (dataset.headers or []):
+            return
+        transaction_ids = set()
+        for value in dataset['transaction_id']:
+            try:
+                transaction_ids.add(uuid.UUID(str(value).strip()))
+            except (TypeError, ValueError):
+                continue
+        if not transaction_ids:
+            return
+
+        model = self._meta.model
+        transaction_model = model if issubclass(model, BankTransaction) else model.bank_transaction_model()
+        transaction_model.refresh_entry_balances(transaction_ids)
+
     def import_data(self, dataset, dry_run=False, raise_errors=False, use_transactions=None, collect_failed_rows=False,
                     **kwargs):
         """
@@ -268,27 +289,15 @@ class ProjectAccountingEntryResource(BaseTransactionResource):
         if dry_run:
             return super().after_import(dataset, result, **kwargs)
 
-        # Import된 payment entries에 대해 ContractPayment 일괄 생성
+        # Import된 payment entries에 대해 ContractPayment 일괄 생성 (set 기반 bulk_create/bulk_update)
         if self._imported_payment_entries:
-            from django.db import transaction
             print(f"🔧 ContractPayment 동기화 시작: {len(self._imported_payment_entries)}건")
 
-            with transaction.atomic():
-                entries = ProjectAccountingEntry.objects.using('default').filter(
-                    pk__in=self._imported_payment_entries
-                ).select_related('account', 'contract', 'project')
-
-                synced_count = 0
-                for entry in entries:
-                    # 매핑된 installment_order_id 가져오기
-                    inst_order_id = self._imported_installment_map.get(entry.pk)
-                    _sync_contract_payment_for_entry(entry, installment_order_id=inst_order_id)
-                    synced_count += 1
-
-                    if synced_count % 1000 == 0:
-                        print(f"  진행중... {synced_count}/{len(self._imported_payment_entries)}")
+            synced = sync_contract_payments_for_entries(
+                self._imported_payment_entries, installment_orders=self._imported_installment_map
+            )
 
-                print(f"✅ ContractPayment 동기화 완료: {synced_count}건")
+            print(f"✅ ContractPayment 동기화 완료: 생성 {synced['created']}건, 수정 {synced['updated']}건")
 
             # 추적 데이터 초기화
             self._imported_payment_entries = []
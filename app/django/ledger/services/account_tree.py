@@ -0,0 +1,100 @@
+"""
+계정 과목 트리 경로 인덱스 서비스
+
+CompanyAccount / ProjectAccount 에 저장되는 경로 인덱스(depth, full_path, ancestor_ids,
+computed_direction)를 계산한다. 모델 save/delete 의 부분 갱신과 전체 재구성
+(마이그레이션 백필, rebuild_account_tree 관리 명령)이 같은 계산 규칙을 공유한다.
+"""
+from collections import defaultdict
+
+PATH_SEPARATOR = ' > '
+TREE_INDEX_FIELDS = ['depth', 'full_path', 'ancestor_ids', 'computed_direction']
+REBUILD_BATCH_SIZE = 500
+
+
+def combine_directions(directions):
+    """
+    하위 계정들의 거래 방향을 하나로 합산
+
+    Returns:
+        str: 'deposit', 'withdraw', 'both', None
+    """
+    found = set(d for d in directions if d)
+    if 'both' in found or len(found) > 1:
+        return 'both'
+    return found.pop() if found else None
+
+
+def resolve_direction(is_category_only, direction, child_directions):
+    """거래 계정은 자신의 direction, 분류 전용 계정은 활성 하위 계정 방향의 합산"""
+    if not is_category_only:
+        return direction
+    return combine_directions(child_directions)
+
+
+def compute_tree_index(rows):
+    """
+    전체 계정 행으로부터 경로 인덱스 계산
+
+    Args:
+        rows: id, parent_id, name, direction, is_category_only, is_active 키를 가진 dict 목록
+
+    Returns:
+        dict: {id: {'depth', 'full_path', 'ancestor_ids', 'computed_direction'}}
+    """
+    nodes = {row['id']: row for row in rows}
+    children = defaultdict(list)
+    for row in rows:
+        children[row['parent_id']].append(row['id'])
+
+    index = {}
+    # 루트부터 순회하며 경로 계산 (부모 경로가 항상 먼저 확정됨)
+    queue = [pk for pk in children[None]]
+    order = []
+    while queue:
+        pk = queue.pop()
+        order.append(pk)
+        row = nodes[pk]
+        parent = index.get(row['parent_id'])
+        if parent:
+            index[pk] = {
+                'depth': parent['depth'] + 1,
+                'full_path': f"{parent['full_path']}{PATH_SEPARATOR}{row['name']}",
+                'ancestor_ids': parent['ancestor_ids'] + [row['parent_id']],
+            }
+        else:
+            index[pk] = {'depth': 1, 'full_path': row['name'], 'ancestor_ids': []}
+        queue.extend(children[pk])
+
+    # 하위 계정부터 거래 방향 합산
+    for pk in reversed(order):
+        row = nodes[pk]
+        child_directions = [index[child]['computed_direction'] for child in children[pk]
+                            if nodes[child]['is_active']]
+        index[pk]['computed_direction'] = resolve_direction(
+            row['is_category_only'], row['direction'], child_directions)
+    return index
+
+
+def rebuild_account_tree(model, batch_size=REBUILD_BATCH_SIZE):
+    """
+    계정 모델의 경로 인덱스 전체 재구성 (변경된 행만 bulk_update)
+
+    Returns:
+        int: 갱신된 계정 수
+    """
+    rows = list(model.objects.values('id', 'parent_id', 'name', 'direction', 'is_category_only', 'is_active'))
+    index = compute_tree_index(rows)
+
+    changed = []
+    for account in model.objects.only('id', *TREE_INDEX_FIELDS):
+        values = index.get(account.pk)
+        if values is None:
+            continue
+        if any(getattr(account, field) != values[field] for field in TREE_INDEX_FIELDS):
+            for field in TREE_INDEX_FIELDS:
+                setattr(account, field, values[field])
+            changed.append(account)
+
+    model.objects.bulk_update(changed, TREE_INDEX_FIELDS, batch_size=batch_size)
+    return len(changed)
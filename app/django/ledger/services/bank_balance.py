@@ -0,0 +1,180 @@
+"""
+은행 계좌 일별 잔액 스냅샷 서비스
+
+계좌별·거래일별 입출금 합계와 마감 누계를 스냅샷 테이블에 유지하여,
+'기준일 현재 잔액' 조회를 전체 거래 합산 대신 계좌당 스냅샷 1행 조회로 처리한다.
+
+- 거래 저장/삭제 시: 변경 전후 차이만큼 해당일 행과 이후 일자 누계를 증분 갱신
+- 관리 명령(rebuild_bank_balance_snapshots): 거래 원장으로부터 전체 재구성
+"""
+import datetime
+
+from django.db import transaction
+from django.db.models import Case, F, Sum, When
+
+DEPOSIT_SORT_ID = 1  # AccountSort 1 = 입금
+WITHDRAW_SORT_ID = 2  # AccountSort 2 = 출금
+REBUILD_BATCH_SIZE = 1000
+
+
+def _as_date(value):
+    if isinstance(value, datetime.date):
+        return value
+    return datetime.date.fromisoformat(str(value))
+
+
+def transaction_balance_state(bank_transaction):
+    """잔액 계산에 영향을 주는 거래 필드 추출"""
+    return {
+        'bank_account_id': bank_transaction.bank_account_id,
+        'deal_date': bank_transaction.deal_date,
+        'sort_id': bank_transaction.sort_id,
+        'amount': bank_transaction.amount,
+    }
+
+
+def _flows(state):
+    """거래 상태 → (입금액, 출금액)"""
+    if state['sort_id'] == DEPOSIT_SORT_ID:
+        return state['amount'], 0
+    if state['sort_id'] == WITHDRAW_SORT_ID:
+        return 0, state['amount']
+    return 0, 0
+
+
+def lock_bank_accounts(snapshot_model, bank_account_ids):
+    """
+    잔액을 갱신할 은행 계좌 행 잠금 (동일 계좌의 동시 갱신 직렬화)
+
+    계좌 간 거래 이동 시 교착을 피하도록 ID 정렬 순서로 한 번에 잠근다. 트랜잭션 안에서 호출해야 한다.
+    """
+    bank_account_model = snapshot_model._meta.get_field('bank_account').related_model
+    list(bank_account_model.objects.select_for_update().filter(pk__in=bank_account_ids).order_by('pk')
+         .values_list('pk', flat=True))
+
+
+def apply_balance_delta(snapshot_model, bank_account_id, deal_date, inflow, outflow):
+    """한 계좌·거래일에 입출금 증감 반영 (해당일 행 upsert + 이후 일자 누계 이동, 계좌 행 잠금 상태에서 호출)"""
+    snapshots = snapshot_model.objects.filter(bank_account_id=bank_account_id)
+    updated = snapshots.filter(deal_date=deal_date).update(
+        inflow=F('inflow') + inflow, outflow=F('outflow') + outflow)
+    if not updated:
+        previous = snapshots.filter(deal_date__lt=deal_date).order_by('-deal_date').first()
+        snapshot_model.objects.create(
+            bank_account_id=bank_account_id,
+            deal_date=deal_date,
+            inflow=inflow,
+            outflow=outflow,
+            cumulative_inflow=previous.cumulative_inflow if previous else 0,
+            cumulative_outflow=previous.cumulative_outflow if previous else 0,
+            closing_balance=previous.closing_balance if previous else 0,
+        )
+
+    snapshots.filter(deal_date__gte=deal_date).update(
+        cumulative_inflow=F('cumulative_inflow') + inflow,
+        cumulative_outflow=F('cumulative_outflow') + outflow,
+        closing_balance=F('closing_balance') + (inflow - outflow),
+    )
+    # 거래가 모두 사라진 날은 직전 스냅샷과 동일하므로 행 제거
+    snapshots.filter(deal_date=deal_date, inflow=0, outflow=0).delete()
+
+
+def record_balance_change(snapshot_model, before=None, after=None):
+    """
+    거래 변경 전후 상태의 차이를 스냅샷에 반영
+
+    변경 전후 계좌를 모두 먼저 잠근 뒤 반영한다 (계좌 이동 거래의 교착 방지).
+
+    Args:
+        before: 변경 전 거래 상태 (신규 생성 시 None)
+        after: 변경 후 거래 상태 (삭제 시 None)
+    """
+    deltas = {}
+    for state, sign in ((before, -1), (after, 1)):
+        if not state:
+            continue
+        inflow, outflow = _flows(state)
+        key = (state['bank_account_id'], _as_date(state['deal_date']))
+        current = deltas.get(key, (0, 0))
+        deltas[key] = (current[0] + sign * inflow, current[1] + sign * outflow)
+
+    deltas = {key: flows for key, flows in deltas.items() if any(flows)}
+    if not deltas:
+        return
+    with transaction.atomic():
+        lock_bank_accounts(snapshot_model, sorted({bank_account_id for bank_account_id, _ in deltas}))
+        for (bank_account_id, deal_date), (inflow, outflow) in deltas.items():
+            apply_balance_delta(snapshot_model, bank_account_id, deal_date, inflow, outflow)
+
+
+def rebuild_balance_snapshots(snapshot_model, transaction_model, bank_account_ids=None,
+                              batch_size=REBUILD_BATCH_SIZE):
+    """
+    거래 원장으로부터 계좌별 일별 스냅샷 전체 재구성
+
+    Returns:
+        int: 생성된 스냅샷 행 수
+    """
+    bank_account_model = snapshot_model._meta.get_field('bank_account').related_model
+    accounts = bank_account_model.objects.all()
+    if bank_account_ids:
+        accounts = accounts.filter(pk__in=bank_account_ids)
+
+    created = 0
+    for bank_account_id in accounts.values_list('pk', flat=True):
+        daily = transaction_model.objects.filter(bank_account_id=bank_account_id).values('deal_date').annotate(
+            day_inflow=Sum(Case(When(sort_id=DEPOSIT_SORT_ID, then=F('amount')), default=0)),
+            day_outflow=Sum(Case(When(sort_id=WITHDRAW_SORT_ID, then=F('amount')), default=0)),
+        ).order_by('deal_date')
+
+        rows = []
+        cumulative_inflow = cumulative_outflow = 0
+        for day in daily:
+            if not day['day_inflow'] and not day['day_outflow']:
+                continue
+            cumulative_inflow += day['day_inflow']
+            cumulative_outflow += day['day_outflow']
+            rows.append(snapshot_model(
+                bank_account_id=bank_account_id,
+                deal_date=day['deal_date'],
+                inflow=day['day_inflow'],
+                outflow=day['day_outflow'],
+                cumulative_inflow=cumulative_inflow,
+                cumulative_outflow=cumulative_outflow,
+                closing_balance=cumulative_inflow - cumulative_outflow,
+            ))
+
+        with transaction.atomic():
+            snapshot_model.objects.filter(bank_account_id=bank_account_id).delete()
+            snapshot_model.objects.bulk_create(rows, batch_size=batch_size)
+        created += len(rows)
+    return created
+
+
+def get_balances_as_of(snapshot_model, date, **filters):
+    """
+    기준일 현재 계좌별 잔액 조회 (계좌당 기준일 이전 마지막 스냅샷 1행)
+
+    Args:
+        date: 기준일 (date 또는 'YYYY-MM-DD')
+        **filters: 스냅샷 쿼리셋 추가 필터 (예: bank_account__project_id=1)
+
+    Returns:
+        list: [{'bank_acc', 'bank_num', 'inc_sum', 'out_sum', 'date_inc', 'date_out', 'balance'}, ...]
+        (기존 balance_by_account 응답 형식과 동일, 계좌 정렬순)
+    """
+    date = _as_date(date)
+    snapshots = snapshot_model.objects.filter(deal_date__lte=date, **filters).select_related(
+        'bank_account').order_by('bank_account_id', '-deal_date').distinct('bank_account_id')
+
+    snapshots = sorted(snapshots, key=lambda s: (s.bank_account.order is None, s.bank_account.order or 0,
+                                                 s.bank_account_id))
+    return [{
+        'bank_acc': snapshot.bank_account.alias_name,
+        'bank_num': snapshot.bank_account.number,
+        'inc_sum': snapshot.cumulative_inflow,
+        'out_sum': snapshot.cumulative_outflow,
+        'date_inc': snapshot.inflow if snapshot.deal_date == date else 0,
+        'date_out': snapshot.outflow if snapshot.deal_date == date else 0,
+        'balance': snapshot.closing_balance,
+    } for snapshot in snapshots]
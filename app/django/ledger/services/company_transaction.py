@@ -1,6 +1,9 @@
+from collections import defaultdict
+
 from django.db.models import Q
 
 from ledger.models import CompanyBankTransaction, CompanyAccount, CompanyAccountingEntry
+from ledger.services.search import entry_transaction_ids, get_search_backend
 
 
 def get_company_transactions(params):
@@ -47,6 +50,7 @@ def get_company_transactions(params):
     search = params.get('search')
 
     entry_filters = Q()
+    backend = get_search_backend()
 
     if account_id:
         try:
@@ -83,47 +87,40 @@ def get_company_transactions(params):
             entry_filters |= Q(account_id__in=account_ids)
 
         # trader 검색 추가
-        entry_filters |= Q(trader__icontains=search)
+        entry_filters |= backend.text_q(['trader'], search)
 
-    # entry_filters가 있는 경우, transaction_id를 통해 필터링
+    # entry_filters가 있는 경우, transaction_id 서브쿼리로 DB 안에서 필터링
     if entry_filters:
-        transaction_ids = CompanyAccountingEntry.objects.filter(
-            entry_filters
-        ).values_list('transaction_id', flat=True).distinct()
+        transaction_ids = entry_transaction_ids(CompanyAccountingEntry, entry_filters)
 
         # search가 있는 경우 OR 조건, 없는 경우 AND 조건
         if search:
-            # trader 검색을 위한 추가 transaction_ids
-            trader_transaction_ids = CompanyAccountingEntry.objects.filter(
-                trader__icontains=search
-            ).values_list('transaction_id', flat=True).distinct()
-
-            # 기존 조건과 trader 조건을 합침
-            all_transaction_ids = set(transaction_ids) | set(trader_transaction_ids)
-
             qs = qs.filter(
-                Q(transaction_id__icontains=search) |
-                Q(content__icontains=search) |
-                Q(note__icontains=search) |
-                Q(transaction_id__in=all_transaction_ids)
+                backend.transaction_id_q(search) |
+                backend.text_q(['content', 'note'], search) |
+                Q(transaction_id__in=transaction_ids)
             )
         else:
             qs = qs.filter(transaction_id__in=transaction_ids)
-    elif search:
-        # entry_filters는 없지만 search는 있는 경우
-        # trader 검색을 위한 transaction_ids
-        trader_transaction_ids = CompanyAccountingEntry.objects.filter(
-            trader__icontains=search
-        ).values_list('transaction_id', flat=True).distinct()
-
-        qs = qs.filter(
-            Q(transaction_id__icontains=search) |
-            Q(content__icontains=search) |
-            Q(note__icontains=search) |
-            Q(transaction_id__in=trader_transaction_ids)
-        )
 
     # 정렬 및 반환
     return qs.select_related(
         'company', 'bank_account', 'sort', 'creator'
     ).order_by('-deal_date', '-created_at')
+
+
+def prefetch_company_transactions(instances):
+    """지정된 거래 목록(instances)에 대해서만 분개를 수동 prefetch 맵핑합니다."""
+    transaction_ids = [t.transaction_id for t in instances]
+    entries_map = defaultdict(list)
+    if transaction_ids:
+        entries = CompanyAccountingEntry.objects.filter(
+            transaction_id__in=transaction_ids
+        ).select_related('account', 'affiliate', 'affiliate__company', 'affiliate__project')
+        for entry in entries:
+            entries_map[entry.transaction_id].append(entry)
+
+    for tx in instances:
+        tx.prefetched_accounting_entries = entries_map.get(tx.transaction_id, [])
+
+    return instances
@@ -0,0 +1,158 @@
+"""
+원장 엑셀 스트리밍 가져오기 엔진
+
+업로드 워크북을 openpyxl read-only 모드로 한 행씩 읽어 고정 크기 청크(tablib Dataset)로
+나누어 처리한다. 전체 파일을 Dataset 으로 적재하지 않으므로 메모리 사용량이 청크 크기로 제한된다.
+
+- 검증 단계: 모든 청크를 dry-run 으로 검증하여 전체 오류 목록(시트 행 번호)을 수집하고
+  청크마다 on_progress(processed, total) 콜백으로 진행률 보고
+- 저장 단계: 오류가 하나도 없을 때만 전체 청크를 하나의 트랜잭션으로 저장 (일부만 반영되지 않음)
+- 저장 중 예외가 발생하면 전체 롤백되므로 같은 파일로 재실행해도 중복 저장되지 않음
+"""
+from django.db import transaction
+from openpyxl import load_workbook
+from tablib import Dataset
+
+IMPORT_CHUNK_SIZE = 500
+EMPTY_VALUES = ('', 'None', 'null', 'NaN')
+MAX_REPORTED_ERRORS = 200
+
+
+def is_empty_row(values):
+    """의미 있는 값이 하나도 없는 행 여부"""
+    for value in values:
+        if value is not None and str(value).strip() not in EMPTY_VALUES:
+            return False
+    return True
+
+
+def open_worksheet(file_obj):
+    """
+    첫 번째 시트를 read-only 모드로 열기
+
+    Returns:
+        tuple: (워크북, 헤더 목록, 데이터 행 iterator, 예상 데이터 행 수)
+    """
+    workbook = load_workbook(file_obj, read_only=True, data_only=True)
+    sheet = workbook.active
+    rows = sheet.iter_rows(values_only=True)
+    headers = list(next(rows, None) or [])
+    while headers and headers[-1] is None:
+        headers.pop()
+    # read-only 시트의 max_row 는 시트 dimension 기준 추정치 (없으면 0)
+    total = max((sheet.max_row or 1) - 1, 0)
+    return workbook, headers, rows, total
+
+
+def iter_chunks(headers, rows, chunk_size=IMPORT_CHUNK_SIZE):
+    """
+    데이터 행을 빈 행을 제외하고 chunk_size 단위 Dataset 으로 묶어 반환
+
+    Yields:
+        tuple: (청크 각 행의 시트 행 번호 목록, 청크 Dataset, 지금까지 읽은 데이터 행 수)
+    """
+    width = len(headers)
+    chunk = Dataset(headers=headers)
+    row_numbers = []
+    read = 0
+    for read, values in enumerate(rows, 1):
+        values = list(values[:width]) + [None] * (width - len(values))
+        if is_empty_row(values):
+            continue
+        chunk.append(values)
+        row_numbers.append(read + 1)  # 헤더 행 포함 시트 행 번호
+        if len(chunk) >= chunk_size:
+            yield row_numbers, chunk, read
+            chunk = Dataset(headers=headers)
+            row_numbers = []
+    if len(chunk):
+        yield row_numbers, chunk, read
+
+
+def _chunk_errors(result, row_numbers):
+    """청크 결과의 오류를 원본 시트 행 번호 기준으로 변환"""
+    errors = []
+    for error_row in result.error_rows:
+        errors.append({
+            'row_number': row_numbers[error_row.number - 1],
+            'row_data': None,
+            'errors': [str(e.error) for e in error_row.errors],
+        })
+    for invalid_row in result.invalid_rows:
+        errors.append({
+            'row_number': row_numbers[invalid_row.number - 1],
+            'row_data': [str(v) for v in invalid_row.values],
+            'errors': [f'{field}: {", ".join(messages)}' for field, messages in invalid_row.error_dict.items()],
+        })
+    return errors
+
+
+def _rewind(file_obj):
+    if hasattr(file_obj, 'seek'):
+        file_obj.seek(0)
+
+
+def validate_workbook(resource, file_obj, chunk_size=IMPORT_CHUNK_SIZE, on_progress=None):
+    """
+    워크북 전체를 청크 단위 dry-run 으로 검증 (저장하지 않음)
+
+    Returns:
+        dict: {'total_rows', 'failed_rows', 'base_errors', 'row_errors', 'error_count'}
+    """
+    workbook, headers, rows, total = open_worksheet(file_obj)
+    summary = {'total_rows': 0, 'failed_rows': 0, 'base_errors': [], 'row_errors': [], 'error_count': 0}
+    try:
+        for row_numbers, chunk, read in iter_chunks(headers, rows, chunk_size):
+            result = resource.import_data(chunk, dry_run=True, raise_errors=False, use_transactions=True)
+            summary['total_rows'] += len(chunk)
+
+            base_errors = [str(e.error) for e in result.base_errors]
+            row_errors = _chunk_errors(result, row_numbers)
+            if base_errors or row_errors:
+                summary['failed_rows'] += len(result.error_rows) + len(result.invalid_rows)
+                summary['error_count'] += len(base_errors) + len(row_errors)
+                summary['base_errors'].extend(base_errors)
+                remaining = MAX_REPORTED_ERRORS - len(summary['row_errors'])
+                summary['row_errors'].extend(row_errors[:max(remaining, 0)])
+
+            if on_progress:
+                on_progress(read, max(total, read))
+    finally:
+        workbook.close()
+    return summary
+
+
+def import_workbook(resource, file_obj, chunk_size=IMPORT_CHUNK_SIZE, on_progress=None, on_success=None):
+    """
+    워크북 가져오기 (전체 검증 후 오류가 없으면 하나의 트랜잭션으로 저장)
+
+    Args:
+        resource: django-import-export 리소스 인스턴스
+        file_obj: 엑셀 파일 경로 또는 파일 객체
+        chunk_size: 청크당 행 수
+        on_progress: 검증 청크 처리 후 호출할 콜백 (processed, total)
+        on_success: 저장 트랜잭션 커밋 직전에 호출할 콜백 (summary) - 작업 완료 기록 등을 함께 커밋
+
+    Returns:
+        dict: {'total_rows', 'new', 'update', 'skip', 'failed_rows', 'base_errors', 'row_errors', 'error_count',
+               'committed'}
+    """
+    summary = validate_workbook(resource, file_obj, chunk_size, on_progress)
+    summary.update({'new': 0, 'update': 0, 'skip': 0, 'committed': False})
+    if summary['error_count']:
+        return summary
+
+    _rewind(file_obj)
+    workbook, headers, rows, _ = open_worksheet(file_obj)
+    try:
+        with transaction.atomic():
+            for _, chunk, _ in iter_chunks(headers, rows, chunk_size):
+                result = resource.import_data(chunk, dry_run=False, raise_errors=True, use_transactions=True)
+                for key in ('new', 'update', 'skip'):
+                    summary[key] += result.totals.get(key, 0)
+            if on_success:
+                on_success(summary)
+    finally:
+        workbook.close()
+    summary['committed'] = True
+    return summary
@@ -2,6 +2,7 @@ from django.db.models import Q
 from collections import defaultdict
 
 from ledger.models import ProjectBankTransaction, ProjectAccount, ProjectAccountingEntry
+from ledger.services.search import entry_transaction_ids, get_search_backend
 
 
 def get_project_transactions(params):
@@ -34,6 +35,13 @@ def get_project_transactions(params):
     if bank_account:
         qs = qs.filter(bank_account_id=bank_account)
 
+    # is_balanced 필터링 (저장된 분개 균형 여부 컬럼 사용)
+    is_balanced = params.get('is_balanced')
+    if is_balanced is not None and is_balanced != '':
+        is_balanced_bool = is_balanced.lower() in ('true', '1', 'yes') if isinstance(is_balanced, str) else bool(
+            is_balanced)
+        qs = qs.filter(is_balanced=is_balanced_bool)
+
     # is_imprest 필터링 (bank_account의 is_imprest 속성 사용)
     is_imprest = params.get('is_imprest')
 
@@ -61,6 +69,7 @@ def get_project_transactions(params):
     search = params.get('search')
 
     entry_filters = Q()
+    backend = get_search_backend()
 
     if account_id:
         try:
@@ -113,50 +122,29 @@ def get_project_transactions(params):
             search_q |= Q(account_id__in=account_ids)
 
         # trader 검색 추가
-        search_q |= Q(trader__icontains=search)
+        search_q |= backend.text_q(['trader'], search)
 
         # 조립된 search_q 조건을 기존 필터에 AND 결합
         entry_filters &= search_q
 
-    # entry_filters가 있는 경우, transaction_id를 통해 필터링
+    # entry_filters가 있는 경우, transaction_id 서브쿼리로 DB 안에서 필터링
     if entry_filters:
-        transaction_ids = ProjectAccountingEntry.objects.filter(
-            entry_filters
-        ).values_list('transaction_id', flat=True).distinct()
+        transaction_ids = entry_transaction_ids(ProjectAccountingEntry, entry_filters)
 
         # search가 있는 경우 OR 조건, 없는 경우 AND 조건
         if search:
-            # trader 검색을 위한 추가 transaction_ids
-            trader_transaction_ids = ProjectAccountingEntry.objects.filter(
-                trader__icontains=search
-            ).values_list('transaction_id', flat=True).distinct()
-
-            # 기존 조건과 trader 조건을 합침
-            all_transaction_ids = set(transaction_ids) | set(trader_transaction_ids)
+            # trader 검색은 다른 분개 조건과 무관하게 추가 매칭
+            trader_transaction_ids = entry_transaction_ids(
+                ProjectAccountingEntry, backend.text_q(['trader'], search))
 
             qs = qs.filter(
-                Q(transaction_id__icontains=search) |
-                Q(content__icontains=search) |
-                Q(note__icontains=search) |
-                Q(project__name__icontains=search) |
-                Q(transaction_id__in=all_transaction_ids)
+                backend.transaction_id_q(search) |
+                backend.text_q(['content', 'note', 'project__name'], search) |
+                Q(transaction_id__in=transaction_ids) |
+                Q(transaction_id__in=trader_transaction_ids)
             )
         else:
             qs = qs.filter(transaction_id__in=transaction_ids)
-    elif search:
-        # entry_filters는 없지만 search는 있는 경우
-        # trader 검색을 위한 transaction_ids
-        trader_transaction_ids = ProjectAccountingEntry.objects.filter(
-            trader__icontains=search
-        ).values_list('transaction_id', flat=True).distinct()
-
-        qs = qs.filter(
-            Q(transaction_id__icontains=search) |
-            Q(content__icontains=search) |
-            Q(note__icontains=search) |
-            Q(project__name__icontains=search) |
-            Q(transaction_id__in=trader_transaction_ids)
-        )
 
     # 지연 평가(Lazy Evaluation) QuerySet 반환
     return qs.select_related(
@@ -0,0 +1,72 @@
+"""
+원장 거래 텍스트 검색 백엔드
+
+거래 적요(content)·비고(note)·분개 거래처(trader) 검색 조건을 DB 엔진에 맞게 생성한다.
+
+- PostgreSQL: ILIKE 조건 → pg_trgm GIN(gin_trgm_ops) 인덱스 사용
+  (Django icontains 는 UPPER(col::text) LIKE 로 변환되어 컬럼 trgm 인덱스를 타지 못함)
+- 그 외(MariaDB, SQLite 등): icontains 조건 (인덱스 없이 동작하는 이식 가능한 기본값)
+
+분개 조건은 transaction_id 서브쿼리로 결합하여 매칭 결과를 DB 안에서 조인한다.
+"""
+import re
+
+from django.db import connections
+from django.db.models import F, Lookup, Q, Value
+
+UUID_FRAGMENT_RE = re.compile(r'^[0-9a-fA-F-]{4,36}$')
+
+
+class ILike(Lookup):
+    """PostgreSQL ILIKE 조건 (pg_trgm GIN 인덱스 사용 가능)"""
+    lookup_name = 'ilike'
+
+    def as_sql(self, compiler, connection):
+        lhs, lhs_params = self.process_lhs(compiler, connection)
+        rhs, rhs_params = self.process_rhs(compiler, connection)
+        return f'{lhs} ILIKE {rhs}', (*lhs_params, *rhs_params)
+
+
+class IContainsSearchBackend:
+    """이식 가능한 기본 검색 백엔드 (icontains)"""
+
+    def text_q(self, fields, term):
+        """fields 중 하나라도 term 을 포함하는 조건 (OR)"""
+        q = Q()
+        for field in fields:
+            q |= Q(**{f'{field}__icontains': term})
+        return q
+
+    def transaction_id_q(self, term):
+        """거래 ID(UUID) 부분 일치 조건 - UUID 조각 형태의 검색어에만 적용"""
+        if not UUID_FRAGMENT_RE.match(term):
+            return Q()
+        return Q(transaction_id__icontains=term)
+
+
+class TrigramSearchBackend(IContainsSearchBackend):
+    """PostgreSQL pg_trgm 검색 백엔드 (ILIKE)"""
+
+    @staticmethod
+    def _pattern(term):
+        escaped = re.sub(r'([\\%_])', r'\\\1', term)
+        return f'%{escaped}%'
+
+    def text_q(self, fields, term):
+        pattern = self._pattern(term)
+        q = Q()
+        for field in fields:
+            q |= Q(ILike(F(field), Value(pattern)))
+        return q
+
+
+def get_search_backend(using='default'):
+    """DB 엔진에 맞는 검색 백엔드 반환"""
+    if connections[using].vendor == 'postgresql':
+        return TrigramSearchBackend()
+    return IContainsSearchBackend()
+
+
+def entry_transaction_ids(entry_model, *conditions):
+    """조건에 맞는 회계 분개의 transaction_id 서브쿼리 (평가하지 않고 DB 조인에 사용)"""
+    return entry_model.objects.filter(*conditions).values('transaction_id')
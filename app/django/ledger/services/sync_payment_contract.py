@@ -3,12 +3,15 @@ import threading
 
 from django.apps import apps
 from django.db import transaction
+from django.utils import timezone
 
 from payment.models import ContractPayment
 
 logger = logging.getLogger(__name__)
 _thread_locals = threading.local()
 
+SYNC_BATCH_SIZE = 1000  # 일괄 동기화 시 조회/저장 단위
+
 
 def trigger_sync_contract_payment(instance):
     if is_bulk_import_active():
@@ -16,6 +19,13 @@ def trigger_sync_contract_payment(instance):
     _sync_contract_payment_for_entry(instance)
 
 
+def trigger_sync_contract_payments(entry_ids):
+    """여러 회계 분개 일괄 동기화 (대량 가져오기 중에는 after_import에서 처리)"""
+    if is_bulk_import_active():
+        return
+    sync_contract_payments_for_entries(entry_ids)
+
+
 def is_bulk_import_active():
     """Check if bulk import is currently active in this thread"""
     return getattr(_thread_locals, 'bulk_import_active', False)
@@ -144,3 +154,107 @@ def _sync_contract_payment_for_entry(instance, installment_order_id=None):
 
         if update_fields:
             contract_payment.save(update_fields=update_fields + ['updated_at'])
+
+
+def _apply_entry_to_payment(contract_payment, entry, bank_transaction, installment_order_id, is_payment):
+    """기존 ContractPayment에 분개/은행거래 값 반영 - 변경 여부 반환 (_sync_contract_payment_for_entry와 동일 규칙)"""
+    changed = False
+    if contract_payment.project_id != entry.project_id:
+        contract_payment.project_id = entry.project_id
+        changed = True
+    if contract_payment.contract_id != entry.contract_id:
+        contract_payment.contract_id = entry.contract_id
+        changed = True
+    if is_payment and installment_order_id and contract_payment.installment_order_id != installment_order_id:
+        contract_payment.installment_order_id = installment_order_id
+        changed = True
+    if bank_transaction and contract_payment.deal_date != bank_transaction.deal_date:
+        contract_payment.deal_date = bank_transaction.deal_date
+        changed = True
+    if contract_payment.is_payment_mismatch == is_payment:
+        contract_payment.is_payment_mismatch = not is_payment
+        changed = True
+    return changed
+
+
+def sync_contract_payments_for_entries(entry_ids, installment_orders=None, batch_size=SYNC_BATCH_SIZE):
+    """
+    여러 ProjectAccountingEntry의 ContractPayment 일괄 동기화 (set 기반)
+
+    배치마다 분개, 은행거래, 기존 ContractPayment를 각각 한 번에 조회한 뒤
+    bulk_create / bulk_update로 반영한다. 동기화 규칙은 _sync_contract_payment_for_entry와 같다.
+
+    - 결제 계정(is_payment) 분개: ContractPayment 생성 또는 project/contract/회차/거래일자 동기화
+    - 비결제 계정 분개: 기존 ContractPayment만 동기화하고 계정 불일치로 표시
+
+    Args:
+        entry_ids: ProjectAccountingEntry PK 목록
+        installment_orders: {분개 PK: 납부회차 ID} (가져오기 시 행별 납부회차)
+        batch_size: 배치 크기
+
+    Returns:
+        dict: {'created': 생성 건수, 'updated': 수정 건수}
+    """
+    ProjectAccountingEntry = apps.get_model('ledger', 'ProjectAccountingEntry')
+    ProjectBankTransaction = apps.get_model('ledger', 'ProjectBankTransaction')
+
+    installment_orders = installment_orders or {}
+    entry_ids = list(dict.fromkeys(entry_ids))
+    result = {'created': 0, 'updated': 0}
+
+    for i in range(0, len(entry_ids), batch_size):
+        batch_ids = entry_ids[i:i + batch_size]
+
+        # ✅ 복제본 지연(Replica lag) 방지를 위해 마스터 DB('default') 명시적 사용
+        with transaction.atomic(using='default'):
+            entries = list(
+                ProjectAccountingEntry.objects.using('default').filter(pk__in=batch_ids, account__isnull=False)
+                .select_related('account')
+                .only('pk', 'project_id', 'contract_id', 'transaction_id', 'account__is_payment')
+            )
+            transaction_ids = {entry.transaction_id for entry in entries if entry.transaction_id}
+            bank_transactions = {
+                bt.transaction_id: bt for bt in ProjectBankTransaction.objects.using('default')
+                .filter(transaction_id__in=transaction_ids).only('transaction_id', 'deal_date', 'creator_id')
+            } if transaction_ids else {}
+            payments = {
+                cp.accounting_entry_id: cp for cp in ContractPayment.objects.using('default')
+                .select_for_update().filter(accounting_entry_id__in=[entry.pk for entry in entries])
+            }
+
+            now = timezone.now()
+            to_create, to_update = [], []
+            for entry in entries:
+                is_payment = entry.account.is_payment
+                bank_transaction = bank_transactions.get(entry.transaction_id)
+                installment_order_id = installment_orders.get(entry.pk)
+                contract_payment = payments.get(entry.pk)
+
+                if contract_payment is None:
+                    if not is_payment:
+                        continue
+                    to_create.append(ContractPayment(
+                        accounting_entry_id=entry.pk,
+                        project_id=entry.project_id,
+                        contract_id=entry.contract_id,
+                        deal_date=bank_transaction.deal_date if bank_transaction else None,
+                        installment_order_id=installment_order_id,
+                        is_payment_mismatch=False,
+                        creator_id=bank_transaction.creator_id if bank_transaction else None,
+                    ))
+                elif _apply_entry_to_payment(contract_payment, entry, bank_transaction, installment_order_id,
+                                             is_payment):
+                    contract_payment.updated_at = now
+                    to_update.append(contract_payment)
+
+            if to_create:
+                ContractPayment.objects.using('default').bulk_create(to_create)
+            if to_update:
+                ContractPayment.objects.using('default').bulk_update(
+                    to_update, ['project', 'contract', 'installment_order', 'deal_date', 'is_payment_mismatch',
+                                'updated_at'])
+
+        result['created'] += len(to_create)
+        result['updated'] += len(to_update)
+
+    return result
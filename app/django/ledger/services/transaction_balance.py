@@ -0,0 +1,104 @@
+"""
+은행 거래 회계 분개 합계(균형 상태) 비정규화 서비스
+
+BankTransaction 에 연결 분개 합계(entry_total), 분개 수(entry_count), 균형 여부(is_balanced)를
+저장해 두어 목록 조회·'미균형' 필터가 행마다 집계 쿼리를 실행하지 않도록 한다.
+
+- 분개 저장/삭제, 거래 저장 시: 해당 거래만 재집계
+- 일괄 가져오기: 행 단위 갱신을 생략하고 가져오기 완료 후 일괄 재집계
+- 관리 명령(verify_transaction_balances): 전체 검증 및 불일치 복구
+"""
+from django.db.models import Count, Sum
+
+BALANCE_FIELDS = ['entry_total', 'entry_count', 'is_balanced']
+VERIFY_BATCH_SIZE = 1000
+
+
+def get_entry_totals(entry_model, transaction_ids):
+    """
+    거래 ID별 회계 분개 합계 조회
+
+    Returns:
+        dict: {transaction_id: (합계, 분개 수)}
+    """
+    rows = entry_model.objects.filter(transaction_id__in=transaction_ids).values('transaction_id').annotate(
+        total=Sum('amount'), count=Count('id')).order_by()
+    return {row['transaction_id']: (row['total'] or 0, row['count']) for row in rows}
+
+
+def apply_entry_totals(bank_transaction, total, count):
+    """
+    거래 인스턴스에 분개 합계 반영
+
+    Returns:
+        bool: 값 변경 여부
+    """
+    values = {
+        'entry_total': total,
+        'entry_count': count,
+        'is_balanced': bank_transaction.amount == total,
+    }
+    changed = any(getattr(bank_transaction, field) != value for field, value in values.items())
+    for field, value in values.items():
+        setattr(bank_transaction, field, value)
+    return changed
+
+
+def refresh_transaction_balances(transaction_model, entry_model, transaction_ids, batch_size=VERIFY_BATCH_SIZE):
+    """
+    지정 거래들의 분개 합계 재집계 (변경된 행만 bulk_update)
+
+    Returns:
+        int: 갱신된 거래 수
+    """
+    transaction_ids = list(set(filter(None, transaction_ids)))
+    updated = 0
+    for i in range(0, len(transaction_ids), batch_size):
+        batch = transaction_ids[i:i + batch_size]
+        totals = get_entry_totals(entry_model, batch)
+        changed = []
+        for bank_transaction in transaction_model.objects.filter(transaction_id__in=batch).only(
+                'pk', 'transaction_id', 'amount', *BALANCE_FIELDS):
+            total, count = totals.get(bank_transaction.transaction_id, (0, 0))
+            if apply_entry_totals(bank_transaction, total, count):
+                changed.append(bank_transaction)
+        transaction_model.objects.bulk_update(changed, BALANCE_FIELDS)
+        updated += len(changed)
+    return updated
+
+
+def verify_transaction_balances(transaction_model, entry_model, repair=False, batch_size=VERIFY_BATCH_SIZE):
+    """
+    저장된 분개 합계와 실제 분개 합계 비교 (pk 순 배치 처리)
+
+    Args:
+        repair: True 이면 불일치 행을 실제 값으로 복구
+
+    Returns:
+        list: 불일치 목록 [{'pk', 'transaction_id', 'stored', 'actual'}, ...]
+    """
+    drifts = []
+    last_pk = 0
+    while True:
+        batch = list(transaction_model.objects.filter(pk__gt=last_pk).order_by('pk').only(
+            'pk', 'transaction_id', 'amount', *BALANCE_FIELDS)[:batch_size])
+        if not batch:
+            break
+        last_pk = batch[-1].pk
+
+        totals = get_entry_totals(entry_model, [t.transaction_id for t in batch])
+        changed = []
+        for bank_transaction in batch:
+            stored = tuple(getattr(bank_transaction, field) for field in BALANCE_FIELDS)
+            total, count = totals.get(bank_transaction.transaction_id, (0, 0))
+            if apply_entry_totals(bank_transaction, total, count):
+                changed.append(bank_transaction)
+                drifts.append({
+                    'pk': bank_transaction.pk,
+                    'transaction_id': bank_transaction.transaction_id,
+                    'stored': dict(zip(BALANCE_FIELDS, stored)),
+                    'actual': {field: getattr(bank_transaction, field) for field in BALANCE_FIELDS},
+                })
+        if repair and changed:
+            transaction_model.objects.bulk_update(changed, BALANCE_FIELDS)
+    return drifts
@@ -1,5 +1,6 @@
 import logging
 import os
+import shutil
 import tempfile
 
 from celery import shared_task
@@ -7,16 +8,17 @@ from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.core.files.storage import default_storage
 from django.core.mail import send_mail
-from django.db import transaction
+from django.utils import timezone
 
 from .models import (
     CompanyBankTransaction, ProjectBankTransaction,
-    CompanyAccountingEntry, ProjectAccountingEntry
+    CompanyAccountingEntry, ProjectAccountingEntry, ImportJob
 )
 from .resources import (
     CompanyBankTransactionResource, ProjectBankTransactionResource,
     CompanyAccountingEntryResource, ProjectAccountingEntryResource
 )
+from .services.ledger_import import import_workbook
 
 logger = logging.getLogger(__name__)
 User = get_user_model()
@@ -30,10 +32,15 @@ User = get_user_model()
     max_retries=3,
     retry_jitter=True
 )
-def async_import_ledger_account(self, file_path: str, user_id: int, resource_type: str = 'company_account') -> dict:
+def async_import_ledger_account(self, file_path: str, user_id: int, resource_type: str = 'company_account',
+                                job_id: int = None) -> dict:
     """
     Ledger 관련 데이터를 비동기로 가져오기
 
+    워크북을 read-only 모드로 한 행씩 읽어 청크 단위로 전체 검증한 뒤(청크마다 ImportJob 진행률 갱신),
+    오류가 없을 때만 하나의 트랜잭션으로 저장한다 (ledger.services.ledger_import).
+    저장 커밋과 함께 ImportJob 을 완료 처리하므로, 커밋 후 재시도·재전달된 작업은 다시 가져오지 않는다.
+
     Args:
         file_path: 업로드된 파일 경로
         user_id: 사용자 ID
@@ -44,20 +51,27 @@ def async_import_ledger_account(self, file_path: str, user_id: int, resource_typ
             - 'project_bank_transaction': 프로젝트 은행 거래
             - 'company_accounting_entry': 본사 회계 분개
             - 'project_accounting_entry': 프로젝트 회계 분개
+        job_id: 진행률을 기록할 ImportJob ID
 
     Returns:
         dict: 가져오기 결과
     """
     tmp_file_path = None
+    committed = False
 
     try:
         # 사용자 정보 가져오기
         user = User.objects.get(id=user_id)
+        job = ImportJob.objects.filter(pk=job_id).first() if job_id else None
+        if job and job.status == ImportJob.COMPLETED:
+            logger.info(f"Import job {job.pk} already committed, skipping redelivered task")
+            return {'success': True, 'skipped': True, 'job_id': job.pk, 'total_rows': job.total_records,
+                    'new_records': job.success_count, 'updated_records': 0, 'error_count': 0}
 
-        # 임시 파일로 다운로드
+        # 임시 파일로 다운로드 (스트리밍 복사)
         with tempfile.NamedTemporaryFile(delete=False, suffix='.xlsx') as tmp_file:
             with default_storage.open(file_path, 'rb') as uploaded_file:
-                tmp_file.write(uploaded_file.read())
+                shutil.copyfileobj(uploaded_file, tmp_file)
             tmp_file_path = tmp_file.name
 
         # 리소스 클래스 선택
@@ -73,85 +87,46 @@ def async_import_ledger_account(self, file_path: str, user_id: int, resource_typ
 
         resource_class, model_name = resource_mapping[resource_type]
 
-        # 데이터 가져오기 실행
-        resource = resource_class()
+        def report_progress(processed, total):
+            if job:
+                job.update_progress(processed, total)
+
+        def mark_job_completed(result):
+            # 가져온 데이터와 같은 트랜잭션으로 완료 기록
+            if job:
+                job.status = ImportJob.COMPLETED
+                job.success_count = result['new'] + result['update']
+                job.completed_at = timezone.now()
+                job.save(update_fields=['status', 'success_count', 'completed_at'])
+
+        # 데이터 가져오기 실행 (전체 검증 후 단일 트랜잭션 저장)
+        summary = import_workbook(resource_class(), tmp_file_path, on_progress=report_progress,
+                                  on_success=mark_job_completed)
+        committed = summary['committed']
 
-        with open(tmp_file_path, 'rb') as file:
-            from tablib import Dataset
-            dataset = Dataset()
-            dataset.load(file.read(), format='xlsx')
-
-            # Clean empty rows from the dataset more thoroughly
-            original_row_count = len(dataset)
-            cleaned_dataset = Dataset(headers=dataset.headers)
-            removed_rows = 0
-
-            for row in dataset:
-                # Check if row has any meaningful data
-                has_data = False
-                for field in row:
-                    if field is not None:
-                        # Convert to string and strip whitespace
-                        field_str = str(field).strip()
-                        # Check if it's not empty and not just whitespace/special chars
-                        if field_str and field_str not in ['', 'None', 'null', 'NaN']:
-                            has_data = True
-                            break
-
-                if has_data:
-                    cleaned_dataset.append(row)
-                else:
-                    removed_rows += 1
-
-            dataset = cleaned_dataset
-            logger.info(f"Removed {removed_rows} empty rows from {original_row_count} total rows. Final dataset: {len(dataset)} rows")
-
-            # 1. Dry run to validate data first
-            dry_run_result = resource.import_data(dataset, dry_run=True, raise_errors=False)
-
-            if dry_run_result.has_validation_errors():
-                # If validation errors are found, do not import. Return errors.
-                base_errors = [str(e.error) for e in dry_run_result.base_errors]
-                row_errors = [
-                    {'row_number': num, 'row_data': row_data, 'errors': [str(e) for e in errs]}
-                    for num, row_data, errs in dry_run_result.row_errors()
-                ]
-
-                import_result = {
-                    'success': False,
-                    'model': model_name,
-                    'total_rows': len(dataset),
-                    'new_records': 0,
-                    'updated_records': 0,
-                    'skipped_records': len(dataset),
-                    'error_count': len(base_errors) + len(row_errors),
-                    'errors': base_errors,  # For the text summary
-                    'row_errors': row_errors,  # For the detailed table
-                    'user_email': user.email,
-                }
-                logger.warning(f"Import validation failed for user {user.username}: {base_errors} | {row_errors}")
-                # Send failure email if needed, then return
-                if hasattr(settings, 'EMAIL_HOST') and settings.EMAIL_HOST:
-                    send_import_error_email(user.email, f"Validation failed. Errors: {base_errors[:5]}")
-                return import_result
-
-            # 2. If dry run is successful, proceed with actual import
-            with transaction.atomic():
-                result = resource.import_data(dataset, dry_run=False, raise_errors=True)  # raise_errors=True for safety
-
-        # This part is now for a guaranteed successful import
         import_result = {
-            'success': True,
+            'success': summary['error_count'] == 0,
             'model': model_name,
-            'total_rows': len(dataset),
-            'new_records': result.totals.get('new', 0),
-            'updated_records': result.totals.get('update', 0),
-            'skipped_records': result.totals.get('skip', 0),
-            'error_count': 0,
-            'errors': [],
+            'total_rows': summary['total_rows'],
+            'new_records': summary['new'],
+            'updated_records': summary['update'],
+            'skipped_records': summary['skip'] if committed else summary['total_rows'],
+            'error_count': summary['error_count'],
+            'errors': summary['base_errors'],  # For the text summary
+            'row_errors': summary['row_errors'],  # For the detailed table
             'user_email': user.email,
         }
 
+        if not import_result['success']:
+            logger.warning(f"Import validation failed for user {user.username}: "
+                           f"{summary['failed_rows']} invalid rows, {summary['error_count']} errors")
+            if hasattr(settings, 'EMAIL_HOST') and settings.EMAIL_HOST:
+                send_import_error_email(
+                    user.email,
+                    f"{summary['failed_rows']}개 행의 오류로 가져오기를 진행하지 않았습니다. "
+                    f"Errors: {(summary['base_errors'] or summary['row_errors'])[:5]}")
+            return import_result
+
         # 성공 이메일 발송
         if hasattr(settings, 'EMAIL_HOST') and settings.EMAIL_HOST:
             send_import_success_email(user.email, import_result)
@@ -171,8 +146,8 @@ def async_import_ledger_account(self, file_path: str, user_id: int, resource_typ
         except Exception as e:
             logger.warning(f"Failed to send import error email: {e}")
 
-        # Celery 재시도 로직
-        if self.request.retries < self.max_retries:
+        # Celery 재시도 로직 (저장 커밋 후 알림 단계 오류는 재시도 시 중복 저장되므로 재시도하지 않음)
+        if not committed and self.request.retries < self.max_retries:
             countdown = 2 ** self.request.retries  # 지수 백오프
             logger.warning(
                 f"Retrying import task in {countdown} seconds (attempt {self.request.retries + 1}/{self.max_retries})")
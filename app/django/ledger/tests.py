@@ -1,3 +1,258 @@
-from django.test import TestCase
+import io
+import uuid
+from datetime import date
 
-# Create your tests here.
+from django.urls import reverse
+from openpyxl import Workbook
+from rest_framework import status
+
+from ibs.models import AccountSort
+from ledger.models import ProjectAccount, ProjectBankAccount, ProjectBankTransaction, ProjectAccountingEntry, \
+    ProjectBankBalanceSnapshot
+from ledger.resources import ProjectBankTransactionResource
+from ledger.services.account_tree import rebuild_account_tree
+from ledger.services.bank_balance import get_balances_as_of, rebuild_balance_snapshots
+from ledger.services.ledger_import import import_workbook
+from ledger.services.project_transaction import get_project_transactions
+from ledger.services.transaction_balance import verify_transaction_balances
+from payment.tests import PaymentTestCaseBase
+
+
+class AccountTreeIndexTests(PaymentTestCaseBase):
+    def setUp(self):
+        super().setUp()
+        self.group = ProjectAccount.objects.create(
+            name='분양수입', category='revenue', is_category_only=True)
+        self.child = ProjectAccount.objects.create(name='중도금', parent=self.group, direction='deposit')
+
+    def test_save_maintains_path_and_ancestors(self):
+        self.assertEqual(self.child.full_path, '분양수입 > 중도금')
+        self.assertEqual(self.child.ancestor_ids, [self.group.pk])
+        self.group.refresh_from_db()
+        self.assertEqual(self.group.computed_direction, 'deposit')
+
+        ProjectAccount.objects.create(name='환불', parent=self.group, direction='withdraw')
+        self.group.refresh_from_db()
+        self.assertEqual(self.group.get_computed_direction(), 'both')
+
+    def test_move_rebuilds_subtree_and_old_parent_direction(self):
+        leaf = ProjectAccount.objects.create(name='1차', parent=self.child, direction='deposit')
+        other = ProjectAccount.objects.create(name='기타수입', category='revenue', is_category_only=True)
+
+        self.child.parent = other
+        self.child.save()
+
+        leaf.refresh_from_db()
+        self.group.refresh_from_db()
+        other.refresh_from_db()
+        self.assertEqual(leaf.full_path, '기타수입 > 중도금 > 1차')
+        self.assertEqual(leaf.ancestor_ids, [other.pk, self.child.pk])
+        self.assertEqual(leaf.depth, 3)
+        self.assertIsNone(self.group.computed_direction)
+        self.assertEqual(other.computed_direction, 'deposit')
+
+    def test_rebuild_restores_index(self):
+        ProjectAccount.objects.update(full_path='', ancestor_ids=[], computed_direction=None)
+        rebuild_account_tree(ProjectAccount)
+
+        self.child.refresh_from_db()
+        self.group.refresh_from_db()
+        self.assertEqual(self.child.full_path, '분양수입 > 중도금')
+        self.assertEqual(self.child.ancestor_ids, [self.group.pk])
+        self.assertEqual(self.group.computed_direction, 'deposit')
+
+
+class BankBalanceSnapshotTests(PaymentTestCaseBase):
+    def setUp(self):
+        super().setUp()
+        self.deposit, _ = AccountSort.objects.get_or_create(pk=1, defaults={'name': '입금'})
+        self.withdraw, _ = AccountSort.objects.get_or_create(pk=2, defaults={'name': '출금'})
+        self.balance_account = ProjectBankAccount.objects.create(
+            project=self.project, bankcode=self.bank_code, alias_name='잔액 테스트', number='999-000')
+
+    def _transaction(self, deal_date, sort, amount):
+        return ProjectBankTransaction.objects.create(
+            project=self.project, bank_account=self.balance_account,
+            deal_date=deal_date, sort=sort, amount=amount, creator=self.user)
+
+    def _balance(self, deal_date):
+        rows = get_balances_as_of(ProjectBankBalanceSnapshot, deal_date, bank_account=self.balance_account)
+        return rows[0] if rows else None
+
+    def _snapshot_rows(self):
+        return list(ProjectBankBalanceSnapshot.objects.filter(bank_account=self.balance_account).order_by(
+            'deal_date').values_list('deal_date', 'inflow', 'outflow', 'closing_balance'))
+
+    def test_incremental_updates_match_rebuild(self):
+        first = self._transaction(date(2026, 1, 1), self.deposit, 1000)
+        second = self._transaction(date(2026, 1, 5), self.withdraw, 300)
+        self._transaction(date(2026, 1, 10), self.deposit, 500)
+
+        row = self._balance('2026-01-05')
+        self.assertEqual((row['balance'], row['date_inc'], row['date_out']), (700, 0, 300))
+        self.assertEqual(self._balance('2026-01-07')['date_out'], 0)
+        self.assertIsNone(self._balance('2025-12-31'))
+
+        first.amount = 2000
+        first.save()
+        second.deal_date = date(2026, 1, 12)
+        second.save()
+        self.assertEqual(self._balance('2026-01-10')['balance'], 2500)
+
+        second.delete()
+        self.assertEqual(self._balance('2026-01-31')['balance'], 2500)
+
+        incremental = self._snapshot_rows()
+        rebuild_balance_snapshots(ProjectBankBalanceSnapshot, ProjectBankTransaction,
+                                  bank_account_ids=[self.balance_account.pk])
+        self.assertEqual(self._snapshot_rows(), incremental)
+
+    def test_moving_transaction_between_accounts_updates_both(self):
+        moved = self._transaction(date(2026, 1, 1), self.deposit, 1000)
+        other = ProjectBankAccount.objects.create(
+            project=self.project, bankcode=self.bank_code, alias_name='이동 대상', number='999-001')
+
+        moved.bank_account = other
+        moved.save()
+        self.assertEqual(self._balance('2026-01-31'), None)
+        rows = get_balances_as_of(ProjectBankBalanceSnapshot, '2026-01-31', bank_account=other)
+        self.assertEqual(rows[0]['balance'], 1000)
+
+
+class TransactionEntryBalanceTests(PaymentTestCaseBase):
+    def test_entry_changes_maintain_balance_state(self):
+        self.bank_transaction.refresh_from_db()
+        self.assertTrue(self.bank_transaction.is_balanced)
+        self.assertEqual((self.bank_transaction.entry_total, self.bank_transaction.entry_count), (30000000, 1))
+
+        self.accounting_entry.amount = 20000000
+        self.accounting_entry.save()
+        self.bank_transaction.refresh_from_db()
+        self.assertFalse(self.bank_transaction.is_balanced)
+
+        self.bank_transaction.amount = 20000000
+        self.bank_transaction.save()
+        self.assertTrue(self.bank_transaction.is_balanced)
+
+        self.accounting_entry.delete()
+        self.bank_transaction.refresh_from_db()
+        self.assertEqual((self.bank_transaction.entry_total, self.bank_transaction.entry_count), (0, 0))
+        self.assertFalse(ProjectBankTransaction.objects.filter(is_balanced=True).exists())
+
+    def test_verify_detects_and_repairs_drift(self):
+        ProjectBankTransaction.objects.filter(pk=self.bank_transaction.pk).update(is_balanced=False, entry_total=0)
+
+        drifts = verify_transaction_balances(ProjectBankTransaction, ProjectAccountingEntry)
+        self.assertEqual([d['pk'] for d in drifts], [self.bank_transaction.pk])
+        self.assertFalse(ProjectBankTransaction.objects.get(pk=self.bank_transaction.pk).is_balanced)
+
+        verify_transaction_balances(ProjectBankTransaction, ProjectAccountingEntry, repair=True)
+        self.assertTrue(ProjectBankTransaction.objects.get(pk=self.bank_transaction.pk).is_balanced)
+        self.assertEqual(verify_transaction_balances(ProjectBankTransaction, ProjectAccountingEntry), [])
+
+
+class LedgerTransactionSearchTests(PaymentTestCaseBase):
+    def _search(self, term, **params):
+        return list(get_project_transactions({'project': self.project.pk, 'search': term, **params}))
+
+    def test_search_matches_transaction_and_entry_text(self):
+        self.assertEqual(self._search('계약금'), [self.bank_transaction])
+        self.assertEqual(self._search('길동'), [self.bank_transaction])
+        self.assertEqual(self._search('길동', account_category='expense'), [self.bank_transaction])
+        self.assertEqual(self._search('없는거래'), [])
+
+    def test_search_escapes_like_wildcards(self):
+        self.assertEqual(self._search('%'), [])
+        self.assertEqual(self._search('_'), [])
+
+
+class LedgerTransactionKeysetPaginationTests(PaymentTestCaseBase):
+    def _ids(self, response):
+        return [row['pk'] for row in response.data['results']]
+
+    def test_cursor_pages_are_stable_under_inserts(self):
+        for day in (1, 1, 2, 3):
+            ProjectBankTransaction.objects.create(
+                project=self.project, bank_account=self.project_bank_account, deal_date=date(2026, 1, day),
+                sort=self.account_sort_deposit, amount=1000, content='커서 테스트', creator=self.user)
+        expected = list(ProjectBankTransaction.objects.filter(project=self.project).order_by(
+            '-deal_date', '-id').values_list('pk', flat=True))
+
+        url = reverse('api:ledger-project-transaction-list')
+        first = self.client.get(url, {'project': self.project.pk, 'pagination': 'cursor', 'limit': 2,
+                                      'total': 'exact'})
+        self.assertEqual(first.status_code, status.HTTP_200_OK)
+        self.assertEqual(first.data['count'], 5)
+        self.assertIsNone(first.data['previous'])
+
+        # 조회 도중 최신 거래가 추가되어도 다음 페이지 경계는 밀리지 않음
+        ProjectBankTransaction.objects.create(
+            project=self.project, bank_account=self.project_bank_account, deal_date=date(2026, 2, 1),
+            sort=self.account_sort_deposit, amount=1000, creator=self.user)
+        second = self.client.get(first.data['next'])
+        third = self.client.get(second.data['next'])
+        self.assertEqual(self._ids(first) + self._ids(second) + self._ids(third), expected)
+        self.assertIsNone(third.data['next'])
+
+        previous = self.client.get(third.data['previous'])
+        self.assertEqual(self._ids(previous), self._ids(second))
+
+    def test_bank_transaction_list_switches_to_cursor_mode(self):
+        url = reverse('api:ledger-project-transaction-list')
+        paged = self.client.get(url, {'project': self.project.pk})
+        self.assertEqual(paged.data['count'], 1)
+        cursor = self.client.get(url, {'project': self.project.pk, 'pagination': 'cursor'})
+        self.assertEqual(self._ids(cursor), [self.bank_transaction.pk])
+        self.assertIsNone(cursor.data['count'])
+        self.assertEqual(self.client.get(url, {'cursor': 'invalid'}).status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_composite_transaction_viewset_has_no_list(self):
+        url = reverse('api:ledger-project-composite-transaction-list')
+        response = self.client.get(url, {'project': self.project.pk})
+        self.assertEqual(response.status_code, status.HTTP_405_METHOD_NOT_ALLOWED)
+
+
+class LedgerStreamingImportTests(PaymentTestCaseBase):
+    def _workbook(self, rows):
+        workbook = Workbook()
+        sheet = workbook.active
+        sheet.append(['id', 'transaction_id', 'project', 'bank_account', 'deal_date', 'sort', 'amount', 'content'])
+        for row in rows:
+            sheet.append(row)
+        buffer = io.BytesIO()
+        workbook.save(buffer)
+        buffer.seek(0)
+        return buffer
+
+    def _row(self, amount, content):
+        return [None, str(uuid.uuid4()), self.project.pk, self.project_bank_account.pk, '2026-03-02',
+                self.account_sort_deposit.pk, amount, content]
+
+    def test_invalid_row_blocks_whole_import_and_reports_sheet_rows(self):
+        progress = []
+        buffer = self._workbook([
+            self._row(1000, '스트리밍 1'),
+            [None] * 8,
+            self._row(2000, '스트리밍 2'),
+            self._row('잘못된 금액', '스트리밍 3'),
+        ])
+        summary = import_workbook(ProjectBankTransactionResource(), buffer, chunk_size=2,
+                                  on_progress=lambda processed, total: progress.append((processed, total)))
+
+        self.assertFalse(summary['committed'])
+        self.assertEqual((summary['total_rows'], summary['new'], summary['failed_rows']), (3, 0, 1))
+        self.assertEqual([e['row_number'] for e in summary['row_errors']], [5])
+        self.assertEqual(progress, [(3, 4), (4, 4)])
+        self.assertFalse(ProjectBankTransaction.objects.filter(content__startswith='스트리밍').exists())
+
+    def test_valid_workbook_imports_all_chunks_in_one_transaction(self):
+        completed = []
+        buffer = self._workbook([self._row(1000, '스트리밍 1'), self._row(2000, '스트리밍 2'),
+                                 self._row(3000, '스트리밍 3')])
+        summary = import_workbook(ProjectBankTransactionResource(), buffer, chunk_size=2,
+                                  on_success=lambda result: completed.append(result['new']))
+
+        self.assertTrue(summary['committed'])
+        self.assertEqual((summary['new'], summary['error_count']), (3, 0))
+        self.assertEqual(completed, [3])
+        self.assertEqual(ProjectBankTransaction.objects.filter(content__startswith='스트리밍').count(), 3)
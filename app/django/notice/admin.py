@@ -28,6 +28,6 @@ class MessageTemplateAdmin(admin.ModelAdmin):
 @admin.register(MessageSendHistory)
 class MessageSendHistoryAdmin(ImportExportMixin, admin.ModelAdmin):
     list_display = ('company_id', 'project', 'request_no', 'message_type',
-                    'sender_number', 'title', 'sent_at', 'sent_by')
-    list_filter = ('message_type', 'sent_by')
+                    'sender_number', 'title', 'sent_at', 'status', 'success_count', 'fail_count', 'sent_by')
+    list_filter = ('message_type', 'status', 'sent_by')
     search_fields = ('title', 'message_content')
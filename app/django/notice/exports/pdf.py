@@ -1,13 +1,9 @@
 from datetime import date, datetime
 
 from django.core.exceptions import ObjectDoesNotExist
-from django.core.files.storage import FileSystemStorage
 from django.db.models import Q, Sum, Max
-from django.http import HttpResponse
-from django.template.loader import render_to_string
-from django.views.generic import View
-from weasyprint import HTML
 
+from _pdf.mixins import ChunkedPdfRenderView
 from _pdf.utils import get_contract, get_due_date_per_order
 from _utils.contract_price import get_contract_payment_plan, get_contract_price
 from _utils.payment_adjustment import aggregate_installment_adjustments
@@ -17,21 +13,32 @@ from payment.models import InstallmentPaymentOrder
 TODAY = date.today()
 
 
-class PdfExportBill(View):
+class PdfExportBill(ChunkedPdfRenderView):
     """고지서 리스트"""
+    chunk_size = 30  # 백그라운드 작업 병렬 렌더링 시 청크(개별 PDF)당 계약 건수
 
-    def get(self, request):
+    def get_items(self, params):
+        return params.get('seq').split('-')  # 계약 건 ID 리스트
+
+    def get_filename(self, params):
+        contractor_list = self.get_items(params)
+        filename = params.get('filename', 'payment_bill')
+        return f'{filename}({len(contractor_list)}건)' if contractor_list else filename
+
+    def render_chunk(self, params, contractor_list, progress=None):
         """
-        :: PDF 파일 생성 함수
-        :parma request:
-        :return:
+        :: 계약 건 목록의 고지서를 하나의 PDF로 렌더링
+        :param params: 요청 파라미터 (project, date, seq, np, nl, filename)
+        :param contractor_list: 계약 건 ID 리스트
+        :param progress: 진행률 콜백 (processed, total)
+        :return pdf bytes:
         """
-        project = request.GET.get('project')  # 프로젝트 ID
-        pub_date = request.GET.get('date')
+        project = params.get('project')  # 프로젝트 ID
+        pub_date = params.get('date')
         pub_date = datetime.strptime(pub_date, '%Y-%m-%d').date() if pub_date else TODAY
         bill_info = SalesBillIssue.objects.get(project=project)
-        np = True if request.GET.get('np') else False
-        nl = True if request.GET.get('nl') else False
+        np = True if params.get('np') else False
+        nl = True if params.get('nl') else False
 
         context = {
             'pub_date': pub_date,
@@ -40,27 +47,20 @@ class PdfExportBill(View):
         payment_orders = InstallmentPaymentOrder.objects.filter(project=project)  # 전체 납부회차 리스트
         now_due_order = bill_info.now_payment_order.pay_code if bill_info.now_payment_order else 2  # 당회 납부 회차
 
-        contractor_list = request.GET.get('seq').split('-')  # 계약 건 ID 리스트
-
         # 해당 계약건에 대한 데이터 정리 --------------------------------------- start
-        context['data_list'] = (self.get_bill_data(cont_id,
-                                                   payment_orders,
-                                                   now_due_order, pub_date, np, nl) for cont_id in contractor_list)
-
+        context['data_list'] = self.iter_bill_data(contractor_list, payment_orders,
+                                                   now_due_order, pub_date, np, nl, progress)
         # 해당 계약건에 대한 데이터 정리 --------------------------------------- end
 
-        html_string = render_to_string('pdf/bill_control.html', context)
-        html = HTML(string=html_string)
-        html.write_pdf(target='/tmp/mypdf.pdf')
-
-        filename = request.GET.get('filename', 'payment_bill')
-        filename = f'{filename}({len(contractor_list)}건)' if contractor_list else filename
+        return self.render_pdf('pdf/bill_control.html', context)
 
-        fs = FileSystemStorage('/tmp')
-        with fs.open('mypdf.pdf') as pdf:
-            response = HttpResponse(pdf, content_type='application/pdf')
-            response['Content-Disposition'] = f'attachment; filename="{filename}.pdf"'
-            return response
+    def iter_bill_data(self, contractor_list, payment_orders, now_due_order, pub_date, np, nl, progress=None):
+        """계약 건별 데이터를 템플릿 렌더링 시점에 순차 생성 (progress 콜백으로 진행률 보고)"""
+        total = len(contractor_list)
+        for processed, cont_id in enumerate(contractor_list, 1):
+            yield self.get_bill_data(cont_id, payment_orders, now_due_order, pub_date, np, nl)
+            if progress:
+                progress(processed, total)
 
     def get_bill_data(self, cont_id, payment_orders, now_due_order, pub_date, np, nl):
         """
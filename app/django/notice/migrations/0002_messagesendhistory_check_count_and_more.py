@@ -0,0 +1,56 @@
+# Generated by Django 6.0.7 on 2026-10-18 05:56
+
+from django.db import migrations, models
+from django.db.models import F
+
+
+def mark_existing_histories_completed(apps, schema_editor):
+    """기존 기록은 발송 성공 건만 저장되었으므로 발송 완료로 표시"""
+    MessageSendHistory = apps.get_model('notice', 'MessageSendHistory')
+    MessageSendHistory.objects.update(status='completed', success_count=F('recipient_count'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notice', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='messagesendhistory',
+            name='check_count',
+            field=models.PositiveSmallIntegerField(default=0, verbose_name='결과 조회 횟수'),
+        ),
+        migrations.AddField(
+            model_name='messagesendhistory',
+            name='checked_at',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='결과 조회 일시'),
+        ),
+        migrations.AddField(
+            model_name='messagesendhistory',
+            name='fail_count',
+            field=models.IntegerField(default=0, verbose_name='실패 건수'),
+        ),
+        migrations.AddField(
+            model_name='messagesendhistory',
+            name='result_message',
+            field=models.CharField(blank=True, max_length=255, verbose_name='결과 메시지'),
+        ),
+        migrations.AddField(
+            model_name='messagesendhistory',
+            name='status',
+            field=models.CharField(choices=[('queued', '발송 대기'), ('requested', '결과 확인 중'), ('completed', '발송 완료'), ('failed', '발송 실패')], db_index=True, default='queued', max_length=10, verbose_name='발송 상태'),
+        ),
+        migrations.AddField(
+            model_name='messagesendhistory',
+            name='success_count',
+            field=models.IntegerField(default=0, verbose_name='성공 건수'),
+        ),
+        migrations.AddField(
+            model_name='messagesendhistory',
+            name='task_id',
+            field=models.CharField(blank=True, max_length=255, verbose_name='태스크 ID'),
+        ),
+        migrations.RunPython(mark_existing_histories_completed, migrations.RunPython.noop),
+    ]
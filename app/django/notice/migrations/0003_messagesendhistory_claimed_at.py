@@ -0,0 +1,23 @@
+# Generated by Django 6.0.7 on 2026-10-18 06:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notice', '0002_messagesendhistory_check_count_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='messagesendhistory',
+            name='claimed_at',
+            field=models.DateTimeField(blank=True, help_text='발송 작업이 API 호출을 위해 대기 기록을 선점한 시각', null=True, verbose_name='발송 작업 선점 일시'),
+        ),
+        migrations.AlterField(
+            model_name='messagesendhistory',
+            name='status',
+            field=models.CharField(choices=[('queued', '발송 대기'), ('sending', '발송 중'), ('requested', '결과 확인 중'), ('completed', '발송 완료'), ('failed', '발송 실패'), ('unknown', '결과 미확인')], db_index=True, default='queued', max_length=10, verbose_name='발송 상태'),
+        ),
+    ]
@@ -86,6 +86,23 @@ class MessageTemplate(models.Model):
 
 
 class MessageSendHistory(models.Model):
+    """메시지 발송 기록 (발송 요청 접수 후 Celery 작업으로 발송 및 결과 갱신)"""
+    QUEUED = 'queued'
+    SENDING = 'sending'
+    REQUESTED = 'requested'
+    COMPLETED = 'completed'
+    FAILED = 'failed'
+    UNKNOWN = 'unknown'
+
+    STATUS_CHOICES = [
+        (QUEUED, '발송 대기'),
+        (SENDING, '발송 중'),
+        (REQUESTED, '결과 확인 중'),
+        (COMPLETED, '발송 완료'),
+        (FAILED, '발송 실패'),
+        (UNKNOWN, '결과 미확인'),
+    ]
+
     # 기본 정보
     company_id = models.CharField('조직 구분 ID', max_length=100, blank=True)
     project = models.ForeignKey('project.Project', on_delete=models.SET_NULL,
@@ -94,7 +111,6 @@ class MessageSendHistory(models.Model):
                                   help_text='iwinv API 요청번호')
 
     # 발송 정보
-    """메시지 발송 기록 (성공한 발송만 저장)"""
     MESSAGE_TYPE_CHOICES = [
         ('SMS', 'SMS'),
         ('LMS', 'LMS'),
@@ -119,6 +135,17 @@ class MessageSendHistory(models.Model):
     sent_by = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.SET_NULL,
                                 null=True, verbose_name='발송자')
 
+    # 발송 상태 (발송 작업 및 결과 조회 작업에서 갱신)
+    status = models.CharField('발송 상태', max_length=10, choices=STATUS_CHOICES, default=QUEUED, db_index=True)
+    success_count = models.IntegerField('성공 건수', default=0)
+    fail_count = models.IntegerField('실패 건수', default=0)
+    result_message = models.CharField('결과 메시지', max_length=255, blank=True)
+    task_id = models.CharField('태스크 ID', max_length=255, blank=True)
+    claimed_at = models.DateTimeField('발송 작업 선점 일시', null=True, blank=True,
+                                      help_text='발송 작업이 API 호출을 위해 대기 기록을 선점한 시각')
+    check_count = models.PositiveSmallIntegerField('결과 조회 횟수', default=0)
+    checked_at = models.DateTimeField('결과 조회 일시', null=True, blank=True)
+
     # 메타 정보
     created = models.DateTimeField('등록일', auto_now_add=True)
 
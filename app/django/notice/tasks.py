@@ -0,0 +1,410 @@
+import base64
+import logging
+from collections import defaultdict
+from datetime import datetime, timedelta
+
+from celery import shared_task
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .models import MessageSendHistory
+from .utils import IwinvSMSService
+
+logger = logging.getLogger(__name__)
+
+SMS_BATCH_SIZE = 1000  # iwinv 문자 API 1회 요청 수신자 상한
+KAKAO_BATCH_SIZE = 10000  # iwinv 알림톡 API 1회 요청 수신자 상한
+RECONCILE_DELAY = 10  # 발송 접수 후 첫 결과 조회까지 대기 (초)
+RECONCILE_MAX_DELAY = 30 * 60  # 예약 발송 결과 조회 예약 최대 지연 (초)
+RECONCILE_MAX_CHECKS = 30  # 발송 기록별 결과 조회 횟수 상한
+RECONCILE_MAX_PAGES = 200  # 조직별 전송 내역 조회 페이지 상한
+SEND_CLAIM_TIMEOUT = 40 * 60  # 발송 중 기록 정리 대기 (초) - 발송 작업 최대 실행 시간(CELERY_TASK_TIME_LIMIT) 초과
+HISTORY_PERIOD_DAYS = 90  # iwinv 전송 내역 조회 가능 기간
+RECONCILE_LOCK_KEY = 'notice:message_reconcile_scheduled:{countdown}'
+RECONCILE_LOCK_TIMEOUT = RECONCILE_DELAY  # 중복 예약 병합 구간 (초) - 대기 시간과 무관하게 고정
+
+SUCCESS_STATUS_CODES = {'0', '06', '1000'}  # 전송 성공 (SMS: 0/06, LMS/MMS: 1000)
+WAIT_STATUS_CODES = {'WAIT'}
+
+
+def _batches(recipients, size):
+    for i in range(0, len(recipients), size):
+        yield recipients[i:i + size]
+
+
+def queue_message_send(data, message_type, user, project_id=None, options=None):
+    """
+    발송 요청을 수신자 배치별 발송 기록(대기)으로 저장하고 커밋 후 발송 작업 예약
+
+    Args:
+        data: 발송 시리얼라이저 validated_data
+        message_type: SMS / LMS / AUTO / MMS / KAKAO
+        user: 발송자
+        project_id: 프로젝트 ID
+        options: 발송 작업에 그대로 전달할 API 옵션
+
+    Returns:
+        list: 생성된 MessageSendHistory 목록
+    """
+    options = dict(options or {})
+    recipients = data['recipients']
+
+    if message_type == 'KAKAO':
+        batch_size = KAKAO_BATCH_SIZE
+        title = data['template_code']
+        content = data.get('resend_content') or ''
+    else:
+        batch_size = SMS_BATCH_SIZE
+        title = data.get('title') or ''
+        content = data['message']
+        if message_type == 'AUTO':  # 90byte 이하 SMS, 초과 LMS (발송 결과로 다시 갱신)
+            options['auto'] = True
+            message_type = 'SMS' if len(content.encode('utf-8')) <= 90 else 'LMS'
+
+    schedule_datetime = None
+    schedule_date, schedule_time = data.get('schedule_date'), data.get('schedule_time')
+    if data.get('scheduled_send', False) and schedule_date and schedule_time:
+        schedule_datetime = timezone.make_aware(datetime.combine(schedule_date, schedule_time))
+
+    # 발송 일시는 결과 조회 전까지 요청(예약) 시각으로 기록
+    now = timezone.now()
+    histories = MessageSendHistory.objects.bulk_create([
+        MessageSendHistory(
+            message_type=message_type,
+            sender_number=data['sender_number'],
+            message_content=content,
+            title=title[:100],
+            recipients=batch,
+            recipient_count=len(batch),
+            sent_at=schedule_datetime or now,
+            company_id=data.get('company_id') or '',
+            project_id=project_id,
+            scheduled_send=schedule_datetime is not None,
+            schedule_datetime=schedule_datetime,
+            sent_by=user,
+        ) for batch in _batches(recipients, batch_size)
+    ])
+
+    def dispatch():
+        for history in histories:
+            send_message_task.delay(history.pk, options)
+
+    transaction.on_commit(dispatch)
+    return histories
+
+
+def encode_message_image(image_file):
+    """MMS 이미지 파일을 작업 인자(JSON)로 전달 가능한 형태로 변환"""
+    image_file.seek(0)
+    return {
+        'name': image_file.name,
+        'content': base64.b64encode(image_file.read()).decode('ascii'),
+        'content_type': getattr(image_file, 'content_type', None) or 'image/jpeg',
+    }
+
+
+def _schedule_args(history):
+    if not history.schedule_datetime:
+        return None, None
+    local = timezone.localtime(history.schedule_datetime)
+    return local.strftime('%Y-%m-%d'), local.strftime('%H:%M')
+
+
+def _send_text(service, history, options):
+    schedule_date, schedule_time = _schedule_args(history)
+    if options.get('auto'):
+        return service.send_auto_message(
+            recipients=history.recipients,
+            message=history.message_content,
+            sender_number=history.sender_number,
+            title=history.title or None,
+            schedule_date=schedule_date,
+            schedule_time=schedule_time
+        )
+    if history.message_type == 'MMS':
+        image = options['image']
+        image_file = SimpleUploadedFile(image['name'], base64.b64decode(image['content']),
+                                        content_type=image['content_type'])
+        return service.send_mms(
+            recipients=history.recipients,
+            message=history.message_content,
+            title=history.title,
+            sender_number=history.sender_number,
+            image_file=image_file,
+            schedule_date=schedule_date,
+            schedule_time=schedule_time,
+            use_v2_api=options.get('use_v2_api', True)
+        )
+    send = service.send_lms if history.message_type == 'LMS' else service.send_sms
+    kwargs = {'title': history.title} if history.message_type == 'LMS' else {}
+    return send(
+        recipients=history.recipients,
+        message=history.message_content,
+        sender_number=history.sender_number,
+        schedule_date=schedule_date,
+        schedule_time=schedule_time,
+        use_v2_api=options.get('use_v2_api', True),
+        **kwargs
+    )
+
+
+def _send_kakao(service, history, options):
+    schedule_date, schedule_time = _schedule_args(history)
+    return service.send_kakao_alimtalk(
+        recipients=history.recipients,
+        template_code=history.title,
+        sender_number=history.sender_number,
+        reserve=history.scheduled_send,
+        send_date=schedule_date,
+        send_time=schedule_time,
+        re_send=options.get('re_send', False),
+        resend_type=options.get('resend_type', 'Y'),
+        resend_title=options.get('resend_title'),
+        resend_content=history.message_content or None
+    )
+
+
+@shared_task(bind=True)
+def send_message_task(self, history_id: int, options: dict = None) -> dict:
+    """
+    발송 기록 1건(수신자 배치) 발송
+
+    iwinv API 접수 후 재시도하면 중복 발송되므로 자동 재시도하지 않는다.
+    대기 기록을 발송 중(선점 일시 기록)으로 선점한 뒤 API 를 호출하며, 작업이 중단되어 발송 중으로 남은 기록은
+    결과 조회 작업이 발송 여부 확인 불가(결과 미확인)로 정리하고 보고한다.
+    조직 구분 ID가 있는 문자 발송은 결과 조회 작업에서 발송 일시/상태를 확정한다.
+
+    Args:
+        history_id: MessageSendHistory ID
+        options: API 옵션 (auto, use_v2_api, image, re_send ...)
+
+    Returns:
+        dict: 처리 결과
+    """
+    # 대기 상태에서 선점한 작업만 발송 (중복 실행 방지)
+    updated = MessageSendHistory.objects.filter(pk=history_id, status=MessageSendHistory.QUEUED) \
+        .update(status=MessageSendHistory.SENDING, claimed_at=timezone.now(), task_id=self.request.id or '')
+    if not updated:
+        return {'success': False, 'history_id': history_id, 'error': 'not queued'}
+
+    history = MessageSendHistory.objects.get(pk=history_id)
+    options = options or {}
+    is_kakao = history.message_type == 'KAKAO'
+
+    try:
+        service = IwinvSMSService()
+        result = _send_kakao(service, history, options) if is_kakao else _send_text(service, history, options)
+    except Exception as e:
+        logger.error(f"메시지 발송 작업 실패 (history_id={history_id}): {e}")
+        result = {'resultCode': -1, 'code': -1, 'message': str(e)}
+
+    if is_kakao:
+        accepted = result.get('code') == 200
+        history.success_count = result.get('success', 0) if accepted else 0
+        history.fail_count = result.get('fail', 0) if accepted else history.recipient_count
+        history.status = MessageSendHistory.COMPLETED if accepted else MessageSendHistory.FAILED
+        message = result.get('message') or IwinvSMSService.get_kakao_error_message(result.get('code', -1))
+    else:
+        accepted = result.get('resultCode') == 0
+        history.request_no = str(result.get('requestNo') or '')
+        history.message_type = result.get('msgType') or history.message_type
+        message = result.get('message') or IwinvSMSService.get_error_message(result.get('resultCode', -1))
+        if not accepted:
+            history.status = MessageSendHistory.FAILED
+            history.fail_count = history.recipient_count
+        elif history.company_id and history.request_no:
+            history.status = MessageSendHistory.REQUESTED
+        else:  # 전송 내역 조회 불가 - 접수 성공을 발송 완료로 간주
+            history.status = MessageSendHistory.COMPLETED
+            history.success_count = history.recipient_count
+
+    history.result_message = (message or '')[:255]
+    history.save(update_fields=['request_no', 'message_type', 'status', 'success_count', 'fail_count',
+                                'result_message'])
+
+    if history.status == MessageSendHistory.REQUESTED:
+        schedule_message_reconcile(_reconcile_countdown(history))
+
+    return {'success': accepted, 'history_id': history_id, 'status': history.status}
+
+
+def _reconcile_countdown(history, now=None):
+    """예약 발송은 예약 시각 이후 결과를 조회하도록 대기 시간 계산"""
+    now = now or timezone.now()
+    if history.schedule_datetime and history.schedule_datetime > now:
+        seconds = (history.schedule_datetime - now).total_seconds() + RECONCILE_DELAY
+        return int(min(seconds, RECONCILE_MAX_DELAY))
+    return RECONCILE_DELAY
+
+
+def schedule_message_reconcile(countdown=RECONCILE_DELAY):
+    """
+    결과 조회 작업 예약 (같은 대기 시간의 예약은 병합 구간 내 1건으로 병합)
+
+    병합 잠금은 대기 시간별로 짧게 고정하여, 예약 발송의 긴 대기 시간이 이후 발송의 결과 조회 예약을 막지 않는다.
+    """
+    if cache.add(RECONCILE_LOCK_KEY.format(countdown=countdown), 1, timeout=RECONCILE_LOCK_TIMEOUT):
+        reconcile_message_send_history.apply_async(countdown=countdown)
+
+
+def _parse_send_date(value):
+    if not value:
+        return None
+    try:
+        return timezone.make_aware(datetime.strptime(value, '%Y-%m-%d %H:%M:%S'))
+    except ValueError:
+        return None
+
+
+def apply_send_history_records(history, records, now=None):
+    """
+    iwinv 전송 내역 레코드로 발송 기록의 상태/발송 일시/성공·실패 건수 갱신 (저장하지 않음)
+
+    같은 요청번호에 대기(WAIT) 레코드와 최종 상태 레코드가 함께 있을 수 있으므로
+    최종 상태 레코드가 조회되면 확정하고, 대기 레코드만 있으면 결과 확인 중으로 유지한다.
+    조회 횟수 상한까지 확정되지 않으면 결과 미확인(종료 상태)으로 전환한다.
+
+    Returns:
+        bool: 결과 조회 종료 여부 (확정 또는 결과 미확인)
+    """
+    history.check_count += 1
+    history.checked_at = now or timezone.now()
+
+    final = [item for item in records if str(item.get('sendStatusCode', '')) not in WAIT_STATUS_CODES]
+    if not final:
+        if history.check_count >= RECONCILE_MAX_CHECKS:
+            history.status = MessageSendHistory.UNKNOWN
+            history.result_message = '발송 결과 확인 횟수를 초과했습니다.'
+            logger.warning(f"메시지 발송 결과 미확인 (history_id={history.pk}, request_no={history.request_no})")
+            return True
+        return False
+
+    success = sum(1 for item in final if str(item.get('sendStatusCode')) in SUCCESS_STATUS_CODES)
+    history.success_count = success
+    history.fail_count = len(final) - success
+    history.status = MessageSendHistory.COMPLETED if success else MessageSendHistory.FAILED
+
+    sent_dates = [d for d in (_parse_send_date(item.get('sendDate')) for item in final) if d]
+    if sent_dates:
+        history.sent_at = max(sent_dates)
+
+    if not success:
+        item = final[0]
+        history.result_message = IwinvSMSService.get_send_status_message(
+            item.get('msgType', history.message_type), str(item.get('sendStatusCode')))[:255]
+    return True
+
+
+def _fetch_send_records(service, company_id, start_date, end_date, request_nos):
+    """조직 전송 내역을 페이지 단위로 조회하여 대상 요청번호별 레코드로 분류"""
+    records = defaultdict(list)
+    single = next(iter(request_nos)) if len(request_nos) == 1 else None
+    fetched = 0
+    for page in range(1, RECONCILE_MAX_PAGES + 1):
+        result = service.get_send_history(
+            company_id=company_id,
+            start_date=start_date.strftime('%Y-%m-%d'),
+            end_date=end_date.strftime('%Y-%m-%d'),
+            request_no=single,
+            page_num=page,
+            page_size=1000
+        )
+        items = (result.get('list') or []) if result.get('resultCode') == 0 else []
+        if not items:
+            break
+        for item in items:
+            request_no = str(item.get('requestNo', ''))
+            if request_no in request_nos:
+                records[request_no].append(item)
+        fetched += len(items)
+        if fetched >= int(result.get('totalCount') or 0):
+            break
+    return records
+
+
+def close_unsettled_histories(now=None):
+    """
+    더 이상 결과를 확정할 수 없는 발송 기록을 결과 미확인(종료 상태)으로 정리하고 보고
+
+    - 발송 중: 선점 후 발송 작업 최대 실행 시간이 지나도록 결과가 반영되지 않은 기록
+      (작업 중단 - API 접수 여부를 알 수 없어 중복 발송 방지를 위해 재발송하지 않음)
+    - 결과 확인 중: 조회 횟수 상한을 초과했거나 iwinv 전송 내역 조회 기간이 지난 기록
+
+    Returns:
+        int: 정리된 기록 수
+    """
+    now = now or timezone.now()
+    stale_sending = MessageSendHistory.objects.filter(
+        status=MessageSendHistory.SENDING, claimed_at__lt=now - timedelta(seconds=SEND_CLAIM_TIMEOUT))
+    expired = MessageSendHistory.objects.filter(status=MessageSendHistory.REQUESTED).filter(
+        Q(check_count__gte=RECONCILE_MAX_CHECKS) | Q(created__lt=now - timedelta(days=HISTORY_PERIOD_DAYS)))
+
+    closed = 0
+    for queryset, message in ((stale_sending, '발송 작업이 중단되어 발송 여부를 확인할 수 없습니다.'),
+                              (expired, '발송 결과 확인 기간(횟수)을 초과했습니다.')):
+        ids = list(queryset.values_list('pk', flat=True))
+        if not ids:
+            continue
+        closed += MessageSendHistory.objects.filter(pk__in=ids, status__in=[
+            MessageSendHistory.SENDING, MessageSendHistory.REQUESTED]).update(
+            status=MessageSendHistory.UNKNOWN, result_message=message, checked_at=now)
+        logger.error(f"메시지 발송 결과 미확인 처리 ({message}): history_ids={ids}")
+    return closed
+
+
+@shared_task(bind=True, ignore_result=True)
+def reconcile_message_send_history(self) -> dict:
+    """
+    결과 확인 중인 발송 기록의 실제 발송 일시/상태를 iwinv 전송 내역에서 일괄 갱신
+
+    조직 구분 ID별로 전송 내역을 한 번에 조회하고 bulk_update 로 반영한다.
+    확정할 수 없는 기록(중단된 발송 중, 조회 상한·기간 초과)은 먼저 결과 미확인으로 정리한다.
+    미확정 기록이 남아 있으면 다음 조회를 다시 예약한다.
+    """
+    now = timezone.now()
+    today = timezone.localdate(now)
+    oldest = now - timedelta(days=HISTORY_PERIOD_DAYS)
+    closed = close_unsettled_histories(now)
+    requested = MessageSendHistory.objects.filter(
+        status=MessageSendHistory.REQUESTED, check_count__lt=RECONCILE_MAX_CHECKS, created__gte=oldest
+    ).exclude(company_id='').exclude(request_no='')
+
+    pending = list(requested.filter(Q(schedule_datetime__isnull=True) | Q(schedule_datetime__lte=now)))
+    settled = 0
+
+    if pending:
+        try:
+            service = IwinvSMSService()
+        except ValueError as e:
+            logger.error(f"메시지 발송 결과 조회 불가: {e}")
+            return {'checked': 0, 'settled': 0, 'closed': closed}
+
+        by_company = defaultdict(list)
+        for history in pending:
+            by_company[history.company_id].append(history)
+
+        for company_id, histories in by_company.items():
+            start_date = max(min(timezone.localdate(h.schedule_datetime or h.created) for h in histories),
+                             today - timedelta(days=HISTORY_PERIOD_DAYS))
+            records = _fetch_send_records(service, company_id, start_date, today,
+                                          {h.request_no for h in histories})
+            for history in histories:
+                settled += apply_send_history_records(history, records.get(history.request_no, []), now)
+
+        MessageSendHistory.objects.bulk_update(
+            pending, ['status', 'sent_at', 'success_count', 'fail_count', 'result_message',
+                      'check_count', 'checked_at'])
+
+    # 미확정 기록 또는 예약 시각 대기 중인 기록이 남아 있으면 다음 조회 예약
+    if len(pending) > settled:
+        schedule_message_reconcile()
+    else:
+        upcoming = requested.filter(schedule_datetime__gt=now).order_by('schedule_datetime').first()
+        if upcoming:
+            schedule_message_reconcile(_reconcile_countdown(upcoming, now))
+
+    logger.info(f"메시지 발송 결과 조회: {len(pending)}건 조회, {settled}건 확정, {closed}건 미확인 정리")
+    return {'checked': len(pending), 'settled': settled, 'closed': closed}
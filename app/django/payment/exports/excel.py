@@ -10,9 +10,10 @@ from django.core.exceptions import ObjectDoesNotExist
 from django.db.models import Q, Sum
 
 from _excel.mixins import ExcelExportMixin, ProjectFilterMixin, AdvancedExcelMixin
+from _utils.payment_status import calculate_payment_status_by_unit_type, get_standardized_paid_by_unit_type
 from contract.models import Contract
 from ledger.models import ProjectBankAccount
-from payment.models import InstallmentPaymentOrder, ContractPayment, SalesPriceByGT, DownPayment
+from payment.models import InstallmentPaymentOrder, SalesPriceByGT, DownPayment
 from project.models import ProjectIncBudget
 
 TODAY = datetime.date.today().strftime('%Y-%m-%d')
@@ -188,7 +189,7 @@ class ExportLedgerPayments(ExcelExportMixin, ProjectFilterMixin, AdvancedExcelMi
             elif '금액' in header_name:
                 currency_columns.append(i)
 
-        for i, row in enumerate(data):
+        for i, row in enumerate(ExcelExportMixin.iterate(data)):
             for col_num, cell_data in enumerate(row):
                 # Select format based on column type
                 if col_num in date_columns:
@@ -631,20 +632,8 @@ class ExportLedgerPaymentStatus(ExcelExportMixin, ProjectFilterMixin, AdvancedEx
         worksheet.ignore_errors({'number_stored_as_text': 'B:C'})
 
         # ----------------- get_data_using_api start ----------------- #
-        # ContractPaymentStatusByUnitTypeViewSet 사용 (Ledger 기반)
-        from apiV1.views.payment import ContractPaymentStatusByUnitTypeViewSet
-
-        # Mock request 객체 생성
-        mock_request = Mock()
-        mock_request.query_params = {
-            'project': str(project.pk),
-            'date': date if date else 'null'
-        }
-
-        # API ViewSet의 list 메서드 호출
-        viewset = ContractPaymentStatusByUnitTypeViewSet()
-        response = viewset.list(mock_request)
-        api_data = response.data
+        # ContractPaymentStatusByUnitTypeViewSet과 동일한 집계 엔진 사용 (Ledger 기반)
+        api_data = calculate_payment_status_by_unit_type(project.pk, date, use_ledger_join=True)
 
         # ----------------- get_data_using_api finish ----------------- #
 
@@ -658,26 +647,11 @@ class ExportLedgerPaymentStatus(ExcelExportMixin, ProjectFilterMixin, AdvancedEx
 
         # 개별 차수×타입별 실수납 금액을 표준화된 방식으로 재계산 (Ledger 기반)
 
-        for item in api_data:
-            # 해당 차수×타입에 대한 표준화된 실수납 금액 계산 (ContractPayment 사용)
-            queryset = (
-                ContractPayment.objects
-                .filter(
-                    project=project,
-                    contract__isnull=False,
-                    contract__is_active=True,
-                    contract__order_group_id=item['order_group_id'],
-                    contract__unit_type_id=item['unit_type_id'],
-                    is_payment_mismatch=False
-                )
-            )
+        standardized_paid_map = get_standardized_paid_by_unit_type(project, date)
 
-            if date and date != 'null':
-                queryset = queryset.filter(deal_date__lte=date)
-
-            standardized_item_paid = queryset.aggregate(
-                total=Sum('accounting_entry__amount')
-            )['total'] or 0
+        for item in api_data:
+            # 해당 차수×타입에 대한 표준화된 실수납 금액 (ContractPayment 사용)
+            standardized_item_paid = standardized_paid_map.get((item['order_group_id'], item['unit_type_id']), 0)
 
             # API 데이터의 paid_amount를 표준화된 값으로 교체
             item['paid_amount'] = standardized_item_paid
@@ -819,7 +793,7 @@ class ExportLedgerOverallSummary(ExcelExportMixin, ProjectFilterMixin, AdvancedE
 
         # ----------------- get_data_using_api start ----------------- #
         # ContractPaymentOverallSummaryViewSet 사용 (Ledger 기반)
-        from apiV1.views.payment import ContractPaymentOverallSummaryViewSet, ContractPaymentStatusByUnitTypeViewSet
+        from apiV1.views.payment import ContractPaymentOverallSummaryViewSet
 
         # Mock request 객체 생성
         mock_request = Mock()
@@ -935,24 +909,13 @@ class ExportLedgerOverallSummary(ExcelExportMixin, ProjectFilterMixin, AdvancedE
         row_num += 1
         worksheet.write(row_num, 1, '계약율', center_format)
 
-        # ContractPaymentStatusByUnitTypeViewSet에서 금액 데이터 가져와서 총 계약률 계산
-        payment_status_mock_request = Mock()
-        payment_status_mock_request.query_params = {
-            'project': str(project.pk),
-            'date': date if date else 'null'
-        }
-
-        payment_status_viewset = ContractPaymentStatusByUnitTypeViewSet()
-        payment_status_response = payment_status_viewset.list(payment_status_mock_request)
-
-        total_contract_rate = 0
-        if payment_status_response.status_code == 200:
-            payment_status_data = payment_status_response.data
-            total_contract_amount = sum(item['contract_amount'] for item in payment_status_data)
-            total_sales_amount = sum(item['total_sales_amount'] for item in payment_status_data)
+        # 차수×타입별 수납 현황 집계 엔진에서 금액 데이터 가져와서 총 계약률 계산
+        payment_status_data = calculate_payment_status_by_unit_type(project.pk, date, use_ledger_join=True)
+        total_contract_amount = sum(item['contract_amount'] for item in payment_status_data)
+        total_sales_amount = sum(item['total_sales_amount'] for item in payment_status_data)
 
-            # 총 계약률 = 총 계약금액 / 총매출액 * 100
-            total_contract_rate = (total_contract_amount / total_sales_amount * 100) if total_sales_amount > 0 else 0
+        # 총 계약률 = 총 계약금액 / 총매출액 * 100
+        total_contract_rate = (total_contract_amount / total_sales_amount * 100) if total_sales_amount > 0 else 0
 
         # Use percent format from mixin
         percent_format = formats['percent']
@@ -3,12 +3,8 @@ from datetime import timedelta
 from decimal import Decimal
 
 from django.core.exceptions import ObjectDoesNotExist
-from django.core.files.storage import FileSystemStorage
-from django.http import HttpResponse
-from django.template.loader import render_to_string
-from django.views.generic import View
-from weasyprint import HTML
 
+from _pdf.mixins import PdfRenderView
 from _pdf.utils import (get_contract, get_simple_orders, get_paid)
 from _utils.contract_price import get_contract_payment_plan, get_contract_price
 from _utils.payment_adjustment import (calculate_all_installments_payment_allocation,
@@ -19,20 +15,19 @@ from payment.models import InstallmentPaymentOrder, SpecialDownPay
 TODAY = date.today()
 
 
-class PdfExportLedgerPayment(View):
+class PdfExportLedgerPayment(PdfRenderView):
     """납부 확인서 (Ledger 기반)"""
 
-    @staticmethod
-    def get(request):
+    def render(self, params, progress=None):
         context = dict()
 
         # 계약 건 객체
-        cont_id = request.GET.get('contract')
+        cont_id = params.get('contract')
         context['contract'] = contract = get_contract(cont_id)
-        context['is_calc'] = calc = True if request.GET.get('is_calc') else False  # 1 = 일반용(할인가산 포함) / '' = 확인용
+        context['is_calc'] = calc = True if params.get('is_calc') else False  # 1 = 일반용(할인가산 포함) / '' = 확인용
 
         # 발행일자
-        pub_date = request.GET.get('pub_date', None)
+        pub_date = params.get('pub_date', None)
         pub_date = datetime.strptime(pub_date, '%Y-%m-%d').date() if pub_date else TODAY
         context['pub_date'] = pub_date
 
@@ -70,18 +65,8 @@ class PdfExportLedgerPayment(View):
         context['calc_sums'] = calc_sums
         # ----------------------------------------------------------------
 
-        html_string = render_to_string('pdf/payments_by_contractor.html', context)
-
-        html = HTML(string=html_string)
-        html.write_pdf(target='/tmp/mypdf.pdf')
-
-        filename = request.GET.get('filename', 'payments_contractor')
-
-        fs = FileSystemStorage('/tmp')
-        with fs.open('mypdf.pdf') as pdf:
-            response = HttpResponse(pdf, content_type='application/pdf')
-            response['Content-Disposition'] = f'attachment; filename="{filename}.pdf"'
-            return response
+        pdf = self.render_pdf('pdf/payments_by_contractor.html', context)
+        return pdf, params.get('filename', 'payments_contractor')
 
     @staticmethod
     def get_simple_orders_from_plan(payment_plan, contract):
@@ -284,19 +269,18 @@ class PdfExportLedgerPayment(View):
         return result, cumulative, (penalty_total, discount_total, unpaid_indices)
 
 
-class PdfExportLedgerDailyLateFee(View):
+class PdfExportLedgerDailyLateFee(PdfRenderView):
     """일자별 연체료 (Ledger 기반)"""
 
-    @staticmethod
-    def get(request):
+    def render(self, params, progress=None):
         context = dict()
 
         # 계약 건 객체
-        cont_id = request.GET.get('contract')
+        cont_id = params.get('contract')
         context['contract'] = contract = get_contract(cont_id)
 
         # 발행일자
-        pub_date = request.GET.get('pub_date', None)
+        pub_date = params.get('pub_date', None)
         pub_date = datetime.strptime(pub_date, '%Y-%m-%d').date() if pub_date else TODAY
         context['pub_date'] = pub_date
 
@@ -331,18 +315,8 @@ class PdfExportLedgerDailyLateFee(View):
 
         # ----------------------------------------------------------------
 
-        html_string = render_to_string('pdf/daily_late_fee.html', context)
-
-        html = HTML(string=html_string)
-        html.write_pdf(target='/tmp/mypdf.pdf')
-
-        filename = request.GET.get('filename', 'daily_late_fee')
-
-        fs = FileSystemStorage('/tmp')
-        with fs.open('mypdf.pdf') as pdf:
-            response = HttpResponse(pdf, content_type='application/pdf')
-            response['Content-Disposition'] = f'attachment; filename="{filename}.pdf"'
-            return response
+        pdf = self.render_pdf('pdf/daily_late_fee.html', context)
+        return pdf, params.get('filename', 'daily_late_fee')
 
     @staticmethod
     def get_unpaid_summary_ledger(contract, pub_date):
@@ -496,10 +470,10 @@ class PdfExportLedgerDailyLateFee(View):
         return daily_fees
 
 
-class PdfExportLedgerCalculation(View):
+class PdfExportLedgerCalculation(PdfRenderView):
     """선납할인/연체가산 내역서 (Ledger 기반)"""
 
-    def get(self, request):
+    def render(self, params, progress=None):
         """
         Note: 이 클래스는 SpecialPaymentOrder와 SpecialDownPay를 사용하는 특수 케이스입니다.
         일반적인 InstallmentPaymentOrder와는 다른 로직을 사용하므로,
@@ -509,13 +483,13 @@ class PdfExportLedgerCalculation(View):
         """
         context = dict()
 
-        project = request.GET.get('project')  # 프로젝트 ID
+        project = params.get('project')  # 프로젝트 ID
         # 계약 건 객체
-        cont_id = request.GET.get('contract')
+        cont_id = params.get('contract')
         context['contract'] = contract = get_contract(cont_id)
 
         # 발행일자
-        pub_date = request.GET.get('pub_date', None)
+        pub_date = params.get('pub_date', None)
         pub_date = datetime.strptime(pub_date, '%Y-%m-%d').date() if pub_date else TODAY
         context['pub_date'] = pub_date
 
@@ -560,18 +534,8 @@ class PdfExportLedgerCalculation(View):
         context['calc_sums'] = calc_sums
         # ----------------------------------------------------------------
 
-        html_string = render_to_string('pdf/calculation_by_contractor.html', context)
-
-        html = HTML(string=html_string)
-        html.write_pdf(target='/tmp/mypdf.pdf')
-
-        filename = request.GET.get('filename', 'calculation_contractor')
-
-        fs = FileSystemStorage('/tmp')
-        with fs.open('mypdf.pdf') as pdf:
-            response = HttpResponse(pdf, content_type='application/pdf')
-            response['Content-Disposition'] = f'attachment; filename="{filename}.pdf"'
-            return response
+        pdf = self.render_pdf('pdf/calculation_by_contractor.html', context)
+        return pdf, params.get('filename', 'calculation_contractor')
 
     @staticmethod
     def get_down_pay(contract):
@@ -0,0 +1,109 @@
+from django.db.models.signals import post_init, post_save, post_delete, m2m_changed
+from django.dispatch import receiver
+
+from _utils.payment_amounts_cache import invalidate_payment_amounts
+from _utils.payment_summary_cache import invalidate_project_payment_summary
+from .models import InstallmentPaymentOrder, SalesPriceByGT, PaymentPerInstallment, DownPayment
+
+
+@receiver(post_save, sender=InstallmentPaymentOrder, dispatch_uid="installment_order_payment_summary_invalidation")
+@receiver(post_delete, sender=InstallmentPaymentOrder,
+          dispatch_uid="installment_order_delete_payment_summary_invalidation")
+@receiver(post_save, sender=SalesPriceByGT, dispatch_uid="sales_price_payment_summary_invalidation")
+@receiver(post_delete, sender=SalesPriceByGT, dispatch_uid="sales_price_delete_payment_summary_invalidation")
+@receiver(post_save, sender=DownPayment, dispatch_uid="down_payment_payment_summary_invalidation")
+@receiver(post_delete, sender=DownPayment, dispatch_uid="down_payment_delete_payment_summary_invalidation")
+def invalidate_project_scoped_payment_summary(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    invalidate_project_payment_summary(instance.project_id)
+
+
+@receiver(m2m_changed, sender=InstallmentPaymentOrder.excluded_order_groups.through,
+          dispatch_uid="installment_order_excluded_groups_payment_summary_invalidation")
+def invalidate_excluded_order_groups_payment_summary(sender, instance, action, **kwargs):
+    if action in ('post_add', 'post_remove', 'post_clear') and isinstance(instance, InstallmentPaymentOrder):
+        invalidate_project_payment_summary(instance.project_id)
+
+
+# ---------------------------------------------------------------------------
+# ContractPrice 회차별 납부금액 캐시 무효화 (의존성 키 범위)
+# ---------------------------------------------------------------------------
+
+_DEPENDENCY_FIELDS = {
+    InstallmentPaymentOrder: ('project_id', 'type_sort'),
+    SalesPriceByGT: ('project_id', 'order_group_id', 'unit_type_id'),
+    DownPayment: ('project_id', 'order_group_id', 'unit_type_id'),
+}
+
+
+@receiver(post_init, sender=InstallmentPaymentOrder, dispatch_uid="installment_order_dependency_snapshot")
+@receiver(post_init, sender=SalesPriceByGT, dispatch_uid="sales_price_dependency_snapshot")
+@receiver(post_init, sender=DownPayment, dispatch_uid="down_payment_dependency_snapshot")
+def snapshot_payment_dependency(sender, instance, **kwargs):
+    """로딩 시점 의존성 값 보관 (추가 조회 없음) - 타입종류/차수/타입이 바뀌면 이전 범위도 무효화"""
+    fields = _DEPENDENCY_FIELDS[sender]
+    if instance.pk and all(field in instance.__dict__ for field in fields):  # 지연 로딩(only/defer) 필드는 조회하지 않음
+        instance._previous_dependency = tuple(instance.__dict__[field] for field in fields)
+
+
+def _invalidate_dependency(sender, values, reason):
+    if sender is InstallmentPaymentOrder:
+        project_id, type_sort = values
+        invalidate_payment_amounts(project_id, reason, type_sort=type_sort)
+    else:
+        project_id, order_group_id, unit_type_id = values
+        invalidate_payment_amounts(project_id, reason, order_group_id=order_group_id, unit_type_id=unit_type_id)
+
+
+@receiver(post_save, sender=InstallmentPaymentOrder, dispatch_uid="installment_order_payment_amounts_invalidation")
+@receiver(post_delete, sender=InstallmentPaymentOrder,
+          dispatch_uid="installment_order_delete_payment_amounts_invalidation")
+@receiver(post_save, sender=SalesPriceByGT, dispatch_uid="sales_price_payment_amounts_invalidation")
+@receiver(post_delete, sender=SalesPriceByGT, dispatch_uid="sales_price_delete_payment_amounts_invalidation")
+@receiver(post_save, sender=DownPayment, dispatch_uid="down_payment_payment_amounts_invalidation")
+@receiver(post_delete, sender=DownPayment, dispatch_uid="down_payment_delete_payment_amounts_invalidation")
+def invalidate_dependent_payment_amounts(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    reason = f'{sender._meta.verbose_name} 변경'
+    current = tuple(getattr(instance, field) for field in _DEPENDENCY_FIELDS[sender])
+    _invalidate_dependency(sender, current, reason)
+
+    previous = getattr(instance, '_previous_dependency', None)
+    if previous and previous != current:
+        _invalidate_dependency(sender, previous, reason)
+    instance._previous_dependency = current
+
+
+@receiver(m2m_changed, sender=InstallmentPaymentOrder.excluded_order_groups.through,
+          dispatch_uid="installment_order_excluded_groups_payment_amounts_invalidation")
+def invalidate_excluded_order_groups_payment_amounts(sender, instance, action, pk_set=None, **kwargs):
+    if not isinstance(instance, InstallmentPaymentOrder):
+        return
+    if action == 'pre_clear':
+        # clear 이후에는 제외되었던 차수를 알 수 없으므로 미리 보관
+        instance._cleared_order_group_ids = set(instance.excluded_order_groups.values_list('pk', flat=True))
+        return
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+
+    order_group_ids = pk_set if action != 'post_clear' else getattr(instance, '_cleared_order_group_ids', set())
+    for order_group_id in order_group_ids or ():
+        invalidate_payment_amounts(instance.project_id, '납부회차 제외 차수 변경',
+                                   type_sort=instance.type_sort, order_group_id=order_group_id)
+
+
+@receiver(post_save, sender=PaymentPerInstallment, dispatch_uid="payment_per_installment_payment_summary_invalidation")
+@receiver(post_delete, sender=PaymentPerInstallment,
+          dispatch_uid="payment_per_installment_delete_payment_summary_invalidation")
+def invalidate_payment_per_installment(sender, instance, raw=False, **kwargs):
+    """회차별 납부금액 변경 - 납부 요약 캐시와 해당 차수·타입 납부금액 캐시 무효화 (부모 가격표 조회 1회)"""
+    if raw:
+        return
+    # 부모 SalesPriceByGT 연쇄 삭제 중이면 조회 결과가 없으며, 부모 삭제 시그널이 무효화를 처리
+    values = SalesPriceByGT.objects.filter(pk=instance.sales_price_id) \
+        .values_list('project_id', 'order_group_id', 'unit_type_id').first()
+    if values:
+        invalidate_project_payment_summary(values[0])
+        _invalidate_dependency(SalesPriceByGT, values, '회차별 납부금액 변경')
@@ -7,12 +7,18 @@ from rest_framework.test import APITestCase
 from rest_framework import status
 
 from company.models import Company
-from contract.models import OrderGroup, Contract, ContractPrice
+from contract.models import OrderGroup, Contract, ContractPrice, PaymentCacheRebuildJob
+from contract.tasks import rebuild_payment_amounts_task
 from items.models import UnitType, KeyUnit, HouseUnit, BuildingUnit, UnitFloorType
 from project.models import Project, ProjectIncBudget
 from work.models.project import IssueProject
+from _utils.contract_price import ProjectPaymentPlanCalculator, get_contract_payment_plan
+from _utils.payment_amounts_cache import rebuild_payment_amounts
+from _utils.payment_status import calculate_payment_status_by_unit_type
+from _utils.payment_summary_cache import get_project_generations, payment_summary_cache_key
 from ibs.models import AccountSort
 from ledger.models import ProjectAccount, ProjectBankAccount, ProjectBankTransaction, ProjectAccountingEntry, BankCode
+from ledger.services.sync_payment_contract import sync_contract_payments_for_entries
 from payment.models import (
     InstallmentPaymentOrder, SalesPriceByGT, PaymentPerInstallment,
     DownPayment, ContractPayment, OverDueRule
@@ -306,6 +312,160 @@ class ContractPaymentModelTests(PaymentTestCaseBase):
         with self.assertRaises(ValidationError):
             cp.clean()
 
+    def test_bulk_sync_creates_and_updates_contract_payments(self):
+        ContractPayment.objects.all().delete()
+        result = sync_contract_payments_for_entries([self.accounting_entry.pk],
+                                                    installment_orders={self.accounting_entry.pk: self.pay_order_down.pk})
+        self.assertEqual(result, {'created': 1, 'updated': 0})
+        cp = ContractPayment.objects.get(accounting_entry=self.accounting_entry)
+        self.assertEqual(cp.deal_date, date(2026, 1, 1))
+        self.assertEqual(cp.installment_order, self.pay_order_down)
+        self.assertEqual(cp.creator, self.user)
+
+        ProjectBankTransaction.objects.filter(pk=self.bank_transaction.pk).update(deal_date=date(2026, 1, 5))
+        result = sync_contract_payments_for_entries([self.accounting_entry.pk])
+        self.assertEqual(result, {'created': 0, 'updated': 1})
+        cp.refresh_from_db()
+        self.assertEqual(cp.deal_date, date(2026, 1, 5))
+        self.assertEqual(cp.installment_order, self.pay_order_down)
+
+
+class ProjectPaymentPlanCalculatorTests(PaymentTestCaseBase):
+    def _get_contract(self):
+        return Contract.objects.select_related(
+            'contractprice', 'order_group', 'unit_type', 'key_unit__houseunit__floor_type'
+        ).get(pk=self.contract.pk)
+
+    def test_batch_plan_matches_single_contract_plan(self):
+        expected = [(p['installment_order'].pk, p['amount'], p['source'])
+                    for p in get_contract_payment_plan(self._get_contract())]
+
+        calculator = ProjectPaymentPlanCalculator(self.project)
+        plan = calculator.get_contract_payment_plan(self._get_contract(), with_due_date=False)
+
+        self.assertEqual([(p['installment_order'].pk, p['amount'], p['source']) for p in plan], expected)
+
+    def test_remain_payment_is_price_minus_other_installments(self):
+        calculator = ProjectPaymentPlanCalculator(self.project)
+        contract = self._get_contract()
+        with self.assertNumQueries(0):
+            plan = calculator.get_contract_payment_plan(contract, with_due_date=False)
+        amounts = {p['installment_order'].pk: p['amount'] for p in plan}
+        self.assertEqual(amounts[self.pay_order_down.pk], 30000000)
+        self.assertEqual(amounts[self.pay_order_remain.pk], 270000000)
+
+
+class PaymentStatusByUnitTypeEngineTests(PaymentTestCaseBase):
+    def test_aggregates_per_order_group_and_unit_type(self):
+        results = calculate_payment_status_by_unit_type(self.project.pk, '2026-12-31', use_ledger_join=True)
+        self.assertEqual(len(results), 1)
+        item = results[0]
+        self.assertEqual(item['order_group_id'], self.order_group.pk)
+        self.assertEqual(item['unit_type_id'], self.unit_type.pk)
+        self.assertEqual(item['planned_units'], 10)
+        self.assertEqual(item['contract_units'], 1)
+        self.assertEqual(item['contract_amount'], 300000000)
+        self.assertEqual(item['paid_amount'], 30000000)
+        self.assertEqual(item['unpaid_amount'], 270000000)
+
+    def test_query_count_is_independent_of_row_count(self):
+        for i in range(2, 6):
+            order_group = OrderGroup.objects.create(project=self.project, order_number=i, sort='2', name=f'{i}차')
+            ProjectIncBudget.objects.create(
+                project=self.project,
+                account=self.project_account_payment,
+                order_group=order_group,
+                unit_type=self.unit_type,
+                quantity=1,
+                budget=300000000
+            )
+
+        with self.assertNumQueries(5):
+            results = calculate_payment_status_by_unit_type(self.project.pk, 'null')
+        self.assertEqual(len(results), 5)
+
+
+class PaymentSummaryCacheTests(PaymentTestCaseBase):
+    def test_sales_price_change_invalidates_summary_cache_key(self):
+        before = payment_summary_cache_key([self.project.pk])
+        with self.captureOnCommitCallbacks(execute=True):
+            self.sales_price.price = 310000000
+            self.sales_price.save()
+        self.assertNotEqual(before, payment_summary_cache_key([self.project.pk]))
+
+    def test_payment_per_installment_change_bumps_project_generation(self):
+        before = get_project_generations([self.project.pk])[self.project.pk]
+        with self.captureOnCommitCallbacks(execute=True):
+            PaymentPerInstallment.objects.create(
+                sales_price=self.sales_price,
+                pay_order=self.pay_order_down,
+                amount=29000000
+            )
+        self.assertNotEqual(before, get_project_generations([self.project.pk])[self.project.pk])
+
+    def test_budget_and_unit_changes_bump_project_generation(self):
+        def bumped(change):
+            before = get_project_generations([self.project.pk])[self.project.pk]
+            with self.captureOnCommitCallbacks(execute=True):
+                change()
+            return before != get_project_generations([self.project.pk])[self.project.pk]
+
+        def change_budget():
+            self.project_inc_budget.budget = 3100000000
+            self.project_inc_budget.save()
+
+        def change_floor_type():
+            self.house_unit.floor_type = None
+            self.house_unit.save()
+
+        self.assertTrue(bumped(change_budget))
+        self.assertTrue(bumped(change_floor_type))
+        self.assertTrue(bumped(self.key_unit.delete))
+
+
+class PaymentAmountsCacheTests(PaymentTestCaseBase):
+    def test_sales_price_change_invalidates_dependent_rows_and_rebuild_restores(self):
+        self.contract_price.refresh_from_db()
+        self.assertTrue(self.contract_price.is_cache_valid)
+        self.assertEqual(self.contract_price.dependency_key,
+                         f'{self.project.pk}:1:{self.order_group.pk}:{self.unit_type.pk}')
+
+        self.sales_price.price = 310000000
+        self.sales_price.save()
+        self.contract_price.refresh_from_db()
+        # 재계산 전까지 마지막 계산값을 유효한 값으로 계속 사용
+        self.assertTrue(self.contract_price.is_stale)
+        self.assertTrue(self.contract_price.is_cache_valid)
+        self.assertEqual(self.contract_price.payment_amounts, {'1': 30000000, '10': 270000000})
+
+        result = rebuild_payment_amounts(self.project)
+        self.assertEqual(result, {'total': 1, 'success': 1, 'error': 0})
+        self.contract_price.refresh_from_db()
+        self.assertFalse(self.contract_price.is_stale)
+        self.assertTrue(self.contract_price.is_cache_valid)
+        self.assertEqual(self.contract_price.price_source, 'contract')
+        self.assertEqual(self.contract_price.payment_amounts, {'1': 30000000, '10': 270000000})
+
+    def test_unrelated_order_group_change_keeps_cache(self):
+        other_group = OrderGroup.objects.create(project=self.project, order_number=2, sort='2', name='2차')
+        DownPayment.objects.create(
+            project=self.project,
+            order_group=other_group,
+            unit_type=self.unit_type,
+            payment_amount=20000000
+        )
+        self.contract_price.refresh_from_db()
+        self.assertFalse(self.contract_price.is_stale)
+
+    def test_rebuild_task_retry_reuses_scheduled_job(self):
+        job = PaymentCacheRebuildJob.objects.create(project=self.project, reason='테스트')
+        rebuild_payment_amounts_task.apply(args=[job.pk])
+        rebuild_payment_amounts_task.apply(args=[job.pk])  # 재시도·중복 실행
+
+        self.assertEqual(PaymentCacheRebuildJob.objects.filter(project=self.project).count(), 1)
+        job.refresh_from_db()
+        self.assertEqual(job.status, PaymentCacheRebuildJob.COMPLETED)
+
 
 class PaymentAPITests(PaymentTestCaseBase):
     def test_installment_order_list(self):
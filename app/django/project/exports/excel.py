@@ -197,12 +197,6 @@ class ExportSites(ExcelExportMixin, AdvancedExcelMixin):
 
         # data finish -------------------------------------------- #
 
-        # Close the workbook before sending the data.
-        workbook.close()
-
-        # Rewind the buffer.
-        output.seek(0)
-
         # Set up the Http response.
         filename = request.GET.get('filename', 'sites')
         filename = f'{filename}-{TODAY}'
@@ -389,12 +383,6 @@ class ExportSitesByOwner(ExcelExportMixin, AdvancedExcelMixin):
 
         # data finish -------------------------------------------- #
 
-        # Close the workbook before sending the data.
-        workbook.close()
-
-        # Rewind the buffer.
-        output.seek(0)
-
         # Set up the Http response.
         filename = request.GET.get('filename', 'sites-by-owner')
         filename = f'{filename}-{TODAY}'
@@ -598,12 +586,6 @@ class ExportSitesContracts(ExcelExportMixin, AdvancedExcelMixin):
 
         # data end ----------------------------------------------- #
 
-        # Close the workbook before sending the data.
-        workbook.close()
-
-        # Rewind the buffer.
-        output.seek(0)
-
         # Set up the Http response.
         filename = request.GET.get('filename', 'sites-contracts')
         filename = f'{filename}-{TODAY}'
@@ -1,8 +1,10 @@
-from django.db.models.signals import post_save, post_delete
+from django.db.models.signals import post_init, post_save, post_delete
 from django.dispatch import receiver
 
+from _utils.payment_amounts_cache import invalidate_payment_amounts
+from _utils.payment_summary_cache import invalidate_project_payment_summary
 from _utils.slack_notifications import send_slack_notification
-from .models import Site, SiteOwner, SiteContract
+from .models import Site, SiteOwner, SiteContract, ProjectIncBudget
 
 
 @receiver(post_save, sender=Site, dispatch_uid="site_slack_notification")
@@ -51,3 +53,32 @@ def notify_site_owner_delete(sender, instance, **kwargs):
 def notify_site_contract_delete(sender, instance, **kwargs):
     """SiteContract 삭제 시 Slack 알림"""
     send_slack_notification(instance, "삭제", getattr(instance, 'creator', None))
+
+
+# 예산 평균가는 가격표가 없는 (차수, 타입)의 공급가로 사용됨
+_BUDGET_PRICE_SOURCES = ('budget', 'unit_type', 'none')
+
+
+@receiver(post_init, sender=ProjectIncBudget, dispatch_uid="inc_budget_dependency_snapshot")
+def snapshot_inc_budget_dependency(sender, instance, **kwargs):
+    """로딩 시점 (차수, 타입) 보관 (추가 조회 없음)"""
+    if instance.pk and {'order_group_id', 'unit_type_id'} <= instance.__dict__.keys():  # 지연 로딩 필드는 조회하지 않음
+        instance._previous_dependency = (instance.order_group_id, instance.unit_type_id)
+
+
+@receiver(post_save, sender=ProjectIncBudget, dispatch_uid="inc_budget_payment_amounts_invalidation")
+@receiver(post_delete, sender=ProjectIncBudget, dispatch_uid="inc_budget_delete_payment_amounts_invalidation")
+def invalidate_inc_budget_payment_amounts(sender, instance, raw=False, **kwargs):
+    """ProjectIncBudget 변경 시 예산/타입 평균가 기준으로 계산된 납부금액·납부 요약 캐시 무효화"""
+    if raw:
+        return
+    invalidate_project_payment_summary(instance.project_id)
+    scopes = {(instance.order_group_id, instance.unit_type_id)}
+    previous = getattr(instance, '_previous_dependency', None)
+    if previous:
+        scopes.add(previous)
+    for order_group_id, unit_type_id in scopes:
+        if order_group_id and unit_type_id:
+            invalidate_payment_amounts(instance.project_id, '수입예산 변경', order_group_id=order_group_id,
+                                       unit_type_id=unit_type_id, price_sources=_BUDGET_PRICE_SOURCES)
+    instance._previous_dependency = (instance.order_group_id, instance.unit_type_id)
@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand
+
+from work.models.project import IssueAccess, Member
+from work.services.issue_access import refresh_issue_access, REBUILD_BATCH_SIZE
+
+
+class Command(BaseCommand):
+    help = '구성원 역할·권한으로부터 사용자별 업무 조회 범위(IssueAccess)를 재구성합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--user',
+            type=int,
+            action='append',
+            dest='users',
+            help='특정 사용자 ID만 처리 (여러 번 지정 가능)'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=REBUILD_BATCH_SIZE,
+            help=f'배치 처리 크기 (기본값: {REBUILD_BATCH_SIZE})'
+        )
+
+    def handle(self, *args, **options):
+        created = refresh_issue_access(IssueAccess, Member, user_ids=options.get('users'),
+                                       batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f'업무 조회 범위 {created}건 재구성 완료'))
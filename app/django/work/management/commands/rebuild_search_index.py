@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from work.services.search_index import INDEX_BATCH_SIZE, SEARCH_SOURCES, rebuild_search_index
+
+
+class Command(BaseCommand):
+    help = '업무·댓글·회의록·공지·문서·게시글 원본으로부터 통합 검색 색인(SearchEntry)을 재구성합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--type',
+            action='append',
+            dest='types',
+            help=f'특정 유형만 처리 (여러 번 지정 가능: {", ".join(SEARCH_SOURCES)})'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=INDEX_BATCH_SIZE,
+            help=f'배치 처리 크기 (기본값: {INDEX_BATCH_SIZE})'
+        )
+
+    def handle(self, *args, **options):
+        types = options.get('types')
+        invalid = set(types or []) - set(SEARCH_SOURCES)
+        if invalid:
+            raise CommandError(f'알 수 없는 유형: {", ".join(sorted(invalid))}')
+
+        result = rebuild_search_index(types, batch_size=options['batch_size'])
+        for object_type, indexed in result.items():
+            self.stdout.write(f'  {object_type}: {indexed}건')
+        self.stdout.write(self.style.SUCCESS(f'통합 검색 색인 {sum(result.values())}건 재구성 완료'))
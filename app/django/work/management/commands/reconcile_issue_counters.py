@@ -0,0 +1,41 @@
+from django.core.management.base import BaseCommand
+
+from work.models.issue import Issue, IssueCounter
+from work.services.issue_counter import reconcile_issue_counters, RECONCILE_BATCH_SIZE
+from work.services.project_tree import get_subtree_ids
+
+
+class Command(BaseCommand):
+    help = '업무 테이블 기준으로 업무 건수 카운터(IssueCounter)를 재집계하여 불일치 항목을 교정합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--project',
+            type=int,
+            action='append',
+            dest='projects',
+            help='특정 워크스페이스 ID(하위 포함)만 처리 (여러 번 지정 가능)'
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='교정하지 않고 불일치 항목 수만 출력'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=RECONCILE_BATCH_SIZE,
+            help=f'배치 처리 크기 (기본값: {RECONCILE_BATCH_SIZE})'
+        )
+
+    def handle(self, *args, **options):
+        project_ids = None
+        if options.get('projects'):
+            project_ids = sorted({pk for project_id in options['projects'] for pk in get_subtree_ids(project_id)})
+
+        mismatched = reconcile_issue_counters(IssueCounter, Issue, project_ids=project_ids,
+                                              dry_run=options['dry_run'], batch_size=options['batch_size'])
+        if options['dry_run']:
+            self.stdout.write(self.style.WARNING(f'업무 건수 카운터 불일치 {mismatched}건 (교정하지 않음)'))
+        else:
+            self.stdout.write(self.style.SUCCESS(f'업무 건수 카운터 불일치 {mismatched}건 교정 완료'))
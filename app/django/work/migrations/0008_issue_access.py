@@ -0,0 +1,39 @@
+# Generated by Django 6.0.7 on 2026-10-18 06:23
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+from work.services.issue_access import refresh_issue_access
+
+
+def build_issue_access(apps, schema_editor):
+    refresh_issue_access(apps.get_model('work', 'IssueAccess'), apps.get_model('work', 'Member'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('work', '0007_alter_projectbookmark_options_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='IssueAccess',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('issue_visible', models.CharField(choices=[('ALL', '모든 업무'), ('PUB', '비공개 업무 제외'), ('PRI', '직접 생성 또는 담당한 업무'), ('NOP', '없음')], default='NOP', max_length=3, verbose_name='업무 보기 권한')),
+                ('private_comment_read', models.BooleanField(default=False, verbose_name='비공개 댓글 보기')),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='issue_accesses', to='work.issueproject', verbose_name='워크스페이스')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='issue_accesses', to=settings.AUTH_USER_MODEL, verbose_name='사용자')),
+            ],
+            options={
+                'verbose_name': '05. 구성원 업무 조회 범위',
+                'verbose_name_plural': '05. 구성원 업무 조회 범위',
+                'indexes': [models.Index(fields=['user', 'issue_visible', 'project'], name='work_issue_access_idx')],
+                'constraints': [models.UniqueConstraint(fields=('user', 'project'), name='unique_issue_access')],
+            },
+        ),
+        migrations.RunPython(build_issue_access, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 6.0.7 on 2026-10-18 06:29
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+from work.services.issue_counter import reconcile_issue_counters
+
+
+def build_issue_counters(apps, schema_editor):
+    reconcile_issue_counters(apps.get_model('work', 'IssueCounter'), apps.get_model('work', 'Issue'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('work', '0008_issue_access'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='IssueCounter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('is_closed', models.BooleanField(default=False, verbose_name='완료 여부')),
+                ('assigned_to_key', models.PositiveBigIntegerField(default=0, help_text='0: 담당자 없음', verbose_name='담당자 ID')),
+                ('creator_key', models.PositiveBigIntegerField(default=0, help_text='0: 작성자 없음', verbose_name='작성자 ID')),
+                ('count', models.IntegerField(default=0, verbose_name='업무 수')),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='issue_counters', to='work.issueproject', verbose_name='워크스페이스')),
+                ('tracker', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='issue_counters', to='work.tracker', verbose_name='유형')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['assigned_to_key', 'is_closed'], name='work_issue_counter_assign_idx'), models.Index(fields=['creator_key', 'is_closed'], name='work_issue_counter_creator_idx')],
+                'constraints': [models.UniqueConstraint(fields=('project', 'tracker', 'is_closed', 'assigned_to_key', 'creator_key'), name='unique_issue_counter')],
+            },
+        ),
+        migrations.RunPython(build_issue_counters, migrations.RunPython.noop),
+    ]
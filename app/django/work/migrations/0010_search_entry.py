@@ -0,0 +1,45 @@
+# Generated by Django 6.0.7 on 2026-10-18 06:33
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('work', '0009_issue_counter'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('object_type', models.CharField(choices=[('issues', '업무'), ('comments', '업무 댓글'), ('meetings', '회의록'), ('news', '공지'), ('documents', '문서'), ('posts', '게시글')], max_length=10, verbose_name='대상 유형')),
+                ('object_id', models.PositiveBigIntegerField(verbose_name='대상 ID')),
+                ('is_private', models.BooleanField(default=False, verbose_name='비공개(비밀글)')),
+                ('is_blind', models.BooleanField(default=False, verbose_name='숨김')),
+                ('is_closed', models.BooleanField(default=False, verbose_name='완료 업무')),
+                ('title', models.CharField(blank=True, default='', max_length=255, verbose_name='제목')),
+                ('title_tokens', models.TextField(blank=True, default='', verbose_name='제목 토큰')),
+                ('body_tokens', models.TextField(blank=True, default='', verbose_name='본문 토큰')),
+                ('attach_tokens', models.TextField(blank=True, default='', verbose_name='첨부 토큰')),
+                ('search_vector', django.contrib.postgres.search.SearchVectorField(null=True, verbose_name='검색 벡터')),
+                ('updated', models.DateTimeField(blank=True, null=True, verbose_name='원본 수정일')),
+                ('indexed', models.DateTimeField(auto_now=True, verbose_name='색인일')),
+                ('creator', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='search_entries', to=settings.AUTH_USER_MODEL, verbose_name='작성자')),
+                ('issue', models.ForeignKey(blank=True, help_text='업무·업무 댓글의 (상위) 업무 - 업무 가시성 조건에 사용', null=True, on_delete=django.db.models.deletion.CASCADE, related_name='search_entries', to='work.issue', verbose_name='업무')),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='search_entries', to='work.issueproject', verbose_name='워크스페이스')),
+            ],
+            options={
+                'verbose_name': '19. 통합 검색 색인',
+                'verbose_name_plural': '19. 통합 검색 색인',
+                'indexes': [django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='work_search_entry_vector'), models.Index(fields=['project', 'object_type'], name='work_search_entry_project_idx')],
+                'constraints': [models.UniqueConstraint(fields=('object_type', 'object_id'), name='unique_search_entry')],
+            },
+        ),
+    ]
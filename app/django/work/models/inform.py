@@ -3,6 +3,7 @@ from datetime import datetime, timedelta
 from django.conf import settings
 from django.db import models
 from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 
 from _utils.file_cleanup import file_cleanup_signals
 from _utils.file_upload import get_news_file_path, populate_file_meta
@@ -169,3 +170,46 @@ class CustomQuery(models.Model):
     def __str__(self):
         scope = "공용" if self.is_public else "개인"
         return f"[{self.get_target_type_display()} - {scope}] {self.name} ({self.user.username})"
+
+
+class SearchEntry(models.Model):
+    """통합 검색 색인 (업무·댓글·회의록·공지·문서·게시글의 n-gram 토큰과 가시성 키, 원본 저장 시 Celery 로 갱신)"""
+    OBJECT_TYPE_CHOICES = (
+        ('issues', '업무'),
+        ('comments', '업무 댓글'),
+        ('meetings', '회의록'),
+        ('news', '공지'),
+        ('documents', '문서'),
+        ('posts', '게시글'),
+    )
+    object_type = models.CharField('대상 유형', max_length=10, choices=OBJECT_TYPE_CHOICES)
+    object_id = models.PositiveBigIntegerField('대상 ID')
+    project = models.ForeignKey(IssueProject, on_delete=models.CASCADE, related_name='search_entries',
+                                verbose_name='워크스페이스')
+    issue = models.ForeignKey('work.Issue', on_delete=models.CASCADE, null=True, blank=True,
+                              related_name='search_entries', verbose_name='업무',
+                              help_text='업무·업무 댓글의 (상위) 업무 - 업무 가시성 조건에 사용')
+    creator = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, blank=True,
+                                related_name='search_entries', verbose_name='작성자')
+    is_private = models.BooleanField('비공개(비밀글)', default=False)
+    is_blind = models.BooleanField('숨김', default=False)
+    is_closed = models.BooleanField('완료 업무', default=False)
+    title = models.CharField('제목', max_length=255, blank=True, default='')
+    title_tokens = models.TextField('제목 토큰', blank=True, default='')
+    body_tokens = models.TextField('본문 토큰', blank=True, default='')
+    attach_tokens = models.TextField('첨부 토큰', blank=True, default='')
+    search_vector = SearchVectorField('검색 벡터', null=True)
+    updated = models.DateTimeField('원본 수정일', null=True, blank=True)
+    indexed = models.DateTimeField('색인일', auto_now=True)
+
+    def __str__(self):
+        return f'{self.object_type}#{self.object_id} {self.title}'
+
+    class Meta:
+        verbose_name = '19. 통합 검색 색인'
+        verbose_name_plural = '19. 통합 검색 색인'
+        constraints = [models.UniqueConstraint(fields=('object_type', 'object_id'), name='unique_search_entry')]
+        indexes = [
+            GinIndex(fields=['search_vector'], name='work_search_entry_vector'),
+            models.Index(fields=['project', 'object_type'], name='work_search_entry_project_idx'),
+        ]
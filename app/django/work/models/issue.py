@@ -1,5 +1,5 @@
 from django.conf import settings
-from django.db import models
+from django.db import models, router, transaction
 from django.contrib.postgres.indexes import GinIndex
 
 from _utils.file_cleanup import file_cleanup_signals
@@ -64,6 +64,12 @@ class Issue(models.Model):
     def __str__(self):
         return f'#{self.pk}-{self.subject}'
 
+    def save(self, *args, **kwargs):
+        # 업무 건수 카운터: 변경 전 키 조회·행 잠금(pre_save)부터 증감(post_save)까지 저장과 같은 트랜잭션에서 수행
+        using = kwargs.get('using') or router.db_for_write(type(self), instance=self)
+        with transaction.atomic(using=using):
+            super().save(*args, **kwargs)
+
     class Meta:
         ordering = ('-updated', '-created')
         verbose_name = '09. 업무(작업)'
@@ -140,6 +146,30 @@ class IssueRelation(models.Model):
         return f'#{self.source.pk} ({self.source.subject}) → #{self.target.pk} ({self.target.subject})'
 
 
+class IssueCounter(models.Model):
+    """업무 건수 집계 (워크스페이스·유형·완료 여부·담당자·작성자별 비정규화 카운터, 업무 저장·삭제 시 갱신)"""
+    project = models.ForeignKey(IssueProject, on_delete=models.CASCADE, related_name='issue_counters',
+                                verbose_name='워크스페이스')
+    tracker = models.ForeignKey('Tracker', on_delete=models.CASCADE, related_name='issue_counters',
+                                verbose_name='유형')
+    is_closed = models.BooleanField('완료 여부', default=False)
+    assigned_to_key = models.PositiveBigIntegerField('담당자 ID', default=0, help_text='0: 담당자 없음')
+    creator_key = models.PositiveBigIntegerField('작성자 ID', default=0, help_text='0: 작성자 없음')
+    count = models.IntegerField('업무 수', default=0)
+
+    def __str__(self):
+        return f'{self.project_id}/{self.tracker_id} - {self.count}'
+
+    class Meta:
+        constraints = [models.UniqueConstraint(
+            fields=('project', 'tracker', 'is_closed', 'assigned_to_key', 'creator_key'),
+            name='unique_issue_counter')]
+        indexes = [
+            models.Index(fields=['assigned_to_key', 'is_closed'], name='work_issue_counter_assign_idx'),
+            models.Index(fields=['creator_key', 'is_closed'], name='work_issue_counter_creator_idx'),
+        ]
+
+
 class TrackerManager(models.Manager):
     def get_queryset(self):
         return super().get_queryset().select_related('default_status')
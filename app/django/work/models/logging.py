@@ -1,6 +1,10 @@
+from collections import defaultdict
+
 from django.conf import settings
 from django.db import models
 
+from _utils.sequence import allocate, make_scope, next_value
+
 from work.models import News
 from work.models.issue import IssueComment, Issue
 from work.models.project import IssueProject
@@ -41,22 +45,42 @@ class ActivityLogEntry(models.Model):
         indexes = [models.Index(fields=['timestamp', 'project'])]
 
 
+def _issue_log_scope(issue_id):
+    return make_scope('work.issue_log', issue_id)
+
+
 class SequentialIntegerField(models.IntegerField):
+    """업무별 일련번호 필드 - 공용 시퀀스에서 원자적으로 채번 (MAX()+1 조회 경합 방지)"""
+
     def pre_save(self, model_instance, add):
-        if add:
-            # Get the maximum value of the sequential field for the current issue
-            max_value = \
-                model_instance.__class__.objects.filter(issue=model_instance.issue).aggregate(models.Max(self.attname))[
-                    f'{self.attname}__max'
-                ]
-            # Increment the maximum value by 1 if it's not None, else start from 1
-            value = (max_value or 0) + 1
+        if add and getattr(model_instance, self.attname) is None:
+            # 업무 범위 시퀀스 최초 사용 시 기존 로그의 최대 번호부터 이어서 채번
+            model = model_instance.__class__
+            issue_id = model_instance.issue_id
+            value = next_value(_issue_log_scope(issue_id), initial=lambda: model.objects.filter(
+                issue_id=issue_id).aggregate(max_value=models.Max(self.attname))['max_value'] or 0)
             setattr(model_instance, self.attname, value)
             return value
         else:
             return super().pre_save(model_instance, add)
 
 
+class IssueLogEntryManager(models.Manager):
+    def bulk_create(self, objs, *args, **kwargs):
+        """업무별로 일련번호 블록을 한 번에 선할당한 뒤 일괄 생성"""
+        objs = list(objs)
+        pending = defaultdict(list)
+        for obj in objs:
+            if obj.log_id is None:
+                pending[obj.issue_id].append(obj)
+        for issue_id, entries in pending.items():
+            numbers = allocate(_issue_log_scope(issue_id), len(entries), initial=lambda: self.filter(
+                issue_id=issue_id).aggregate(max_value=models.Max('log_id'))['max_value'] or 0)
+            for obj, number in zip(entries, numbers):
+                obj.log_id = number
+        return super().bulk_create(objs, *args, **kwargs)
+
+
 class IssueLogEntry(models.Model):
     log_id = SequentialIntegerField()
     issue = models.ForeignKey(Issue, on_delete=models.CASCADE, verbose_name='업무')
@@ -69,6 +93,8 @@ class IssueLogEntry(models.Model):
     creator = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, blank=True,
                                 verbose_name='작성자')
 
+    objects = IssueLogEntryManager()
+
     def __str__(self):
         return f"{self.action} - {self.timestamp}"
 
@@ -3,6 +3,8 @@ from django.db import models
 from django.db.models import Q
 from tree_queries.query import TreeQuerySet
 
+from _utils.work_permission_cache import get_cached_permission_value
+
 
 class IssueProjectManager(models.Manager.from_queryset(TreeQuerySet)):
     def get_queryset(self):
@@ -129,9 +131,13 @@ class IssueProject(models.Model):
         if not hasattr(self, '_user_permission_cache'):
             self._user_permission_cache = {}
         user_key = user.pk
-        if user_key in self._user_permission_cache:
-            return self._user_permission_cache[user_key]
+        if user_key not in self._user_permission_cache:
+            self._user_permission_cache[user_key] = get_cached_permission_value(
+                user.pk, self.pk, 'permissions', lambda: self.compute_user_permissions(user))
+        return self._user_permission_cache[user_key]
 
+    def compute_user_permissions(self, user):
+        """상속 구성원·역할 권한으로부터 권한 코드 목록 계산 (캐시 미사용)"""
         permission_codes = set()
 
         # 1. 상속 가능한 상위 워크스페이스 목록 계산
@@ -166,9 +172,7 @@ class IssueProject(models.Model):
         elif self.status == '9':
             permission_codes = set()
 
-        result = list(permission_codes)
-        self._user_permission_cache[user_key] = result
-        return result
+        return sorted(permission_codes)
 
     def get_user_role_attributes(self, user):
         """
@@ -191,6 +195,17 @@ class IssueProject(models.Model):
                 'user_visible': 'ALL'
             }
 
+        return get_cached_permission_value(
+            user.pk, self.pk, 'role_attributes', lambda: self.compute_user_role_attributes(user))
+
+    def compute_user_role_attributes(self, user):
+        """상속 구성원 역할로부터 종합 역할 속성 계산 (캐시 미사용)"""
+        default_attrs = {
+            'assignable': False,
+            'issue_visible': 'NOP',
+            'user_visible': 'NOP'
+        }
+
         # 2. 상속 가능한 상위 워크스페이스 목록 계산
         projects_to_fetch = [self]
         curr = self
@@ -319,6 +334,25 @@ class Member(models.Model):
         unique_together = ('user', 'project')  # 한 워크스페이스당 한 번만 속할 수 있음
 
 
+class IssueAccess(models.Model):
+    """사용자별 업무 조회 범위 (구성원 역할·권한으로부터 계산된 비정규화 테이블, 업무/댓글 목록 가시성 필터에 사용)"""
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='issue_accesses',
+                             verbose_name='사용자')
+    project = models.ForeignKey(IssueProject, on_delete=models.CASCADE, related_name='issue_accesses',
+                                verbose_name='워크스페이스')
+    issue_visible = models.CharField('업무 보기 권한', max_length=3, choices=Role.ISSUE_VIEW_PERM, default='NOP')
+    private_comment_read = models.BooleanField('비공개 댓글 보기', default=False)
+
+    def __str__(self):
+        return f'{self.user_id} - {self.project_id} ({self.issue_visible})'
+
+    class Meta:
+        verbose_name = '05. 구성원 업무 조회 범위'
+        verbose_name_plural = '05. 구성원 업무 조회 범위'
+        constraints = [models.UniqueConstraint(fields=('user', 'project'), name='unique_issue_access')]
+        indexes = [models.Index(fields=['user', 'issue_visible', 'project'], name='work_issue_access_idx')]
+
+
 class ProjectSubscription(models.Model):
     user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, verbose_name="사용자")
     project = models.ForeignKey(IssueProject, on_delete=models.CASCADE, verbose_name="업무 워크스페이스")
@@ -351,15 +385,14 @@ class ProjectBookmark(models.Model):
 class VersionManager(models.Manager):
 
     def accessible_from(self, project):
-        ancestors = project.get_ancestors()
-        descendants = project.get_descendants()
+        from work.services.project_tree import get_ancestor_ids, get_descendant_ids, get_root_id, get_subtree_ids
 
-        ancestor_ids = ancestors.values('id')
-        descendant_ids = descendants.values('id')
+        # 트리 세대 캐시에서 상위/하위 ID 조회 (ancestors는 루트부터 정렬됨)
+        ancestor_ids = get_ancestor_ids(project.pk)
+        descendant_ids = get_descendant_ids(project.pk)
 
-        # 워크스페이스 트리의 루트를 찾습니다 (ancestors는 루트부터 정렬됨)
-        root = ancestors.first() or project
-        root_descendants = root.get_descendants(include_self=True).values('id')
+        # 워크스페이스 트리의 루트를 찾습니다
+        root_descendants = get_subtree_ids(get_root_id(project.pk))
 
         # sharing: 0:없음, 1:하위, 2:상위/하위, 3:최상위 및 모든 하위, 4:전체
         return self.filter(
@@ -0,0 +1,125 @@
+"""
+업무 조회 범위(IssueAccess) 비정규화 서비스
+
+사용자별로 업무를 볼 수 있는 워크스페이스와 수준(ALL / PUB), 비공개 댓글 열람 여부를 IssueAccess 테이블에
+저장해 두고, 업무·댓글 목록은 이 테이블 서브쿼리(semi-join)로 필터링한다. 요청마다 Member → Role →
+Permission 을 파이썬으로 순회하거나 다중 조인 후 distinct() 를 수행하지 않는다.
+
+- 구성원·구성원 역할 변경: 해당 사용자 행 재계산
+- 역할(issue_visible)·역할 권한·권한 코드 변경: 해당 역할을 가진 사용자 행 재계산
+- 워크스페이스 삭제는 FK CASCADE, 공개 여부·상태는 조회 시 워크스페이스 컬럼을 직접 사용
+- 관리 명령(rebuild_issue_access): 전체 재구성
+"""
+from django.db import transaction
+from django.db.models import Q
+
+from _utils.work_permission_cache import get_cached_global_value
+
+VISIBILITY_ORDER = {'ALL': 3, 'PUB': 2, 'PRI': 1, 'NOP': 0}
+PRIVATE_COMMENT_READ = 'issue.private_comment_read'
+NON_MEMBER_ROLE_ID = 2  # 비회원 역할
+REBUILD_BATCH_SIZE = 1000
+
+
+def resolve_role_access(roles):
+    """
+    역할 목록의 종합 업무 조회 수준·비공개 댓글 열람 여부
+
+    Returns:
+        tuple: (issue_visible, private_comment_read)
+    """
+    best_visible, private_comment_read = 'NOP', False
+    for role in roles:
+        if VISIBILITY_ORDER.get(role.issue_visible, 0) > VISIBILITY_ORDER.get(best_visible, 0):
+            best_visible = role.issue_visible
+        if any(perm.code == PRIVATE_COMMENT_READ for perm in role.permissions.all()):
+            private_comment_read = True
+    return best_visible, private_comment_read
+
+
+def refresh_issue_access(access_model, member_model, user_ids=None, batch_size=REBUILD_BATCH_SIZE):
+    """
+    사용자별 업무 조회 범위 재계산 (user_ids 미지정 시 전체 재구성)
+
+    Returns:
+        int: 생성된 조회 범위 행 수
+    """
+    members = member_model.objects.prefetch_related('roles__permissions').order_by()
+    existing = access_model.objects.all()
+    if user_ids is not None:
+        user_ids = list(set(filter(None, user_ids)))
+        if not user_ids:
+            return 0
+        members = members.filter(user_id__in=user_ids)
+        existing = existing.filter(user_id__in=user_ids)
+
+    rows = []
+    for member in members.iterator(chunk_size=batch_size):
+        issue_visible, private_comment_read = resolve_role_access(member.roles.all())
+        # 조회 범위가 넓어지는 경우만 행 저장 (PRI/NOP 은 작성·담당 업무 조건으로 처리)
+        if issue_visible in ('ALL', 'PUB') or private_comment_read:
+            rows.append(access_model(user_id=member.user_id, project_id=member.project_id,
+                                     issue_visible=issue_visible, private_comment_read=private_comment_read))
+
+    with transaction.atomic():
+        existing.delete()
+        access_model.objects.bulk_create(rows, batch_size=batch_size)
+    return len(rows)
+
+
+def refresh_users_with_roles(access_model, member_model, role_ids):
+    """역할을 가진 구성원 사용자들의 조회 범위 재계산"""
+    user_ids = member_model.objects.filter(roles__in=role_ids).values_list('user_id', flat=True).distinct()
+    return refresh_issue_access(access_model, member_model, list(user_ids))
+
+
+def get_non_member_access():
+    """
+    비회원 역할(공개 워크스페이스 기본 권한)의 업무 조회 수준·비공개 댓글 열람 여부 (권한 캐시 사용)
+
+    Returns:
+        tuple: (issue_visible, private_comment_read)
+    """
+    def compute():
+        from work.models.project import Role
+        role = Role.objects.prefetch_related('permissions').filter(pk=NON_MEMBER_ROLE_ID).first()
+        return resolve_role_access([role]) if role else ('NOP', False)
+
+    return tuple(get_cached_global_value('non_member_access', compute))
+
+
+def visible_issue_q(user, prefix='', include_member_pub=False):
+    """
+    사용자가 볼 수 있는 업무 조건 (prefix 로 관계 경로 지정, 예: 'issue__')
+
+    작성·담당 업무 + 조회 범위 ALL 워크스페이스 전체 + 비회원 역할 기준 공개 워크스페이스
+    (include_member_pub: 조회 범위 PUB 워크스페이스의 공개 업무 포함 - 업무 댓글 목록 기준)
+    """
+    from work.models.project import IssueAccess
+    accesses = IssueAccess.objects.filter(user_id=user.pk)
+
+    q = Q(**{f'{prefix}creator_id': user.pk}) | Q(**{f'{prefix}assigned_to_id': user.pk})
+    q |= Q(**{f'{prefix}project_id__in': accesses.filter(issue_visible='ALL').values('project_id')})
+    if include_member_pub:
+        q |= Q(**{f'{prefix}project_id__in': accesses.filter(issue_visible='PUB').values('project_id'),
+                  f'{prefix}is_private': False})
+
+    non_member_visible, _ = get_non_member_access()
+    if non_member_visible == 'ALL':
+        q |= Q(**{f'{prefix}project__is_public': True})
+    elif non_member_visible == 'PUB':
+        q |= Q(**{f'{prefix}project__is_public': True, f'{prefix}is_private': False})
+    return q
+
+
+def visible_comment_q(user):
+    """사용자가 볼 수 있는 업무 댓글 조건 (부모 업무 가시성 + 비공개 댓글 열람 권한)"""
+    from work.models.project import IssueAccess
+    comment_q = Q(is_private=False) | Q(creator_id=user.pk)
+    comment_q |= Q(issue__project_id__in=IssueAccess.objects.filter(
+        user_id=user.pk, private_comment_read=True).values('project_id'))
+
+    _, non_member_private_read = get_non_member_access()
+    if non_member_private_read:
+        comment_q |= Q(issue__project__is_public=True)
+    return visible_issue_q(user, prefix='issue__', include_member_pub=True) & comment_q
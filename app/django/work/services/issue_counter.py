@@ -0,0 +1,148 @@
+"""
+업무 건수 카운터(IssueCounter) 비정규화 서비스
+
+(워크스페이스, 유형, 완료 여부, 담당자, 작성자) 조합별 업무 수를 카운터 테이블에 유지하고,
+유형별 업무 집계·사용자별 업무 현황(내 페이지)은 Issue 테이블 COUNT 대신 카운터 합계를 조회한다.
+
+- 업무 생성·수정(이동·완료·담당 변경)·삭제: 변경 전/후 키 카운터를 같은 트랜잭션에서 -1/+1
+  (Issue.save·삭제는 트랜잭션 안에서 실행되며 변경 전 업무 행을 잠가 동시 저장 시 같은 변경 전 키의 중복 차감 방지)
+- 카운터 증감은 단일 UPDATE(count = count ± 1) 원자 연산 (_utils.sequence.increment_counter)
+- 관리 명령(reconcile_issue_counters): Issue 테이블 기준 재집계 후 불일치 카운터 교정
+"""
+from collections import defaultdict
+
+from django.db import router, transaction
+from django.db.models import BooleanField, Count, ExpressionWrapper, Q, Sum
+
+from _utils.sequence import increment_counter
+
+RECONCILE_BATCH_SIZE = 1000
+
+_ISSUE_KEY_FIELDS = ('project_id', 'tracker_id', 'closed', 'assigned_to_id', 'creator_id')
+
+
+def counter_key(project_id, tracker_id, closed, assigned_to_id, creator_id):
+    """카운터 키 (project_id, tracker_id, is_closed, assigned_to_key, creator_key)"""
+    return project_id, tracker_id, closed is not None, assigned_to_id or 0, creator_id or 0
+
+
+def issue_counter_key(issue):
+    """업무 인스턴스의 현재 카운터 키"""
+    return counter_key(*(getattr(issue, field) for field in _ISSUE_KEY_FIELDS))
+
+
+def load_counter_key(issue_model, issue_pk):
+    """DB 에 저장된 업무의 카운터 키 (없으면 None)"""
+    using = router.db_for_write(issue_model)  # 복제 지연과 무관하게 primary 에서 조회
+    issues = issue_model._base_manager.using(using).filter(pk=issue_pk)
+    if transaction.get_connection(using).in_atomic_block:
+        # 같은 업무 동시 수정 시 변경 전 키를 중복 차감하지 않도록 트랜잭션 종료까지 업무 행 잠금
+        issues = issues.select_for_update()
+    row = issues.values_list(*_ISSUE_KEY_FIELDS).first()
+    return counter_key(*row) if row else None
+
+
+def _key_filters(key):
+    project_id, tracker_id, is_closed, assigned_to_key, creator_key = key
+    return {'project_id': project_id, 'tracker_id': tracker_id, 'is_closed': is_closed,
+            'assigned_to_key': assigned_to_key, 'creator_key': creator_key}
+
+
+def apply_counter_change(old_key, new_key):
+    """변경 전 키 카운터 -1, 변경 후 키 카운터 +1 (키가 같으면 변경 없음)"""
+    if old_key == new_key:
+        return
+    from work.models.issue import IssueCounter
+    with transaction.atomic():
+        if old_key:
+            increment_counter(IssueCounter, _key_filters(old_key), 'count', -1)
+        if new_key:
+            increment_counter(IssueCounter, _key_filters(new_key), 'count', 1)
+
+
+def count_by_tracker(project_ids=None):
+    """
+    유형별 진행·완료 업무 수
+
+    Returns:
+        dict: {(tracker_id, is_closed): 업무 수}
+    """
+    from work.models.issue import IssueCounter
+    counters = IssueCounter.objects.all()
+    if project_ids is not None:
+        counters = counters.filter(project_id__in=project_ids)
+    rows = counters.values('tracker_id', 'is_closed').annotate(total=Sum('count')).order_by()
+    return {(row['tracker_id'], row['is_closed']): row['total'] for row in rows}
+
+
+def count_by_user(user_id, exclude_project_status='9'):
+    """
+    사용자 담당·작성 업무의 진행·완료 수 (사용 안 함 상태 워크스페이스 제외)
+
+    Returns:
+        dict: {'charged': {is_closed: 업무 수}, 'created': {is_closed: 업무 수}}
+    """
+    from work.models.issue import IssueCounter
+    counters = IssueCounter.objects.exclude(project__status=exclude_project_status)
+    result = {}
+    for name, field in (('charged', 'assigned_to_key'), ('created', 'creator_key')):
+        rows = counters.filter(**{field: user_id}).values('is_closed').annotate(total=Sum('count')).order_by()
+        result[name] = defaultdict(int, {row['is_closed']: row['total'] for row in rows})
+    return result
+
+
+def _collect_counts(counter_model, issue_model, project_ids):
+    """Issue 테이블 기준 기대 카운터와 현재 카운터 (키별 합계)"""
+    issues = issue_model._base_manager.order_by()
+    counters = counter_model.objects.order_by()
+    if project_ids is not None:
+        issues = issues.filter(project_id__in=project_ids)
+        counters = counters.filter(project_id__in=project_ids)
+
+    expected = defaultdict(int)
+    rows = issues.values(
+        'project_id', 'tracker_id', 'assigned_to_id', 'creator_id',
+        is_closed=ExpressionWrapper(Q(closed__isnull=False), output_field=BooleanField()),
+    ).annotate(total=Count('id'))
+    for row in rows:
+        key = (row['project_id'], row['tracker_id'], bool(row['is_closed']),
+               row['assigned_to_id'] or 0, row['creator_id'] or 0)
+        expected[key] += row['total']
+
+    actual = defaultdict(int)
+    for *key, count in counters.values_list('project_id', 'tracker_id', 'is_closed', 'assigned_to_key',
+                                            'creator_key', 'count'):
+        actual[tuple(key)] += count
+    return expected, actual
+
+
+def reconcile_issue_counters(counter_model, issue_model, project_ids=None, dry_run=False,
+                             batch_size=RECONCILE_BATCH_SIZE):
+    """
+    Issue 테이블 기준으로 카운터 재집계 후 불일치 키 교정 (project_ids 미지정 시 전체)
+
+    Returns:
+        int: 불일치(교정 대상) 카운터 키 수
+    """
+    with transaction.atomic():
+        if not dry_run:
+            # 재집계 중 업무 저장으로 인한 카운터 변경과 경합하지 않도록 대상 카운터 행 잠금
+            locked = counter_model.objects.select_for_update()
+            if project_ids is not None:
+                locked = locked.filter(project_id__in=project_ids)
+            list(locked.values_list('pk', flat=True))
+
+        expected, actual = _collect_counts(counter_model, issue_model, project_ids)
+        mismatched = [key for key in expected.keys() | actual.keys() if expected[key] != actual[key]]
+        if dry_run or not mismatched:
+            return len(mismatched)
+
+        for start in range(0, len(mismatched), batch_size):
+            q = Q()
+            for key in mismatched[start:start + batch_size]:
+                q |= Q(**_key_filters(key))
+            counter_model.objects.filter(q).delete()
+        counter_model.objects.bulk_create(
+            [counter_model(**_key_filters(key), count=expected[key]) for key in mismatched if expected[key]],
+            batch_size=batch_size)
+    return len(mismatched)
@@ -0,0 +1,50 @@
+"""
+업무 직렬화 관계 일괄 로딩(data loader) 서비스
+
+업무 목록 한 페이지의 업무 ID 를 모아 하위 업무, 선·후행 관계, 관람자, 첨부 파일·링크를
+관계 종류별 쿼리 1회로 읽어 각 업무 인스턴스에 미리 연결해 둔다. IssueSerializer 는
+연결된 목록(LOADED_* 속성)을 사용하므로 페이지 크기·하위 업무 수와 무관하게 쿼리 수가 일정하다.
+
+- IssueViewSet.get_queryset: issue_prefetches() 로 페이지 평가 시 일괄 로딩
+- 그 외 경로(직접 생성한 인스턴스 등): load_issue_relations(instances) 로 수동 로딩
+"""
+from django.db.models import Prefetch, prefetch_related_objects
+
+LOADED_SUB_ISSUES = 'loaded_sub_issues'
+LOADED_OUTGOING_RELATIONS = 'loaded_outgoing_relations'
+
+# 중첩 업무(IssueInIssueSerializer) 표시에 필요한 관계
+NESTED_ISSUE_RELATED = ('project', 'tracker', 'status', 'assigned_to')
+
+
+def _nested_issue_queryset():
+    from work.models.issue import Issue
+    return Issue.objects.select_related(*NESTED_ISSUE_RELATED).prefetch_related('watchers')
+
+
+def issue_prefetches():
+    """업무 상세 직렬화에 필요한 관계 Prefetch 목록 (관계 종류별 쿼리 1회)"""
+    from work.models.issue import IssueFile, IssueLink, IssueRelation
+
+    def relation_queryset(side):
+        # 관계 상대편 업무를 중첩 업무 표시 형태로 함께 로딩
+        return IssueRelation.objects.select_related(
+            *[f'{side}__{name}' for name in NESTED_ISSUE_RELATED]).prefetch_related(f'{side}__watchers')
+
+    return [
+        'watchers',
+        Prefetch('files', queryset=IssueFile.objects.select_related('creator')),
+        Prefetch('links', queryset=IssueLink.objects.select_related('creator')),
+        Prefetch('issue_set', queryset=_nested_issue_queryset().order_by('id'), to_attr=LOADED_SUB_ISSUES),
+        Prefetch('outgoing_relations', queryset=relation_queryset('target').order_by('id'),
+                 to_attr=LOADED_OUTGOING_RELATIONS),
+        Prefetch('incoming_relation', queryset=relation_queryset('source')),
+    ]
+
+
+def load_issue_relations(instances):
+    """지정된 업무 목록(instances)에 대해 아직 로딩되지 않은 경우만 관계 일괄 로딩"""
+    pending = [issue for issue in instances if not hasattr(issue, LOADED_SUB_ISSUES)]
+    if pending:
+        prefetch_related_objects(pending, *issue_prefetches())
+    return instances
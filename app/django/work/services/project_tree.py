@@ -0,0 +1,116 @@
+"""
+업무 워크스페이스 트리 조회 서비스 - 트리 세대(generation) 기반 캐시
+
+특정 워크스페이스의 하위 트리(자신 + 모든 하위) / 상위 경로(루트 → 직계 상위) ID 목록을
+해당 노드에서 시작하는 재귀 CTE 한 번으로 계산하고 캐시에 보관한다.
+(TreeQuerySet.descendants 는 전체 트리 CTE 를 만든 뒤 경로로 거르므로 요청마다 전체 테이블을 순회)
+
+워크스페이스 생성·수정·삭제 시 트리 세대를 증가시켜 모든 트리 캐시를 무효화한다.
+업무 필터, 활동 로그 필터, 단계(Version) 공유 범위, 캘린더, 유형별 업무 집계가 이 서비스를 공유한다.
+"""
+import time
+
+from django.core.cache import cache
+from django.db import connection, transaction
+
+PROJECT_TREE_CACHE_TIMEOUT = 60 * 60 * 24 * 7  # 7일 (세대 키 변경으로 무효화)
+MAX_TREE_DEPTH = 100  # 상위 경로 탐색 한도 (잘못된 순환 참조 방지)
+
+_GENERATION_KEY = 'work_project_tree:generation'
+_ENTRY_KEY = 'work_project_tree:{generation}:{project_id}'
+
+SUBTREE_SQL = """
+    WITH RECURSIVE project_tree AS (
+        SELECT id FROM {table} WHERE id = %s
+        UNION
+        SELECT p.id FROM {table} p JOIN project_tree pt ON p.parent_id = pt.id
+    )
+    SELECT id FROM project_tree
+"""
+
+ANCESTORS_SQL = """
+    WITH RECURSIVE project_path AS (
+        SELECT id, parent_id, 0 AS depth FROM {table} WHERE id = %s
+        UNION ALL
+        SELECT p.id, p.parent_id, pp.depth + 1
+        FROM {table} p JOIN project_path pp ON p.id = pp.parent_id
+        WHERE pp.depth < %s
+    )
+    SELECT id FROM project_path WHERE depth > 0 ORDER BY depth DESC
+"""
+
+
+def _initial_generation():
+    # 세대 키가 유실(eviction)된 뒤 다시 생성되어도 이전 세대 값과 겹치지 않도록 시각 기반 초기값 사용
+    return int(time.time() * 1000)
+
+
+def get_tree_generation():
+    """현재 워크스페이스 트리 캐시 세대 (없으면 생성)"""
+    generation = cache.get(_GENERATION_KEY)
+    if generation is None:
+        # 동시 요청이 먼저 생성한 값이 있으면 그것을 사용
+        cache.add(_GENERATION_KEY, _initial_generation(), timeout=None)
+        generation = cache.get(_GENERATION_KEY)
+    return generation
+
+
+def bump_tree_generation():
+    """트리 세대 증가 → 모든 워크스페이스 트리 캐시 무효화"""
+    try:
+        cache.incr(_GENERATION_KEY)
+    except ValueError:
+        cache.set(_GENERATION_KEY, _initial_generation(), timeout=None)
+
+
+def invalidate_project_tree():
+    """즉시 세대 증가 + 트랜잭션 커밋 이후 한 번 더 증가 (커밋 전 트리로 재계산된 캐시 무효화)"""
+    bump_tree_generation()
+    transaction.on_commit(bump_tree_generation)
+
+
+def _fetch_ids(sql, params):
+    from work.models.project import IssueProject
+    table = connection.ops.quote_name(IssueProject._meta.db_table)
+    with connection.cursor() as cursor:
+        cursor.execute(sql.format(table=table), params)
+        return [row[0] for row in cursor.fetchall()]
+
+
+def get_project_tree(project_id):
+    """
+    워크스페이스 트리 정보 조회 (세대 캐시)
+
+    Returns:
+        dict: {'subtree': [자신 + 모든 하위 ID], 'ancestors': [루트 → 직계 상위 ID]}
+    """
+    key = _ENTRY_KEY.format(generation=get_tree_generation(), project_id=project_id)
+    tree = cache.get(key)
+    if tree is None:
+        tree = {
+            'subtree': _fetch_ids(SUBTREE_SQL, [project_id]),
+            'ancestors': _fetch_ids(ANCESTORS_SQL, [project_id, MAX_TREE_DEPTH]),
+        }
+        cache.set(key, tree, timeout=PROJECT_TREE_CACHE_TIMEOUT)
+    return tree
+
+
+def get_subtree_ids(project_id):
+    """자신과 모든 하위 워크스페이스 ID 목록"""
+    return get_project_tree(project_id)['subtree']
+
+
+def get_descendant_ids(project_id):
+    """모든 하위 워크스페이스 ID 목록 (자신 제외)"""
+    return [pk for pk in get_subtree_ids(project_id) if pk != project_id]
+
+
+def get_ancestor_ids(project_id):
+    """상위 워크스페이스 ID 목록 (루트부터, 자신 제외)"""
+    return get_project_tree(project_id)['ancestors']
+
+
+def get_root_id(project_id):
+    """트리 루트 워크스페이스 ID"""
+    ancestors = get_ancestor_ids(project_id)
+    return ancestors[0] if ancestors else project_id
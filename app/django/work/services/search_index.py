@@ -0,0 +1,443 @@
+"""
+통합 검색 색인(SearchEntry) 서비스
+
+업무·업무 댓글·회의록·공지·문서·게시글의 제목/본문/첨부 텍스트를 n-gram 토큰으로 분해해
+SearchEntry 한 테이블에 저장하고, 검색은 GIN 인덱스(tsvector) 한 번의 조회로 모든 유형을
+관련도(ts_rank) 순으로 찾는다. 유형별 icontains 전체 스캔을 수행하지 않는다.
+
+- 토큰화: 단어(문자·숫자 연속)를 2-gram 으로 분해 (한국어 조사·복합어 부분 일치 지원, 형태소 분석기 불필요)
+- 가중치: 제목 A / 본문 B / 첨부(파일명·설명·링크) C → 제목만·첨부 포함 등 검색 범위를 가중치 조건으로 처리
+- 가시성: 워크스페이스·(상위) 업무·작성자·비공개·숨김 키를 함께 저장하여 조회 조건으로 사용하고,
+  색인 갱신 전 변경(비공개·숨김 전환, 권한 변경)에 대비해 원본 테이블 기준 가시성 조건을 다시 적용
+- 갱신: 원본·첨부 저장 시 커밋 후 Celery 태스크로 일괄 재색인, 관리 명령(rebuild_search_index)으로 전체 재구성
+"""
+import re
+import threading
+from abc import ABC, abstractmethod
+from collections import defaultdict
+
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+from django.db import transaction
+from django.db.models import F, Q, Window
+from django.db.models.functions import RowNumber
+from django.utils.html import strip_tags
+
+NGRAM_SIZE = 2
+INDEX_BATCH_SIZE = 500
+SEARCH_CONFIG = 'simple'  # 언어별 어간 처리 없이 토큰 그대로 색인
+
+TITLE_WEIGHT, BODY_WEIGHT, ATTACH_WEIGHT = 'A', 'B', 'C'
+
+# attach_mode: '1' 제목+본문, '2' 제목+본문+첨부, '3' 첨부만
+ATTACH_MODE_WEIGHTS = {
+    '1': TITLE_WEIGHT + BODY_WEIGHT,
+    '2': TITLE_WEIGHT + BODY_WEIGHT + ATTACH_WEIGHT,
+    '3': ATTACH_WEIGHT,
+}
+
+_WORD_RE = re.compile(r'[^\W_]+')
+
+
+# ============================================
+# 토큰화
+# ============================================
+
+def tokenize(text, n=NGRAM_SIZE):
+    """텍스트 → n-gram 토큰 목록 (n 자 이하 단어는 그대로)"""
+    tokens = []
+    for word in _WORD_RE.findall(strip_tags(text or '').lower()):
+        if len(word) <= n:
+            tokens.append(word)
+        else:
+            tokens.extend(word[i:i + n] for i in range(len(word) - n + 1))
+    return tokens
+
+
+def query_tokens(text, n=NGRAM_SIZE):
+    """검색어 → 중복 제거한 n-gram 토큰 (다른 토큰이 있으면 1자 토큰 제외)"""
+    tokens = list(dict.fromkeys(tokenize(text, n)))
+    return [token for token in tokens if len(token) >= n] or tokens
+
+
+def _join_tokens(*texts):
+    return ' '.join(token for text in texts for token in tokenize(text))
+
+
+# ============================================
+# 색인 대상 정의
+# ============================================
+
+def _is_manager(user):
+    return user.is_superuser or getattr(user, 'work_manager', False)
+
+
+def _member_projects(user):
+    from work.models.project import Member
+    return Member.objects.filter(user_id=user.pk).values('project_id')
+
+
+class SearchSource(ABC):
+    """색인 대상 유형 (원본 조회 쿼리셋 + 색인 항목 값 + 원본 기준 가시성 조건)"""
+    object_type = None
+
+    @abstractmethod
+    def queryset(self):
+        """색인 대상 원본 쿼리셋"""
+
+    @abstractmethod
+    def entry(self, obj):
+        """원본 객체의 색인 항목 값"""
+
+    @abstractmethod
+    def visible_q(self, user):
+        """사용자가 볼 수 있는 원본 조건 (색인 가시성 조건 visible_entry_q 와 같은 규칙)"""
+
+    def visible_ids(self, user):
+        """사용자가 현재 볼 수 있는 원본 ID 서브쿼리"""
+        return self.queryset().prefetch_related(None).filter(self.visible_q(user)).values('pk')
+
+
+class IssueSource(SearchSource):
+    object_type = 'issues'
+
+    def queryset(self):
+        from work.models.issue import Issue
+        return Issue.objects.prefetch_related('files')
+
+    def entry(self, obj):
+        return {
+            'project_id': obj.project_id, 'issue_id': obj.pk, 'creator_id': obj.creator_id,
+            'is_private': obj.is_private, 'is_closed': obj.closed is not None, 'updated': obj.updated,
+            'title': obj.subject, 'title_tokens': _join_tokens(obj.subject),
+            'body_tokens': _join_tokens(obj.description),
+            'attach_tokens': _join_tokens(*[f'{f.file_name} {f.description}' for f in obj.files.all()]),
+        }
+
+    def visible_q(self, user):
+        from work.services.issue_access import visible_issue_q
+        q = ~Q(project__status='9')
+        return q if _is_manager(user) else q & visible_issue_q(user)
+
+
+class CommentSource(SearchSource):
+    object_type = 'comments'
+
+    def queryset(self):
+        from work.models.issue import IssueComment
+        return IssueComment.objects.select_related('issue')
+
+    def entry(self, obj):
+        return {
+            'project_id': obj.issue.project_id, 'issue_id': obj.issue_id, 'creator_id': obj.creator_id,
+            'is_private': obj.is_private, 'updated': obj.updated,
+            'title': obj.issue.subject, 'body_tokens': _join_tokens(obj.content),
+        }
+
+    def visible_q(self, user):
+        from work.services.issue_access import visible_comment_q
+        q = Q(issue__project__status='1')
+        if _is_manager(user):
+            return q & (Q(is_private=False) | Q(creator_id=user.pk))
+        return q & visible_comment_q(user)
+
+
+class MeetingSource(SearchSource):
+    object_type = 'meetings'
+
+    def queryset(self):
+        from work.models.meeting import Meeting
+        return Meeting.objects.prefetch_related('files')
+
+    def entry(self, obj):
+        return {
+            'project_id': obj.project_id, 'creator_id': obj.creator_id, 'updated': obj.updated,
+            'title': obj.title, 'title_tokens': _join_tokens(obj.title),
+            'body_tokens': _join_tokens(obj.agenda, obj.decisions),
+            'attach_tokens': _join_tokens(*[f'{f.file_name} {f.description}' for f in obj.files.all()]),
+        }
+
+    def visible_q(self, user):
+        if _is_manager(user):
+            return Q()
+        return Q(project__is_public=True) | Q(project_id__in=_member_projects(user))
+
+
+class NewsSource(SearchSource):
+    object_type = 'news'
+
+    def queryset(self):
+        from work.models.inform import News
+        return News.objects.prefetch_related('files')
+
+    def entry(self, obj):
+        return {
+            'project_id': obj.project_id, 'creator_id': obj.author_id, 'updated': obj.updated,
+            'title': obj.title, 'title_tokens': _join_tokens(obj.title),
+            'body_tokens': _join_tokens(obj.summary, obj.content),
+            'attach_tokens': _join_tokens(*[f'{f.file_name} {f.description}' for f in obj.files.all()]),
+        }
+
+    def visible_q(self, user):
+        if _is_manager(user):
+            return Q()
+        return Q(project__is_public=True) | Q(project_id__in=_member_projects(user))
+
+
+class DocumentSource(SearchSource):
+    object_type = 'documents'
+
+    def queryset(self):
+        # SoftDeleteManager - 휴지통 문서는 색인에서 제외
+        from docs.models import Document
+        return Document.objects.prefetch_related('files', 'images', 'links')
+
+    def entry(self, obj):
+        attachments = [f'{f.file_name} {f.description}' for f in obj.files.all()]
+        attachments += [i.image_name for i in obj.images.all()]
+        attachments += [f'{link.link} {link.description}' for link in obj.links.all()]
+        return {
+            'project_id': obj.issue_project_id, 'creator_id': obj.creator_id, 'is_private': obj.is_secret,
+            'is_blind': obj.is_blind, 'updated': obj.updated,
+            'title': obj.title, 'title_tokens': _join_tokens(obj.title),
+            'body_tokens': _join_tokens(obj.description), 'attach_tokens': _join_tokens(*attachments),
+        }
+
+    def visible_q(self, user):
+        q = Q(issue_project__status='1')
+        if _is_manager(user):
+            return q
+        return (q & Q(issue_project_id__in=_member_projects(user)) &
+                (Q(is_secret=False) | Q(creator_id=user.pk)) & Q(is_blind=False))
+
+
+class PostSource(SearchSource):
+    object_type = 'posts'
+
+    def queryset(self):
+        # 휴지통 게시글, 검색 미사용 게시판 게시글은 색인에서 제외
+        from forum.models import Post
+        return Post.objects.filter(deleted__isnull=True, forum__search_able=True).select_related(
+            'forum').prefetch_related('files', 'images')
+
+    def entry(self, obj):
+        attachments = [f.file_name for f in obj.files.all()] + [i.image_name for i in obj.images.all()]
+        return {
+            'project_id': obj.forum.project_id, 'creator_id': obj.creator_id, 'is_private': obj.is_secret,
+            'is_blind': obj.is_blind, 'updated': obj.updated,
+            'title': obj.title, 'title_tokens': _join_tokens(obj.title),
+            'body_tokens': _join_tokens(obj.content), 'attach_tokens': _join_tokens(*attachments),
+        }
+
+    def visible_q(self, user):
+        q = Q(forum__project__status='1') & Q(is_blind=False)
+        if _is_manager(user):
+            return q
+        return (q & (Q(forum__project__is_public=True) | Q(forum__project_id__in=_member_projects(user))) &
+                (Q(is_secret=False) | Q(creator_id=user.pk)))
+
+
+SEARCH_SOURCES = {source.object_type: source for source in (
+    IssueSource(), CommentSource(), MeetingSource(), NewsSource(), DocumentSource(), PostSource())}
+
+
+# ============================================
+# 색인 갱신
+# ============================================
+
+def _vector_expression():
+    return (SearchVector('title_tokens', weight=TITLE_WEIGHT, config=SEARCH_CONFIG) +
+            SearchVector('body_tokens', weight=BODY_WEIGHT, config=SEARCH_CONFIG) +
+            SearchVector('attach_tokens', weight=ATTACH_WEIGHT, config=SEARCH_CONFIG))
+
+
+def remove_search_entries(object_type, object_ids):
+    """색인 항목 삭제"""
+    from work.models.inform import SearchEntry
+    SearchEntry.objects.filter(object_type=object_type, object_id__in=list(object_ids)).delete()
+
+
+def index_objects(object_type, object_ids, batch_size=INDEX_BATCH_SIZE):
+    """
+    원본 객체 재색인 (원본이 없거나 색인 제외 대상이면 항목 삭제)
+
+    Returns:
+        int: 색인된 항목 수
+    """
+    from work.models.inform import SearchEntry
+    source = SEARCH_SOURCES[object_type]
+    object_ids = sorted(set(filter(None, object_ids)))
+    indexed = 0
+    for start in range(0, len(object_ids), batch_size):
+        batch = object_ids[start:start + batch_size]
+        entries = [SearchEntry(object_type=object_type, object_id=obj.pk, **source.entry(obj))
+                   for obj in source.queryset().filter(pk__in=batch)]
+        with transaction.atomic():
+            SearchEntry.objects.filter(object_type=object_type, object_id__in=batch).delete()
+            SearchEntry.objects.bulk_create(entries, batch_size=batch_size)
+            SearchEntry.objects.filter(object_type=object_type, object_id__in=batch).update(
+                search_vector=_vector_expression())
+        indexed += len(entries)
+    return indexed
+
+
+def rebuild_search_index(object_types=None, batch_size=INDEX_BATCH_SIZE):
+    """
+    유형별 전체 재색인
+
+    Returns:
+        dict: {object_type: 색인된 항목 수}
+    """
+    from work.models.inform import SearchEntry
+    result = {}
+    for object_type in object_types or SEARCH_SOURCES:
+        source = SEARCH_SOURCES[object_type]
+        source_ids = source.queryset().order_by().values_list('pk', flat=True)
+        # 원본에서 사라진(삭제·색인 제외) 항목 정리
+        SearchEntry.objects.filter(object_type=object_type).exclude(object_id__in=source_ids).delete()
+        result[object_type] = index_objects(object_type, list(source_ids), batch_size=batch_size)
+    return result
+
+
+_pending = threading.local()
+
+
+class _PendingIndex:
+    """한 트랜잭션(세이브포인트) 범위에서 예약된 재색인 대상 - 커밋 후 유형별 Celery 태스크 한 번으로 전달"""
+
+    def __init__(self):
+        self.items = defaultdict(set)
+
+    def dispatch(self):
+        from work.tasks import update_search_index_task
+        items, self.items = self.items, defaultdict(set)
+        for object_type, object_ids in items.items():
+            if object_ids:
+                update_search_index_task.delay(object_type, sorted(object_ids))
+
+
+def _is_scheduled(connection, batch):
+    return any(getattr(func, '__self__', None) is batch for _, func, _ in connection.run_on_commit)
+
+
+def schedule_search_index(object_type, object_ids):
+    """
+    커밋 이후 재색인 예약
+
+    같은 트랜잭션(세이브포인트) 범위에서 예약된 대상은 유형별로 모아 Celery 태스크 한 번으로 처리한다.
+    예약 묶음은 세이브포인트 경로별로 두고 해당 범위에서 커밋 콜백을 등록하므로, 롤백된 범위의 예약은
+    콜백과 함께 버려지고 다음 트랜잭션으로 넘어가지 않는다.
+    """
+    batch = _PendingIndex()
+    batch.items[object_type].update(filter(None, object_ids))
+    connection = transaction.get_connection()
+    if not connection.in_atomic_block:
+        batch.dispatch()
+        return
+
+    # 롤백·실행 완료로 커밋 콜백이 사라진 묶음 정리
+    batches = {key: pending for key, pending in getattr(_pending, 'batches', {}).items()
+               if _is_scheduled(connection, pending)}
+    key = tuple(connection.savepoint_ids)
+    if key in batches:
+        batches[key].items[object_type].update(batch.items[object_type])
+    else:
+        batches[key] = batch
+        transaction.on_commit(batch.dispatch)
+    _pending.batches = batches
+
+
+# ============================================
+# 검색
+# ============================================
+
+def build_search_query(text, weights=None):
+    """검색어 → tsquery (모든 토큰 AND, weights 지정 시 해당 가중치 위치에서만 일치)"""
+    tokens = query_tokens(text)
+    if not tokens:
+        return None
+    suffix = f':{weights}' if weights else ''
+    raw = ' & '.join(f"'{token}'{suffix}" for token in tokens)
+    return SearchQuery(raw, config=SEARCH_CONFIG, search_type='raw')
+
+
+def visible_entry_q(user):
+    """사용자가 볼 수 있는 색인 항목 조건 (유형별 기존 가시성 규칙)"""
+    from work.services.issue_access import visible_comment_q, visible_issue_q
+
+    active = Q(project__status='1')
+
+    if _is_manager(user):
+        return (Q(object_type='issues') & ~Q(project__status='9') |
+                Q(object_type='comments') & active & (Q(is_private=False) | Q(creator_id=user.pk)) |
+                Q(object_type__in=('meetings', 'news')) |
+                Q(object_type='documents') & active |
+                Q(object_type='posts') & active & Q(is_blind=False))
+
+    member_projects = _member_projects(user)
+    public_or_member = Q(project__is_public=True) | Q(project_id__in=member_projects)
+    own_or_public = Q(is_private=False) | Q(creator_id=user.pk)
+    return (Q(object_type='issues') & ~Q(project__status='9') & visible_issue_q(user, prefix='issue__') |
+            Q(object_type='comments') & active & visible_comment_q(user) |
+            Q(object_type__in=('meetings', 'news')) & public_or_member |
+            Q(object_type='documents') & active & Q(project_id__in=member_projects) & own_or_public &
+            Q(is_blind=False) |
+            Q(object_type='posts') & active & public_or_member & own_or_public & Q(is_blind=False))
+
+
+def live_visible_entry_q(user, object_types=None):
+    """원본 테이블 기준으로 현재 볼 수 있는 색인 항목 조건 (색인 갱신 전 가시성 변경 반영)"""
+    q = Q(pk__in=[])
+    for object_type, source in SEARCH_SOURCES.items():
+        if object_types is None or object_type in object_types:
+            q |= Q(object_type=object_type, object_id__in=source.visible_ids(user))
+    return q
+
+
+def search_entries(user, text, object_types=None, scope='all', slug='', title_only=False, opened_only=False,
+                   attach_mode='1'):
+    """
+    관련도 순 통합 검색 쿼리셋 (rank 주석 포함, 평가하지 않음)
+
+    Returns:
+        QuerySet | None: 검색 토큰이 없으면 None
+    """
+    from work.models.inform import SearchEntry
+
+    weights = TITLE_WEIGHT if title_only else ATTACH_MODE_WEIGHTS.get(attach_mode, ATTACH_MODE_WEIGHTS['1'])
+    query = build_search_query(text, weights)
+    if query is None:
+        return None
+
+    entries = SearchEntry.objects.filter(search_vector=query).filter(visible_entry_q(user))
+    if object_types is not None:
+        entries = entries.filter(object_type__in=object_types)
+    entries = entries.filter(live_visible_entry_q(user, object_types))
+    if opened_only:
+        entries = entries.exclude(object_type='issues', is_closed=True)
+    if scope == 'project' and slug:
+        entries = entries.filter(project__slug=slug)
+    elif scope == 'my':
+        entries = entries.filter(project_id__in=_member_projects(user))
+
+    return entries.select_related('project').defer(
+        'title_tokens', 'body_tokens', 'attach_tokens', 'search_vector',
+    ).annotate(
+        rank=SearchRank(F('search_vector'), query)).order_by('-rank', '-updated', '-pk')
+
+
+def top_entries_by_type(entries, limit=25):
+    """
+    유형별 상위 limit 개 항목 (윈도 함수로 한 번에 조회)
+
+    Returns:
+        dict: {object_type: [SearchEntry, ...]} (관련도 순)
+    """
+    ranked = entries.annotate(type_rank=Window(
+        RowNumber(), partition_by=F('object_type'),
+        order_by=[F('rank').desc(), F('updated').desc(nulls_last=True), F('pk').desc()],
+    )).filter(type_rank__lte=limit)
+
+    grouped = defaultdict(list)
+    for entry in ranked:
+        grouped[entry.object_type].append(entry)
+    return grouped
@@ -1,11 +1,19 @@
-from django.db.models.signals import pre_save, post_save, pre_delete
+from django.db.models.signals import pre_save, post_save, pre_delete, post_delete, m2m_changed
 from django.dispatch import receiver
 
-from work.models.inform import News
-from work.models.issue import Issue, IssueRelation, IssueComment
+from docs.models import Document, File as DocumentFile, Image as DocumentImage, Link as DocumentLink
+from forum.models import Forum, Post, PostFile, PostImage
+from work.models.inform import News, NewsFile
+from work.models.issue import Issue, IssueRelation, IssueComment, IssueFile
 from work.models.logging import ActivityLogEntry, IssueLogEntry
-from work.models.meeting import Meeting
+from work.models.meeting import Meeting, MeetingFile
+from work.models.project import IssueAccess, IssueProject, Member, Permission, Role
+from work.services.issue_access import PRIVATE_COMMENT_READ, refresh_issue_access
+from work.services.issue_counter import apply_counter_change, issue_counter_key, load_counter_key
+from work.services.project_tree import invalidate_project_tree
+from work.services.search_index import remove_search_entries, schedule_search_index
 from work.services.work_services import MeetingService, IssueService
+from _utils.work_permission_cache import invalidate_work_permissions
 
 
 @receiver(pre_save, sender=Meeting)
@@ -61,6 +69,28 @@ def issue_log_delete(sender, instance, **kwargs):
     ActivityLogEntry.objects.filter(issue=instance).delete()
 
 
+# ============================================
+# 업무 건수 카운터(IssueCounter) 갱신
+# ============================================
+
+@receiver(pre_save, sender=Issue)
+@receiver(pre_delete, sender=Issue)
+def issue_counter_collect(sender, instance, **kwargs):
+    # 저장·삭제 전 DB 기준 카운터 키 (신규 업무는 None)
+    instance._counter_key = load_counter_key(sender, instance.pk) if instance.pk else None
+
+
+@receiver(post_save, sender=Issue)
+def issue_counter_update(sender, instance, **kwargs):
+    apply_counter_change(getattr(instance, '_counter_key', None), issue_counter_key(instance))
+    instance._counter_key = issue_counter_key(instance)
+
+
+@receiver(post_delete, sender=Issue)
+def issue_counter_delete(sender, instance, **kwargs):
+    apply_counter_change(getattr(instance, '_counter_key', None), None)
+
+
 @receiver(post_save, sender=IssueRelation)
 def issue_relation_create(sender, instance, created, **kwargs):
     if created:
@@ -102,3 +132,178 @@ def news_log_changes(sender, instance, created, **kwargs):
 @receiver(pre_delete, sender=News)
 def news_log_delete(sender, instance, **kwargs):
     ActivityLogEntry.objects.filter(news=instance).delete()
+
+
+# 워크스페이스 권한 캐시 무효화
+@receiver(post_save, sender=Member)
+@receiver(post_delete, sender=Member)
+def member_permission_invalidate(sender, instance, **kwargs):
+    invalidate_work_permissions(instance.user_id)
+
+
+@receiver(m2m_changed, sender=Member.roles.through)
+def member_roles_permission_invalidate(sender, instance, action, reverse, **kwargs):
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    # Member.roles 변경은 해당 사용자만, Role.member_set 변경은 전체 무효화
+    invalidate_work_permissions(None if reverse else instance.user_id)
+
+
+@receiver(post_save, sender=IssueProject)
+@receiver(post_delete, sender=IssueProject)
+@receiver(post_save, sender=Role)
+@receiver(post_delete, sender=Role)
+@receiver(post_save, sender=Permission)
+@receiver(post_delete, sender=Permission)
+def work_permission_invalidate(sender, **kwargs):
+    # 워크스페이스 트리·상태·유형, 역할 속성, 권한 코드 변경은 모든 사용자에게 영향
+    invalidate_work_permissions()
+
+
+@receiver(post_save, sender=IssueProject)
+@receiver(post_delete, sender=IssueProject)
+def project_tree_invalidate(sender, **kwargs):
+    # 워크스페이스 생성·이동·삭제 시 하위/상위 트리 캐시 무효화
+    invalidate_project_tree()
+
+
+@receiver(m2m_changed, sender=Role.permissions.through)
+def role_permissions_invalidate(sender, action, **kwargs):
+    if action in ('post_add', 'post_remove', 'post_clear'):
+        invalidate_work_permissions()
+
+
+# 업무 조회 범위(IssueAccess) 갱신
+def _refresh_issue_access(user_ids):
+    refresh_issue_access(IssueAccess, Member, list(user_ids))
+
+
+def _role_user_ids(role_ids):
+    return list(Member.objects.filter(roles__in=role_ids).values_list('user_id', flat=True).distinct())
+
+
+@receiver(post_save, sender=Member)
+@receiver(post_delete, sender=Member)
+def member_issue_access_refresh(sender, instance, **kwargs):
+    _refresh_issue_access([instance.user_id])
+
+
+@receiver(m2m_changed, sender=Member.roles.through)
+def member_roles_issue_access_refresh(sender, instance, action, reverse, pk_set, **kwargs):
+    if not reverse:
+        if action in ('post_add', 'post_remove', 'post_clear'):
+            _refresh_issue_access([instance.user_id])
+    elif action == 'pre_clear':
+        instance._issue_access_user_ids = _role_user_ids([instance.pk])
+    elif action in ('post_add', 'post_remove'):
+        _refresh_issue_access(Member.objects.filter(pk__in=pk_set).values_list('user_id', flat=True))
+    elif action == 'post_clear':
+        _refresh_issue_access(getattr(instance, '_issue_access_user_ids', []))
+
+
+@receiver(post_save, sender=Role)
+def role_issue_access_refresh(sender, instance, created, **kwargs):
+    if not created:
+        _refresh_issue_access(_role_user_ids([instance.pk]))
+
+
+@receiver(pre_delete, sender=Role)
+def role_issue_access_collect(sender, instance, **kwargs):
+    instance._issue_access_user_ids = _role_user_ids([instance.pk])
+
+
+@receiver(post_delete, sender=Role)
+def role_issue_access_cleanup(sender, instance, **kwargs):
+    _refresh_issue_access(getattr(instance, '_issue_access_user_ids', []))
+
+
+@receiver(m2m_changed, sender=Role.permissions.through)
+def role_permissions_issue_access_refresh(sender, instance, action, reverse, pk_set, **kwargs):
+    # 비공개 댓글 열람 권한 변경만 조회 범위에 영향
+    role_ids = instance.roles.values('pk') if reverse else [instance.pk]
+    if action == 'pre_clear':
+        instance._issue_access_user_ids = _role_user_ids(role_ids)
+    elif action == 'post_clear':
+        _refresh_issue_access(getattr(instance, '_issue_access_user_ids', []))
+    elif action in ('post_add', 'post_remove'):
+        if reverse:
+            affected = instance.code == PRIVATE_COMMENT_READ
+            role_ids = list(pk_set)
+        else:
+            affected = Permission.objects.filter(pk__in=pk_set, code=PRIVATE_COMMENT_READ).exists()
+        if affected:
+            _refresh_issue_access(_role_user_ids(role_ids))
+
+
+@receiver(post_save, sender=Permission)
+def permission_issue_access_refresh(sender, instance, created, **kwargs):
+    if not created:
+        _refresh_issue_access(_role_user_ids(instance.roles.values('pk')))
+
+
+@receiver(pre_delete, sender=Permission)
+def permission_issue_access_collect(sender, instance, **kwargs):
+    if instance.code == PRIVATE_COMMENT_READ:
+        instance._issue_access_user_ids = _role_user_ids(instance.roles.values('pk'))
+
+
+@receiver(post_delete, sender=Permission)
+def permission_issue_access_cleanup(sender, instance, **kwargs):
+    _refresh_issue_access(getattr(instance, '_issue_access_user_ids', []))
+
+
+# ============================================
+# 통합 검색 색인(SearchEntry) 갱신
+# ============================================
+
+# 발신 모델 → (색인 유형, 색인 대상 ID 속성)
+SEARCH_INDEX_TARGETS = {
+    Issue: ('issues', 'pk'),
+    IssueFile: ('issues', 'issue_id'),
+    IssueComment: ('comments', 'pk'),
+    Meeting: ('meetings', 'pk'),
+    MeetingFile: ('meetings', 'meeting_id'),
+    News: ('news', 'pk'),
+    NewsFile: ('news', 'news_id'),
+    Document: ('documents', 'pk'),
+    DocumentFile: ('documents', 'docs_id'),
+    DocumentImage: ('documents', 'docs_id'),
+    DocumentLink: ('documents', 'docs_id'),
+    Post: ('posts', 'pk'),
+    PostFile: ('posts', 'post_id'),
+    PostImage: ('posts', 'post_id'),
+}
+
+
+def search_index_update(sender, instance, **kwargs):
+    object_type, attr = SEARCH_INDEX_TARGETS[sender]
+    schedule_search_index(object_type, [getattr(instance, attr)])
+
+
+def search_index_delete(sender, instance, **kwargs):
+    object_type, attr = SEARCH_INDEX_TARGETS[sender]
+    if attr == 'pk':
+        remove_search_entries(object_type, [instance.pk])
+    else:
+        # 첨부 삭제 → 원본 재색인
+        schedule_search_index(object_type, [getattr(instance, attr)])
+
+
+for search_sender in SEARCH_INDEX_TARGETS:
+    label = search_sender._meta.label_lower
+    post_save.connect(search_index_update, sender=search_sender, dispatch_uid=f'search_index_update:{label}')
+    post_delete.connect(search_index_delete, sender=search_sender, dispatch_uid=f'search_index_delete:{label}')
+
+
+@receiver(post_save, sender=Issue)
+def issue_comments_search_index(sender, instance, created, **kwargs):
+    # 업무 워크스페이스 이동 시 댓글 색인의 워크스페이스 키 갱신
+    if not created and hasattr(instance, 'old_project'):
+        schedule_search_index('comments', instance.comments.values_list('pk', flat=True))
+
+
+@receiver(post_save, sender=Forum)
+def forum_posts_search_index(sender, instance, created, **kwargs):
+    # 게시판 검색 사용 여부 변경 시 게시글 색인 추가·제외
+    if not created:
+        schedule_search_index('posts', Post.objects.filter(forum=instance).values_list('pk', flat=True))
@@ -212,3 +212,8 @@ def send_news_push_task(news_pk):
         print(f"❌ Async news notification task failed: {e}")
 
 
+@shared_task
+def update_search_index_task(object_type, object_ids):
+    """원본 저장·삭제 후 통합 검색 색인 일괄 갱신"""
+    from work.services.search_index import index_objects
+    return index_objects(object_type, object_ids)
@@ -1,10 +1,21 @@
 from django.contrib.auth import get_user_model
-from django.test import TestCase
+from django.db import connection
+from django.db.models.signals import pre_save
+from django.test import TestCase, RequestFactory
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 
+from apiV1.serializers.work.issue import IssueSerializer
 from company.models import Company
-from work.models.issue import Issue, Tracker, IssueStatus, CodeIssuePriority
-from work.models.project import IssueProject, Role, Member
+from work.models.issue import (Issue, Tracker, IssueStatus, CodeIssuePriority, IssueRelation, IssueCounter,
+                               IssueComment)
+from work.models.logging import IssueLogEntry
+from work.models.project import IssueProject, Role, Member, Permission, IssueAccess
+from work.services.issue_access import visible_issue_q
+from work.services.issue_counter import count_by_tracker, count_by_user, reconcile_issue_counters
+from work.services.issue_loader import issue_prefetches
+from work.services.project_tree import get_ancestor_ids, get_subtree_ids
+from work.services.search_index import index_objects, query_tokens, search_entries, top_entries_by_type
 from work.services.work_services import IssueService
 
 User = get_user_model()
@@ -96,3 +107,228 @@ class WorkAppTests(TestCase):
         members = child_project.all_members()
         self.assertEqual(len(members), 1)
         self.assertTrue(members[0]['roles'][0]['inherited'])
+
+    def test_permission_cache_invalidated_by_role_and_member_changes(self):
+        read_perm = Permission.objects.create(module='issue', code='issue.read', name='업무 보기')
+        create_perm = Permission.objects.create(module='issue', code='issue.create', name='업무 생성')
+        role = Role.objects.create(name='Reporter', creator=self.user)
+        role.permissions.add(read_perm)
+        member = Member.objects.create(user=self.user, project=self.project)
+        member.roles.add(role)
+
+        def permissions():
+            return IssueProject.objects.get(pk=self.project.pk).get_user_permissions(self.user)
+
+        self.assertEqual(permissions(), ['issue.read'])
+        with self.assertNumQueries(1):  # 워크스페이스 조회만, 권한은 캐시 사용
+            self.assertEqual(permissions(), ['issue.read'])
+
+        role.permissions.add(create_perm)
+        self.assertEqual(permissions(), ['issue.create', 'issue.read'])
+
+        member.delete()
+        self.assertEqual(permissions(), [])
+
+    def test_issue_log_sequence_allocates_consecutive_numbers(self):
+        issue = Issue.objects.create(
+            project=self.project,
+            tracker=self.tracker,
+            status=self.status_open,
+            priority=self.priority,
+            subject='Sequence Issue',
+            start_date=timezone.now().date(),
+            creator=self.user
+        )
+        existing = IssueLogEntry.objects.filter(issue=issue).count()
+
+        IssueLogEntry.objects.create(issue=issue, action='Comment', creator=self.user)
+        IssueLogEntry.objects.bulk_create([IssueLogEntry(issue=issue, action='Updated') for _ in range(3)])
+
+        log_ids = sorted(IssueLogEntry.objects.filter(issue=issue).values_list('log_id', flat=True))
+        self.assertEqual(log_ids, list(range(1, existing + 5)))
+
+    def test_issue_access_table_follows_member_role_changes(self):
+        viewer = User.objects.create_user(username='viewer', email='viewer@example.com', password='password')
+        self.project.is_public = False
+        self.project.save()
+        role = Role.objects.create(name='Viewer', issue_visible='PUB', creator=self.user)
+        member = Member.objects.create(user=viewer, project=self.project)
+        member.roles.add(role)
+
+        def create_issue(subject, is_private):
+            return Issue.objects.create(project=self.project, tracker=self.tracker, status=self.status_open,
+                                        priority=self.priority, subject=subject, is_private=is_private,
+                                        start_date=timezone.now().date(), creator=self.user)
+
+        public_issue = create_issue('Public', False)
+        private_issue = create_issue('Private', True)
+
+        def visible_ids(**kwargs):
+            return set(Issue.objects.filter(visible_issue_q(viewer, **kwargs)).values_list('pk', flat=True))
+
+        self.assertEqual(IssueAccess.objects.get(user=viewer, project=self.project).issue_visible, 'PUB')
+        self.assertEqual(visible_ids(), set())
+        self.assertEqual(visible_ids(include_member_pub=True), {public_issue.pk})
+
+        role.issue_visible = 'ALL'
+        role.save()
+        self.assertEqual(visible_ids(), {public_issue.pk, private_issue.pk})
+
+        member.roles.remove(role)
+        self.assertFalse(IssueAccess.objects.filter(user=viewer).exists())
+        self.assertEqual(visible_ids(), set())
+
+    def test_project_subtree_ids_follow_tree_changes(self):
+        child = IssueProject.objects.create(company=self.company, name='Child', slug='child', parent=self.project,
+                                            creator=self.user)
+        grandchild = IssueProject.objects.create(company=self.company, name='Grandchild', slug='grandchild',
+                                                 parent=child, creator=self.user)
+
+        self.assertEqual(set(get_subtree_ids(self.project.pk)), {self.project.pk, child.pk, grandchild.pk})
+        self.assertEqual(get_ancestor_ids(grandchild.pk), [self.project.pk, child.pk])
+
+        grandchild.parent = None
+        grandchild.save()
+        self.assertEqual(set(get_subtree_ids(self.project.pk)), {self.project.pk, child.pk})
+        self.assertEqual(get_ancestor_ids(grandchild.pk), [])
+
+    def test_issue_serializer_query_count_is_constant(self):
+        admin = User.objects.create_superuser(username='admin', email='admin@example.com', password='password')
+        request = RequestFactory().get('/api/v1/issue/')
+        request.user = admin
+
+        def create_issue(subject, parent=None):
+            issue = Issue.objects.create(project=self.project, tracker=self.tracker, status=self.status_open,
+                                         priority=self.priority, subject=subject, parent=parent,
+                                         start_date=timezone.now().date(), creator=self.user)
+            issue.watchers.add(self.user)
+            return issue
+
+        def create_tree(index):
+            parent = create_issue(f'Parent {index}')
+            children = [create_issue(f'Child {index}-{n}', parent) for n in range(2)]
+            IssueRelation.objects.create(source=children[0], target=children[1])
+            return parent
+
+        def serialize(issue_ids):
+            queryset = Issue.objects.filter(pk__in=issue_ids).prefetch_related(*issue_prefetches()).order_by('id')
+            with CaptureQueriesContext(connection) as ctx:
+                data = IssueSerializer(queryset, many=True, context={'request': request}).data
+            return data, len(ctx.captured_queries)
+
+        small, small_count = serialize([create_tree(i).pk for i in range(2)])
+        large, large_count = serialize([create_tree(i).pk for i in range(2, 8)])
+
+        self.assertEqual(small_count, large_count)
+        self.assertEqual(len(large), 6)
+        self.assertEqual([len(row['sub_issues']) for row in large], [2] * 6)
+        self.assertEqual(large[0]['sub_issues'][0]['watchers'][0]['pk'], self.user.pk)
+
+    def test_issue_counters_follow_issue_changes(self):
+        other = IssueProject.objects.create(company=self.company, name='Other', slug='other', creator=self.user)
+        issue = Issue.objects.create(project=self.project, tracker=self.tracker, status=self.status_open,
+                                     priority=self.priority, subject='Counted', assigned_to=self.user,
+                                     start_date=timezone.now().date(), creator=self.user)
+
+        self.assertEqual(count_by_tracker([self.project.pk]), {(self.tracker.pk, False): 1})
+        self.assertEqual(count_by_user(self.user.pk)['charged'][False], 1)
+
+        issue.status = self.status_closed
+        issue.closed = timezone.now()
+        issue.project = other
+        issue.assigned_to = None
+        issue.save()
+        self.assertEqual(count_by_tracker([self.project.pk]).get((self.tracker.pk, False), 0), 0)
+        self.assertEqual(count_by_tracker([other.pk]), {(self.tracker.pk, True): 1})
+        self.assertEqual(count_by_user(self.user.pk)['charged'][False], 0)
+        self.assertEqual(count_by_user(self.user.pk)['created'][True], 1)
+
+        IssueCounter.objects.update(count=5)
+        self.assertEqual(reconcile_issue_counters(IssueCounter, Issue, dry_run=True), 2)
+        reconcile_issue_counters(IssueCounter, Issue)
+        self.assertEqual(reconcile_issue_counters(IssueCounter, Issue, dry_run=True), 0)
+        self.assertEqual(count_by_tracker(), {(self.tracker.pk, True): 1})
+
+        issue.delete()
+        self.assertEqual(count_by_tracker(), {(self.tracker.pk, True): 0})
+
+    def test_issue_counters_stay_consistent_when_same_issue_saved_twice(self):
+        issue = Issue.objects.create(project=self.project, tracker=self.tracker, status=self.status_open,
+                                     priority=self.priority, subject='Counted', assigned_to=self.user,
+                                     start_date=timezone.now().date(), creator=self.user)
+        first, second = Issue.objects.get(pk=issue.pk), Issue.objects.get(pk=issue.pk)
+
+        depths = []
+
+        def record_depth(sender, instance, **kwargs):
+            depths.append(len(connection.savepoint_ids))
+
+        pre_save.connect(record_depth, sender=Issue)
+        try:
+            first.status = self.status_closed
+            first.closed = timezone.now()
+            first.save()
+            second.assigned_to = None  # 변경 전 값을 가진 사본 저장
+            second.save()
+        finally:
+            pre_save.disconnect(record_depth, sender=Issue)
+
+        # 저장마다 자체 트랜잭션 안에서 변경 전 키 조회·잠금 후 카운터 증감
+        self.assertEqual(len(depths), 2)
+        self.assertTrue(all(depth > len(connection.savepoint_ids) for depth in depths))
+        self.assertEqual(reconcile_issue_counters(IssueCounter, Issue, dry_run=True), 0)
+        self.assertEqual(count_by_user(self.user.pk)['charged'][False], 0)
+        self.assertEqual(count_by_user(self.user.pk)['created'][False], 1)
+
+    def test_search_index_ranks_visible_entries(self):
+        admin = User.objects.create_superuser(username='admin', email='admin@example.com', password='password')
+        viewer = User.objects.create_user(username='viewer', email='viewer@example.com', password='password')
+        self.project.is_public = False
+        self.project.save()
+
+        def create_issue(subject, description='', is_private=False):
+            return Issue.objects.create(project=self.project, tracker=self.tracker, status=self.status_open,
+                                        priority=self.priority, subject=subject, description=description,
+                                        is_private=is_private, start_date=timezone.now().date(),
+                                        creator=self.user)
+
+        titled = create_issue('통합 검색엔진 개선')
+        body = create_issue('기타 작업', description='<p>검색엔진 응답 속도</p>')
+        private = create_issue('검색엔진 비공개', is_private=True)
+        create_issue('관련 없는 업무')
+        index_objects('issues', Issue.objects.values_list('pk', flat=True))
+
+        self.assertEqual(query_tokens('검색엔진'), ['검색', '색엔', '엔진'])
+
+        def found(user, text, **kwargs):
+            return [entry.object_id for entry in search_entries(user, text, **kwargs)]
+
+        ranked = found(admin, '검색엔진')
+        self.assertEqual(set(ranked), {titled.pk, body.pk, private.pk})
+        self.assertEqual(ranked[-1], body.pk)  # 제목 일치가 본문 일치보다 상위
+        self.assertEqual(set(found(admin, '검색엔진', title_only=True)), {titled.pk, private.pk})
+        self.assertEqual(len(top_entries_by_type(search_entries(admin, '검색엔진'), limit=2)['issues']), 2)
+
+        self.assertEqual(found(viewer, '검색엔진'), [])
+        role = Role.objects.create(name='Viewer', issue_visible='ALL', creator=self.user)
+        Member.objects.create(user=viewer, project=self.project).roles.add(role)
+        self.assertEqual(set(found(viewer, '검색엔진')), {titled.pk, body.pk, private.pk})
+
+        private.delete()
+        self.assertEqual(set(found(admin, '검색엔진')), {titled.pk, body.pk})
+
+    def test_search_results_recheck_live_visibility(self):
+        admin = User.objects.create_superuser(username='admin', email='admin@example.com', password='password')
+        issue = Issue.objects.create(project=self.project, tracker=self.tracker, status=self.status_open,
+                                     priority=self.priority, subject='배포 일정', start_date=timezone.now().date(),
+                                     creator=self.user)
+        comment = IssueComment.objects.create(issue=issue, content='검색엔진 점검 결과', creator=self.user)
+        index_objects('comments', [comment.pk])
+
+        def found():
+            return [entry.object_id for entry in search_entries(admin, '검색엔진', object_types=['comments'])]
+
+        self.assertEqual(found(), [comment.pk])
+        # 색인 갱신 전(커밋 후 재색인 이전) 비공개 전환도 검색 결과에서 바로 제외
+        IssueComment.objects.filter(pk=comment.pk).update(is_private=True)
+        self.assertEqual(found(), [])
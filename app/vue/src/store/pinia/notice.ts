@@ -80,80 +80,14 @@ export const useNotice = defineStore('notice', () => {
         return response.data
       }
 
-      // company_id가 없으면 즉시 경고 메시지 (전송 내역 조회 불가)
-      if (!payload.company_id) {
-        message(
-          'warning',
-          '발송 요청 접수',
-          'SMS 발송 요청이 접수되었습니다. 조직 구분 ID가 없어 발송 결과를 확인할 수 없습니다.',
-        )
-        return response.data
-      }
-
-      // API 접수는 성공했으나, 실제 발송 결과는 비동기로 처리됨
-      // 2-3초 후 전송 내역을 조회하여 실제 발송 상태 확인
-      message('info', '', '발송 요청이 접수되었습니다. 실제 발송 결과를 확인 중...')
-
-      // 2.5초 대기 (iwinv API가 실제 발송 처리할 시간)
-      await new Promise(resolve => setTimeout(resolve, 2500))
-
-      // 전송 내역 조회 (오늘 날짜, requestNo로 필터링)
-      const today = new Date()
-      const historyParams = {
-        company_id: payload.company_id,
-        start_date: today.toISOString().split('T')[0],
-        end_date: today.toISOString().split('T')[0],
-        request_no: response.data.requestNo,
-        page_num: 1,
-        page_size: 10,
-      }
-
-      const historyResponse = await api.get<SendHistoryResponse>('/messages/send-history/', {
-        params: historyParams,
-      })
-
-      if (historyResponse.data.resultCode === 0 && historyResponse.data.list.length > 0) {
-        // 같은 requestNo에 대해 여러 레코드가 있을 수 있음 (WAIT 상태와 최종 상태)
-        // 최종 상태를 우선적으로 확인 (구분이 "API"인 것 또는 WAIT가 아닌 것)
-        const records = historyResponse.data.list.filter(
-          item => item.requestNo === response.data.requestNo,
-        )
-
-        // API 구분이 있는 것(최종 상태) 우선, 없으면 첫 번째 레코드
-        const sendResult = records.find(item => item.sendStatusCode !== 'WAIT') || records[0]
-
-        // 발송 상태 확인
-        // '0', '06' = 성공
-        // 'WAIT' = 대기 중
-        // 그 외 = 실패
-        if (sendResult.sendStatusCode === '0' || sendResult.sendStatusCode === '06') {
-          message(
-            'success',
-            '발송 성공',
-            `SMS가 성공적으로 발송되었습니다. (${payload.recipients.length}건)`,
-          )
-        } else if (sendResult.sendStatusCode === 'WAIT') {
-          message(
-            'info',
-            '발송 대기 중',
-            `SMS 발송이 접수되었습니다. 전송 처리 중입니다. (${payload.recipients.length}건)`,
-          )
-        } else {
-          message(
-            'danger',
-            '발송 실패',
-            sendResult.sendStatusMessage ||
-              `발송에 실패했습니다. (코드: ${sendResult.sendStatusCode})`,
-          )
-        }
-      } else {
-        // 전송 내역 조회 실패 시 경고 메시지
-        message(
-          'warning',
-          '발송 확인 필요',
-          `발송 요청은 접수되었으나 결과 확인에 실패했습니다. (${historyResponse.data.message || '전송 내역을 확인해주세요.'})`,
-        )
-      }
+      // 발송은 서버 작업 큐에서 처리되며 실제 발송 결과는 발송 기록에서 확인
+      message(
+        'info',
+        '발송 요청 접수',
+        payload.company_id
+          ? `${response.data.message} 발송 결과는 발송 기록에서 확인할 수 있습니다.`
+          : `${response.data.message} 조직 구분 ID가 없어 발송 결과를 확인할 수 없습니다.`,
+      )
 
       return response.data
     } catch (err: any) {
@@ -192,7 +126,7 @@ export const useNotice = defineStore('notice', () => {
       const response = await api.post<SMSResponse>('/messages/send-mms/', formData)
 
       if (response.data.resultCode === 0) {
-        message('success', '', 'MMS가 성공적으로 발송되었습니다.')
+        message('info', '발송 요청 접수', response.data.message)
       } else {
         message('danger', '발송 실패', response.data.message || '알 수 없는 오류가 발생했습니다.')
       }
@@ -216,11 +150,7 @@ export const useNotice = defineStore('notice', () => {
       const response = await api.post<KakaoResponse>('/messages/send-kakao/', payload)
 
       if (response.data.code === 200) {
-        message(
-          'success',
-          '',
-          `카카오 알림톡이 성공적으로 발송되었습니다. (성공: ${response.data.success}건)`,
-        )
+        message('info', '발송 요청 접수', response.data.message)
       } else {
         message('danger', '발송 실패', response.data.message || '알 수 없는 오류가 발생했습니다.')
       }
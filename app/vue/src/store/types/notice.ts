@@ -99,7 +99,8 @@ export declare interface SMSResponse {
   resultCode: number
   message: string
   requestNo: string | null
-  msgType: 'SMS' | 'LMS' | 'MMS'
+  msgType: 'SMS' | 'LMS' | 'MMS' | 'AUTO'
+  historyIds?: number[]
 }
 
 export declare interface KakaoResponse {
@@ -107,6 +108,7 @@ export declare interface KakaoResponse {
   message: string
   success: number
   fail: number
+  historyIds?: number[]
 }
 
 // 메시지 템플릿 관련 타입
@@ -123,6 +125,14 @@ export declare interface MessageTemplate {
 }
 
 // 메시지 발송 기록 관련 타입
+export type MessageSendStatus =
+  | 'queued'
+  | 'sending'
+  | 'requested'
+  | 'completed'
+  | 'failed'
+  | 'unknown'
+
 export declare interface MessageSendHistory {
   id: number
   message_type: 'SMS' | 'LMS' | 'MMS' | 'KAKAO'
@@ -141,6 +151,11 @@ export declare interface MessageSendHistory {
     pk: number
     username: string
   } | null
+  status: MessageSendStatus
+  success_count: number
+  fail_count: number
+  result_message: string
+  checked_at: string | null
   created: string
 }
 
@@ -158,6 +173,9 @@ export declare interface MessageSendHistoryList {
     pk: number
     username: string
   } | null
+  status: MessageSendStatus
+  success_count: number
+  fail_count: number
   created: string
 }
 